@@ -0,0 +1 @@
+"""Offline benchmarking of Sub Manager against a simulated Reddit."""
@@ -0,0 +1,1321 @@
+"""In-memory model of the parts of the Reddit API used by Sub Manager."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import collections
+import difflib
+import json
+import re
+import threading
+import time
+import urllib.parse
+import uuid
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Tuple,
+    Union,
+)
+
+# Third party imports
+import requests
+import requests.adapters
+import requests.structures
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.core.ratelimit
+
+JSONData = Union[Dict[str, Any], List[Any], bool, None]
+FormData = Dict[str, str]
+
+ACCESS_TOKEN_PATH: Final[str] = "/api/v1/access_token"
+ACCESS_TOKEN_LIFETIME_S: Final[int] = 3600
+RATE_LIMIT_WINDOW_S_DEFAULT: Final[float] = 600
+SUBMISSION_ID_OFFSET: Final[int] = 36**5
+
+MOD_PERMISSION_ALL: Final[str] = "all"
+MOD_PERMISSION_CONFIG: Final[str] = "config"
+MOD_PERMISSION_WIKI: Final[str] = "wiki"
+
+SCOPES: Final[dict[str, dict[str, str]]] = {
+    scope: {"description": f"Fake {scope} scope", "id": scope, "name": scope}
+    for scope in (
+        "edit",
+        "identity",
+        "modconfig",
+        "modlog",
+        "modposts",
+        "read",
+        "submit",
+        "wikiedit",
+        "wikiread",
+    )
+}
+
+
+# ---- Helpers ----
+
+
+class FakeResponse(NamedTuple):
+    """A response from the fake Reddit, before it's encoded for transport."""
+
+    status_code: int
+    body: JSONData
+    headers: dict[str, str] = {}
+
+    @property
+    def content(self) -> bytes:
+        """Get the body of the response, encoded as JSON."""
+        if self.body is None:
+            return b""
+        return json.dumps(self.body).encode("utf-8")
+
+
+class RequestRecord(NamedTuple):
+    """A request served by the fake Reddit, for tallying and timing."""
+
+    account: str | None
+    route: str
+    status_code: int
+    duration_s: float
+
+
+def to_base36(number: int) -> str:
+    """Convert a non-negative integer to a lowercase base 36 string."""
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    base36_digits = []
+    while True:
+        number, remainder = divmod(number, len(digits))
+        base36_digits.append(digits[remainder])
+        if not number:
+            return "".join(reversed(base36_digits))
+
+
+def make_error(status_code: int, message: str) -> FakeResponse:
+    """Make an error response in the form Reddit returns them."""
+    return FakeResponse(
+        status_code,
+        {"error": status_code, "message": message},
+    )
+
+
+def make_listing(children: list[JSONData]) -> JSONData:
+    """Make a single-page listing of the passed children."""
+    return {
+        "kind": "Listing",
+        "data": {
+            "after": None,
+            "before": None,
+            "children": children,
+            "dist": len(children),
+        },
+    }
+
+
+def make_things(kind: str, thing_data: dict[str, Any]) -> JSONData:
+    """Make the response Reddit returns after creating or editing a thing."""
+    return {
+        "json": {
+            "data": {"things": [{"kind": kind, "data": thing_data}]},
+            "errors": [],
+        },
+    }
+
+
+def parse_form(body: str | bytes | None) -> FormData:
+    """Parse an URL-encoded form request body."""
+    if not body:
+        return {}
+    if isinstance(body, bytes):
+        body = body.decode("utf-8")
+    return dict(urllib.parse.parse_qsl(body, keep_blank_values=True))
+
+
+def merge_text(base: str, mine: str, theirs: str) -> str | None:
+    """Merge two edits of the base text by line, or None if they overlap."""
+    base_lines = base.splitlines(keepends=True)
+    edit_hunks: list[list[tuple[int, int, list[str]]]] = []
+    for edited in (mine, theirs):
+        edited_lines = edited.splitlines(keepends=True)
+        matcher = difflib.SequenceMatcher(
+            None,
+            base_lines,
+            edited_lines,
+            autojunk=False,
+        )
+        edit_hunks.append(
+            [
+                (base_start, base_end, edited_lines[edit_start:edit_end])
+                for tag, base_start, base_end, edit_start, edit_end in (
+                    matcher.get_opcodes()
+                )
+                if tag != "equal"
+            ],
+        )
+    my_hunks, their_hunks = edit_hunks
+
+    # Like Reddit, reject edits that change the same or adjacent lines
+    for my_start, my_end, __ in my_hunks:
+        for their_start, their_end, __ in their_hunks:
+            if my_start <= their_end and their_start <= my_end:
+                return None
+    merged_lines = list(base_lines)
+    for base_start, base_end, hunk_lines in sorted(
+        my_hunks + their_hunks,
+        key=lambda hunk: hunk[0],
+        reverse=True,
+    ):
+        merged_lines[base_start:base_end] = hunk_lines
+    return "".join(merged_lines)
+
+
+# ---- Reddit objects ----
+
+
+class FakeWikiRevision(NamedTuple):
+    """A revision of a wiki page."""
+
+    revision_id: str
+    author: str
+    content: str
+    reason: str
+    timestamp: float
+
+
+class FakeWikiPage:
+    """A subreddit wiki page and its revision history."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.revisions: list[FakeWikiRevision] = []
+
+    @property
+    def latest(self) -> FakeWikiRevision | None:
+        """Get the current revision of the page, if any."""
+        return self.revisions[-1] if self.revisions else None
+
+
+class FakeWidget:
+    """A New Reddit sidebar or top bar widget."""
+
+    def __init__(self, widget_id: str, kind: str, **fields: Any) -> None:
+        self.widget_id = widget_id
+        self.kind = kind
+        self.fields = fields
+
+    def to_json(self) -> dict[str, Any]:
+        """Serialize the widget as Reddit returns it."""
+        return {"id": self.widget_id, "kind": self.kind, **self.fields}
+
+
+class FakeComment:
+    """A comment on a submission."""
+
+    def __init__(
+        self,
+        comment_id: str,
+        author: str,
+        body: str,
+        link_id: str,
+    ) -> None:
+        self.comment_id = comment_id
+        self.author = author
+        self.body = body
+        self.link_id = link_id
+        self.distinguished: str | None = None
+        self.stickied = False
+        self.created_utc = time.time()
+
+    def to_json(self) -> dict[str, Any]:
+        """Serialize the comment as Reddit returns it."""
+        return {
+            "author": self.author,
+            "body": self.body,
+            "created_utc": self.created_utc,
+            "distinguished": self.distinguished,
+            "id": self.comment_id,
+            "link_id": self.link_id,
+            "name": f"t1_{self.comment_id}",
+            "parent_id": self.link_id,
+            "replies": "",
+            "stickied": self.stickied,
+        }
+
+
+class FakeSubmission:
+    """A self post in a subreddit."""
+
+    def __init__(
+        self,
+        submission_id: str,
+        subreddit: str,
+        author: str,
+        title: str,
+        selftext: str,
+    ) -> None:
+        self.submission_id = submission_id
+        self.subreddit = subreddit
+        self.author = author
+        self.title = title
+        self.selftext = selftext
+        self.created_utc = time.time()
+        self.edited: float | bool = False
+        self.approved = False
+        self.send_replies = True
+        self.comments: list[FakeComment] = []
+
+    @property
+    def fullname(self) -> str:
+        """Get the fullname (type prefix and ID) of the submission."""
+        return f"t3_{self.submission_id}"
+
+    @property
+    def permalink(self) -> str:
+        """Get the relative URL of the submission."""
+        return f"/r/{self.subreddit}/comments/{self.submission_id}/post/"
+
+    def to_json(self, stickied: bool = False) -> dict[str, Any]:
+        """Serialize the submission as Reddit returns it."""
+        return {
+            "approved": self.approved,
+            "author": self.author,
+            "created_utc": self.created_utc,
+            "edited": self.edited,
+            "id": self.submission_id,
+            "is_self": True,
+            "name": self.fullname,
+            "num_comments": len(self.comments),
+            "permalink": self.permalink,
+            "selftext": self.selftext,
+            "send_replies": self.send_replies,
+            "stickied": stickied,
+            "subreddit": self.subreddit,
+            "title": self.title,
+            "url": f"https://www.reddit.com{self.permalink}",
+        }
+
+
+class FakeSubreddit:
+    """A subreddit and its wiki, widgets, stickies and modlog."""
+
+    def __init__(self, name: str, subreddit_id: str) -> None:
+        self.name = name
+        self.subreddit_id = subreddit_id
+        self.moderators: dict[str, list[str]] = {}
+        self.wiki_pages: dict[str, FakeWikiPage] = {}
+        self.widgets: dict[str, FakeWidget] = {}
+        self.sidebar: list[str] = []
+        self.topbar: list[str] = []
+        self.stickies: list[str] = []
+        self.mod_log: list[dict[str, Any]] = []
+
+    def get_mod_permissions(self, username: str) -> list[str] | None:
+        """Get the user's mod permissions, or None if not a mod."""
+        return self.moderators.get(username.lower(), None)
+
+    def has_mod_permission(self, username: str, permission: str) -> bool:
+        """Check if the user is a mod with the given permission."""
+        mod_permissions = self.get_mod_permissions(username) or []
+        return bool({MOD_PERMISSION_ALL, permission} & set(mod_permissions))
+
+    def log_mod_action(
+        self,
+        username: str,
+        action: str,
+        *,
+        details: str = "",
+        target_permalink: str = "",
+    ) -> None:
+        """Record an action in the modlog."""
+        self.mod_log.insert(
+            0,
+            {
+                "action": action,
+                "created_utc": time.time(),
+                "description": None,
+                "details": details,
+                "id": f"ModAction_{uuid.uuid4()}",
+                "mod": username,
+                "subreddit": self.name,
+                "target_permalink": target_permalink,
+            },
+        )
+
+
+# ---- Fake Reddit ----
+
+
+RouteHandler = Callable[
+    ["FakeReddit", str, Tuple[str, ...], FormData],
+    FakeResponse,
+]
+ROUTES: Final[list[tuple[str, str, re.Pattern[str], str]]] = [
+    (method, route, re.compile(f"^{pattern}/?$"), handler_name)
+    for method, route, pattern, handler_name in (
+        ("GET", "me", "/api/v1/me", "get_me"),
+        ("GET", "scopes", "/api/v1/scopes", "get_scopes"),
+        (
+            "GET",
+            "username_available",
+            "/api/username_available",
+            "get_username_available",
+        ),
+        ("GET", "info", "/api/info", "get_info"),
+        ("GET", "subreddit", "/r/([^/]+)/about", "get_subreddit_about"),
+        (
+            "GET",
+            "moderators",
+            "/r/([^/]+)/about/moderators",
+            "get_moderators",
+        ),
+        ("GET", "sticky", "/r/([^/]+)/about/sticky", "get_sticky"),
+        ("GET", "mod_log", "/r/([^/]+)/about/log", "get_mod_log"),
+        ("GET", "listing", "/r/([^/]+)/(?:hot|new)", "get_listing"),
+        (
+            "GET",
+            "wiki_revisions",
+            "/r/([^/]+)/wiki/revisions/(.+?)",
+            "get_wiki_revisions",
+        ),
+        ("GET", "wiki_page", "/r/([^/]+)/wiki/(.+?)", "get_wiki_page"),
+        ("POST", "wiki_edit", "/r/([^/]+)/api/wiki/edit", "post_wiki_edit"),
+        ("GET", "widgets", "/r/([^/]+)/api/widgets", "get_widgets"),
+        (
+            "PUT",
+            "widget_edit",
+            "/r/([^/]+)/api/widget/([^/]+)",
+            "put_widget",
+        ),
+        (
+            "GET",
+            "submission",
+            "/comments/([^/]+)(?:/[^/]*)?",
+            "get_submission",
+        ),
+        ("POST", "submit", "/api/submit", "post_submit"),
+        ("POST", "edit", "/api/editusertext", "post_edit"),
+        ("POST", "comment", "/api/comment", "post_comment"),
+        ("POST", "approve", "/api/approve", "post_approve"),
+        ("POST", "distinguish", "/api/distinguish", "post_distinguish"),
+        ("POST", "sticky", "/api/set_subreddit_sticky", "post_sticky"),
+        ("POST", "send_replies", "/api/sendreplies", "post_send_replies"),
+    )
+]
+
+
+class FakeReddit:  # pylint: disable = too-many-public-methods
+    """A stateful, thread-safe stand-in for the Reddit API."""
+
+    def __init__(
+        self,
+        *,
+        latency_s: float = 0,
+        rate_limit: int | None = None,
+        rate_limit_window_s: float = RATE_LIMIT_WINDOW_S_DEFAULT,
+    ) -> None:
+        self.latency_s = latency_s
+        self.rate_limit = rate_limit
+        self.rate_limit_window_s = rate_limit_window_s
+        self.subreddits: dict[str, FakeSubreddit] = {}
+        self.submissions: dict[str, FakeSubmission] = {}
+        self.comments: dict[str, FakeComment] = {}
+        self.refresh_tokens: dict[str, str] = {}
+        self.access_tokens: dict[str, str] = {}
+        self.request_log: list[RequestRecord] = []
+        self._rate_windows: dict[str, tuple[float, int]] = {}
+        self._id_counter = 0
+        self._lock = threading.RLock()
+
+    # ---- Seeding ----
+
+    def _next_id(self) -> int:
+        """Get the next ID number for a new object."""
+        with self._lock:
+            self._id_counter += 1
+            return self._id_counter
+
+    def add_account(self, username: str) -> dict[str, str]:
+        """Add an account, returning the PRAW config to log in with it."""
+        refresh_token = f"fake-refresh-{username}"
+        with self._lock:
+            self.refresh_tokens[refresh_token] = username
+        return {
+            "client_id": f"fake-client-{username}",
+            "client_secret": "fake-client-secret",
+            "refresh_token": refresh_token,
+        }
+
+    def add_subreddit(
+        self,
+        name: str,
+        moderators: Mapping[str, Collection[str]] | None = None,
+    ) -> FakeSubreddit:
+        """Add a subreddit with the given mods and their permissions."""
+        subreddit = FakeSubreddit(name, to_base36(self._next_id()))
+        for username, mod_permissions in (moderators or {}).items():
+            subreddit.moderators[username.lower()] = list(mod_permissions)
+        with self._lock:
+            self.subreddits[name.lower()] = subreddit
+        return subreddit
+
+    def get_subreddit(self, name: str) -> FakeSubreddit | None:
+        """Get a subreddit by its case-insensitive name, if it exists."""
+        return self.subreddits.get(name.lower(), None)
+
+    def edit_wiki_page(
+        self,
+        subreddit: FakeSubreddit,
+        page_name: str,
+        content: str,
+        *,
+        author: str,
+        reason: str = "",
+    ) -> FakeWikiRevision:
+        """Add a new revision of a wiki page, creating it if needed."""
+        with self._lock:
+            wiki_page = subreddit.wiki_pages.setdefault(
+                page_name.lower(),
+                FakeWikiPage(page_name.lower()),
+            )
+            revision = FakeWikiRevision(
+                revision_id=str(uuid.UUID(int=self._next_id())),
+                author=author,
+                content=content,
+                reason=reason,
+                timestamp=time.time(),
+            )
+            wiki_page.revisions.append(revision)
+            subreddit.log_mod_action(
+                author,
+                "wikirevise",
+                details=f"Page {wiki_page.name} edited",
+                target_permalink=f"/r/{subreddit.name}/wiki/{wiki_page.name}",
+            )
+        return revision
+
+    def add_widget(
+        self,
+        subreddit: FakeSubreddit,
+        kind: str,
+        *,
+        topbar: bool = False,
+        **fields: Any,
+    ) -> FakeWidget:
+        """Add a widget to a subreddit's sidebar, or to its top bar."""
+        widget = FakeWidget(f"widget_{to_base36(self._next_id())}", kind)
+        widget.fields = fields
+        with self._lock:
+            subreddit.widgets[widget.widget_id] = widget
+            (subreddit.topbar if topbar else subreddit.sidebar).append(
+                widget.widget_id,
+            )
+        return widget
+
+    def add_submission(
+        self,
+        subreddit: FakeSubreddit,
+        author: str,
+        title: str,
+        selftext: str,
+        *,
+        submission_id: str | None = None,
+    ) -> FakeSubmission:
+        """Add a self post to a subreddit, with the given ID if passed."""
+        submission = FakeSubmission(
+            submission_id or to_base36(SUBMISSION_ID_OFFSET + self._next_id()),
+            subreddit.name,
+            author,
+            title,
+            selftext,
+        )
+        with self._lock:
+            self.submissions[submission.submission_id] = submission
+        return submission
+
+    # ---- Request handling ----
+
+    def get_request_counts(self) -> collections.Counter[str]:
+        """Count the requests served so far by route."""
+        with self._lock:
+            return collections.Counter(
+                request_record.route for request_record in self.request_log
+            )
+
+    def reset_request_log(self) -> None:
+        """Forget the requests served so far."""
+        with self._lock:
+            self.request_log.clear()
+
+    def pop_request_counts(self) -> collections.Counter[str]:
+        """Count the requests served so far by route, then forget them."""
+        with self._lock:
+            request_counts = collections.Counter(
+                request_record.route for request_record in self.request_log
+            )
+            self.request_log.clear()
+        return request_counts
+
+    def _check_rate_limit(
+        self,
+        username: str,
+    ) -> tuple[bool, dict[str, str]]:
+        """Count a request against the user's budget; get the headers."""
+        # Without a limit, send no headers so PRAW doesn't pace requests
+        if self.rate_limit is None:
+            return True, {}
+        current_time = time.time()
+        window_start, used = self._rate_windows.get(username, (0, 0))
+        if current_time - window_start >= self.rate_limit_window_s:
+            window_start, used = current_time, 0
+        allowed = used < self.rate_limit
+        if allowed:
+            used += 1
+        self._rate_windows[username] = (window_start, used)
+        reset_s = window_start + self.rate_limit_window_s - current_time
+        rate_limit_headers = {
+            submanager.core.ratelimit.HEADER_REMAINING: str(
+                max(self.rate_limit - used, 0),
+            ),
+            submanager.core.ratelimit.HEADER_RESET: str(
+                max(round(reset_s), 0),
+            ),
+            submanager.core.ratelimit.HEADER_USED: str(used),
+        }
+        return allowed, rate_limit_headers
+
+    def _grant_token(self, data: FormData) -> FakeResponse:
+        """Grant an access token for a refresh token."""
+        username = self.refresh_tokens.get(data.get("refresh_token", ""))
+        if data.get("grant_type") != "refresh_token" or username is None:
+            return FakeResponse(400, {"error": "invalid_grant"})
+        access_token = f"fake-access-{username}-{uuid.uuid4().hex}"
+        self.access_tokens[access_token] = username
+        return FakeResponse(
+            200,
+            {
+                "access_token": access_token,
+                "expires_in": ACCESS_TOKEN_LIFETIME_S,
+                "scope": "*",
+                "token_type": "bearer",
+            },
+        )
+
+    def handle_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: str | bytes | None = None,
+        headers: Mapping[str, str | bytes] | None = None,
+    ) -> FakeResponse:
+        """Serve a Reddit API request."""
+        start_time = time.monotonic()
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        url_parts = urllib.parse.urlsplit(url)
+        data = parse_form(body)
+        data.update(urllib.parse.parse_qsl(url_parts.query))
+        path = url_parts.path.rstrip("/") or "/"
+
+        authorization = (headers or {}).get("Authorization", "")
+        if isinstance(authorization, bytes):
+            authorization = authorization.decode("utf-8")
+
+        username = None
+        with self._lock:
+            if path == ACCESS_TOKEN_PATH:
+                route = "access_token"
+                response = self._grant_token(data)
+            elif path == "/api/v1/scopes" and not authorization:
+                route = "scopes"
+                response = self.get_scopes("", (), data)
+            else:
+                username = self.access_tokens.get(
+                    authorization.partition(" ")[2],
+                    None,
+                )
+                route, response = self._route(method, path, username, data)
+            self.request_log.append(
+                RequestRecord(
+                    account=username,
+                    route=route,
+                    status_code=response.status_code,
+                    duration_s=time.monotonic() - start_time,
+                ),
+            )
+        return response
+
+    def _route(
+        self,
+        method: str,
+        path: str,
+        username: str | None,
+        data: FormData,
+    ) -> tuple[str, FakeResponse]:
+        """Route an authorized request to its handler."""
+        if username is None:
+            return "unauthorized", make_error(401, "Unauthorized")
+        allowed, rate_limit_headers = self._check_rate_limit(username)
+        if not allowed:
+            return "rate_limited", FakeResponse(
+                429,
+                {"error": 429, "message": "Too Many Requests"},
+                rate_limit_headers,
+            )
+        for route_method, route, pattern, handler_name in ROUTES:
+            match = pattern.match(path)
+            if route_method != method.upper() or not match:
+                continue
+            handler: RouteHandler = getattr(type(self), handler_name)
+            response = handler(self, username, match.groups(), data)
+            return route, response._replace(
+                headers={**rate_limit_headers, **response.headers},
+            )
+        return "not_found", make_error(404, "Not Found")
+
+    # ---- Accounts ----
+
+    def get_me(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Get the current user."""
+        return FakeResponse(
+            200,
+            {"id": username, "name": username, "created_utc": 0},
+        )
+
+    def get_scopes(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Get the available OAuth scopes."""
+        return FakeResponse(200, dict(SCOPES))
+
+    def get_username_available(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Check if a username is available."""
+        taken_usernames = {
+            taken_username.lower()
+            for taken_username in self.refresh_tokens.values()
+        }
+        return FakeResponse(
+            200,
+            data.get("user", "").lower() not in taken_usernames,
+        )
+
+    # ---- Subreddits ----
+
+    def get_subreddit_about(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Get a subreddit's details."""
+        subreddit = self.get_subreddit(path_args[0])
+        if subreddit is None:
+            return make_error(404, "Not Found")
+        return FakeResponse(
+            200,
+            {
+                "kind": "t5",
+                "data": {
+                    "display_name": subreddit.name,
+                    "id": subreddit.subreddit_id,
+                    "name": f"t5_{subreddit.subreddit_id}",
+                    "subscribers": 1,
+                    "user_is_moderator": (
+                        subreddit.get_mod_permissions(username) is not None
+                    ),
+                },
+            },
+        )
+
+    def get_moderators(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Get a subreddit's moderators, optionally just the given user."""
+        subreddit = self.get_subreddit(path_args[0])
+        if subreddit is None:
+            return make_error(404, "Not Found")
+        if subreddit.get_mod_permissions(username) is None:
+            return make_error(403, "Forbidden")
+        user_filter = data.get("user", "").lower()
+        return FakeResponse(
+            200,
+            {
+                "kind": "UserList",
+                "data": {
+                    "children": [
+                        {
+                            "date": 0,
+                            "id": f"t2_{mod_name}",
+                            "mod_permissions": mod_permissions,
+                            "name": mod_name,
+                        }
+                        for mod_name, mod_permissions in (
+                            subreddit.moderators.items()
+                        )
+                        if not user_filter or mod_name == user_filter
+                    ],
+                },
+            },
+        )
+
+    def get_mod_log(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Get a subreddit's most recent mod actions."""
+        subreddit = self.get_subreddit(path_args[0])
+        if subreddit is None:
+            return make_error(404, "Not Found")
+        if subreddit.get_mod_permissions(username) is None:
+            return make_error(403, "Forbidden")
+        limit = int(data.get("limit", 100) or 100)
+        return FakeResponse(
+            200,
+            make_listing(
+                [
+                    {"kind": "modaction", "data": dict(mod_action)}
+                    for mod_action in subreddit.mod_log[:limit]
+                ],
+            ),
+        )
+
+    def get_listing(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Get the posts in a subreddit, newest first."""
+        subreddit = self.get_subreddit(path_args[0])
+        if subreddit is None:
+            return make_error(404, "Not Found")
+        limit = int(data.get("limit", 25) or 25)
+        submissions = [
+            submission
+            for submission in reversed(self.submissions.values())
+            if submission.subreddit.lower() == subreddit.name.lower()
+        ]
+        return FakeResponse(
+            200,
+            make_listing(
+                [
+                    {"kind": "t3", "data": submission.to_json()}
+                    for submission in submissions[:limit]
+                ],
+            ),
+        )
+
+    # ---- Wiki ----
+
+    def get_wiki_page(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Get the current revision of a wiki page."""
+        subreddit = self.get_subreddit(path_args[0])
+        if subreddit is None:
+            return make_error(404, "Not Found")
+        wiki_page = subreddit.wiki_pages.get(path_args[1].lower(), None)
+        if wiki_page is None or wiki_page.latest is None:
+            return FakeResponse(404, {"reason": "PAGE_NOT_CREATED"})
+        revision = wiki_page.latest
+        return FakeResponse(
+            200,
+            {
+                "kind": "wikipage",
+                "data": {
+                    "content_html": "",
+                    "content_md": revision.content,
+                    "may_revise": self.may_revise(
+                        subreddit,
+                        wiki_page.name,
+                        username,
+                    ),
+                    "reason": revision.reason or None,
+                    "revision_by": {
+                        "kind": "t2",
+                        "data": {"name": revision.author},
+                    },
+                    "revision_date": revision.timestamp,
+                    "revision_id": revision.revision_id,
+                },
+            },
+        )
+
+    def may_revise(
+        self,
+        subreddit: FakeSubreddit,
+        page_name: str,
+        username: str,
+    ) -> bool:
+        """Check if the user can edit the wiki page."""
+        permission = MOD_PERMISSION_WIKI
+        if page_name.lower().startswith("config/"):
+            permission = MOD_PERMISSION_CONFIG
+        return subreddit.has_mod_permission(username, permission)
+
+    def get_wiki_revisions(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Get the revisions of a wiki page, newest first."""
+        subreddit = self.get_subreddit(path_args[0])
+        if subreddit is None:
+            return make_error(404, "Not Found")
+        wiki_page = subreddit.wiki_pages.get(path_args[1].lower(), None)
+        if wiki_page is None:
+            return FakeResponse(404, {"reason": "PAGE_NOT_CREATED"})
+        limit = int(data.get("limit", 25) or 25)
+        return FakeResponse(
+            200,
+            make_listing(
+                [
+                    {
+                        "author": {
+                            "kind": "t2",
+                            "data": {"name": revision.author},
+                        },
+                        "id": revision.revision_id,
+                        "page": wiki_page.name,
+                        "reason": revision.reason or None,
+                        "revision_hidden": False,
+                        "timestamp": revision.timestamp,
+                    }
+                    for revision in reversed(wiki_page.revisions[-limit:])
+                ],
+            ),
+        )
+
+    def post_wiki_edit(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Edit a wiki page, merging edits made since the previous revision.
+
+        As on Reddit, the edit is rejected if it conflicts with them.
+        """
+        subreddit = self.get_subreddit(path_args[0])
+        if subreddit is None:
+            return make_error(404, "Not Found")
+        page_name = data.get("page", "").lower()
+        if not self.may_revise(subreddit, page_name, username):
+            return make_error(403, "Forbidden")
+        wiki_page = subreddit.wiki_pages.get(page_name, None)
+        content = data.get("content", "")
+        previous = data.get("previous", None)
+        if (
+            previous
+            and wiki_page is not None
+            and wiki_page.latest is not None
+            and wiki_page.latest.revision_id != previous
+        ):
+            base_revision = next(
+                (
+                    revision
+                    for revision in wiki_page.revisions
+                    if revision.revision_id == previous
+                ),
+                None,
+            )
+            merged_content = None
+            if base_revision is not None:
+                merged_content = merge_text(
+                    base_revision.content,
+                    content,
+                    wiki_page.latest.content,
+                )
+            if merged_content is None:
+                return FakeResponse(
+                    409,
+                    {"reason": "EDIT_CONFLICT", "message": "Conflict"},
+                )
+            content = merged_content
+        self.edit_wiki_page(
+            subreddit,
+            page_name,
+            content,
+            author=username,
+            reason=data.get("reason", ""),
+        )
+        return FakeResponse(200, {})
+
+    # ---- Widgets ----
+
+    def get_widgets(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Get a subreddit's sidebar and top bar widgets."""
+        subreddit = self.get_subreddit(path_args[0])
+        if subreddit is None:
+            return make_error(404, "Not Found")
+        return FakeResponse(
+            200,
+            {
+                "items": {
+                    widget_id: widget.to_json()
+                    for widget_id, widget in subreddit.widgets.items()
+                },
+                "layout": {
+                    "idCardWidget": None,
+                    "moderatorWidget": None,
+                    "sidebar": {"order": list(subreddit.sidebar)},
+                    "topbar": {"order": list(subreddit.topbar)},
+                },
+            },
+        )
+
+    def put_widget(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Update the fields of a widget."""
+        subreddit = self.get_subreddit(path_args[0])
+        if subreddit is None:
+            return make_error(404, "Not Found")
+        if not subreddit.has_mod_permission(username, MOD_PERMISSION_CONFIG):
+            return make_error(403, "Forbidden")
+        widget = subreddit.widgets.get(path_args[1], None)
+        if widget is None:
+            return make_error(404, "Not Found")
+        widget_fields = json.loads(data.get("json", "{}"))
+        for key in ("id", "kind"):
+            widget_fields.pop(key, None)
+        widget.fields.update(widget_fields)
+        subreddit.log_mod_action(username, "community_widgets")
+        return FakeResponse(200, widget.to_json())
+
+    # ---- Submissions and comments ----
+
+    def get_submission_or_comment(
+        self,
+        fullname: str,
+    ) -> FakeSubmission | FakeComment | None:
+        """Get a submission or comment by its fullname, if it exists."""
+        kind, __, thing_id = fullname.partition("_")
+        if kind == "t3":
+            return self.submissions.get(thing_id, None)
+        if kind == "t1":
+            return self.comments.get(thing_id, None)
+        return None
+
+    def is_stickied(self, submission: FakeSubmission) -> bool:
+        """Check if a submission is currently pinned in its subreddit."""
+        subreddit = self.get_subreddit(submission.subreddit)
+        return bool(
+            subreddit and submission.submission_id in subreddit.stickies,
+        )
+
+    def get_submission(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Get a submission and its comments."""
+        submission = self.submissions.get(path_args[0], None)
+        if submission is None:
+            return make_error(404, "Not Found")
+        return FakeResponse(
+            200,
+            [
+                make_listing(
+                    [
+                        {
+                            "kind": "t3",
+                            "data": submission.to_json(
+                                stickied=self.is_stickied(submission),
+                            ),
+                        },
+                    ],
+                ),
+                make_listing(
+                    [
+                        {"kind": "t1", "data": comment.to_json()}
+                        for comment in submission.comments
+                    ],
+                ),
+            ],
+        )
+
+    def get_info(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Get the submissions and comments with the given fullnames."""
+        children: list[JSONData] = []
+        for fullname in data.get("id", "").split(","):
+            thing = self.get_submission_or_comment(fullname)
+            if isinstance(thing, FakeSubmission):
+                children.append(
+                    {
+                        "kind": "t3",
+                        "data": thing.to_json(
+                            stickied=self.is_stickied(thing),
+                        ),
+                    },
+                )
+            elif isinstance(thing, FakeComment):
+                children.append({"kind": "t1", "data": thing.to_json()})
+        return FakeResponse(200, make_listing(children))
+
+    def get_sticky(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Redirect to the pinned post in the given slot, if any."""
+        subreddit = self.get_subreddit(path_args[0])
+        if subreddit is None:
+            return make_error(404, "Not Found")
+        sticky_index = int(data.get("num", 1) or 1) - 1
+        if sticky_index >= len(subreddit.stickies):
+            return make_error(404, "Not Found")
+        submission = self.submissions[subreddit.stickies[sticky_index]]
+        return FakeResponse(
+            302,
+            None,
+            {"location": f"https://www.reddit.com{submission.permalink}"},
+        )
+
+    def post_submit(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Submit a new self post."""
+        subreddit = self.get_subreddit(data.get("sr", ""))
+        if subreddit is None:
+            return make_error(404, "Not Found")
+        submission = self.add_submission(
+            subreddit,
+            username,
+            data.get("title", ""),
+            data.get("text", ""),
+        )
+        return FakeResponse(
+            200,
+            {
+                "json": {
+                    "data": {
+                        "id": submission.submission_id,
+                        "name": submission.fullname,
+                        "url": submission.to_json()["url"],
+                    },
+                    "errors": [],
+                },
+            },
+        )
+
+    def post_edit(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Edit the text of a submission or comment."""
+        thing = self.get_submission_or_comment(data.get("thing_id", ""))
+        if thing is None:
+            return make_error(404, "Not Found")
+        if thing.author.lower() != username.lower():
+            return make_error(403, "Forbidden")
+        if isinstance(thing, FakeComment):
+            thing.body = data.get("text", "")
+            return FakeResponse(200, make_things("t1", thing.to_json()))
+        thing.selftext = data.get("text", "")
+        thing.edited = time.time()
+        return FakeResponse(200, make_things("t3", thing.to_json()))
+
+    def post_comment(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Reply to a submission."""
+        submission = self.get_submission_or_comment(data.get("thing_id", ""))
+        if not isinstance(submission, FakeSubmission):
+            return make_error(404, "Not Found")
+        comment = FakeComment(
+            to_base36(self._next_id()),
+            username,
+            data.get("text", ""),
+            submission.fullname,
+        )
+        submission.comments.append(comment)
+        self.comments[comment.comment_id] = comment
+        return FakeResponse(200, make_things("t1", comment.to_json()))
+
+    def get_moderated_thing(
+        self,
+        username: str,
+        fullname: str,
+    ) -> FakeSubmission | FakeComment | FakeResponse:
+        """Get a thing the user can moderate, or the error response."""
+        thing = self.get_submission_or_comment(fullname)
+        if thing is None:
+            return make_error(404, "Not Found")
+        subreddit_name = (
+            thing.subreddit
+            if isinstance(thing, FakeSubmission)
+            else self.submissions[thing.link_id[3:]].subreddit
+        )
+        subreddit = self.get_subreddit(subreddit_name)
+        if subreddit is None or (
+            subreddit.get_mod_permissions(username) is None
+        ):
+            return make_error(403, "Forbidden")
+        return thing
+
+    def post_approve(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Approve a submission."""
+        thing = self.get_moderated_thing(username, data.get("id", ""))
+        if isinstance(thing, FakeResponse):
+            return thing
+        if isinstance(thing, FakeSubmission):
+            thing.approved = True
+        return FakeResponse(200, {})
+
+    def post_distinguish(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Distinguish a comment, and optionally sticky it."""
+        thing = self.get_moderated_thing(username, data.get("id", ""))
+        if isinstance(thing, FakeResponse):
+            return thing
+        if isinstance(thing, FakeComment):
+            thing.distinguished = (
+                None if data.get("how") == "no" else "moderator"
+            )
+            thing.stickied = data.get("sticky") == "True"
+            return FakeResponse(200, make_things("t1", thing.to_json()))
+        return FakeResponse(200, make_things("t3", thing.to_json()))
+
+    def post_sticky(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Pin or unpin a submission in the top or bottom slot."""
+        submission = self.get_moderated_thing(username, data.get("id", ""))
+        if isinstance(submission, FakeResponse):
+            return submission
+        if not isinstance(submission, FakeSubmission):
+            return make_error(400, "Bad Request")
+        subreddit = self.get_subreddit(submission.subreddit)
+        assert subreddit is not None  # nosec
+        stickies = subreddit.stickies
+        if submission.submission_id in stickies:
+            stickies.remove(submission.submission_id)
+        if data.get("state") != "True":
+            return FakeResponse(200, {})
+        if data.get("num") == "1":
+            if len(stickies) > 1:
+                stickies.pop(0)
+            stickies.insert(0, submission.submission_id)
+        else:
+            if len(stickies) > 1:
+                stickies.pop()
+            stickies.append(submission.submission_id)
+        return FakeResponse(200, {})
+
+    def post_send_replies(
+        self,
+        username: str,
+        path_args: tuple[str, ...],
+        data: FormData,
+    ) -> FakeResponse:
+        """Enable or disable inbox replies to a submission."""
+        thing = self.get_submission_or_comment(data.get("id", ""))
+        if isinstance(thing, FakeSubmission):
+            thing.send_replies = data.get("state") == "True"
+        return FakeResponse(200, {})
+
+
+# ---- Transport ----
+
+
+class FakeRedditAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter serving requests from a fake Reddit."""
+
+    def __init__(self, fake_reddit: FakeReddit) -> None:
+        super().__init__()
+        self.fake_reddit = fake_reddit
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Serve the request from the fake Reddit instead of the network."""
+        fake_response = self.fake_reddit.handle_request(
+            request.method or "GET",
+            request.url or "",
+            body=request.body,  # type: ignore[arg-type]
+            headers=request.headers,
+        )
+        response = requests.Response()
+        response.status_code = fake_response.status_code
+        response.headers = requests.structures.CaseInsensitiveDict(
+            {"content-type": "application/json", **fake_response.headers},
+        )
+        response._content = fake_response.content  # noqa: WPS437
+        response.encoding = "utf-8"
+        response.url = request.url or ""
+        response.request = request
+        response.reason = "OK" if response.ok else "Error"
+        return response
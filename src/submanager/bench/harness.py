@@ -0,0 +1,308 @@
+"""Time the core routines against a fake Reddit with synthetic configs."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import contextlib
+import io
+import tempfile
+import time
+import tracemalloc
+from pathlib import (
+    Path,
+)
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    NamedTuple,
+)
+
+# Third party imports
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.bench.fakereddit
+import submanager.bench.synthetic
+import submanager.config.static
+import submanager.config.synthetic
+import submanager.config.utils
+import submanager.core.initialization
+import submanager.core.run
+import submanager.models.config
+import submanager.utils.output
+import submanager.validation.validate
+from submanager.types import (
+    AccountsMap,
+)
+
+SCENARIO_MANAGE: Final[str] = "manage"
+SCENARIO_VALIDATE: Final[str] = "validate"
+SCENARIO_CYCLE_THREADS: Final[str] = "cycle-threads"
+SCENARIOS: Final[tuple[str, ...]] = (
+    SCENARIO_MANAGE,
+    SCENARIO_VALIDATE,
+    SCENARIO_CYCLE_THREADS,
+)
+ITEM_COUNTS_DEFAULT: Final[tuple[int, ...]] = (10, 100, 1000, 5000)
+
+STATIC_CONFIG_FILENAME: Final[str] = "config.json"
+DYNAMIC_CONFIG_FILENAME: Final[str] = "config_dynamic.json"
+
+
+class BenchmarkResult(NamedTuple):
+    """The measured cost of one run of a scenario."""
+
+    scenario: str
+    item_count: int
+    wall_time_s: float
+    request_counts: Dict[str, int]
+    peak_memory_bytes: int
+
+    @property
+    def request_count(self) -> int:
+        """Get the total number of requests made to Reddit."""
+        return sum(self.request_counts.values())
+
+
+class BenchmarkContext(NamedTuple):
+    """Everything a scenario needs to run against a fake Reddit."""
+
+    fake_reddit: submanager.bench.fakereddit.FakeReddit
+    config_paths: submanager.models.config.ConfigPaths
+    static_config: submanager.models.config.StaticConfig
+    http_adapter: submanager.bench.fakereddit.FakeRedditAdapter
+    accounts: AccountsMap
+
+
+def setup_context(
+    scenario: str,
+    item_count: int,
+    config_dir: Path,
+    *,
+    latency_s: float = 0,
+    rate_limit: int | None = None,
+) -> BenchmarkContext:
+    """Seed a fake Reddit and write a synthetic config for a scenario."""
+    fake_reddit = submanager.bench.fakereddit.FakeReddit(
+        latency_s=latency_s,
+        rate_limit=rate_limit,
+    )
+    thread_count = item_count if scenario == SCENARIO_CYCLE_THREADS else 0
+    raw_config = submanager.bench.synthetic.seed_synthetic_data(
+        fake_reddit,
+        submanager.config.synthetic.generate_synthetic_config(
+            submanager.config.synthetic.SyntheticConfigOptions(
+                item_count=0 if thread_count else item_count,
+                thread_count=thread_count,
+            ),
+        ),
+    )
+    config_paths = submanager.models.config.ConfigPaths(
+        dynamic=config_dir / DYNAMIC_CONFIG_FILENAME,
+        static=config_dir / STATIC_CONFIG_FILENAME,
+    )
+    submanager.config.utils.write_config(
+        raw_config,
+        config_path=config_paths.static,
+    )
+    static_config = submanager.config.static.render_static_config(raw_config)
+    http_adapter = submanager.bench.fakereddit.FakeRedditAdapter(fake_reddit)
+    accounts = submanager.core.initialization.setup_accounts(
+        static_config.accounts,
+        rate_limit_config=static_config.rate_limit,
+        http_adapter=http_adapter,
+    )
+    return BenchmarkContext(
+        fake_reddit=fake_reddit,
+        config_paths=config_paths,
+        static_config=static_config,
+        http_adapter=http_adapter,
+        accounts=accounts,
+    )
+
+
+def run_manage(context: BenchmarkContext) -> None:
+    """Run the manage loop once, syncing every item."""
+    submanager.core.run.run_manage_once(
+        context.static_config,
+        context.accounts,
+        config_path_dynamic=context.config_paths.dynamic,
+        target_cache_path=context.config_paths.target_cache,
+    )
+
+
+def run_validate(context: BenchmarkContext) -> None:
+    """Validate the config, including every endpoint, without the cache."""
+    submanager.validation.validate.validate_config(
+        context.config_paths,
+        http_adapter=context.http_adapter,
+    )
+
+
+def run_cycle_threads(context: BenchmarkContext) -> None:
+    """Post a new thread for every managed thread."""
+    submanager.core.run.cycle_threads(
+        context.static_config,
+        context.accounts,
+        thread_keys=context.static_config.thread_manager.items.keys(),
+        config_path_dynamic=context.config_paths.dynamic,
+    )
+
+
+SCENARIO_FUNCTIONS: Final[dict[str, Callable[[BenchmarkContext], None]]] = {
+    SCENARIO_MANAGE: run_manage,
+    SCENARIO_VALIDATE: run_validate,
+    SCENARIO_CYCLE_THREADS: run_cycle_threads,
+}
+
+# Run once untimed first, so the old threads' links are updated when timed
+SCENARIOS_WARMUP: Final[frozenset[str]] = frozenset((SCENARIO_CYCLE_THREADS,))
+
+
+class ScenarioRun(NamedTuple):
+    """The measurements taken during a single run of a scenario."""
+
+    wall_time_s: float
+    request_counts: Dict[str, int]
+    peak_memory_bytes: int
+
+
+def run_scenario_once(
+    scenario: str,
+    item_count: int,
+    *,
+    trace_memory: bool = False,
+    latency_s: float = 0,
+    rate_limit: int | None = None,
+) -> ScenarioRun:
+    """Set up and run a scenario on a fresh fake Reddit, measuring it."""
+    scenario_function = SCENARIO_FUNCTIONS[scenario]
+    peak_memory_bytes = 0
+    with tempfile.TemporaryDirectory() as config_dir:
+        context = setup_context(
+            scenario,
+            item_count,
+            Path(config_dir),
+            latency_s=latency_s,
+            rate_limit=rate_limit,
+        )
+        # Silence the routines' own progress output so it isn't timed
+        with contextlib.redirect_stdout(io.StringIO()):
+            if scenario in SCENARIOS_WARMUP:
+                scenario_function(context)
+            context.fake_reddit.reset_request_log()
+
+            if trace_memory:
+                tracemalloc.start()
+            start_time = time.perf_counter()
+            try:
+                scenario_function(context)
+                wall_time_s = time.perf_counter() - start_time
+                if trace_memory:
+                    __, peak_memory_bytes = tracemalloc.get_traced_memory()
+            finally:
+                if trace_memory:
+                    tracemalloc.stop()
+
+    return ScenarioRun(
+        wall_time_s=wall_time_s,
+        request_counts=dict(context.fake_reddit.get_request_counts()),
+        peak_memory_bytes=peak_memory_bytes,
+    )
+
+
+def run_scenario(
+    scenario: str,
+    item_count: int,
+    *,
+    measure_memory: bool = True,
+    latency_s: float = 0,
+    rate_limit: int | None = None,
+) -> BenchmarkResult:
+    """Run a scenario, measuring its time, requests and peak memory.
+
+    Tracing allocations slows Python down several-fold, so the memory is
+    measured in a separate run from the one that's timed.
+    """
+    if scenario not in SCENARIO_FUNCTIONS:
+        raise KeyError(f"Scenario {scenario!r} not found in {SCENARIOS}")
+    timed_run = run_scenario_once(
+        scenario,
+        item_count,
+        latency_s=latency_s,
+        rate_limit=rate_limit,
+    )
+    peak_memory_bytes = 0
+    if measure_memory:
+        peak_memory_bytes = run_scenario_once(
+            scenario,
+            item_count,
+            trace_memory=True,
+            latency_s=latency_s,
+            rate_limit=rate_limit,
+        ).peak_memory_bytes
+
+    return BenchmarkResult(
+        scenario=scenario,
+        item_count=item_count,
+        wall_time_s=timed_run.wall_time_s,
+        request_counts=timed_run.request_counts,
+        peak_memory_bytes=peak_memory_bytes,
+    )
+
+
+def run_benchmarks(
+    scenarios: Collection[str] = SCENARIOS,
+    item_counts: Collection[int] = ITEM_COUNTS_DEFAULT,
+    *,
+    measure_memory: bool = True,
+    latency_s: float = 0,
+    rate_limit: int | None = None,
+    verbose: bool = False,
+) -> list[BenchmarkResult]:
+    """Run each scenario at each config size."""
+    vprint = submanager.utils.output.VerbosePrinter(enable=verbose)
+    vprint(format_header())
+    results = []
+    for scenario in scenarios:
+        for item_count in item_counts:
+            result = run_scenario(
+                scenario,
+                item_count,
+                measure_memory=measure_memory,
+                latency_s=latency_s,
+                rate_limit=rate_limit,
+            )
+            vprint(format_result(result))
+            results.append(result)
+    return results
+
+
+def format_header() -> str:
+    """Format the header of the table of measurements."""
+    return (
+        f"{'Scenario':<14} {'Items':>6} {'Time (s)':>10} "
+        f"{'Requests':>9} {'Peak (MB)':>10}"
+    )
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """Format the measurements of one run as a table row."""
+    return (
+        f"{result.scenario:<14} {result.item_count:>6} "
+        f"{result.wall_time_s:>10.3f} {result.request_count:>9} "
+        f"{result.peak_memory_bytes / 2**20:>10.1f}"
+    )
+
+
+def format_results(results: Collection[BenchmarkResult]) -> str:
+    """Format the measurements of each run as a table."""
+    return "\n".join(
+        [format_header(), *(format_result(result) for result in results)],
+    )
@@ -0,0 +1,215 @@
+"""Replay a recorded cassette offline and compare the requests made."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import collections
+import contextlib
+import io
+import tempfile
+from pathlib import (
+    Path,
+)
+from typing import (
+    Collection,
+    NamedTuple,
+)
+
+# Third party imports
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.bench.harness
+import submanager.config.static
+import submanager.config.utils
+import submanager.core.cassette
+import submanager.core.initialization
+import submanager.core.run
+import submanager.models.config
+from submanager.constants import (
+    CONFIG_PATH_STATIC,
+)
+from submanager.types import (
+    PathLikeStr,
+)
+
+ITEM_UNLABELED: Final[str] = "(none)"
+
+
+class ItemRequestStats(NamedTuple):
+    """The requests made for one item when recorded and when replayed."""
+
+    item: str
+    recorded_count: int
+    replayed_count: int
+    recorded_time_s: float
+    replayed_time_s: float
+
+    @property
+    def count_delta(self) -> int:
+        """Get the change in the number of requests made for the item."""
+        return self.replayed_count - self.recorded_count
+
+    @property
+    def time_delta_s(self) -> float:
+        """Get the change in the time spent on requests for the item."""
+        return self.replayed_time_s - self.recorded_time_s
+
+
+class ReplayResult(NamedTuple):
+    """The requests made during a run, as recorded and as replayed."""
+
+    recorded: submanager.models.config.Cassette
+    replayed: submanager.models.config.Cassette
+
+    @property
+    def item_stats(self) -> list[ItemRequestStats]:
+        """Get the request counts and times of each item, sorted by item."""
+        return compare_cassettes(self.recorded, self.replayed)
+
+
+def summarize_cassette(
+    cassette: submanager.models.config.Cassette,
+) -> dict[str, tuple[int, float]]:
+    """Get the number of and time taken by each item's requests."""
+    counts: collections.Counter[str] = collections.Counter()
+    times: collections.defaultdict[str, float] = collections.defaultdict(
+        float,
+    )
+    for interaction in cassette.interactions:
+        item = interaction.item or ITEM_UNLABELED
+        counts[item] += 1
+        times[item] += interaction.duration_s
+    return {item: (count, times[item]) for item, count in counts.items()}
+
+
+def compare_cassettes(
+    recorded: submanager.models.config.Cassette,
+    replayed: submanager.models.config.Cassette,
+) -> list[ItemRequestStats]:
+    """Compare the requests made for each item between two cassettes."""
+    recorded_summary = summarize_cassette(recorded)
+    replayed_summary = summarize_cassette(replayed)
+    item_stats = []
+    for item in sorted(recorded_summary.keys() | replayed_summary.keys()):
+        recorded_count, recorded_time_s = recorded_summary.get(item, (0, 0))
+        replayed_count, replayed_time_s = replayed_summary.get(item, (0, 0))
+        item_stats.append(
+            ItemRequestStats(
+                item=item,
+                recorded_count=recorded_count,
+                replayed_count=replayed_count,
+                recorded_time_s=recorded_time_s,
+                replayed_time_s=replayed_time_s,
+            ),
+        )
+    return item_stats
+
+
+def get_regressions(result: ReplayResult) -> list[ItemRequestStats]:
+    """Get the items that made more requests than when recorded.
+
+    Per-account lookups (e.g. tokens) are excluded, as which item makes them
+    depends on how the concurrent requests happen to be scheduled.
+    """
+    return [
+        item_stats
+        for item_stats in result.item_stats
+        if item_stats.count_delta > 0
+        and item_stats.item != submanager.core.cassette.ITEM_ACCOUNT
+    ]
+
+
+def replay_cassette(
+    cassette_path: PathLikeStr,
+    config_path_static: PathLikeStr = CONFIG_PATH_STATIC,
+    *,
+    replay_latency: bool = True,
+) -> ReplayResult:
+    """Run the manage loop once against a cassette instead of Reddit."""
+    cassette = submanager.core.cassette.load_cassette(cassette_path)
+    static_config = submanager.config.static.load_static_config(
+        config_path_static,
+    )
+    player = submanager.core.cassette.CassettePlayer(
+        cassette,
+        replay_latency=replay_latency,
+    )
+    with tempfile.TemporaryDirectory() as config_dir:
+        # Start from the state the recorded run did, without touching it
+        config_paths = submanager.models.config.ConfigPaths(
+            dynamic=(
+                Path(config_dir)
+                / submanager.bench.harness.DYNAMIC_CONFIG_FILENAME
+            ),
+        )
+        for state, state_path in (
+            (cassette.dynamic_config, config_paths.dynamic),
+            (cassette.target_cache, config_paths.target_cache),
+        ):
+            if state:
+                submanager.config.utils.write_config(
+                    state,
+                    config_path=state_path,
+                )
+
+        accounts = submanager.core.initialization.setup_accounts(
+            static_config.accounts,
+            rate_limit_config=static_config.rate_limit,
+            cassette=player,
+            reddit_url=static_config.http.reddit_url,
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            submanager.core.run.run_manage_once(
+                static_config,
+                accounts,
+                config_path_dynamic=config_paths.dynamic,
+                target_cache_path=config_paths.target_cache,
+            )
+
+    return ReplayResult(recorded=cassette, replayed=player.finish())
+
+
+def format_item_stats(item_stats: ItemRequestStats) -> str:
+    """Format the requests made for one item as a table row."""
+    flag = "*" if item_stats.count_delta else " "
+    return (
+        f"{flag}{item_stats.item:<44} {item_stats.recorded_count:>8} "
+        f"{item_stats.replayed_count:>8} {item_stats.count_delta:>+6} "
+        f"{item_stats.recorded_time_s:>9.3f} "
+        f"{item_stats.replayed_time_s:>9.3f} "
+        f"{item_stats.time_delta_s:>+9.3f}"
+    )
+
+
+def format_replay_result(result: ReplayResult) -> str:
+    """Format the per-item comparison of a replay as a table."""
+    item_stats: Collection[ItemRequestStats] = result.item_stats
+    total_stats = ItemRequestStats(
+        "Total",
+        len(result.recorded.interactions),
+        len(result.replayed.interactions),
+        sum(stats.recorded_time_s for stats in item_stats),
+        sum(stats.replayed_time_s for stats in item_stats),
+    )
+    header = (
+        f" {'Item':<44} {'Recorded':>8} {'Replayed':>8} {'Delta':>6} "
+        f"{'Rec (s)':>9} {'Rep (s)':>9} {'Delta (s)':>9}"
+    )
+    wall_time = (
+        f"Wall time: {result.recorded.wall_time_s:.3f} s recorded, "
+        f"{result.replayed.wall_time_s:.3f} s replayed"
+    )
+    return "\n".join(
+        [
+            header,
+            *(format_item_stats(stats) for stats in item_stats),
+            format_item_stats(total_stats),
+            wall_time,
+        ],
+    )
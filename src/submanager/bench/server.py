@@ -0,0 +1,140 @@
+"""Serve a fake Reddit over HTTP, for soak testing a running Sub Manager."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import http.server
+import threading
+import time
+from types import (
+    TracebackType,
+)
+
+# Third party imports
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.bench.fakereddit
+
+HOST_DEFAULT: Final[str] = "127.0.0.1"
+
+
+class FakeRedditRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Handle each HTTP request by passing it to the server's fake Reddit."""
+
+    # Keep connections alive, as Reddit does, so the pool is exercised
+    protocol_version = "HTTP/1.1"
+    server: FakeRedditServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Serve a GET request."""
+        self.serve_request()
+
+    def do_PATCH(self) -> None:  # noqa: N802
+        """Serve a PATCH request."""
+        self.serve_request()
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Serve a POST request."""
+        self.serve_request()
+
+    def do_PUT(self) -> None:  # noqa: N802
+        """Serve a PUT request."""
+        self.serve_request()
+
+    def serve_request(self) -> None:
+        """Serve a request from the fake Reddit and write the response."""
+        content_length = int(self.headers.get("Content-Length", 0) or 0)
+        body = self.rfile.read(content_length) if content_length else None
+        fake_response = self.server.fake_reddit.handle_request(
+            self.command,
+            f"http://{self.headers.get('Host', '')}{self.path}",
+            body=body,
+            headers=dict(self.headers.items()),
+        )
+        content = fake_response.content
+        self.send_response(fake_response.status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for header_name, header_value in fake_response.headers.items():
+            self.send_header(header_name, header_value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: WPS125
+        """Don't log each request, as there can be many thousands of them."""
+
+
+class FakeRedditServer(http.server.ThreadingHTTPServer):
+    """A local HTTP server emulating the Reddit API with a fake Reddit."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        fake_reddit: submanager.bench.fakereddit.FakeReddit,
+        host: str = HOST_DEFAULT,
+        port: int = 0,
+    ) -> None:
+        super().__init__((host, port), FakeRedditRequestHandler)
+        self.fake_reddit = fake_reddit
+        self.start_time = time.monotonic()
+        self._serve_thread: threading.Thread | None = None
+
+    def __enter__(self) -> FakeRedditServer:
+        """Start serving requests and return the server."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop serving requests."""
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Get the base URL to point Sub Manager's http.reddit_url at."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port!s}"
+
+    def start(self) -> None:
+        """Start serving requests in a background thread."""
+        self._serve_thread = threading.Thread(
+            target=self.serve_forever,
+            name="fake-reddit-server",
+            daemon=True,
+        )
+        self._serve_thread.start()
+
+    def stop(self) -> None:
+        """Stop serving requests and close the socket."""
+        if self._serve_thread is not None:
+            self.shutdown()
+            self._serve_thread.join()
+            self._serve_thread = None
+        self.server_close()
+
+    def format_throughput(self) -> str:
+        """Summarize and reset the requests served since last called."""
+        now = time.monotonic()
+        elapsed_s = max(now - self.start_time, 1e-9)
+        request_counts = self.fake_reddit.pop_request_counts()
+        self.start_time = now
+        request_count = sum(request_counts.values())
+        top_routes = ", ".join(
+            f"{route}={count}"
+            for route, count in request_counts.most_common(5)
+        )
+        return (
+            f"{request_count} requests in {elapsed_s:.1f} s "
+            f"({request_count / elapsed_s:.1f}/s): {top_routes}"
+        )
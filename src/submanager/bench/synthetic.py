@@ -0,0 +1,199 @@
+"""Seed a fake Reddit with the data a synthetic config points at."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import random
+
+# Third party imports
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.bench.fakereddit
+import submanager.config.static
+import submanager.endpoint.permissions
+import submanager.enums
+import submanager.models.base
+import submanager.models.config
+from submanager.types import (
+    ConfigDict,
+    StrMap,
+)
+
+SYNTHETIC_PARAGRAPHS: Final[int] = 8
+SYNTHETIC_LINK: Final[str] = "https://old.reddit.com/r/SubManagerBench/"
+
+
+def generate_text(
+    title: str,
+    version: int = 0,
+    paragraph_count: int = SYNTHETIC_PARAGRAPHS,
+) -> str:
+    """Generate some Markdown text for a synthetic page or thread."""
+    paragraphs = [f"# {title}", ""]
+    for paragraph_n in range(paragraph_count):
+        paragraphs += [
+            (
+                f"Paragraph {paragraph_n} of {title} (version {version}), "
+                f"with a [link]({SYNTHETIC_LINK}) and some filler text."
+            ),
+            "",
+        ]
+    return "\n".join(paragraphs)
+
+
+# ---- Seeding from a config ----
+
+
+class SyntheticDataSeeder:
+    """Create everything a static config refers to on a fake Reddit."""
+
+    def __init__(
+        self,
+        fake_reddit: submanager.bench.fakereddit.FakeReddit,
+        static_config: submanager.models.config.StaticConfig,
+        *,
+        seed: int = 0,
+    ) -> None:
+        self.fake_reddit = fake_reddit
+        self.static_config = static_config
+        self.rng = random.Random(seed)
+        self._seeded: set[
+            tuple[str, submanager.enums.EndpointType, str]
+        ] = set()
+
+    def get_subreddit(
+        self,
+        context: submanager.models.base.ContextConfig,
+    ) -> submanager.bench.fakereddit.FakeSubreddit:
+        """Get a subreddit, adding it modded by every account if needed."""
+        subreddit = self.fake_reddit.get_subreddit(context.subreddit)
+        if subreddit is None:
+            subreddit = self.fake_reddit.add_subreddit(
+                context.subreddit,
+                {
+                    account_key: [
+                        submanager.endpoint.permissions.MOD_PERMISSION_ALL,
+                    ]
+                    for account_key in self.static_config.accounts
+                },
+            )
+        return subreddit
+
+    def generate_text(self, title: str) -> str:
+        """Generate text of a randomly varying length for an endpoint."""
+        return generate_text(
+            title,
+            paragraph_count=self.rng.randint(1, SYNTHETIC_PARAGRAPHS * 2),
+        )
+
+    def seed_endpoint(
+        self,
+        endpoint_config: submanager.models.config.EndpointTypeConfig,
+        *,
+        is_source: bool = True,
+    ) -> None:
+        """Create the page, widget or thread the endpoint refers to."""
+        endpoint_type = endpoint_config.endpoint_type
+        context = endpoint_config.context
+        endpoint_key = (
+            context.subreddit.lower(),
+            endpoint_type,
+            endpoint_config.endpoint_name,
+        )
+        if endpoint_key in self._seeded:
+            return
+        self._seeded.add(endpoint_key)
+
+        subreddit = self.get_subreddit(context)
+        content = (
+            self.generate_text(endpoint_config.endpoint_name)
+            if is_source
+            else ""
+        )
+        if endpoint_type == submanager.enums.EndpointType.WIKI_PAGE:
+            self.fake_reddit.edit_wiki_page(
+                subreddit,
+                endpoint_config.endpoint_name,
+                content,
+                author=context.account,
+            )
+        elif endpoint_type == submanager.enums.EndpointType.WIDGET:
+            self.fake_reddit.add_widget(
+                subreddit,
+                "textarea",
+                shortName=endpoint_config.endpoint_name,
+                styles={"backgroundColor": "", "headerColor": ""},
+                text=content,
+            )
+        elif endpoint_type == submanager.enums.EndpointType.THREAD:
+            self.fake_reddit.add_submission(
+                subreddit,
+                context.account,
+                endpoint_config.description or endpoint_config.endpoint_name,
+                content,
+                submission_id=endpoint_config.endpoint_name,
+            )
+        elif endpoint_type == submanager.enums.EndpointType.MENU:
+            # Each subreddit has a single menu, shared by any menu endpoints
+            self._seeded.add((context.subreddit.lower(), endpoint_type, ""))
+            if not any(
+                subreddit.widgets[widget_id].kind == "menu"
+                for widget_id in subreddit.topbar
+            ):
+                self.fake_reddit.add_widget(
+                    subreddit,
+                    "menu",
+                    topbar=True,
+                    data=[],
+                    showWiki=False,
+                )
+
+    def seed(self) -> dict[str, StrMap]:
+        """Seed every endpoint, returning the PRAW config of each account."""
+        account_configs: dict[str, StrMap] = {
+            account_key: self.fake_reddit.add_account(account_key)
+            for account_key in self.static_config.accounts
+        }
+        for sync_item in self.static_config.sync_manager.items.values():
+            self.seed_endpoint(sync_item.source)
+            for target_config in sync_item.targets.values():
+                self.seed_endpoint(target_config, is_source=False)
+        for thread_item in self.static_config.thread_manager.items.values():
+            self.seed_endpoint(thread_item.source)
+            subreddit = self.get_subreddit(thread_item.context)
+            for page_name in thread_item.link_update_pages:
+                self.fake_reddit.edit_wiki_page(
+                    subreddit,
+                    page_name,
+                    "",
+                    author=thread_item.context.account,
+                )
+        return account_configs
+
+
+def seed_synthetic_data(
+    fake_reddit: submanager.bench.fakereddit.FakeReddit,
+    raw_config: ConfigDict,
+    *,
+    seed: int = 0,
+) -> ConfigDict:
+    """Seed the fake Reddit from a config, pointing its accounts at it."""
+    static_config = submanager.config.static.render_static_config(raw_config)
+    account_configs = SyntheticDataSeeder(
+        fake_reddit,
+        static_config,
+        seed=seed,
+    ).seed()
+    return {
+        **raw_config,
+        "accounts": {
+            account_key: {"config": account_config}
+            for account_key, account_config in account_configs.items()
+        },
+    }
@@ -0,0 +1,368 @@
+"""Micro-benchmark the text processing run on every synced page."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import json
+import timeit
+from pathlib import (
+    Path,
+)
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    NamedTuple,
+)
+
+# Third party imports
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.config.utils
+import submanager.models.config
+import submanager.sync.menu
+import submanager.sync.processing
+import submanager.sync.utils
+import submanager.thread.creation
+from submanager.types import (
+    PathLikeStr,
+)
+
+# Reddit's maximum wiki page size
+WIKI_MAX_BYTES: Final[int] = 512 * 1024
+SIZES_BYTES_DEFAULT: Final[tuple[int, ...]] = (
+    1024,
+    16 * 1024,
+    128 * 1024,
+    WIKI_MAX_BYTES,
+)
+
+MARKER_COUNT: Final[int] = 50
+MARKED_SECTION_MIN_BYTES: Final[int] = 256
+MENU_CHILD_COUNT: Final[int] = 5
+REPLACE_RULE_COUNT: Final[int] = 100
+THREAD_LINK_COUNT: Final[int] = 20
+
+REPEAT_COUNT: Final[int] = 5
+MIN_MEASURE_TIME_S: Final[float] = 0.2
+REGRESSION_THRESHOLD_DEFAULT: Final[float] = 1.5
+
+SYNTHETIC_LINK: Final[str] = "https://old.reddit.com/r/SubManagerBench/"
+THREAD_PERMALINK: Final[str] = "/r/SubManagerBench/comments/abc{n}/thread_{n}"
+THREAD_SHORTLINK: Final[str] = "https://redd.it/abc{n}"
+
+BenchmarkFunction = Callable[[], object]
+
+
+class TextBenchmarkResult(NamedTuple):
+    """The time one text benchmark case took on an input of a given size."""
+
+    case: str
+    size_bytes: int
+    time_s: float
+
+    @property
+    def key(self) -> str:
+        """Get the key identifying the case and size in a baseline."""
+        return format_key(self.case, self.size_bytes)
+
+
+class TextBenchmarkComparison(NamedTuple):
+    """A benchmark result compared against its stored baseline."""
+
+    result: TextBenchmarkResult
+    baseline_time_s: float | None
+
+    @property
+    def ratio(self) -> float | None:
+        """Get how many times slower the result was than the baseline."""
+        if not self.baseline_time_s:
+            return None
+        return self.result.time_s / self.baseline_time_s
+
+
+def format_key(case: str, size_bytes: int) -> str:
+    """Format the key identifying a case and size in a baseline."""
+    return f"{case}@{size_bytes}"
+
+
+# ---- Synthetic inputs ----
+
+
+def fill_to_size(parts: list[str], size_bytes: int) -> str:
+    """Repeat the parts cyclically until the text reaches the given size."""
+    text_parts: list[str] = []
+    text_size = 0
+    while text_size < size_bytes:
+        part = parts[len(text_parts) % len(parts)]
+        text_parts.append(part)
+        text_size += len(part) + 1
+    return "\n".join(text_parts)[:size_bytes]
+
+
+def get_marker_count(size_bytes: int) -> int:
+    """Get how many marked sections to put in a page of the given size."""
+    return max(min(MARKER_COUNT, size_bytes // MARKED_SECTION_MIN_BYTES), 1)
+
+
+def generate_page_text(size_bytes: int) -> str:
+    """Generate a wiki page with many marked sections, links and rules."""
+    paragraphs = [
+        f"Paragraph {paragraph_n} with a [link]({SYNTHETIC_LINK}"
+        f"wiki/page_{paragraph_n}) and rule_{paragraph_n} to replace, "
+        f"plus links to {THREAD_SHORTLINK.format(n=paragraph_n)} and "
+        f"https://www.reddit.com{THREAD_PERMALINK.format(n=paragraph_n)}."
+        for paragraph_n in range(REPLACE_RULE_COUNT)
+    ]
+    marker_count = get_marker_count(size_bytes)
+    sections = []
+    for section_n in range(marker_count):
+        sections += [
+            submanager.sync.utils.PATTERN_TEMPLATE.format(
+                pattern=f"Section {section_n} Start",
+            ),
+            fill_to_size(paragraphs[section_n:], size_bytes // marker_count),
+            submanager.sync.utils.PATTERN_TEMPLATE.format(
+                pattern=f"Section {section_n} End",
+            ),
+        ]
+    return "\n".join(sections)
+
+
+def generate_menu_text(size_bytes: int) -> str:
+    """Generate menu source text with many sections and children."""
+    sections = []
+    section_n = 0
+    text_size = 0
+    while text_size < size_bytes:
+        children = [
+            f"* [Child {section_n}.{child_n}]({SYNTHETIC_LINK}{child_n})"
+            for child_n in range(MENU_CHILD_COUNT)
+        ]
+        section = "\n".join([f"[Section {section_n}](", *children])
+        sections.append(section)
+        text_size += len(section) + 2
+        section_n += 1
+    return "\n\n".join(sections)
+
+
+def generate_replace_rules() -> dict[str, str]:
+    """Generate many replace rules, as a large config might have."""
+    return {
+        f"rule_{rule_n}": f"replacement_{rule_n}"
+        for rule_n in range(REPLACE_RULE_COUNT)
+    }
+
+
+def generate_thread_links() -> dict[str, str]:
+    """Generate the old and new links of many managed threads."""
+    links = {}
+    for thread_n in range(THREAD_LINK_COUNT):
+        links[
+            THREAD_PERMALINK.format(n=thread_n).strip("/")
+        ] = THREAD_PERMALINK.format(n=thread_n + THREAD_LINK_COUNT).strip("/")
+        links[THREAD_SHORTLINK.format(n=thread_n)] = THREAD_SHORTLINK.format(
+            n=thread_n + THREAD_LINK_COUNT,
+        )
+    return links
+
+
+# ---- Benchmark cases ----
+
+
+def setup_search_startend(size_bytes: int) -> BenchmarkFunction:
+    """Search for the middle section among many marked sections."""
+    page_text = generate_page_text(size_bytes)
+    section_n = get_marker_count(size_bytes) // 2
+    return lambda: submanager.sync.utils.search_startend(
+        page_text,
+        f"Section {section_n}",
+        " Start",
+        " End",
+    )
+
+
+def setup_replace_patterns(size_bytes: int) -> BenchmarkFunction:
+    """Apply many replace rules to a page."""
+    page_text = generate_page_text(size_bytes)
+    replace_rules = generate_replace_rules()
+    return lambda: submanager.sync.utils.replace_patterns(
+        page_text,
+        replace_rules,
+    )
+
+
+def setup_truncate_lines(size_bytes: int) -> BenchmarkFunction:
+    """Truncate a page to half its lines."""
+    page_text = generate_page_text(size_bytes)
+    lines = max(page_text.count("\n") // 2, 1)
+    return lambda: submanager.sync.utils.truncate_lines(page_text, lines)
+
+
+def setup_handle_endpoint_pattern(size_bytes: int) -> BenchmarkFunction:
+    """Replace the middle marked section of a page with new text."""
+    page_text = generate_page_text(size_bytes)
+    marker_count = get_marker_count(size_bytes)
+    pattern_config = submanager.models.config.PatternConfig(
+        pattern=f"Section {marker_count // 2}",
+    )
+    replace_text = generate_page_text(size_bytes // marker_count)
+    return lambda: submanager.sync.processing.handle_endpoint_pattern(
+        page_text,
+        pattern_config,
+        replace_text,
+    )
+
+
+def setup_parse_menu(size_bytes: int) -> BenchmarkFunction:
+    """Parse a large menu."""
+    menu_text = generate_menu_text(size_bytes)
+    return lambda: submanager.sync.menu.parse_menu(menu_text)
+
+
+def setup_replace_thread_links(size_bytes: int) -> BenchmarkFunction:
+    """Update the links of many threads on a page."""
+    page_text = generate_page_text(size_bytes)
+    thread_links = generate_thread_links()
+    return lambda: submanager.thread.creation.replace_thread_links(
+        page_text,
+        thread_links,
+    )
+
+
+CASE_SETUP_FUNCTIONS: Final[dict[str, Callable[[int], BenchmarkFunction]]] = {
+    "search_startend": setup_search_startend,
+    "replace_patterns": setup_replace_patterns,
+    "truncate_lines": setup_truncate_lines,
+    "handle_endpoint_pattern": setup_handle_endpoint_pattern,
+    "parse_menu": setup_parse_menu,
+    "replace_thread_links": setup_replace_thread_links,
+}
+CASES: Final[tuple[str, ...]] = tuple(CASE_SETUP_FUNCTIONS)
+
+
+# ---- Running and comparing ----
+
+
+def time_function(
+    function: BenchmarkFunction,
+    *,
+    min_time_s: float = MIN_MEASURE_TIME_S,
+    repeat: int = REPEAT_COUNT,
+) -> float:
+    """Get the best time per call over several repeats of many calls."""
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        time_taken_s = timer.timeit(number)
+        if time_taken_s >= min_time_s:
+            break
+        number *= 10 if time_taken_s < min_time_s / 10 else 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_text_benchmarks(
+    cases: Collection[str] = CASES,
+    sizes_bytes: Collection[int] = SIZES_BYTES_DEFAULT,
+    *,
+    min_time_s: float = MIN_MEASURE_TIME_S,
+    repeat: int = REPEAT_COUNT,
+) -> list[TextBenchmarkResult]:
+    """Time each case at each input size."""
+    results = []
+    for case in cases:
+        setup_function = CASE_SETUP_FUNCTIONS[case]
+        for size_bytes in sizes_bytes:
+            time_s = time_function(
+                setup_function(size_bytes),
+                min_time_s=min_time_s,
+                repeat=repeat,
+            )
+            results.append(TextBenchmarkResult(case, size_bytes, time_s))
+    return results
+
+
+def write_baseline(
+    results: Collection[TextBenchmarkResult],
+    baseline_path: PathLikeStr,
+) -> None:
+    """Store the times of each result as a baseline to compare against."""
+    Path(baseline_path).parent.mkdir(parents=True, exist_ok=True)
+    submanager.config.utils.write_config(
+        {result.key: result.time_s for result in results},
+        config_path=baseline_path,
+    )
+
+
+def load_baseline(baseline_path: PathLikeStr) -> Dict[str, float]:
+    """Load the stored times of each case and size."""
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline: Dict[str, float] = json.load(baseline_file)
+    return baseline
+
+
+def compare_to_baseline(
+    results: Collection[TextBenchmarkResult],
+    baseline: Dict[str, float],
+) -> list[TextBenchmarkComparison]:
+    """Compare each result against its time in the baseline, if any."""
+    return [
+        TextBenchmarkComparison(result, baseline.get(result.key, None))
+        for result in results
+    ]
+
+
+def get_regressions(
+    comparisons: Collection[TextBenchmarkComparison],
+    threshold: float = REGRESSION_THRESHOLD_DEFAULT,
+) -> list[TextBenchmarkComparison]:
+    """Get the results slower than the threshold times their baseline."""
+    return [
+        comparison
+        for comparison in comparisons
+        if comparison.ratio is not None and comparison.ratio > threshold
+    ]
+
+
+def format_comparison(
+    comparison: TextBenchmarkComparison,
+    threshold: float = REGRESSION_THRESHOLD_DEFAULT,
+) -> str:
+    """Format a result and its change from the baseline as a table row."""
+    result = comparison.result
+    row = (
+        f"{result.case:<24} {result.size_bytes // 1024:>7} "
+        f"{result.time_s * 1e6:>12.1f}"
+    )
+    ratio = comparison.ratio
+    if ratio is None or comparison.baseline_time_s is None:
+        return row
+    flag = " SLOWER" if ratio > threshold else ""
+    return (
+        f"{row} {comparison.baseline_time_s * 1e6:>12.1f} {ratio:>6.2f}x{flag}"
+    )
+
+
+def format_comparisons(
+    comparisons: Collection[TextBenchmarkComparison],
+    threshold: float = REGRESSION_THRESHOLD_DEFAULT,
+) -> str:
+    """Format the results and any changes from the baseline as a table."""
+    header = f"{'Case':<24} {'KB':>7} {'Time (us)':>12}"
+    if any(comparison.ratio is not None for comparison in comparisons):
+        header += f" {'Base (us)':>12} {'Ratio':>7}"
+    return "\n".join(
+        [
+            header,
+            *(
+                format_comparison(comparison, threshold)
+                for comparison in comparisons
+            ),
+        ],
+    )
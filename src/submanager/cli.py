@@ -20,6 +20,7 @@ from typing import (
 
 # Local imports
 import submanager
+import submanager.config.synthetic
 import submanager.core.commands
 import submanager.core.run
 import submanager.enums
@@ -144,6 +145,104 @@ def create_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Don't raise an error/warning if the config file already exists",
     )
+    parser_generate.add_argument(
+        "--synthetic",
+        action="store_true",
+        help=(
+            "Generate many synthetic items based on the example, for testing "
+            "at scale, shaped by the options below"
+        ),
+    )
+    parser_generate.add_argument(
+        "--items",
+        type=int,
+        metavar="N",
+        help=(
+            "With --synthetic, the number of sync items (default "
+            f"{submanager.config.synthetic.ITEM_COUNT_DEFAULT})"
+        ),
+    )
+    parser_generate.add_argument(
+        "--targets",
+        type=int,
+        metavar="N",
+        help=(
+            "With --synthetic, the number of targets per item (default "
+            f"{submanager.config.synthetic.TARGET_COUNT_DEFAULT})"
+        ),
+    )
+    parser_generate.add_argument(
+        "--threads",
+        type=int,
+        metavar="N",
+        help=(
+            "With --synthetic, the number of managed threads (default "
+            f"{submanager.config.synthetic.THREAD_COUNT_DEFAULT})"
+        ),
+    )
+    parser_generate.add_argument(
+        "--subreddits",
+        type=int,
+        metavar="N",
+        help=(
+            "With --synthetic, the number of subreddits used (default "
+            f"{submanager.config.synthetic.SUBREDDIT_COUNT_DEFAULT})"
+        ),
+    )
+    parser_generate.add_argument(
+        "--accounts",
+        type=int,
+        metavar="N",
+        help=(
+            "With --synthetic, the number of accounts used (default "
+            f"{submanager.config.synthetic.ACCOUNT_COUNT_DEFAULT})"
+        ),
+    )
+    endpoint_types_default = [
+        endpoint_type.value
+        for endpoint_type in submanager.config.synthetic.ENDPOINT_TYPES_DEFAULT
+    ]
+    parser_generate.add_argument(
+        "--endpoint-type",
+        dest="endpoint_types",
+        action="append",
+        choices=[
+            endpoint_type.value
+            for endpoint_type in submanager.enums.EndpointType
+        ],
+        help=(
+            "With --synthetic, an endpoint type to mix in; repeat to add "
+            "more types or weight one more heavily "
+            f"(default {', '.join(endpoint_types_default)})"
+        ),
+    )
+    parser_generate.add_argument(
+        "--shared-sources",
+        type=int,
+        metavar="N",
+        help=(
+            "With --synthetic, share N sources between all the items, "
+            "rather than each item having its own"
+        ),
+    )
+    parser_generate.add_argument(
+        "--seed",
+        type=int,
+        help=(
+            "With --synthetic, the seed to randomly mix endpoint types by "
+            f"(default {submanager.config.synthetic.SEED_DEFAULT})"
+        ),
+    )
+
+    # Show the execution plan
+    plan_desc = "Show the reads and writes of a run and predicted requests"
+    parser_plan = subparsers.add_parser(
+        "plan",
+        description=plan_desc,
+        help=plan_desc,
+        argument_default=argparse.SUPPRESS,
+    )
+    parser_plan.set_defaults(func=submanager.core.commands.run_show_plan)
 
     # Validate the config file
     validate_desc = "Validate the bot's config files"
@@ -187,6 +286,48 @@ def create_arg_parser() -> argparse.ArgumentParser:
         help="The keys of the threads to cycle, as listed in the config",
     )
 
+    # Sync the indicated items now
+    sync_desc = "Sync the sync and thread item(s) passed now"
+    parser_sync = subparsers.add_parser(
+        "sync",
+        description=sync_desc,
+        help=sync_desc,
+        argument_default=argparse.SUPPRESS,
+    )
+    parser_sync.set_defaults(func=submanager.core.run.run_sync_items)
+    parser_sync.add_argument(
+        "item_keys",
+        nargs="+",
+        help="The keys of the items to sync, as listed in the config",
+    )
+    parser_sync.add_argument(
+        "--resync-all",
+        action="store_true",
+        help="Resync the items even if the source hasn't been modified",
+    )
+
+    # Get the status of the running bot
+    status_desc = "Get the status of the running bot"
+    parser_status = subparsers.add_parser(
+        "status",
+        description=status_desc,
+        help=status_desc,
+        argument_default=argparse.SUPPRESS,
+    )
+    parser_status.set_defaults(func=submanager.core.commands.run_get_status)
+
+    # Reload the config of the running bot
+    reload_desc = "Make the running bot reload and revalidate its config"
+    parser_reload = subparsers.add_parser(
+        "reload-config",
+        description=reload_desc,
+        help=reload_desc,
+        argument_default=argparse.SUPPRESS,
+    )
+    parser_reload.set_defaults(
+        func=submanager.core.commands.run_reload_config,
+    )
+
     # Run the bot once
     run_desc = "Run the bot through one cycle and exit"
     parser_run = subparsers.add_parser(
@@ -201,6 +342,14 @@ def create_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Don't validate the config against Reddit prior to executing it",
     )
+    parser_run.add_argument(
+        "--revalidate-all",
+        action="store_true",
+        help=(
+            "Revalidate all accounts and endpoints against Reddit, even if "
+            "unchanged since they were last successfully validated"
+        ),
+    )
     parser_run.add_argument(
         "--resync-all",
         action="store_true",
@@ -209,6 +358,14 @@ def create_arg_parser() -> argparse.ArgumentParser:
             "modified; useful after adding targets & other config changes"
         ),
     )
+    parser_run.add_argument(
+        "--record-cassette",
+        metavar="PATH",
+        help=(
+            "Record the requests made to Reddit, with credentials scrubbed, "
+            "to a cassette file at PATH that can be replayed offline"
+        ),
+    )
 
     # Start the bot running
     start_desc = "Start the bot running continuously until stopped or errored"
@@ -224,6 +381,14 @@ def create_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Don't validate the config against Reddit prior to executing it",
     )
+    parser_start.add_argument(
+        "--revalidate-all",
+        action="store_true",
+        help=(
+            "Revalidate all accounts and endpoints against Reddit, even if "
+            "unchanged since they were last successfully validated"
+        ),
+    )
     parser_start.add_argument(
         "--repeat-interval-s",
         type=float,
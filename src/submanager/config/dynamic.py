@@ -15,6 +15,7 @@ from types import (
 )
 from typing import (
     ContextManager,
+    Tuple,
 )
 
 # Third party imports
@@ -34,6 +35,8 @@ from submanager.types import (
     PathLikeStr,
 )
 
+FileSignature = Tuple[int, int]
+
 
 def render_dynamic_config(
     static_config: submanager.models.config.StaticConfig,
@@ -94,6 +97,58 @@ def load_dynamic_config(
     return dynamic_config
 
 
+def get_file_signature(config_path: PathLikeStr) -> FileSignature | None:
+    """Get the modification time and size of a file, if it exists."""
+    try:
+        file_stat = Path(config_path).stat()
+    except FileNotFoundError:
+        return None
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+class DynamicConfigCache:
+    """Keep the loaded dynamic config to reuse until its file changes."""
+
+    def __init__(self) -> None:
+        self.static_config: submanager.models.config.StaticConfig | None = None
+        self.dynamic_config: submanager.models.config.DynamicConfig | None = (
+            None
+        )
+        self.file_signature: FileSignature | None = None
+
+    def get(
+        self,
+        static_config: submanager.models.config.StaticConfig,
+        config_path: PathLikeStr,
+    ) -> submanager.models.config.DynamicConfig | None:
+        """Get the stored config, if still current for the file and config."""
+        if (
+            self.dynamic_config is None
+            or self.static_config is not static_config
+            or self.file_signature is None
+            or self.file_signature != get_file_signature(config_path)
+        ):
+            return None
+        return self.dynamic_config
+
+    def store(
+        self,
+        static_config: submanager.models.config.StaticConfig,
+        config_path: PathLikeStr,
+        dynamic_config: submanager.models.config.DynamicConfig,
+    ) -> None:
+        """Store the config, as it is in the file it was just written to."""
+        self.static_config = static_config
+        self.dynamic_config = dynamic_config
+        self.file_signature = get_file_signature(config_path)
+
+    def clear(self) -> None:
+        """Drop the stored config, so it is loaded again next time."""
+        self.static_config = None
+        self.dynamic_config = None
+        self.file_signature = None
+
+
 class LockedandLoadedDynamicConfig(
     ContextManager[submanager.models.config.DynamicConfig],
 ):
@@ -105,11 +160,16 @@ class LockedandLoadedDynamicConfig(
         config_path: PathLikeStr = CONFIG_PATH_DYNAMIC,
         timeout_s: float = submanager.config.lock.TIMEOUT_S_DEFAULT,
         verbose: bool = False,
+        cache: DynamicConfigCache | None = None,
     ) -> None:
         self.static_config = static_config
         self.config_path = Path(config_path)
         self.timeout_s = timeout_s
         self.verbose = verbose
+        self.cache = cache
+        self.dynamic_config: submanager.models.config.DynamicConfig | None = (
+            None
+        )
 
     def __enter__(self) -> submanager.models.config.DynamicConfig:
         """Attempt to acquire a lock on a dynamic config file and return it."""
@@ -119,10 +179,18 @@ class LockedandLoadedDynamicConfig(
             timeout_s=self.timeout_s,
             verbose=self.verbose,
         )
-        dynamic_config = load_dynamic_config(
-            static_config=self.static_config,
-            config_path=self.config_path,
-        )
+        dynamic_config = None
+        if self.cache is not None:
+            dynamic_config = self.cache.get(
+                self.static_config,
+                self.config_path,
+            )
+        if dynamic_config is None:
+            dynamic_config = load_dynamic_config(
+                static_config=self.static_config,
+                config_path=self.config_path,
+            )
+        self.dynamic_config = dynamic_config
         return dynamic_config
 
     def __exit__(
@@ -132,5 +200,15 @@ class LockedandLoadedDynamicConfig(
         exc_tb: TracebackType | None,
     ) -> Literal[False]:
         """Release the lock on the dynamic config."""
+        if self.cache is not None:
+            # If interrupted, the state may not match what was written out
+            if exc_type is None and self.dynamic_config is not None:
+                self.cache.store(
+                    self.static_config,
+                    self.config_path,
+                    self.dynamic_config,
+                )
+            else:
+                self.cache.clear()
         submanager.config.lock.unlock_config(self.config_path)
         return False
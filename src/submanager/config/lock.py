@@ -6,7 +6,9 @@ from __future__ import (
 )
 
 # Standard library imports
+import contextlib
 import os
+import sys
 import time
 from pathlib import (
     Path,
@@ -61,6 +63,34 @@ def unlock_config(
     return True
 
 
+def check_pid_running(pid: int) -> bool:
+    """Check if a process is running, assuming it is if unable to tell."""
+    if pid == os.getpid() or sys.platform.startswith("win"):
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def break_stale_lock(config_path: PathLikeStr = CONFIG_PATH_DYNAMIC) -> bool:
+    """Remove the config's lock if the process that held it has exited."""
+    lock_file_path = generate_lock_file_path(config_path)
+    try:
+        with open(lock_file_path, encoding="utf-8") as lock_file:
+            lock_pid = int(lock_file.read().strip())
+    except (FileNotFoundError, ValueError):
+        return False
+    if check_pid_running(lock_pid):
+        return False
+    with contextlib.suppress(FileNotFoundError):
+        lock_file_path.unlink()
+    return True
+
+
 def lock_config(config_path: PathLikeStr = CONFIG_PATH_DYNAMIC) -> bool:
     """Lock the config if not locked by another process, optionally waiting."""
     lock_file_path = generate_lock_file_path(config_path)
@@ -89,6 +119,7 @@ def wait_for_lock(
     raise_error_on_timeout: bool = True,
     timeout_s: float = TIMEOUT_S_DEFAULT,
     check_interval_s: float = CHECK_INTERVAL_S_DEFAULT,
+    break_stale: bool = False,
     verbose: bool = False,
 ) -> bool:
     """Attempt to acquire a lock, waiting until one is available."""
@@ -105,6 +136,9 @@ def wait_for_lock(
                 time_elapsed = time.monotonic() - start_time
                 vprint(f"Acquired config lock after {time_elapsed} s")
             return True
+        if break_stale and break_stale_lock(config_path):
+            vprint(f"Removed stale lock on {config_path.as_posix()!r}")
+            continue
         if first_attempt:
             vprint(
                 f"File {config_path.as_posix()!r} is locked; "
@@ -23,10 +23,12 @@ import toml
 import toml.decoder
 
 # Local imports
+import submanager.config.synthetic
 import submanager.config.utils
 import submanager.exceptions
 import submanager.models.config
 import submanager.models.example
+import submanager.sync.graph
 import submanager.utils.dicthelpers
 from submanager.constants import (
     CONFIG_PATH_STATIC,
@@ -190,6 +192,9 @@ def load_static_config(
             message_post=error,
         ) from error
 
+    # Order the items once on load, warning early of any dependency cycles
+    submanager.sync.graph.get_sync_levels(static_config.sync_manager)
+
     return static_config
 
 
@@ -198,8 +203,10 @@ def generate_static_config(
     *,
     force: bool = False,
     exist_ok: bool = False,
+    synthetic_options: submanager.config.synthetic.SyntheticConfigOptions
+    | None = None,
 ) -> bool:
-    """Generate a static config file with the default example settings."""
+    """Generate a static config file with the example or synthetic items."""
     config_path = Path(config_path)
     config_exists = config_path.exists()
     if config_exists:
@@ -208,11 +215,21 @@ def generate_static_config(
                 return True
             raise submanager.exceptions.ConfigExistsError(config_path)
 
-    example_config = submanager.models.example.EXAMPLE_STATIC_CONFIG.dict(
-        exclude=submanager.models.example.EXAMPLE_EXCLUDE_FIELDS,
-    )
+    generated_config: ConfigDict
+    if synthetic_options is None:
+        generated_config = (
+            submanager.models.example.EXAMPLE_STATIC_CONFIG.dict(
+                exclude=submanager.models.example.EXAMPLE_EXCLUDE_FIELDS,
+            )
+        )
+    else:
+        generated_config = (
+            submanager.config.synthetic.generate_synthetic_config(
+                synthetic_options,
+            )
+        )
     submanager.config.utils.write_config(
-        config=example_config,
+        config=generated_config,
         config_path=config_path,
     )
     return config_exists
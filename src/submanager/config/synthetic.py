@@ -0,0 +1,274 @@
+"""Generate large synthetic static configs for testing at scale."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import random
+from typing import (
+    NamedTuple,
+    Sequence,
+)
+
+# Third party imports
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.enums
+import submanager.exceptions
+import submanager.models.base
+import submanager.models.config
+import submanager.models.example
+from submanager.types import (
+    ConfigDict,
+)
+
+SYNTHETIC_ACCOUNT_TEMPLATE: Final[str] = "SyntheticUser{n}"
+SYNTHETIC_SUBREDDIT_TEMPLATE: Final[str] = "SyntheticSub{n}"
+SYNTHETIC_SITE_NAME_TEMPLATE: Final[str] = "SYNTHETIC_SITE_NAME_{n}"
+
+# Thread IDs are base 36; a fixed leading letter keeps them 6 characters
+SYNTHETIC_THREAD_ID_TEMPLATE: Final[str] = "s{n:05x}"
+
+ITEM_COUNT_DEFAULT: Final[int] = 100
+TARGET_COUNT_DEFAULT: Final[int] = 1
+THREAD_COUNT_DEFAULT: Final[int] = 0
+SUBREDDIT_COUNT_DEFAULT: Final[int] = 1
+ACCOUNT_COUNT_DEFAULT: Final[int] = 1
+ENDPOINT_TYPES_DEFAULT: Final[tuple[submanager.enums.EndpointType, ...]] = (
+    submanager.enums.EndpointType.WIKI_PAGE,
+)
+SEED_DEFAULT: Final[int] = 0
+
+
+class SyntheticConfigOptions(NamedTuple):
+    """The shape and size of a synthetic config to generate."""
+
+    item_count: int = ITEM_COUNT_DEFAULT
+    target_count: int = TARGET_COUNT_DEFAULT
+    thread_count: int = THREAD_COUNT_DEFAULT
+    subreddit_count: int = SUBREDDIT_COUNT_DEFAULT
+    account_count: int = ACCOUNT_COUNT_DEFAULT
+    endpoint_types: Sequence[
+        submanager.enums.EndpointType
+    ] = ENDPOINT_TYPES_DEFAULT
+    source_count: int | None = None
+    seed: int = SEED_DEFAULT
+
+    def validate(self) -> None:
+        """Check the counts describe a config that can be generated."""
+        minimum_counts = {
+            "item_count": 0,
+            "target_count": 0,
+            "thread_count": 0,
+            "subreddit_count": 1,
+            "account_count": 1,
+            "source_count": 1,
+        }
+        for count_name, minimum_count in minimum_counts.items():
+            count: int | None = getattr(self, count_name)
+            if count is not None and count < minimum_count:
+                raise submanager.exceptions.ConfigError(
+                    f"Synthetic config {count_name} must be at least "
+                    f"{minimum_count}, not {count!r}",
+                )
+        if not self.endpoint_types:
+            raise submanager.exceptions.ConfigError(
+                "Synthetic config must have at least one endpoint type",
+            )
+
+
+def get_exclude_fields(
+    static_config: submanager.models.config.StaticConfig,
+) -> dict[str, object]:
+    """Get the fields to not output, as they're filled in when rendered."""
+    return {
+        "sync_manager": {
+            "items": {
+                item_key: {
+                    "source": {"uid"},
+                    "targets": {
+                        target_key: {"uid"} for target_key in item.targets
+                    },
+                    "uid": ...,
+                }
+                for item_key, item in static_config.sync_manager.items.items()
+            },
+        },
+        "thread_manager": {
+            "items": {
+                thread_key: {"source": {"uid"}, "uid": ...}
+                for thread_key in static_config.thread_manager.items
+            },
+        },
+    }
+
+
+def get_context(
+    options: SyntheticConfigOptions,
+    index: int,
+) -> submanager.models.base.ContextConfig:
+    """Get the context of the nth endpoint, spread across subs and users."""
+    return submanager.models.base.ContextConfig(
+        account=SYNTHETIC_ACCOUNT_TEMPLATE.format(
+            n=index % options.account_count,
+        ),
+        subreddit=SYNTHETIC_SUBREDDIT_TEMPLATE.format(
+            n=index % options.subreddit_count,
+        ),
+    )
+
+
+def get_endpoint_name(
+    endpoint_type: submanager.enums.EndpointType,
+    name: str,
+    index: int,
+) -> str:
+    """Get the name of an endpoint of the given type on Reddit."""
+    if endpoint_type == submanager.enums.EndpointType.THREAD:
+        return SYNTHETIC_THREAD_ID_TEMPLATE.format(n=index)
+    if endpoint_type == submanager.enums.EndpointType.WIKI_PAGE:
+        return f"synthetic/{name}"
+    return name
+
+
+def generate_source(
+    options: SyntheticConfigOptions,
+    source_n: int,
+    endpoint_type: submanager.enums.EndpointType,
+) -> submanager.models.config.FullEndpointConfig:
+    """Generate the nth sync source, based on the example source."""
+    return submanager.models.example.EXAMPLE_SOURCE.copy(
+        update={
+            "context": get_context(options, source_n),
+            "description": f"Synthetic sync source {source_n}",
+            "endpoint_name": get_endpoint_name(
+                endpoint_type,
+                f"source_{source_n}",
+                source_n,
+            ),
+            "endpoint_type": endpoint_type,
+        },
+    )
+
+
+def generate_target(
+    options: SyntheticConfigOptions,
+    item_n: int,
+    target_n: int,
+    endpoint_type: submanager.enums.EndpointType,
+) -> submanager.models.config.FullEndpointConfig:
+    """Generate a sync target, based on the example target."""
+    target_index = item_n * options.target_count + target_n
+    return submanager.models.example.EXAMPLE_TARGET.copy(
+        update={
+            "context": get_context(options, item_n + target_n),
+            "description": f"Synthetic sync target {item_n}.{target_n}",
+            "endpoint_name": get_endpoint_name(
+                endpoint_type,
+                f"target_{item_n}_{target_n}",
+                # Leave room for the thread IDs of the sources
+                options.item_count + target_index,
+            ),
+            "endpoint_type": endpoint_type,
+        },
+    )
+
+
+def generate_synthetic_config(
+    options: SyntheticConfigOptions | None = None,
+) -> ConfigDict:
+    """Generate a static config of many items, based on the example."""
+    if options is None:
+        options = SyntheticConfigOptions()
+    options.validate()
+    rng = random.Random(options.seed)
+    source_types = [
+        endpoint_type
+        for endpoint_type in options.endpoint_types
+        if endpoint_type != submanager.enums.EndpointType.MENU
+    ] or [submanager.enums.EndpointType.WIKI_PAGE]
+    source_count = options.source_count or options.item_count
+    sources = [
+        generate_source(options, source_n, rng.choice(source_types))
+        for source_n in range(source_count)
+    ]
+
+    sync_items = {}
+    for item_n in range(options.item_count):
+        sync_items[
+            f"sync_{item_n}"
+        ] = submanager.models.example.EXAMPLE_SYNC_ITEM.copy(
+            update={
+                "description": f"Synthetic sync item {item_n}",
+                "enabled": True,
+                "source": sources[item_n % source_count],
+                "targets": {
+                    f"target_{target_n}": generate_target(
+                        options,
+                        item_n,
+                        target_n,
+                        rng.choice(options.endpoint_types),
+                    )
+                    for target_n in range(options.target_count)
+                },
+            },
+        )
+
+    thread_items = {}
+    for thread_n in range(options.thread_count):
+        thread_context = get_context(options, thread_n)
+        thread_items[
+            f"thread_{thread_n}"
+        ] = submanager.models.example.EXAMPLE_THREAD.copy(
+            update={
+                "context": thread_context,
+                "description": f"Synthetic managed thread {thread_n}",
+                "enabled": True,
+                "link_update_pages": [f"synthetic/thread_links_{thread_n}"],
+                "source": generate_source(
+                    options,
+                    source_count + thread_n,
+                    submanager.enums.EndpointType.WIKI_PAGE,
+                ),
+                "target_context": thread_context,
+            },
+        )
+
+    accounts = submanager.models.config.AccountsConfig(
+        {
+            SYNTHETIC_ACCOUNT_TEMPLATE.format(
+                n=account_n,
+            ): submanager.models.example.EXAMPLE_ACCOUNT_CONFIG.copy(
+                update={
+                    "config": {
+                        "site_name": SYNTHETIC_SITE_NAME_TEMPLATE.format(
+                            n=account_n,
+                        ),
+                    },
+                },
+            )
+            for account_n in range(options.account_count)
+        },
+    )
+    static_config = submanager.models.example.EXAMPLE_STATIC_CONFIG.copy(
+        update={
+            "accounts": accounts,
+            "context_default": get_context(options, 0),
+            "sync_manager": submanager.models.config.SyncManagerConfig(
+                items=sync_items,
+            ),
+            "thread_manager": submanager.models.config.ThreadManagerConfig(
+                items=thread_items,
+            ),
+        },
+    )
+    synthetic_config: ConfigDict = static_config.dict(
+        exclude=get_exclude_fields(static_config),  # type: ignore[arg-type]
+        exclude_defaults=True,
+    )
+    return synthetic_config
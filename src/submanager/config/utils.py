@@ -6,6 +6,7 @@ from __future__ import (
 )
 
 # Standard library imports
+import enum
 import json
 from pathlib import (
     Path,
@@ -35,6 +36,15 @@ from submanager.types import (
 SUPPORTED_CONFIG_FORMATS: Final[frozenset[str]] = frozenset(("json", "toml"))
 
 
+def serialize_enum(value: object) -> object:
+    """Serialize enum values (e.g. endpoint types) in a config as JSON."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable",
+    )
+
+
 def serialize_config(
     config: ConfigDict | pydantic.BaseModel,
     output_format: str = "json",
@@ -44,7 +54,11 @@ def serialize_config(
         if isinstance(config, pydantic.BaseModel):
             serialized_config = config.json(indent=4)
         else:
-            serialized_config = json.dumps(config, indent=4)
+            serialized_config = json.dumps(
+                config,
+                indent=4,
+                default=serialize_enum,
+            )
     elif output_format == "toml":
         serialized_config = toml.dumps(dict(config))
     else:
@@ -39,6 +39,7 @@ START_TIME: Final[float] = time.monotonic()
 
 SECURE_DIR_MODE: Final[int] = 0o770
 SECURE_FILE_MODE: Final[int] = 0o660
+SECRET_FILE_MODE: Final[int] = 0o600
 
 USER_CONFIG_DIR: Final[Path] = platformdirs.user_config_path(
     appname=PACKAGE_NAME,
@@ -54,6 +55,11 @@ USER_STATE_DIR: Final[Path] = platformdirs.user_state_path(
 CONFIG_PATH_STATIC: Final[Path] = USER_CONFIG_DIR / "config.toml"
 CONFIG_PATH_DYNAMIC: Final[Path] = USER_STATE_DIR / "config_dynamic.json"
 
+VALIDATION_CACHE_FILENAME: Final[str] = "validation_cache.json"
+TOKEN_CACHE_FILENAME: Final[str] = "token_cache.json"
+TARGET_CACHE_FILENAME: Final[str] = "target_cache.json"
+CONTROL_SOCKET_FILENAME: Final[str] = "control.sock"
+
 
 # ---- URL constants ----
 
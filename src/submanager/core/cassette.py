@@ -0,0 +1,416 @@
+"""Record the requests made to Reddit during a run and replay them offline."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import collections
+import http
+import json
+import threading
+import time
+import urllib.parse
+from pathlib import (
+    Path,
+)
+from typing import (
+    Callable,
+    Iterable,
+    Mapping,
+    Tuple,
+    Union,
+)
+
+# Third party imports
+import pydantic
+import requests
+import requests.structures
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.config.utils
+import submanager.core.tokens
+import submanager.exceptions
+import submanager.models.config
+import submanager.utils.tracing
+from submanager.types import (
+    ConfigDict,
+    PathLikeStr,
+)
+
+SCRUBBED_VALUE: Final[str] = "SCRUBBED"
+
+# Request and response fields holding credentials, never to be recorded
+SECRET_FIELDS: Final[frozenset[str]] = frozenset(
+    (
+        "access_token",
+        "client_id",
+        "client_secret",
+        "code",
+        "password",
+        "refresh_token",
+        "username",
+    ),
+)
+
+# Request fields holding the content of an edit, ignored when matching
+CONTENT_FIELDS: Final[frozenset[str]] = frozenset(
+    ("content", "json", "previous", "reason", "text", "title"),
+)
+
+# Per-account lookups, made by whichever item happens to need them first
+ITEM_ACCOUNT: Final[str] = "(account)"
+ACCOUNT_PATHS: Final[tuple[str, ...]] = ("/api/v1/me",)
+
+RATE_LIMIT_HEADER_PREFIX: Final[str] = "x-ratelimit-"
+RECORDED_HEADERS: Final[frozenset[str]] = frozenset(
+    ("content-type", "location"),
+)
+
+InteractionKey = Tuple[str, str, str]
+
+
+# ---- Helpers ----
+
+
+def scrub_fields(fields: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Replace the values of any secret fields, sorting them by name."""
+    return sorted(
+        (key, SCRUBBED_VALUE if key in SECRET_FIELDS else str(value))
+        for key, value in fields
+    )
+
+
+def scrub_json(payload: object) -> object:
+    """Replace the values of any secret fields nested in a JSON value."""
+    if isinstance(payload, Mapping):
+        return {
+            key: SCRUBBED_VALUE if key in SECRET_FIELDS else scrub_json(value)
+            for key, value in payload.items()
+        }
+    if isinstance(payload, (list, tuple)):
+        return [scrub_json(value) for value in payload]
+    return payload
+
+
+def scrub_url(url: str, params: Mapping[str, str] | None = None) -> str:
+    """Get the full URL of a request, with any secrets scrubbed."""
+    prepared_url = requests.Request("GET", url, params=params).prepare().url
+    url_parts = urllib.parse.urlsplit(prepared_url or url)
+    query = urllib.parse.urlencode(
+        scrub_fields(urllib.parse.parse_qsl(url_parts.query)),
+    )
+    return urllib.parse.urlunsplit(url_parts._replace(query=query))
+
+
+def get_form_fields(data: object) -> list[tuple[str, str]]:
+    """Get the fields of a form request body, if it is one."""
+    if isinstance(data, Mapping):
+        return list(data.items())
+    if isinstance(data, (list, tuple)):
+        return [tuple(field) for field in data]
+    return []
+
+
+def scrub_body(data: object = None, json_data: object = None) -> str:
+    """Serialize the body of a request, with any secrets scrubbed."""
+    if json_data is not None:
+        return json.dumps(scrub_json(json_data), sort_keys=True)
+    return urllib.parse.urlencode(scrub_fields(get_form_fields(data)))
+
+
+def scrub_content(content: str) -> str:
+    """Scrub any credentials (e.g. access tokens) from a response body."""
+    try:
+        payload = json.loads(content)
+    except ValueError:
+        return content
+    scrubbed_payload = scrub_json(payload)
+    if scrubbed_payload == payload:
+        return content
+    return json.dumps(scrubbed_payload)
+
+
+def get_interaction_key(method: str, url: str, body: str) -> InteractionKey:
+    """Get the key to match a request against the recorded ones."""
+    body_fields = [
+        (key, value)
+        for key, value in urllib.parse.parse_qsl(body)
+        if key not in CONTENT_FIELDS
+    ]
+    return (method.upper(), url, urllib.parse.urlencode(body_fields))
+
+
+def get_item_label(method: str, url: str, body: str) -> str | None:
+    """Get the item a request was made for, if known."""
+    url_path = urllib.parse.urlsplit(url).path.rstrip("/")
+    is_token_request = submanager.core.tokens.is_cacheable_token_request(
+        method,
+        url,
+        urllib.parse.parse_qsl(body),
+    )
+    if is_token_request or url_path.endswith(ACCOUNT_PATHS):
+        return ITEM_ACCOUNT
+    return submanager.utils.tracing.get_current_item()
+
+
+def load_state_file(state_path: PathLikeStr) -> ConfigDict:
+    """Load a file of run-time state, if it exists."""
+    if not Path(state_path).exists():
+        return {}
+    return submanager.config.utils.load_config(state_path)
+
+
+def load_cassette(
+    cassette_path: PathLikeStr,
+) -> submanager.models.config.Cassette:
+    """Load a recorded cassette from a file."""
+    cassette_path = Path(cassette_path)
+    try:
+        raw_cassette = submanager.config.utils.load_config(cassette_path)
+    except FileNotFoundError as error:
+        raise submanager.exceptions.ConfigNotFoundError(
+            cassette_path,
+        ) from error
+    try:
+        return submanager.models.config.Cassette.parse_obj(raw_cassette)
+    except pydantic.ValidationError as error:
+        raise submanager.exceptions.ConfigValidationError(
+            cassette_path,
+            message_post=error,
+        ) from error
+
+
+def generate_response(
+    interaction: submanager.models.config.CassetteInteraction,
+    *,
+    rate_limit_headers: bool = False,
+) -> requests.Response:
+    """Generate a response from a recorded interaction, as if from Reddit."""
+    response = requests.Response()
+    response.status_code = interaction.status_code
+    response.url = interaction.url
+    response.encoding = "utf-8"
+    response.headers = requests.structures.CaseInsensitiveDict(
+        {
+            key: value
+            for key, value in interaction.headers.items()
+            if rate_limit_headers
+            or not key.startswith(RATE_LIMIT_HEADER_PREFIX)
+        },
+    )
+    response._content = interaction.content.encode(  # noqa: WPS437
+        "utf-8",
+    )
+    return response
+
+
+# ---- Recording and replay ----
+
+
+class CassetteRecorder:
+    """Record each request made to Reddit, with credentials scrubbed."""
+
+    def __init__(self) -> None:
+        self.cassette = submanager.models.config.Cassette()
+        self.start_time = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def snapshot(
+        self,
+        config_paths: submanager.models.config.ConfigPaths,
+    ) -> None:
+        """Record the dynamic config and target cache the run starts from."""
+        with self._lock:
+            self.cassette.dynamic_config = load_state_file(
+                config_paths.dynamic,
+            )
+            self.cassette.target_cache = load_state_file(
+                config_paths.target_cache,
+            )
+            self.start_time = time.perf_counter()
+
+    def request(
+        self,
+        send_request: Callable[[], requests.Response],
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, str] | None = None,
+        data: object = None,
+        json_data: object = None,
+    ) -> requests.Response:
+        """Send the request to Reddit and record it and its response."""
+        start_time = time.perf_counter()
+        response = send_request()
+        duration_s = time.perf_counter() - start_time
+        scrubbed_url = scrub_url(url, params)
+        body = scrub_body(data, json_data)
+        interaction = submanager.models.config.CassetteInteraction(
+            method=method.upper(),
+            url=scrubbed_url,
+            body=body,
+            item=get_item_label(method, scrubbed_url, body),
+            status_code=response.status_code,
+            headers={
+                key.lower(): value
+                for key, value in response.headers.items()
+                if key.lower() in RECORDED_HEADERS
+                or key.lower().startswith(RATE_LIMIT_HEADER_PREFIX)
+            },
+            content=scrub_content(response.text),
+            duration_s=duration_s,
+        )
+        with self._lock:
+            self.cassette.interactions.append(interaction)
+        return response
+
+    def write(self, cassette_path: PathLikeStr) -> None:
+        """Write out the recorded requests and the run's total time."""
+        with self._lock:
+            self.cassette.wall_time_s = time.perf_counter() - self.start_time
+            submanager.config.utils.write_config(
+                self.cassette,
+                config_path=cassette_path,
+            )
+
+
+class CassettePlayer:
+    """Serve requests from a cassette instead of sending them to Reddit."""
+
+    def __init__(
+        self,
+        cassette: submanager.models.config.Cassette,
+        *,
+        replay_latency: bool = True,
+        rate_limit_headers: bool = False,
+    ) -> None:
+        self.replay_latency = replay_latency
+        self.rate_limit_headers = rate_limit_headers
+        self.replayed = submanager.models.config.Cassette(
+            dynamic_config=cassette.dynamic_config,
+            target_cache=cassette.target_cache,
+        )
+        self.start_time = time.perf_counter()
+        self._recorded: dict[
+            InteractionKey,
+            collections.deque[submanager.models.config.CassetteInteraction],
+        ] = {}
+        self._last_recorded: dict[
+            InteractionKey,
+            submanager.models.config.CassetteInteraction,
+        ] = {}
+        for interaction in cassette.interactions:
+            interaction_key = get_interaction_key(
+                interaction.method,
+                interaction.url,
+                interaction.body,
+            )
+            self._recorded.setdefault(
+                interaction_key,
+                collections.deque(),
+            ).append(interaction)
+        self._lock = threading.Lock()
+
+    def match(
+        self,
+        interaction_key: InteractionKey,
+    ) -> submanager.models.config.CassetteInteraction | None:
+        """Get the next recorded response to a request, if there is one.
+
+        Once the recorded responses for a request run out, the last one is
+        repeated, so that requests beyond those recorded can still succeed.
+        """
+        with self._lock:
+            recorded = self._recorded.get(interaction_key, None)
+            if recorded:
+                self._last_recorded[interaction_key] = recorded.popleft()
+            return self._last_recorded.get(interaction_key, None)
+
+    def request(
+        self,
+        send_request: Callable[[], requests.Response],
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, str] | None = None,
+        data: object = None,
+        json_data: object = None,
+    ) -> requests.Response:
+        """Respond to the request as Reddit did when it was recorded."""
+        start_time = time.perf_counter()
+        scrubbed_url = scrub_url(url, params)
+        body = scrub_body(data, json_data)
+        recorded = self.match(get_interaction_key(method, scrubbed_url, body))
+        if recorded is None:
+            response = self.generate_unrecorded_response(
+                method,
+                scrubbed_url,
+                body,
+            )
+        else:
+            if self.replay_latency:
+                time.sleep(recorded.duration_s)
+            response = generate_response(
+                recorded,
+                rate_limit_headers=self.rate_limit_headers,
+            )
+
+        interaction = submanager.models.config.CassetteInteraction(
+            method=method.upper(),
+            url=scrubbed_url,
+            body=body,
+            item=get_item_label(method, scrubbed_url, body),
+            status_code=response.status_code,
+            duration_s=time.perf_counter() - start_time,
+        )
+        with self._lock:
+            self.replayed.interactions.append(interaction)
+        return response
+
+    def generate_unrecorded_response(
+        self,
+        method: str,
+        url: str,
+        body: str,
+    ) -> requests.Response:
+        """Respond to a request that wasn't recorded."""
+        # Tokens may have come from the token cache when recording
+        if submanager.core.tokens.is_cacheable_token_request(
+            method,
+            url,
+            urllib.parse.parse_qsl(body),
+        ):
+            return submanager.core.tokens.generate_token_response(
+                submanager.models.config.TokenCacheEntry(
+                    access_token=SCRUBBED_VALUE,
+                    expiration_timestamp=(
+                        time.time()
+                        + submanager.core.tokens.TOKEN_REFRESH_MARGIN_S * 2
+                    ),
+                    scope="*",
+                ),
+                url=url,
+            )
+        return generate_response(
+            submanager.models.config.CassetteInteraction(
+                method=method.upper(),
+                url=url,
+                status_code=http.HTTPStatus.NOT_FOUND,
+                headers={"content-type": "application/json"},
+                content=json.dumps({"error": http.HTTPStatus.NOT_FOUND}),
+            ),
+        )
+
+    def finish(self) -> submanager.models.config.Cassette:
+        """Get the requests made during the replay and its total time."""
+        with self._lock:
+            self.replayed.wall_time_s = time.perf_counter() - self.start_time
+            return self.replayed
+
+
+CassetteHook = Union[CassetteRecorder, CassettePlayer]
@@ -11,6 +11,9 @@ import sys
 from pathlib import (
     Path,
 )
+from typing import (
+    Sequence,
+)
 
 # Third party imports
 import platformdirs
@@ -21,9 +24,13 @@ from typing_extensions import (
 # Local imports
 import submanager
 import submanager.config.static
+import submanager.config.synthetic
+import submanager.core.control
 import submanager.core.initialization
+import submanager.enums
 import submanager.exceptions
 import submanager.models.config
+import submanager.sync.plan
 import submanager.utils.output
 import submanager.validation.endpoints
 import submanager.validation.validate
@@ -155,16 +162,45 @@ def run_generate_config(
     *,
     force: bool = False,
     exist_ok: bool = False,
+    synthetic: bool = False,
+    items: int = submanager.config.synthetic.ITEM_COUNT_DEFAULT,
+    targets: int = submanager.config.synthetic.TARGET_COUNT_DEFAULT,
+    threads: int = submanager.config.synthetic.THREAD_COUNT_DEFAULT,
+    subreddits: int = submanager.config.synthetic.SUBREDDIT_COUNT_DEFAULT,
+    accounts: int = submanager.config.synthetic.ACCOUNT_COUNT_DEFAULT,
+    endpoint_types: Sequence[str] | None = None,
+    shared_sources: int | None = None,
+    seed: int = submanager.config.synthetic.SEED_DEFAULT,
     verbose: bool = True,
 ) -> None:
     """Generate the various config files for sub manager."""
     vprint = submanager.utils.output.VerbosePrinter(enable=verbose)
     if config_paths is None:
         config_paths = submanager.models.config.ConfigPaths()
+    synthetic_options = None
+    if synthetic:
+        synthetic_options = submanager.config.synthetic.SyntheticConfigOptions(
+            item_count=items,
+            target_count=targets,
+            thread_count=threads,
+            subreddit_count=subreddits,
+            account_count=accounts,
+            endpoint_types=(
+                [
+                    submanager.enums.EndpointType(endpoint_type)
+                    for endpoint_type in endpoint_types
+                ]
+                if endpoint_types
+                else submanager.config.synthetic.ENDPOINT_TYPES_DEFAULT
+            ),
+            source_count=shared_sources,
+            seed=seed,
+        )
     config_exists = submanager.config.static.generate_static_config(
         config_path=config_paths.static,
         force=force,
         exist_ok=exist_ok,
+        synthetic_options=synthetic_options,
     )
 
     # Generate the appropriate message depending on what happened
@@ -178,6 +214,24 @@ def run_generate_config(
     vprint(message)
 
 
+def run_show_plan(
+    config_paths: submanager.models.config.ConfigPaths | None = None,
+    *,
+    verbose: bool = True,
+) -> None:
+    """Print the execution plan of a sync run and its predicted requests."""
+    vprint = submanager.utils.output.VerbosePrinter(enable=verbose)
+    if config_paths is None:
+        config_paths = submanager.models.config.ConfigPaths()
+    static_config = submanager.config.static.load_static_config(
+        config_paths.static,
+    )
+    execution_plan = submanager.sync.plan.build_plan(
+        static_config.sync_manager,
+    )
+    vprint(submanager.sync.plan.format_plan(execution_plan))
+
+
 def run_validate_config(
     config_paths: submanager.models.config.ConfigPaths | None = None,
     *,
@@ -210,3 +264,49 @@ def run_validate_config(
         raise
     else:
         wprint("Config validation SUCCEEDED", level=2)
+
+
+def run_control_command(
+    command: str,
+    config_paths: submanager.models.config.ConfigPaths | None = None,
+    *,
+    verbose: bool = True,
+) -> None:
+    """Send a command to the running Sub Manager, which must exist."""
+    if config_paths is None:
+        config_paths = submanager.models.config.ConfigPaths()
+    if not submanager.core.control.run_on_daemon(
+        config_paths.control_socket,
+        command,
+        verbose=verbose,
+    ):
+        raise submanager.exceptions.SubManagerUserError(
+            "No running Sub Manager found with control socket "
+            f"{config_paths.control_socket.as_posix()!r}",
+        )
+
+
+def run_get_status(
+    config_paths: submanager.models.config.ConfigPaths | None = None,
+    *,
+    verbose: bool = True,
+) -> None:
+    """Print the status of the running Sub Manager."""
+    run_control_command(
+        submanager.core.control.COMMAND_STATUS,
+        config_paths=config_paths,
+        verbose=verbose,
+    )
+
+
+def run_reload_config(
+    config_paths: submanager.models.config.ConfigPaths | None = None,
+    *,
+    verbose: bool = True,
+) -> None:
+    """Make the running Sub Manager reload and revalidate its config."""
+    run_control_command(
+        submanager.core.control.COMMAND_RELOAD,
+        config_paths=config_paths,
+        verbose=verbose,
+    )
@@ -0,0 +1,328 @@
+"""Control a running Sub Manager over a local Unix domain socket."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import inspect
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from pathlib import (
+    Path,
+)
+from typing import (
+    Collection,
+    Dict,
+    Mapping,
+)
+
+# Third party imports
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.core.isolation
+import submanager.exceptions
+import submanager.utils.output
+from submanager.constants import (
+    SECRET_FILE_MODE,
+)
+from submanager.types import (
+    ControlHandler,
+    JSONDict,
+    JSONValue,
+    PathLikeStr,
+)
+
+COMMAND_CYCLE_THREADS: Final[str] = "cycle-threads"
+COMMAND_RELOAD: Final[str] = "reload"
+COMMAND_STATUS: Final[str] = "status"
+COMMAND_SYNC: Final[str] = "sync"
+
+CONNECT_TIMEOUT_S: Final[float] = 1
+RESPONSE_TIMEOUT_S: Final[float] = 600
+MAX_MESSAGE_BYTES: Final[int] = 2**20
+
+CONTROL_SUPPORTED: Final[bool] = hasattr(socket, "AF_UNIX") and hasattr(
+    socketserver,
+    "ThreadingUnixStreamServer",
+)
+
+# Only the owner may connect, as commands can edit the sub's content
+SOCKET_UMASK: Final[int] = 0o777 & ~SECRET_FILE_MODE
+
+ControlResponse = Dict[str, JSONValue]
+
+
+def encode_message(message: JSONDict) -> bytes:
+    """Encode a request or response as one line of JSON."""
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def is_socket_live(socket_path: PathLikeStr) -> bool:
+    """Check if something is accepting connections on the socket."""
+    if not CONTROL_SUPPORTED or not Path(socket_path).exists():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(CONNECT_TIMEOUT_S)
+        try:
+            client.connect(os.fspath(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+# ---- Server ----
+
+
+class ControlRequest:
+    """A command received over the socket, waiting to be handled."""
+
+    def __init__(self, command: str, arguments: JSONDict) -> None:
+        self.command = command
+        self.arguments = arguments
+        self.response: ControlResponse = {}
+        self.done = threading.Event()
+
+
+class ControlRequestHandler(socketserver.StreamRequestHandler):
+    """Read one request from a connection and write back the response."""
+
+    server: ControlSocketServer
+
+    def handle(self) -> None:
+        """Parse the request, pass it on to be run and send the response."""
+        request_line = self.rfile.readline(MAX_MESSAGE_BYTES)
+        try:
+            message = json.loads(request_line)
+            command = str(message["command"])
+            arguments = dict(message.get("arguments", {}))
+        except (TypeError, ValueError, KeyError) as error:
+            response: ControlResponse = {
+                "ok": False,
+                "message": f"Invalid control request: {error}",
+            }
+        else:
+            response = self.server.control_server.submit(command, arguments)
+        self.wfile.write(encode_message(response))
+
+
+if CONTROL_SUPPORTED:
+
+    class ControlSocketServer(
+        socketserver.ThreadingUnixStreamServer,
+    ):
+        """Socket server that passes requests on to the control server."""
+
+        daemon_threads = True
+
+        def __init__(
+            self,
+            socket_path: PathLikeStr,
+            control_server: ControlServer,
+        ) -> None:
+            self.control_server = control_server
+            super().__init__(os.fspath(socket_path), ControlRequestHandler)
+
+
+class ControlServer:
+    """Accept commands over the socket and run them on the main thread."""
+
+    def __init__(
+        self,
+        socket_path: PathLikeStr,
+        handlers: Mapping[str, ControlHandler],
+        *,
+        immediate_commands: Collection[str] = (COMMAND_STATUS,),
+        verbose: bool = False,
+    ) -> None:
+        self.socket_path = Path(socket_path)
+        self.handlers = handlers
+        self.immediate_commands = immediate_commands
+        self.verbose = verbose
+        self._requests: queue.Queue[ControlRequest] = queue.Queue()
+        self._socket_server: ControlSocketServer | None = None
+
+    def start(self) -> bool:
+        """Start listening on the socket, returning False if unable to."""
+        vprint = submanager.utils.output.VerbosePrinter(enable=self.verbose)
+        if not CONTROL_SUPPORTED:
+            vprint("Control socket not supported on this platform; skipping")
+            return False
+        if is_socket_live(self.socket_path):
+            raise submanager.exceptions.SubManagerUserError(
+                "Another Sub Manager is already running with control socket "
+                f"{self.socket_path.as_posix()!r}",
+            )
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        # Create the socket without access for others, rather than after
+        umask_previous = os.umask(SOCKET_UMASK)
+        try:
+            self._socket_server = ControlSocketServer(self.socket_path, self)
+        except OSError as error:
+            vprint(
+                "Could not open control socket at "
+                f"{self.socket_path.as_posix()!r}; skipping "
+                f"({type(error).__name__}: {error})",
+            )
+            return False
+        finally:
+            os.umask(umask_previous)
+        threading.Thread(
+            target=self._socket_server.serve_forever,
+            name="submanager-control",
+            daemon=True,
+        ).start()
+        vprint(f"Listening on control socket {self.socket_path.as_posix()!r}")
+        return True
+
+    def stop(self) -> None:
+        """Stop listening on the socket and remove it."""
+        if self._socket_server is None:
+            return
+        self._socket_server.shutdown()
+        self._socket_server.server_close()
+        self._socket_server = None
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+    def submit(
+        self,
+        command: str,
+        arguments: JSONDict,
+    ) -> ControlResponse:
+        """Queue a command to be run and wait for its response."""
+        request = ControlRequest(command, arguments)
+        if command in self.immediate_commands:
+            self.handle_request(request)
+            return request.response
+        self._requests.put(request)
+        if not request.done.wait(RESPONSE_TIMEOUT_S):
+            return {
+                "ok": False,
+                "message": f"Timed out waiting for {command!r} to run",
+            }
+        return request.response
+
+    def handle_request(self, request: ControlRequest) -> None:
+        """Run the handler for a command and record the response."""
+        vprint = submanager.utils.output.VerbosePrinter(enable=self.verbose)
+        handler = self.handlers.get(request.command, None)
+        try:
+            if handler is None:
+                raise submanager.exceptions.SubManagerUserError(
+                    f"Unknown control command {request.command!r}; "
+                    f"must be one of {set(self.handlers)!r}",
+                )
+            try:
+                inspect.signature(handler).bind(**request.arguments)
+            except TypeError as error:
+                raise submanager.exceptions.SubManagerUserError(
+                    f"Invalid arguments for {request.command!r}: {error}",
+                ) from error
+            vprint(f"Running control command {request.command!r}")
+            message = handler(**request.arguments)
+        except submanager.core.isolation.ITEM_ERRORS as error:
+            request.response = {
+                "ok": False,
+                "message": f"{type(error).__name__}: {error}",
+            }
+        except BaseException as error:  # noqa: B902
+            request.response = {
+                "ok": False,
+                "message": f"Unhandled {type(error).__name__}: {error}",
+            }
+            raise
+        else:
+            request.response = {"ok": True, "message": message}
+        finally:
+            request.done.set()
+
+    def handle_pending(self) -> None:
+        """Run all the commands received so far."""
+        while True:
+            try:
+                request = self._requests.get_nowait()
+            except queue.Empty:
+                return
+            self.handle_request(request)
+
+    def serve_for_interval(self, interval_s: float) -> None:
+        """Wait for the interval, running any commands as they arrive."""
+        self.handle_pending()
+        wait_until = time.monotonic() + interval_s
+        while True:
+            time_left_s = wait_until - time.monotonic()
+            if time_left_s <= 0:
+                return
+            try:
+                request = self._requests.get(timeout=time_left_s)
+            except queue.Empty:
+                return
+            self.handle_request(request)
+
+
+# ---- Client ----
+
+
+def send_command(
+    socket_path: PathLikeStr,
+    command: str,
+    arguments: JSONDict | None = None,
+    *,
+    timeout_s: float = RESPONSE_TIMEOUT_S,
+) -> ControlResponse | None:
+    """Send a command to a running Sub Manager, or None if there isn't one."""
+    if not CONTROL_SUPPORTED or not Path(socket_path).exists():
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(CONNECT_TIMEOUT_S)
+        try:
+            client.connect(os.fspath(socket_path))
+        except OSError:
+            return None
+        client.settimeout(timeout_s)
+        client.sendall(
+            encode_message(
+                {"command": command, "arguments": dict(arguments or {})},
+            ),
+        )
+        with client.makefile("rb") as response_file:
+            response_line = response_file.readline(MAX_MESSAGE_BYTES)
+    if not response_line:
+        raise submanager.exceptions.SubManagerUserError(
+            f"Sub Manager closed the connection running {command!r}",
+        )
+    response: ControlResponse = json.loads(response_line)
+    return response
+
+
+def run_on_daemon(
+    socket_path: PathLikeStr,
+    command: str,
+    arguments: JSONDict | None = None,
+    *,
+    verbose: bool = True,
+) -> bool:
+    """Hand off a command to a running Sub Manager, if there is one."""
+    vprint = submanager.utils.output.VerbosePrinter(enable=verbose)
+    response = send_command(socket_path, command, arguments)
+    if response is None:
+        return False
+    if not response.get("ok", False):
+        raise submanager.exceptions.SubManagerUserError(
+            str(response.get("message", "Unknown error")),
+            message_pre=f"Running Sub Manager failed to run {command!r}:",
+        )
+    vprint(str(response.get("message", "")))
+    return True
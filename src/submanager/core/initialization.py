@@ -12,10 +12,16 @@ from typing import (
 
 # Third party imports
 import praw.reddit
+import requests.adapters
 
 # Local imports
 import submanager.config.dynamic
 import submanager.config.static
+import submanager.core.cassette
+import submanager.core.ratelimit
+import submanager.core.requestor
+import submanager.core.session
+import submanager.core.tokens
 import submanager.exceptions
 import submanager.models.config
 import submanager.utils.output
@@ -24,6 +30,7 @@ from submanager.constants import (
 )
 from submanager.types import (
     AccountsMap,
+    PathLikeStr,
 )
 
 StaticDynamicTuple = Tuple[
@@ -35,21 +42,49 @@ StaticDynamicTuple = Tuple[
 def setup_accounts(
     accounts_config: submanager.models.config.AccountsConfig,
     *,
+    token_cache_path: PathLikeStr | None = None,
+    rate_limit_config: submanager.models.config.RateLimitConfig | None = None,
+    http_adapter: requests.adapters.HTTPAdapter | None = None,
+    cassette: submanager.core.cassette.CassetteHook | None = None,
+    reddit_url: str | None = None,
     verbose: bool = False,
 ) -> AccountsMap:
     """Set up the PRAW Reddit objects for each account in the config."""
     vprint = submanager.utils.output.VerbosePrinter(verbose)
 
+    # Send all requests to another server (e.g. a fake Reddit), if passed
+    url_kwargs = {}
+    if reddit_url is not None:
+        url_kwargs = {"oauth_url": reddit_url, "reddit_url": reddit_url}
+
+    token_cache = None
+    if token_cache_path is not None:
+        token_cache = submanager.core.tokens.TokenCache(token_cache_path)
+
     # For each account, create and set up the Reddit object
     accounts = {}
     for account_key, account_kwargs in accounts_config.items():
         vprint(f"Setting up account {account_key!r}")
+        request_pacer = None
+        if rate_limit_config is not None:
+            request_pacer = submanager.core.ratelimit.RequestPacer(
+                rate_limit_config,
+            )
         try:
             reddit = praw.reddit.Reddit(
                 user_agent=USER_AGENT,
                 check_for_async=False,
                 praw8_raise_exception_on_me=True,
-                **account_kwargs.config,
+                requestor_class=submanager.core.requestor.SubManagerRequestor,
+                requestor_kwargs={
+                    "cassette": cassette,
+                    "request_pacer": request_pacer,
+                    "session": submanager.core.session.create_session(
+                        http_adapter,
+                    ),
+                    "token_cache": token_cache,
+                },
+                **{**url_kwargs, **account_kwargs.config},
             )
         except submanager.exceptions.PRAW_ALL_ERRORS as error:
             raise submanager.exceptions.AccountConfigError(
@@ -0,0 +1,157 @@
+"""Isolate errors in individual items so the rest of the run continues."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import configparser
+import time
+from typing import (
+    Callable,
+)
+
+# Third party imports
+import praw.exceptions
+import prawcore.exceptions
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.exceptions
+import submanager.models.base
+import submanager.models.config
+import submanager.utils.output
+from submanager.types import (
+    ExceptTuple,
+)
+
+RATELIMIT_ERROR_TYPE: Final[str] = "RATELIMIT"
+
+# Transient errors that are likely to succeed if tried again later
+RETRYABLE_ERRORS: Final[ExceptTuple] = (
+    *submanager.exceptions.PRAW_RETRYABLE_ERRORS,
+    *submanager.exceptions.REQUESTS_CONNECTIVITY_ERROS,
+    submanager.exceptions.RedditConnectionError,
+)
+
+# Errors that may be specific to an item; anything else stops the run
+ITEM_ERRORS: Final[ExceptTuple] = (
+    *RETRYABLE_ERRORS,
+    *submanager.exceptions.PRAW_ALL_ERRORS,
+    submanager.exceptions.SubManagerError,
+)
+
+# Errors with an account or the config, which stop the run for every item
+FATAL_ERRORS: Final[ExceptTuple] = (
+    configparser.Error,
+    praw.exceptions.InvalidImplicitAuth,
+    praw.exceptions.ReadOnlyException,
+    prawcore.exceptions.InsufficientScope,
+    prawcore.exceptions.InvalidToken,
+    prawcore.exceptions.OAuthException,
+    submanager.exceptions.AuthError,
+    submanager.exceptions.ConfigError,
+    submanager.exceptions.LockTimeoutError,
+)
+
+
+def is_fatal_error(error: BaseException) -> bool:
+    """Check if an error affects the whole run, not just the one item."""
+    return isinstance(error, FATAL_ERRORS)
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Check if an error is transient, rather than needing user action."""
+    if isinstance(error, RETRYABLE_ERRORS):
+        return True
+    if isinstance(error, praw.exceptions.RedditAPIException):
+        return any(
+            error_item.error_type == RATELIMIT_ERROR_TYPE
+            for error_item in error.items
+        )
+    return False
+
+
+def get_backoff_s(
+    error_count: int,
+    retry_config: submanager.models.config.RetryConfig,
+) -> float:
+    """Get how long to wait before retrying an item after repeated errors."""
+    backoff_s: float = retry_config.backoff_initial_s * (
+        retry_config.backoff_factor ** max(error_count - 1, 0)
+    )
+    return min(backoff_s, retry_config.backoff_max_s)
+
+
+def is_quarantined(
+    dynamic_config: submanager.models.config.DynamicSyncItemConfig,
+    retry_config: submanager.models.config.RetryConfig | None,
+) -> bool:
+    """Check if an item is waiting out its back-off after an error."""
+    if retry_config is None or not retry_config.enabled:
+        return False
+    return dynamic_config.retry_timestamp > time.time()
+
+
+def record_item_error(
+    error: BaseException,
+    item_config: submanager.models.base.ItemConfig,
+    dynamic_config: submanager.models.config.DynamicSyncItemConfig,
+    retry_config: submanager.models.config.RetryConfig,
+) -> None:
+    """Quarantine an item with back-off after it failed with an error."""
+    dynamic_config.error_count += 1
+    retryable = is_retryable_error(error)
+    if retryable:
+        backoff_s = get_backoff_s(dynamic_config.error_count, retry_config)
+    else:
+        backoff_s = retry_config.backoff_max_s
+    dynamic_config.retry_timestamp = time.time() + backoff_s
+    # Make sure all targets are brought up to date on the next attempt
+    dynamic_config.source_timestamp = 0
+    dynamic_config.source_hash = None
+    error_kind = "Transient" if retryable else "Persistent"
+    print(  # noqa: WPS421
+        f"{error_kind} error in item {item_config.uid} "
+        f"(failure #{dynamic_config.error_count}); "
+        f"quarantined for {backoff_s:.0f} s: "
+        f"{submanager.utils.output.format_error(error)}",
+    )
+
+
+def run_isolated(
+    run_item: Callable[[], None],
+    item_config: submanager.models.base.ItemConfig,
+    dynamic_config: submanager.models.config.DynamicSyncItemConfig,
+    retry_config: submanager.models.config.RetryConfig,
+    *,
+    verbose: bool = True,
+) -> bool:
+    """Run an item, quarantining it with back-off if it fails with an error."""
+    vprint = submanager.utils.output.VerbosePrinter(enable=verbose)
+    if not retry_config.enabled:
+        run_item()
+        return True
+
+    if is_quarantined(dynamic_config, retry_config):
+        retry_in_s = dynamic_config.retry_timestamp - time.time()
+        vprint(
+            f"Skipping quarantined item {item_config.uid} "
+            f"for {retry_in_s:.0f} s",
+        )
+        return False
+
+    try:
+        run_item()
+    except ITEM_ERRORS as error:
+        if is_fatal_error(error):
+            raise
+        record_item_error(error, item_config, dynamic_config, retry_config)
+        return False
+
+    dynamic_config.error_count = 0
+    dynamic_config.retry_timestamp = 0
+    return True
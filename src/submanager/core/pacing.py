@@ -0,0 +1,41 @@
+"""Spread items evenly across the repeat interval with stable phase offsets."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import hashlib
+from typing import (
+    NamedTuple,
+)
+
+# Third party imports
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.models.base
+
+PHASE_HASH_BYTES: Final[int] = 8
+
+
+def get_phase_fraction(uid: str) -> float:
+    """Get a stable fraction in [0, 1) of the interval at which to run."""
+    uid_hash = hashlib.sha256(uid.encode("utf-8")).digest()
+    hash_value = int.from_bytes(uid_hash[:PHASE_HASH_BYTES], byteorder="big")
+    return hash_value / float(1 << (PHASE_HASH_BYTES * 8))
+
+
+class PhaseSlot(NamedTuple):
+    """One of a number of equal slots the repeat interval is divided into."""
+
+    slot_index: int
+    slot_count: int
+
+    def contains(self, item_config: submanager.models.base.ItemConfig) -> bool:
+        """Check if the item's phase offset falls within this slot."""
+        item_slot = int(get_phase_fraction(item_config.uid) * self.slot_count)
+        return item_slot == self.slot_index % self.slot_count
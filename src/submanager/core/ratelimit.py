@@ -0,0 +1,168 @@
+"""Pace requests to stay within each account's Reddit rate limit budget."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import contextlib
+import contextvars
+import threading
+import time
+from typing import (
+    Generator,
+    Mapping,
+    NamedTuple,
+    Union,
+)
+
+# Third party imports
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.models.config
+from submanager.types import (
+    AccountsMap,
+)
+
+HEADER_REMAINING: Final[str] = "x-ratelimit-remaining"
+HEADER_RESET: Final[str] = "x-ratelimit-reset"
+HEADER_USED: Final[str] = "x-ratelimit-used"
+
+READ_METHODS: Final[frozenset[str]] = frozenset(("get", "head", "options"))
+
+# Whether requests in this context are low priority, e.g. change probes
+BACKGROUND_REQUESTS: Final[
+    contextvars.ContextVar[bool]
+] = contextvars.ContextVar("background_requests", default=False)
+
+
+class AccountBudget(NamedTuple):
+    """The rate limit budget left for an account in the current window."""
+
+    remaining: float | None
+    used: int | None
+    reset_timestamp: float | None
+
+
+def get_account_budgets(accounts: AccountsMap) -> dict[str, AccountBudget]:
+    """Get the current rate limit budget of each account, for monitoring."""
+    account_budgets = {}
+    for account_key, reddit in accounts.items():
+        limits: Mapping[str, Union[float, None]] = reddit.auth.limits
+        used = limits["used"]
+        account_budgets[account_key] = AccountBudget(
+            remaining=limits["remaining"],
+            used=None if used is None else int(used),
+            reset_timestamp=limits["reset_timestamp"],
+        )
+    return account_budgets
+
+
+@contextlib.contextmanager
+def background_requests() -> Generator[None, None, None]:
+    """Give the requests made within lower priority than syncing items."""
+    context_token = BACKGROUND_REQUESTS.set(True)
+    try:
+        yield
+    finally:
+        BACKGROUND_REQUESTS.reset(context_token)
+
+
+def format_account_budgets(
+    account_budgets: Mapping[str, AccountBudget],
+) -> str:
+    """Format the account rate limit budgets as a human-readable summary."""
+    budget_lines = []
+    for account_key, account_budget in account_budgets.items():
+        if account_budget.remaining is None:
+            budget_lines.append(f"{account_key}: no requests made")
+            continue
+        reset_in_s = max(
+            (account_budget.reset_timestamp or 0) - time.time(),
+            0,
+        )
+        budget_lines.append(
+            f"{account_key}: {account_budget.remaining:.0f} remaining, "
+            f"{account_budget.used} used, resets in {reset_in_s:.0f} s",
+        )
+    return "\n".join(budget_lines)
+
+
+class RequestPacer:
+    """Spread an account's reads over its budget, keeping some for writes.
+
+    Background requests (e.g. change probes) also leave a reserve for the
+    reads of the items actually being synced.
+    """
+
+    def __init__(
+        self,
+        rate_limit_config: submanager.models.config.RateLimitConfig,
+    ) -> None:
+        self.rate_limit_config = rate_limit_config
+        self.remaining: float | None = None
+        self.used: int | None = None
+        self.reset_timestamp: float | None = None
+        self._next_read_timestamp: float = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, *, write: bool, background: bool = False) -> float:
+        """Reserve a slot for a request, returning the wait time until it."""
+        with self._lock:
+            current_time = time.time()
+            if (
+                not self.rate_limit_config.enabled
+                or self.remaining is None
+                or self.reset_timestamp is None
+                or self.reset_timestamp <= current_time
+            ):
+                return 0
+            reset_in_s = self.reset_timestamp - current_time
+
+            # Writes only have to wait if the budget is entirely used up
+            if write:
+                return 0 if self.remaining >= 1 else reset_in_s
+
+            # Reads hold back a reserve for writes, and are paced evenly
+            remaining_reads = (
+                self.remaining - self.rate_limit_config.write_reserve
+            )
+            if background:
+                remaining_reads -= self.rate_limit_config.background_reserve
+            if remaining_reads < 1:
+                return reset_in_s
+            read_timestamp = max(
+                self._next_read_timestamp,
+                current_time - self.rate_limit_config.read_burst_s,
+            )
+            self._next_read_timestamp = read_timestamp + (
+                reset_in_s / remaining_reads
+            )
+            return max(read_timestamp - current_time, 0)
+
+    def wait(self, method: str) -> None:
+        """Wait for the slot for a request with the given HTTP method."""
+        wait_s = self.reserve(
+            write=method.lower() not in READ_METHODS,
+            background=BACKGROUND_REQUESTS.get(),
+        )
+        if wait_s > 0:
+            time.sleep(wait_s)  # nosemgrep
+
+    def update(self, response_headers: Mapping[str, str]) -> None:
+        """Update the remaining budget from a response's rate limit headers."""
+        with self._lock:
+            if HEADER_REMAINING not in response_headers:
+                if self.remaining is not None and self.used is not None:
+                    self.remaining -= 1
+                    self.used += 1
+                return
+            self.remaining = float(response_headers[HEADER_REMAINING])
+            self.used = int(response_headers[HEADER_USED])
+            self.reset_timestamp = time.time() + float(
+                response_headers[HEADER_RESET],
+            )
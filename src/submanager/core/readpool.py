@@ -0,0 +1,150 @@
+"""Spread read-only fetches across the accounts that can access them."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import threading
+import time
+
+# Local imports
+import submanager.core.ratelimit
+import submanager.models.config
+import submanager.validation.cache
+from submanager.types import (
+    AccountsMap,
+)
+
+
+def get_pool_accounts(
+    static_config: submanager.models.config.StaticConfig,
+) -> list[str]:
+    """Get the keys of the accounts that may be used for reads."""
+    pool_accounts = static_config.read_pool.accounts or list(
+        static_config.accounts,
+    )
+    return [
+        account_key
+        for account_key in pool_accounts
+        if account_key in static_config.accounts
+    ]
+
+
+def make_reader_config(
+    endpoint_config: submanager.models.config.EndpointTypeConfig,
+    account_key: str,
+) -> submanager.models.config.EndpointTypeConfig:
+    """Get a copy of an endpoint config that reads using another account."""
+    return endpoint_config.copy(
+        update={
+            "context": endpoint_config.context.copy(
+                update={"account": account_key},
+            ),
+        },
+    )
+
+
+class ReadPool:
+    """Pick the account to use for fetches that only need read access."""
+
+    def __init__(
+        self,
+        static_config: submanager.models.config.StaticConfig,
+        accounts: AccountsMap,
+        validation_cache: submanager.validation.cache.ValidationCacheSession,
+    ) -> None:
+        self.static_config = static_config
+        self.accounts = accounts
+        self.validation_cache = validation_cache
+        # Readers of each endpoint, with when they were looked up
+        self._readers: dict[str, tuple[float, list[str]]] = {}
+        self._lock = threading.Lock()
+
+    def get_readers(
+        self,
+        endpoint_config: submanager.models.config.EndpointTypeConfig,
+    ) -> list[str]:
+        """Get the owning account and the others found able to read it."""
+        with self._lock:
+            cache_entry = self._readers.get(endpoint_config.uid, None)
+        # Look them up again once the validation they're based on is stale
+        if cache_entry is not None and (
+            time.time() - cache_entry[0] <= self.static_config.validation_ttl_s
+        ):
+            return cache_entry[1]
+        owner = endpoint_config.context.account
+        readers = [owner] + [
+            account_key
+            for account_key in get_pool_accounts(self.static_config)
+            if account_key != owner
+            and account_key in self.accounts
+            and self.validation_cache.check_endpoint(
+                make_reader_config(endpoint_config, account_key),
+            )
+        ]
+        with self._lock:
+            self._readers[endpoint_config.uid] = (time.time(), readers)
+        return readers
+
+    def drop_reader(
+        self,
+        endpoint_config: submanager.models.config.EndpointTypeConfig,
+        account_key: str,
+    ) -> None:
+        """Stop reading an endpoint with an account that lost access to it."""
+        if account_key == endpoint_config.context.account:
+            return
+        with self._lock:
+            cache_entry = self._readers.get(endpoint_config.uid, None)
+            if cache_entry is None:
+                return
+            lookup_time, readers = cache_entry
+            self._readers[endpoint_config.uid] = (
+                lookup_time,
+                [reader for reader in readers if reader != account_key],
+            )
+
+    def get_reader(
+        self,
+        endpoint_config: submanager.models.config.EndpointTypeConfig,
+    ) -> str:
+        """Get the account with the most budget left to read an endpoint."""
+        readers = self.get_readers(endpoint_config)
+        account_budgets = submanager.core.ratelimit.get_account_budgets(
+            AccountsMap(
+                {
+                    account_key: self.accounts[account_key]
+                    for account_key in readers
+                },
+            ),
+        )
+        return max(
+            readers,
+            key=lambda account_key: (
+                account_budgets[account_key].remaining is None,
+                account_budgets[account_key].remaining or 0,
+            ),
+        )
+
+
+def load_read_pool(
+    static_config: submanager.models.config.StaticConfig,
+    accounts: AccountsMap,
+    config_paths: submanager.models.config.ConfigPaths,
+) -> ReadPool | None:
+    """Set up the read pool from the validation results, if enabled."""
+    if not static_config.read_pool.enabled:
+        return None
+    validation_cache = submanager.validation.cache.ValidationCacheSession(
+        static_config=static_config,
+        validation_cache=submanager.validation.cache.load_validation_cache(
+            config_paths.validation_cache,
+        ),
+    )
+    return ReadPool(
+        static_config=static_config,
+        accounts=accounts,
+        validation_cache=validation_cache,
+    )
@@ -0,0 +1,88 @@
+"""Requestor used by PRAW to make HTTP requests on behalf of each account."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import functools
+from typing import (
+    Any,
+)
+
+# Third party imports
+import prawcore.requestor
+import requests
+
+# Local imports
+import submanager.core.cassette
+import submanager.core.ratelimit
+import submanager.core.tokens
+
+
+class SubManagerRequestor(prawcore.requestor.Requestor):
+    """Requestor that caches tokens, paces and records requests if enabled."""
+
+    def __init__(
+        self,
+        *args: Any,
+        token_cache: submanager.core.tokens.TokenCache | None = None,
+        request_pacer: submanager.core.ratelimit.RequestPacer | None = None,
+        cassette: submanager.core.cassette.CassetteHook | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.token_cache = token_cache
+        self.request_pacer = request_pacer
+        self.cassette = cassette
+
+    def request(
+        self,
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Issue the HTTP request, using the token cache and pacer if set."""
+        method, url = args[:2]
+        send_request = functools.partial(
+            super().request,
+            *args,
+            timeout=timeout,
+            **kwargs,
+        )
+        # Record or replay only what would actually be sent over the network
+        if self.cassette is not None:
+            send_request = functools.partial(
+                self.cassette.request,
+                send_request,
+                method,
+                url,
+                params=kwargs.get("params", None),
+                data=kwargs.get("data", None),
+                json_data=kwargs.get("json", None),
+            )
+
+        data = kwargs.get("data", None)
+        if self.token_cache is not None and (
+            submanager.core.tokens.is_cacheable_token_request(
+                method, url, data
+            )
+        ):
+            token_key = submanager.core.tokens.hash_token_request(
+                url=url,
+                auth=kwargs.get("auth", None),
+                data=data,
+            )
+            return self.token_cache.request_token(
+                token_key,
+                send_request,
+                url=url,
+            )
+
+        if self.request_pacer is None:
+            return send_request()
+        self.request_pacer.wait(method)
+        response = send_request()
+        self.request_pacer.update(response.headers)
+        return response
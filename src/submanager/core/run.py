@@ -6,18 +6,33 @@ from __future__ import (
 )
 
 # Standard library imports
+import itertools
+import os
+import time
 from typing import (
+    Callable,
     Collection,
+    NamedTuple,
 )
 
 # Local imports
 import submanager.config.dynamic
 import submanager.config.utils
+import submanager.core.cassette
+import submanager.core.control
 import submanager.core.initialization
+import submanager.core.pacing
+import submanager.core.ratelimit
+import submanager.core.readpool
+import submanager.core.session
 import submanager.exceptions
 import submanager.models.config
+import submanager.sync.cache
 import submanager.sync.manager
+import submanager.sync.modlog
+import submanager.sync.probe
 import submanager.thread.manager
+import submanager.thread.utils
 import submanager.utils.misc
 import submanager.utils.output
 import submanager.validation.validate
@@ -26,66 +41,99 @@ from submanager.constants import (
 )
 from submanager.types import (
     AccountsMap,
+    ControlHandler,
     PathLikeStr,
 )
 
 
+def reset_sync_timestamps(
+    dynamic_config: submanager.models.config.DynamicConfig,
+    item_keys: Collection[str] | None = None,
+) -> None:
+    """Reset the source timestamps so items get resynced and retried."""
+    dynamic_items: itertools.chain[
+        tuple[str, submanager.models.config.DynamicSyncItemConfig]
+    ] = itertools.chain(
+        dynamic_config.sync_manager.items.items(),
+        dynamic_config.thread_manager.items.items(),
+    )
+    for item_key, dynamic_item in dynamic_items:
+        if item_keys is None or item_key in item_keys:
+            dynamic_item.source_timestamp = 0
+            dynamic_item.source_hash = None
+            dynamic_item.retry_timestamp = 0
+
+
+class InitialSetup(NamedTuple):
+    """The loaded config and accounts, and the pool the accounts share."""
+
+    static_config: submanager.models.config.StaticConfig
+    accounts: AccountsMap
+    http_adapter: submanager.core.session.SharedHTTPAdapter
+
+
 def run_initial_setup(
     config_paths: submanager.models.config.ConfigPaths | None = None,
     *,
     skip_validate: bool = False,
+    revalidate_all: bool = False,
     resync_all: bool = False,
-) -> tuple[submanager.models.config.StaticConfig, AccountsMap]:
+    cassette: submanager.core.cassette.CassetteHook | None = None,
+) -> InitialSetup:
     """Run initial run-time setup for each time the application is started."""
     if config_paths is None:
         config_paths = submanager.models.config.ConfigPaths()
-    if not skip_validate:
-        submanager.validation.validate.validate_config(
-            config_paths=config_paths,
-            offline_only=False,
-            raise_error=True,
-            verbose=True,
-        )
-
     (
         static_config,
         dynamic_config,
     ) = submanager.core.initialization.setup_config(config_paths=config_paths)
-    accounts = submanager.core.initialization.setup_accounts(
-        static_config.accounts,
+
+    # Validate and run with the same pool, closed by the caller when done
+    http_adapter = submanager.core.session.create_http_adapter(
+        static_config.http,
+        account_count=len(static_config.accounts),
     )
+    try:
+        if not skip_validate:
+            submanager.validation.validate.validate_config(
+                config_paths=config_paths,
+                offline_only=False,
+                use_cache=not revalidate_all,
+                raise_error=True,
+                http_adapter=http_adapter,
+                verbose=True,
+            )
+        accounts = submanager.core.initialization.setup_accounts(
+            static_config.accounts,
+            token_cache_path=config_paths.token_cache,
+            rate_limit_config=static_config.rate_limit,
+            http_adapter=http_adapter,
+            cassette=cassette,
+            reddit_url=static_config.http.reddit_url,
+        )
+    except BaseException:
+        http_adapter.close_pool()
+        raise
 
-    # Reset the source timestamps so all items get resynced
+    # Reset the source timestamps so all items get resynced and retried
     if resync_all:
-        dynamic_items: list[
-            submanager.models.config.DynamicSyncItemConfig
-        ] = list(dynamic_config.sync_manager.items.values()) + list(
-            dynamic_config.thread_manager.items.values(),
-        )
-        for item in dynamic_items:
-            item.source_timestamp = 0
+        reset_sync_timestamps(dynamic_config)
         submanager.config.utils.write_config(
             dynamic_config,
             config_path=config_paths.dynamic,
         )
 
-    return static_config, accounts
+    return InitialSetup(static_config, accounts, http_adapter)
 
 
-def run_cycle_threads(
+def cycle_threads(
+    static_config: submanager.models.config.StaticConfig,
+    accounts: AccountsMap,
     thread_keys: Collection[str],
-    config_paths: submanager.models.config.ConfigPaths | None = None,
+    config_path_dynamic: PathLikeStr = CONFIG_PATH_DYNAMIC,
 ) -> None:
-    """Post new threads for one or more existing managed threads."""
-    if config_paths is None:
-        config_paths = submanager.models.config.ConfigPaths()
+    """Post new threads for the passed managed threads."""
     thread_keys = set(thread_keys)
-
-    static_config, accounts = run_initial_setup(
-        config_paths,
-        skip_validate=True,
-        resync_all=False,
-    )
     managed_threads = static_config.thread_manager.items
 
     keys_notfound = thread_keys - managed_threads.keys()
@@ -100,7 +148,7 @@ def run_cycle_threads(
     }
     with submanager.config.dynamic.LockedandLoadedDynamicConfig(
         static_config=static_config,
-        config_path=config_paths.dynamic,
+        config_path=config_path_dynamic,
         verbose=True,
     ) as dynamic_config:
         for thread_key, thread_config in threads_tocycle.items():
@@ -112,8 +160,147 @@ def run_cycle_threads(
             )
         submanager.config.utils.write_config(
             dynamic_config,
-            config_path=config_paths.dynamic,
+            config_path=config_path_dynamic,
+        )
+
+
+def run_cycle_threads(
+    thread_keys: Collection[str],
+    config_paths: submanager.models.config.ConfigPaths | None = None,
+) -> None:
+    """Post new threads for one or more existing managed threads."""
+    if config_paths is None:
+        config_paths = submanager.models.config.ConfigPaths()
+
+    # Hand off to the running Sub Manager, if there is one
+    if submanager.core.control.run_on_daemon(
+        config_paths.control_socket,
+        submanager.core.control.COMMAND_CYCLE_THREADS,
+        {"thread_keys": sorted(thread_keys)},
+    ):
+        return
+
+    static_config, accounts, http_adapter = run_initial_setup(
+        config_paths,
+        skip_validate=True,
+        resync_all=False,
+    )
+    try:
+        cycle_threads(
+            static_config=static_config,
+            accounts=accounts,
+            thread_keys=thread_keys,
+            config_path_dynamic=config_paths.dynamic,
+        )
+    finally:
+        http_adapter.close_pool()
+
+
+def sync_items(
+    static_config: submanager.models.config.StaticConfig,
+    accounts: AccountsMap,
+    item_keys: Collection[str],
+    config_path_dynamic: PathLikeStr = CONFIG_PATH_DYNAMIC,
+    *,
+    resync: bool = False,
+    read_pool: submanager.core.readpool.ReadPool | None = None,
+    verbose: bool = False,
+) -> None:
+    """Sync the passed sync and thread items now, regardless of schedule."""
+    sync_keys = set(item_keys) & static_config.sync_manager.items.keys()
+    thread_keys = set(item_keys) & static_config.thread_manager.items.keys()
+    keys_notfound = set(item_keys) - sync_keys - thread_keys
+    if keys_notfound:
+        raise submanager.exceptions.SubManagerUserError(
+            f"Item keys {keys_notfound!r} not found in sync or thread items",
+        )
+
+    with submanager.config.dynamic.LockedandLoadedDynamicConfig(
+        static_config=static_config,
+        config_path=config_path_dynamic,
+        verbose=True,
+    ) as dynamic_config:
+        if resync:
+            reset_sync_timestamps(dynamic_config, item_keys)
+        for sync_key in sorted(sync_keys):
+            submanager.sync.manager.sync_one(
+                sync_item=static_config.sync_manager.items[sync_key],
+                dynamic_config=dynamic_config.sync_manager.items[sync_key],
+                accounts=accounts,
+                read_pool=read_pool,
+            )
+        for thread_key in sorted(thread_keys):
+            submanager.thread.manager.manage_thread(
+                thread_config=static_config.thread_manager.items[thread_key],
+                dynamic_config=dynamic_config.thread_manager.items[thread_key],
+                accounts=accounts,
+                read_pool=read_pool,
+                verbose=verbose,
+            )
+        submanager.config.utils.write_config(
+            dynamic_config,
+            config_path=config_path_dynamic,
+        )
+
+
+def run_sync_items(
+    item_keys: Collection[str],
+    config_paths: submanager.models.config.ConfigPaths | None = None,
+    *,
+    resync_all: bool = False,
+    verbose: bool = True,
+) -> None:
+    """Sync one or more sync or thread items now."""
+    if config_paths is None:
+        config_paths = submanager.models.config.ConfigPaths()
+
+    # Hand off to the running Sub Manager, if there is one
+    if submanager.core.control.run_on_daemon(
+        config_paths.control_socket,
+        submanager.core.control.COMMAND_SYNC,
+        {"item_keys": sorted(item_keys), "resync": resync_all},
+        verbose=verbose,
+    ):
+        return
+
+    static_config, accounts, http_adapter = run_initial_setup(
+        config_paths,
+        skip_validate=True,
+        resync_all=False,
+    )
+    try:
+        sync_items(
+            static_config=static_config,
+            accounts=accounts,
+            item_keys=item_keys,
+            config_path_dynamic=config_paths.dynamic,
+            resync=resync_all,
+            read_pool=submanager.core.readpool.load_read_pool(
+                static_config,
+                accounts,
+                config_paths,
+            ),
+            verbose=verbose,
         )
+    finally:
+        http_adapter.close_pool()
+
+
+def write_dynamic_config_if_dirty(
+    dynamic_config: submanager.models.config.DynamicConfig,
+    config_path_dynamic: PathLikeStr = CONFIG_PATH_DYNAMIC,
+) -> bool:
+    """Write out the dynamic config only if any of its state changed."""
+    dirty_models = dynamic_config.get_dirty_models()
+    if not dirty_models:
+        return False
+    submanager.config.utils.write_config(
+        dynamic_config,
+        config_path=config_path_dynamic,
+    )
+    for dirty_model in dirty_models:
+        dirty_model.mark_clean()
+    return True
 
 
 def run_manage_once(
@@ -121,6 +308,16 @@ def run_manage_once(
     accounts: AccountsMap,
     config_path_dynamic: PathLikeStr = CONFIG_PATH_DYNAMIC,
     *,
+    target_cache_path: PathLikeStr | None = None,
+    phase_slot: submanager.core.pacing.PhaseSlot | None = None,
+    read_pool: submanager.core.readpool.ReadPool | None = None,
+    render_cache: submanager.sync.cache.RenderCache | None = None,
+    dynamic_config_cache: (
+        submanager.config.dynamic.DynamicConfigCache | None
+    ) = None,
+    thread_config_cache: (
+        submanager.thread.utils.ThreadConfigCache | None
+    ) = None,
     verbose: bool = False,
 ) -> None:
     """Run the manage loop once, without validation checks."""
@@ -132,59 +329,379 @@ def run_manage_once(
         static_config=static_config,
         config_path=config_path_dynamic,
         verbose=True,
+        cache=dynamic_config_cache,
     ) as dynamic_config:
-        dynamic_config_active = dynamic_config.copy(deep=True)
-
         # Run the core manager tasks
         if static_config.sync_manager.enabled:
+            modlog_changes = None
+            modlog_filter = None
+            sync_phase_slot = phase_slot
+            if static_config.modlog.enabled:
+                modlog_changes = submanager.sync.modlog.poll_modlog(
+                    static_config,
+                    dynamic_config.modlog,
+                    accounts,
+                    verbose=verbose,
+                )
+                modlog_filter = submanager.sync.modlog.get_modlog_filter(
+                    static_config,
+                    dynamic_config,
+                    modlog_changes,
+                )
+                # The modlog picks the items, so touched ones aren't deferred
+                sync_phase_slot = None
+            target_cache = None
+            if target_cache_path is not None:
+                target_cache = submanager.sync.cache.TargetContentCache(
+                    submanager.sync.cache.load_target_cache(target_cache_path),
+                )
             submanager.sync.manager.sync_all(
                 static_config.sync_manager,
-                dynamic_config_active.sync_manager,
+                dynamic_config.sync_manager,
                 accounts,
+                retry_config=static_config.retry,
+                phase_slot=sync_phase_slot,
+                item_filter=modlog_filter,
+                read_pool=read_pool,
+                target_cache=target_cache,
+                render_cache=render_cache,
             )
+            if target_cache is not None and target_cache_path is not None:
+                target_cache.write(target_cache_path)
+            if modlog_changes is not None:
+                modlog_changes.advance_cursors(dynamic_config.modlog)
         if static_config.thread_manager.enabled:
             submanager.thread.manager.manage_threads(
                 static_config.thread_manager,
-                dynamic_config_active.thread_manager,
+                dynamic_config.thread_manager,
                 accounts,
+                retry_config=static_config.retry,
+                phase_slot=phase_slot,
+                read_pool=read_pool,
+                config_cache=thread_config_cache,
             )
 
         # Write out the dynamic config if it changed
-        if dynamic_config_active != dynamic_config:
-            submanager.config.utils.write_config(
-                dynamic_config_active,
-                config_path=config_path_dynamic,
-            )
+        write_dynamic_config_if_dirty(dynamic_config, config_path_dynamic)
+    vprint(
+        "Rate limit budget remaining:\n"
+        + submanager.core.ratelimit.format_account_budgets(
+            submanager.core.ratelimit.get_account_budgets(accounts),
+        ),
+    )
+    if render_cache is not None:
+        vprint(f"Render cache: {render_cache.format_stats()}")
     vprint("Sub Manager run complete")
 
 
+def run_probe_once(
+    static_config: submanager.models.config.StaticConfig,
+    accounts: AccountsMap,
+    config_path_dynamic: PathLikeStr = CONFIG_PATH_DYNAMIC,
+    *,
+    target_cache_path: PathLikeStr | None = None,
+    read_pool: submanager.core.readpool.ReadPool | None = None,
+    render_cache: submanager.sync.cache.RenderCache | None = None,
+    dynamic_config_cache: (
+        submanager.config.dynamic.DynamicConfigCache | None
+    ) = None,
+    verbose: bool = False,
+) -> None:
+    """Probe sync sources for changes and sync only those that changed."""
+    if not static_config.sync_manager.enabled:
+        return
+    with submanager.config.dynamic.LockedandLoadedDynamicConfig(
+        static_config=static_config,
+        config_path=config_path_dynamic,
+        verbose=verbose,
+        cache=dynamic_config_cache,
+    ) as dynamic_config:
+        target_cache = None
+        if target_cache_path is not None:
+            target_cache = submanager.sync.cache.TargetContentCache(
+                submanager.sync.cache.load_target_cache(target_cache_path),
+            )
+        submanager.sync.manager.sync_all(
+            static_config.sync_manager,
+            dynamic_config.sync_manager,
+            accounts,
+            retry_config=static_config.retry,
+            item_filter=submanager.sync.probe.get_probe_filter(
+                static_config.sync_manager,
+                dynamic_config.sync_manager,
+                accounts,
+                verbose=verbose,
+            ),
+            read_pool=read_pool,
+            target_cache=target_cache,
+            render_cache=render_cache,
+        )
+        if target_cache is not None and target_cache_path is not None:
+            target_cache.write(target_cache_path)
+        write_dynamic_config_if_dirty(dynamic_config, config_path_dynamic)
+
+
+def wait_with_probes(
+    static_config: submanager.models.config.StaticConfig,
+    accounts: AccountsMap,
+    config_path_dynamic: PathLikeStr,
+    wait_interval_s: float,
+    *,
+    target_cache_path: PathLikeStr | None = None,
+    read_pool: submanager.core.readpool.ReadPool | None = None,
+    render_cache: submanager.sync.cache.RenderCache | None = None,
+    dynamic_config_cache: (
+        submanager.config.dynamic.DynamicConfigCache | None
+    ) = None,
+    sleep_for_interval: Callable[
+        [float],
+        None,
+    ] = submanager.utils.misc.sleep_for_interval,
+    verbose: bool = False,
+) -> None:
+    """Wait until the next full run, probing for changes in the meantime."""
+    wait_until = time.monotonic() + wait_interval_s
+    while True:
+        time_left_s = wait_until - time.monotonic()
+        if time_left_s <= 0:
+            return
+        sleep_for_interval(min(time_left_s, static_config.probe.interval_s))
+        if time.monotonic() < wait_until:
+            run_probe_once(
+                static_config=static_config,
+                accounts=accounts,
+                config_path_dynamic=config_path_dynamic,
+                target_cache_path=target_cache_path,
+                read_pool=read_pool,
+                render_cache=render_cache,
+                dynamic_config_cache=dynamic_config_cache,
+                verbose=verbose,
+            )
+
+
 def run_manage(
     config_paths: submanager.models.config.ConfigPaths | None = None,
     *,
     skip_validate: bool = False,
+    revalidate_all: bool = False,
     resync_all: bool = False,
+    record_cassette: PathLikeStr | None = None,
     verbose: bool = True,
 ) -> None:
     """Load the config file and run the thread manager."""
     if config_paths is None:
         config_paths = submanager.models.config.ConfigPaths()
-    static_config, accounts = run_initial_setup(
+
+    # Hand off to the running Sub Manager, if there is one
+    if (
+        not revalidate_all
+        and record_cassette is None
+        and submanager.core.control.run_on_daemon(
+            config_paths.control_socket,
+            submanager.core.control.COMMAND_SYNC,
+            {"resync": resync_all, "validate": not skip_validate},
+            verbose=verbose,
+        )
+    ):
+        return
+
+    cassette_recorder = None
+    if record_cassette is not None:
+        cassette_recorder = submanager.core.cassette.CassetteRecorder()
+    static_config, accounts, http_adapter = run_initial_setup(
         config_paths,
         skip_validate=skip_validate,
+        revalidate_all=revalidate_all,
         resync_all=resync_all,
+        cassette=cassette_recorder,
     )
-    run_manage_once(
-        static_config=static_config,
-        accounts=accounts,
-        config_path_dynamic=config_paths.dynamic,
-        verbose=verbose,
-    )
+    if cassette_recorder is not None:
+        cassette_recorder.snapshot(config_paths)
+    try:
+        run_manage_once(
+            static_config=static_config,
+            accounts=accounts,
+            config_path_dynamic=config_paths.dynamic,
+            target_cache_path=config_paths.target_cache,
+            read_pool=submanager.core.readpool.load_read_pool(
+                static_config,
+                accounts,
+                config_paths,
+            ),
+            verbose=verbose,
+        )
+    finally:
+        http_adapter.close_pool()
+    if cassette_recorder is not None and record_cassette is not None:
+        cassette_recorder.write(record_cassette)
+        vprint = submanager.utils.output.VerbosePrinter(enable=verbose)
+        vprint(f"Recorded requests to cassette {record_cassette!r}")
+
+
+class ManageDaemon:
+    """A running Sub Manager and the commands it accepts while running."""
+
+    def __init__(
+        self,
+        config_paths: submanager.models.config.ConfigPaths,
+        *,
+        skip_validate: bool = False,
+        revalidate_all: bool = False,
+        verbose: bool = True,
+    ) -> None:
+        self.config_paths = config_paths
+        self.verbose = verbose
+        self.start_time = time.time()
+        self.run_count = 0
+        self.last_run_time: float | None = None
+        (
+            self.static_config,
+            self.accounts,
+            self.http_adapter,
+        ) = run_initial_setup(
+            config_paths,
+            skip_validate=skip_validate,
+            revalidate_all=revalidate_all,
+            resync_all=True,
+        )
+        self.read_pool = submanager.core.readpool.load_read_pool(
+            self.static_config,
+            self.accounts,
+            config_paths,
+        )
+        self.render_cache = submanager.sync.cache.RenderCache()
+        # Reused between the runs of each slot, rather than loaded each time
+        self.dynamic_config_cache = (
+            submanager.config.dynamic.DynamicConfigCache()
+        )
+        self.thread_config_cache = submanager.thread.utils.ThreadConfigCache()
+
+    @property
+    def handlers(self) -> dict[str, ControlHandler]:
+        """Get the handlers for each command accepted over the socket."""
+        return {
+            submanager.core.control.COMMAND_CYCLE_THREADS: self.cycle_threads,
+            submanager.core.control.COMMAND_RELOAD: self.reload,
+            submanager.core.control.COMMAND_STATUS: self.get_status,
+            submanager.core.control.COMMAND_SYNC: self.sync_items,
+        }
+
+    def run_once(
+        self,
+        phase_slot: submanager.core.pacing.PhaseSlot | None = None,
+    ) -> None:
+        """Run the manage loop once with the current config."""
+        run_manage_once(
+            static_config=self.static_config,
+            accounts=self.accounts,
+            config_path_dynamic=self.config_paths.dynamic,
+            target_cache_path=self.config_paths.target_cache,
+            phase_slot=phase_slot,
+            read_pool=self.read_pool,
+            render_cache=self.render_cache,
+            dynamic_config_cache=self.dynamic_config_cache,
+            thread_config_cache=self.thread_config_cache,
+            verbose=self.verbose,
+        )
+        self.run_count += 1
+        self.last_run_time = time.time()
+
+    def cycle_threads(self, thread_keys: Collection[str]) -> str:
+        """Post new threads for the passed managed threads."""
+        cycle_threads(
+            static_config=self.static_config,
+            accounts=self.accounts,
+            thread_keys=thread_keys,
+            config_path_dynamic=self.config_paths.dynamic,
+        )
+        return f"Cycled threads {sorted(thread_keys)!r}"
+
+    def sync_items(
+        self,
+        item_keys: Collection[str] = (),
+        resync: bool = False,
+        validate: bool = False,
+    ) -> str:
+        """Sync the passed items now, or run all of them if none passed."""
+        # Like a standalone run, load and check the config on disk first
+        if validate:
+            self.reload()
+        if item_keys:
+            sync_items(
+                static_config=self.static_config,
+                accounts=self.accounts,
+                item_keys=item_keys,
+                config_path_dynamic=self.config_paths.dynamic,
+                resync=resync,
+                read_pool=self.read_pool,
+                verbose=self.verbose,
+            )
+            return f"Synced items {sorted(item_keys)!r}"
+
+        if resync:
+            with submanager.config.dynamic.LockedandLoadedDynamicConfig(
+                static_config=self.static_config,
+                config_path=self.config_paths.dynamic,
+                verbose=True,
+            ) as dynamic_config:
+                reset_sync_timestamps(dynamic_config)
+                submanager.config.utils.write_config(
+                    dynamic_config,
+                    config_path=self.config_paths.dynamic,
+                )
+        self.run_once()
+        return "Ran all items"
+
+    def reload(self) -> str:
+        """Reload and revalidate the config, keeping the old one on error."""
+        static_config, accounts, http_adapter = run_initial_setup(
+            self.config_paths,
+            resync_all=False,
+        )
+        self.read_pool = submanager.core.readpool.load_read_pool(
+            static_config,
+            accounts,
+            self.config_paths,
+        )
+        self.http_adapter.close_pool()
+        self.static_config, self.accounts = static_config, accounts
+        self.http_adapter = http_adapter
+        return f"Reloaded config {self.config_paths.static.as_posix()!r}"
+
+    def close(self) -> None:
+        """Close the connections of the accounts, once done running."""
+        self.http_adapter.close_pool()
+
+    def get_status(self) -> str:
+        """Get a summary of the state of the running Sub Manager."""
+        last_run = "never"
+        if self.last_run_time is not None:
+            last_run = f"{time.time() - self.last_run_time:.0f} s ago"
+        status_lines = [
+            (
+                f"Sub Manager running as PID {os.getpid()} "
+                f"for {time.time() - self.start_time:.0f} s"
+            ),
+            f"Config: {self.config_paths.static.as_posix()!r}",
+            f"Runs completed: {self.run_count} (last {last_run})",
+            (
+                f"Items: {len(self.static_config.sync_manager.items)} sync, "
+                f"{len(self.static_config.thread_manager.items)} thread"
+            ),
+            f"Render cache: {self.render_cache.format_stats()}",
+            "Rate limit budget remaining:",
+            submanager.core.ratelimit.format_account_budgets(
+                submanager.core.ratelimit.get_account_budgets(self.accounts),
+            ),
+        ]
+        return "\n".join(status_lines)
 
 
 def start_manage(
     config_paths: submanager.models.config.ConfigPaths | None = None,
     *,
     skip_validate: bool = False,
+    revalidate_all: bool = False,
     repeat_interval_s: float | None = None,
     repeat_max_n: int | None = None,
     verbose: bool = True,
@@ -196,30 +713,83 @@ def start_manage(
     vprint("Starting Sub Manager")
     if config_paths is None:
         config_paths = submanager.models.config.ConfigPaths()
-    static_config, accounts = run_initial_setup(
+    daemon = ManageDaemon(
         config_paths,
         skip_validate=skip_validate,
-        resync_all=True,
+        revalidate_all=revalidate_all,
+        verbose=verbose,
+    )
+
+    # Accept commands from the CLI while running
+    control_server = submanager.core.control.ControlServer(
+        config_paths.control_socket,
+        daemon.handlers,
+        verbose=verbose,
     )
-    if repeat_interval_s is None:
-        repeat_interval_s = static_config.repeat_interval_s
+    control_server.start()
+    try:
+        run_mainloop(
+            daemon,
+            control_server,
+            repeat_interval_s=repeat_interval_s,
+            repeat_max_n=repeat_max_n,
+        )
+    except KeyboardInterrupt:
+        vprint("Received keyboard interrupt; exiting")
+    finally:
+        control_server.stop()
+        daemon.close()
 
+
+def run_mainloop(
+    daemon: ManageDaemon,
+    control_server: submanager.core.control.ControlServer,
+    *,
+    repeat_interval_s: float | None = None,
+    repeat_max_n: int | None = None,
+) -> None:
+    """Run the manage loop repeatedly, handling commands between runs."""
+    slot_index = 0
     while True:
+        # If pacing, split each cycle into runs handling a slot of items each
+        static_config = daemon.static_config
+        if not slot_index:
+            daemon.dynamic_config_cache.clear()
+        slot_count = 1
+        phase_slot = None
+        if static_config.pacing.enabled:
+            slot_count = static_config.pacing.slots
+            phase_slot = submanager.core.pacing.PhaseSlot(
+                slot_index=slot_index % slot_count,
+                slot_count=slot_count,
+            )
+
         # Run the bot
-        run_manage_once(
-            static_config=static_config,
-            accounts=accounts,
-            config_path_dynamic=config_paths.dynamic,
-            verbose=verbose,
-        )
-        if repeat_max_n is not None:
+        daemon.run_once(phase_slot=phase_slot)
+        slot_index = (slot_index + 1) % slot_count
+        if repeat_max_n is not None and not slot_index:
             repeat_max_n -= 1
             if repeat_max_n <= 0:
                 break
 
-        # Wait until the desired time of the next cycle
-        try:
-            submanager.utils.misc.sleep_for_interval(repeat_interval_s)
-        except KeyboardInterrupt:
-            vprint("Received keyboard interrupt; exiting")
-            break
+        # Wait until the desired time of the next cycle or slot
+        wait_interval_s = (
+            static_config.repeat_interval_s
+            if repeat_interval_s is None
+            else repeat_interval_s
+        ) / slot_count
+        if static_config.probe.enabled:
+            wait_with_probes(
+                static_config=static_config,
+                accounts=daemon.accounts,
+                config_path_dynamic=daemon.config_paths.dynamic,
+                wait_interval_s=wait_interval_s,
+                target_cache_path=daemon.config_paths.target_cache,
+                read_pool=daemon.read_pool,
+                render_cache=daemon.render_cache,
+                dynamic_config_cache=daemon.dynamic_config_cache,
+                sleep_for_interval=control_server.serve_for_interval,
+                verbose=daemon.verbose,
+            )
+        else:
+            control_server.serve_for_interval(wait_interval_s)
@@ -0,0 +1,61 @@
+"""Shared HTTP connection pooling for all requests made to Reddit."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Third party imports
+import requests
+import requests.adapters
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.models.config
+import submanager.utils.concurrency
+
+HTTP_PREFIXES: Final[tuple[str, ...]] = ("https://", "http://")
+
+
+class SharedHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTP adapter whose pool outlives the sessions it is mounted on."""
+
+    def close(self) -> None:
+        """Keep the pool open when any one session using it is closed."""
+
+    def close_pool(self) -> None:
+        """Close the pool and its connections, once no session needs it."""
+        super().close()
+
+
+def create_http_adapter(
+    http_config: submanager.models.config.HTTPConfig,
+    *,
+    account_count: int = 1,
+) -> SharedHTTPAdapter:
+    """Create a connection pool sized for the most workers across accounts."""
+    pool_maxsize = http_config.pool_maxsize
+    if pool_maxsize is None:
+        pool_maxsize = max(
+            requests.adapters.DEFAULT_POOLSIZE,
+            submanager.utils.concurrency.MAX_WORKERS_PER_ACCOUNT
+            * account_count,
+        )
+    return SharedHTTPAdapter(
+        pool_connections=http_config.pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=http_config.pool_block,
+    )
+
+
+def create_session(
+    http_adapter: requests.adapters.HTTPAdapter | None = None,
+) -> requests.Session:
+    """Create a session, with its own cookies, using a shared pool."""
+    session = requests.Session()
+    if http_adapter is not None:
+        for prefix in HTTP_PREFIXES:
+            session.mount(prefix, http_adapter)
+    return session
@@ -0,0 +1,271 @@
+"""Persist OAuth access tokens to reuse them across restarts and processes."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import contextlib
+import hashlib
+import http
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import (
+    Path,
+)
+from typing import (
+    Callable,
+    Generator,
+    Iterable,
+)
+
+# Third party imports
+import prawcore.const
+import pydantic
+import requests
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.config.lock
+import submanager.config.utils
+import submanager.exceptions
+import submanager.models.config
+from submanager.constants import (
+    SECRET_FILE_MODE,
+    SECURE_DIR_MODE,
+)
+from submanager.types import (
+    PathLikeStr,
+)
+
+# Refresh tokens this long before they expire, to not use one mid-expiry
+TOKEN_REFRESH_MARGIN_S: Final[float] = 300
+TOKEN_LOCK_TIMEOUT_S: Final[float] = 10
+
+# One-time grants (e.g. authorization codes) must never be replayed
+CACHED_GRANT_TYPES: Final[frozenset[str]] = frozenset(
+    (
+        "client_credentials",
+        "https://oauth.reddit.com/grants/installed_client",
+        "password",
+        "refresh_token",
+    ),
+)
+
+
+# ---- Helpers ----
+
+
+def is_cacheable_token_request(
+    method: str,
+    url: str,
+    data: Iterable[tuple[str, object]] | None,
+) -> bool:
+    """Check if a request is for an access token that can be cached."""
+    grant_type = dict(data or ()).get("grant_type", None)
+    return (
+        method.lower() == "post"
+        and url.endswith(prawcore.const.ACCESS_TOKEN_PATH)
+        and grant_type in CACHED_GRANT_TYPES
+    )
+
+
+def hash_token_request(url: str, auth: object, data: object) -> str:
+    """Generate a stable key for a token request without storing secrets."""
+    serialized_request = json.dumps(
+        [url, auth, data],
+        default=str,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return hashlib.sha256(serialized_request.encode("utf-8")).hexdigest()
+
+
+def parse_token_response(
+    response: requests.Response,
+    pre_request_time: float,
+) -> submanager.models.config.TokenCacheEntry | None:
+    """Get a cache entry from a token response, or None if not usable."""
+    if response.status_code != http.HTTPStatus.OK:
+        return None
+    try:
+        payload = response.json()
+        return submanager.models.config.TokenCacheEntry(
+            access_token=payload["access_token"],
+            expiration_timestamp=pre_request_time + payload["expires_in"],
+            scope=payload.get("scope", ""),
+        )
+    except (KeyError, TypeError, ValueError, pydantic.ValidationError):
+        return None
+
+
+def generate_token_response(
+    cache_entry: submanager.models.config.TokenCacheEntry,
+    url: str,
+) -> requests.Response:
+    """Generate a token response from a cache entry, as if from Reddit."""
+    payload = {
+        "access_token": cache_entry.access_token,
+        "expires_in": int(cache_entry.expiration_timestamp - time.time()),
+        "scope": cache_entry.scope,
+        "token_type": "bearer",
+    }
+    response = requests.Response()
+    response.status_code = http.HTTPStatus.OK
+    response.url = url
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps(payload).encode(  # noqa: WPS437
+        "utf-8",
+    )
+    return response
+
+
+# ---- Token cache ----
+
+
+class TokenCache:
+    """Share unexpired access tokens between accounts and processes."""
+
+    def __init__(
+        self,
+        cache_path: PathLikeStr,
+        *,
+        refresh_margin_s: float = TOKEN_REFRESH_MARGIN_S,
+    ) -> None:
+        self.cache_path = Path(cache_path)
+        self.refresh_margin_s = refresh_margin_s
+        self._lock = threading.Lock()
+        # Each token is requested by one thread at a time, others in parallel
+        self._key_locks: dict[str, threading.Lock] = {}
+        # Tokens handed out, so a re-request (e.g. if revoked) gets a new one
+        self._issued_tokens: dict[str, str] = {}
+
+    def _get_key_lock(self, token_key: str) -> threading.Lock:
+        """Get the in-process lock for requesting the given token."""
+        with self._lock:
+            return self._key_locks.setdefault(token_key, threading.Lock())
+
+    @contextlib.contextmanager
+    def _locked(self) -> Generator[bool, None, None]:
+        """Hold both the in-process and the cross-process cache lock.
+
+        Yields whether the cross-process lock was acquired. Locks left by
+        processes that have exited are broken, so this is only False if
+        another running process holds the lock for longer than the timeout.
+        """
+        with self._lock:
+            self.cache_path.parent.mkdir(
+                mode=SECURE_DIR_MODE,
+                parents=True,
+                exist_ok=True,
+            )
+            acquired_lock = submanager.config.lock.wait_for_lock(
+                self.cache_path,
+                raise_error_on_timeout=False,
+                timeout_s=TOKEN_LOCK_TIMEOUT_S,
+                break_stale=True,
+            )
+            try:
+                yield acquired_lock
+            finally:
+                if acquired_lock:
+                    submanager.config.lock.unlock_config(self.cache_path)
+
+    def load(self) -> submanager.models.config.TokenCache:
+        """Load the cached tokens, dropping any that have expired."""
+        token_cache = submanager.models.config.TokenCache()
+        if self.cache_path.exists():
+            try:
+                raw_cache = submanager.config.utils.load_config(
+                    self.cache_path,
+                )
+                token_cache = submanager.models.config.TokenCache.parse_obj(
+                    raw_cache,
+                )
+            except (
+                json.decoder.JSONDecodeError,
+                pydantic.ValidationError,
+                submanager.exceptions.ConfigError,
+            ):
+                return token_cache
+        current_time = time.time()
+        for token_key, cache_entry in list(token_cache.tokens.items()):
+            if cache_entry.expiration_timestamp <= current_time:
+                del token_cache.tokens[token_key]  # noqa: WPS420
+        return token_cache
+
+    def write(self, token_cache: submanager.models.config.TokenCache) -> None:
+        """Atomically write the tokens, readable only by the current user."""
+        serialized_cache = submanager.config.utils.serialize_config(
+            token_cache,
+        )
+        # Write to a temp file and swap it in, so readers never see part of it
+        cache_fd, temp_path = tempfile.mkstemp(
+            dir=self.cache_path.parent,
+            prefix=f"~{self.cache_path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            os.chmod(temp_path, SECRET_FILE_MODE)
+            with open(
+                cache_fd,
+                mode="w",
+                encoding="utf-8",
+                newline="\n",
+            ) as cache_file:
+                cache_file.write(serialized_cache)
+            os.replace(temp_path, self.cache_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            raise
+
+    def request_token(
+        self,
+        token_key: str,
+        request_token: Callable[[], requests.Response],
+        url: str,
+    ) -> requests.Response:
+        """Get a cached token if still fresh, else request and cache one.
+
+        The cache is only locked to read and write it, not for the request.
+        """
+        with self._get_key_lock(token_key):
+            with self._locked() as acquired_lock:
+                # If another process is stuck holding the lock, skip the cache
+                if not acquired_lock:
+                    return request_token()
+                cache_entry = self.load().tokens.get(token_key, None)
+                if (
+                    cache_entry is not None
+                    and self._issued_tokens.get(token_key, None)
+                    != cache_entry.access_token
+                    and cache_entry.expiration_timestamp - time.time()
+                    > self.refresh_margin_s
+                ):
+                    self._issued_tokens[token_key] = cache_entry.access_token
+                    return generate_token_response(cache_entry, url=url)
+
+            pre_request_time = time.time()
+            response = request_token()
+            cache_entry = parse_token_response(response, pre_request_time)
+            if cache_entry is not None:
+                self._issued_tokens[token_key] = cache_entry.access_token
+            with self._locked() as acquired_lock:
+                if not acquired_lock:
+                    return response
+                # Reload, as other tokens may have been cached in the meantime
+                token_cache = self.load()
+                if cache_entry is None:
+                    token_cache.tokens.pop(token_key, None)
+                else:
+                    token_cache.tokens[token_key] = cache_entry
+                self.write(token_cache)
+            return response
@@ -11,13 +11,13 @@ import abc
 # Third party imports
 import praw.models.reddit.subreddit
 import praw.reddit
-import prawcore.exceptions
 from typing_extensions import (
     Protocol,
     runtime_checkable,
 )
 
 # Local imports
+import submanager.endpoint.permissions
 import submanager.exceptions
 import submanager.models.config
 from submanager.types import (
@@ -139,10 +139,24 @@ class SyncEndpoint(metaclass=abc.ABCMeta):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def _check_is_editable(self, raise_error: bool = True) -> bool:
+    def _check_is_editable(
+        self,
+        raise_error: bool = True,
+        *,
+        permissions_cache: (
+            submanager.endpoint.permissions.ModPermissionsCache | None
+        ) = None,
+    ) -> bool:
         """Check if the object can be edited by the user, w/o validation."""
 
-    def check_is_editable(self, raise_error: bool = True) -> bool | None:
+    def check_is_editable(
+        self,
+        raise_error: bool = True,
+        *,
+        permissions_cache: (
+            submanager.endpoint.permissions.ModPermissionsCache | None
+        ) = None,
+    ) -> bool | None:
         """Check if the object can be edited by the user, with validation."""
         if self._validated is None or (
             self._validated is False and raise_error
@@ -150,7 +164,10 @@ class SyncEndpoint(metaclass=abc.ABCMeta):
             self.validate(raise_error=raise_error)
         if not self.is_valid:
             return None
-        return self._check_is_editable(raise_error=raise_error)
+        return self._check_is_editable(
+            raise_error=raise_error,
+            permissions_cache=permissions_cache,
+        )
 
     @property
     def is_editable(self) -> bool | None:
@@ -190,21 +207,33 @@ class WidgetSyncEndpoint(SyncEndpoint, metaclass=abc.ABCMeta):
         """Set up the underlying PRAW object the endpoint will use."""
         raise NotImplementedError
 
-    def _check_is_editable(self, raise_error: bool = True) -> bool:
+    def _check_is_editable(
+        self,
+        raise_error: bool = True,
+        *,
+        permissions_cache: (
+            submanager.endpoint.permissions.ModPermissionsCache | None
+        ) = None,
+    ) -> bool:
         """Is True if the widget is editable, False otherwise."""
-        try:
-            # static analysis: ignore[incompatible_call]
-            self._object.mod.update()  # type: ignore[call-arg]
-        except prawcore.exceptions.Forbidden as error:
-            if not raise_error:
-                return False
-            raise submanager.exceptions.NotAModError(
-                self.config,
-                message_pre=(
-                    f"Account {self.config.context.account!r} must "
-                    "be a moderator to update widgets"
-                ),
-                message_post=error,
-            ) from error
-
-        return True
+        if submanager.endpoint.permissions.check_mod_permission(
+            self._reddit,
+            self.config.context.subreddit,
+            submanager.endpoint.permissions.MOD_PERMISSION_CONFIG,
+            permissions_cache=permissions_cache,
+        ):
+            return True
+
+        if not raise_error:
+            return False
+        raise submanager.exceptions.NotAModError(
+            self.config,
+            message_pre=(
+                f"Account {self.config.context.account!r} must "
+                "be a moderator to update widgets"
+            ),
+            message_post=(
+                "The account needs the 'config' (or 'all') mod permission "
+                f"on 'r/{self.config.context.subreddit}'."
+            ),
+        )
@@ -8,13 +8,13 @@ from __future__ import (
 # Third party imports
 import praw.models.reddit.submission
 import praw.models.reddit.widgets
-import prawcore.exceptions
 from typing_extensions import (
     Literal,
 )
 
 # Local imports
 import submanager.endpoint.base
+import submanager.endpoint.permissions
 import submanager.exceptions
 from submanager.types import (
     MenuData,
@@ -46,17 +46,35 @@ class ThreadSyncEndpoint(
         """Update the thread's text to be that passed."""
         self._object.edit(str(new_content))
 
-    def _check_is_editable(self, raise_error: bool = True) -> bool:
+    def _check_is_editable(
+        self,
+        raise_error: bool = True,
+        *,
+        permissions_cache: (
+            submanager.endpoint.permissions.ModPermissionsCache | None
+        ) = None,
+    ) -> bool:
         """Is True if the thread is editable, False otherwise."""
-        try:
-            self.edit(self.content)
-        except prawcore.exceptions.Forbidden as error:
+        if not self._object.is_self:
+            if not raise_error:
+                return False
+            raise submanager.exceptions.PostTypeError(
+                self.config,
+                message_pre=(
+                    f"Cannot edit link post {self._object.title!r} "
+                    f"({self._object.id}); must be a selfpost"
+                ),
+            )
+
+        author = self._object.author
+        author_name = "[deleted]" if author is None else author.name
+        username = submanager.endpoint.permissions.get_username(self._reddit)
+        if author_name.lower() != username.lower():
             if not raise_error:
                 return False
             account = self.config.context.account
             post_title = self._object.title
             post_id = self._object.id
-            author_name = self._object.author.name
             raise submanager.exceptions.NotOPError(
                 self.config,
                 message_pre=(
@@ -64,26 +82,8 @@ class ThreadSyncEndpoint(
                     f"the post {post_title!r} ({post_id}) "
                     f"must be the OP {author_name!r}"
                 ),
-                message_post=error,
-            ) from error
-        except praw.exceptions.RedditAPIException as error:
-            for reddit_error in error.items:
-                error_type = reddit_error.error_type
-                if error_type.lower().strip() == "placeholder":
-                    break
-            else:
-                raise
-
-            if not raise_error:
-                return False
-            raise submanager.exceptions.PostTypeError(
-                self.config,
-                message_pre=(
-                    f"Cannot edit link post {self._object.title!r} "
-                    f"({self._object.id}); must be a selfpost"
-                ),
-                message_post=error,
-            ) from error
+                message_post=f"Account is logged in as u/{username}.",
+            )
 
         return True
 
@@ -117,39 +117,102 @@ class WikiSyncEndpoint(
         wiki_text: str = self._object.content_md
         return wiki_text
 
-    def edit(self, new_content: object, reason: str = "") -> None:
-        """Update the wiki page with the given text."""
-        self._object.edit(str(new_content), reason=reason)
+    @property
+    def revision_id(self) -> str | None:
+        """Get the ID of the wiki page's current revision, if reported."""
+        revision_id: str | None = getattr(self._object, "revision_id", None)
+        return revision_id
+
+    def edit(
+        self,
+        new_content: object,
+        reason: str = "",
+        *,
+        previous: str | None = None,
+    ) -> None:
+        """Update the wiki page, failing if not at the previous revision."""
+        edit_settings = {} if previous is None else {"previous": previous}
+        self._object.edit(
+            content=str(new_content),
+            reason=reason,
+            **edit_settings,
+        )
 
-    def _check_is_editable(self, raise_error: bool = True) -> bool:
+    def check_own_revision(
+        self,
+        revision_id: str | None,
+        parent_revision_id: str | None = None,
+    ) -> str | None:
+        """Get the latest revision's ID, if it is still the given own edit.
+
+        If the edit's ID isn't known, it must be the latest revision, made by
+        the current account directly on top of the given parent revision.
+        """
+        latest_revisions = list(
+            self._object.revisions(limit=1 if revision_id else 2),
+        )
+        if not latest_revisions:
+            return None
+        latest_id = str(latest_revisions[0]["id"])
+        if revision_id:
+            return latest_id if latest_id == revision_id else None
+
+        if len(latest_revisions) < 2 or (
+            str(latest_revisions[1]["id"]) != parent_revision_id
+        ):
+            return None
+        latest_author = latest_revisions[0]["author"]
+        current_user = self._reddit.user.me()
+        if (
+            not latest_author
+            or current_user is None
+            or latest_author.name.lower() != current_user.name.lower()
+        ):
+            return None
+        return latest_id
+
+    def _check_is_editable(
+        self,
+        raise_error: bool = True,
+        *,
+        permissions_cache: (
+            submanager.endpoint.permissions.ModPermissionsCache | None
+        ) = None,
+    ) -> bool:
         """Is True if the wiki page is editable, False otherwise."""
-        try:
-            self.edit(self.content, reason="Validation edit from Sub Manager")
-        except (
-            prawcore.exceptions.Forbidden,
-            praw.exceptions.RedditAPIException,
-        ) as error:
-            if isinstance(error, praw.exceptions.RedditAPIException):
-                expected_error = any(
-                    reddit_error.error_type.upper() == "WIKI_CREATE_ERROR"
-                    for reddit_error in error.items
+        # Reddit reports this with the page content, so it needs no request
+        may_revise: bool | None = getattr(self._object, "may_revise", None)
+        if may_revise is None:
+            page_permission = (
+                submanager.endpoint.permissions.MOD_PERMISSION_WIKI
+            )
+            if self.config.endpoint_name.lower().startswith("config/"):
+                page_permission = (
+                    submanager.endpoint.permissions.MOD_PERMISSION_CONFIG
                 )
-                if not expected_error:
-                    raise
-
-            if not raise_error:
-                return False
-            raise submanager.exceptions.WikiPagePermissionError(
-                self.config,
-                message_pre=(
-                    f"Account {self.config.context.account!r} "
-                    "must be authorized to edit wiki page "
-                    f"{self.config.endpoint_name!r}"
-                ),
-                message_post=error,
-            ) from error
+            may_revise = submanager.endpoint.permissions.check_mod_permission(
+                self._reddit,
+                self.config.context.subreddit,
+                page_permission,
+                permissions_cache=permissions_cache,
+            )
+        if may_revise:
+            return True
 
-        return True
+        if not raise_error:
+            return False
+        raise submanager.exceptions.WikiPagePermissionError(
+            self.config,
+            message_pre=(
+                f"Account {self.config.context.account!r} "
+                "must be authorized to edit wiki page "
+                f"{self.config.endpoint_name!r}"
+            ),
+            message_post=(
+                "Check the page's edit settings and the account's wiki "
+                "mod permissions or approved editor status."
+            ),
+        )
 
     @property
     def revision_date(self) -> int:
@@ -0,0 +1,94 @@
+"""Read-only lookups of the current account's permissions on Reddit."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Third party imports
+import praw.reddit
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.exceptions
+import submanager.utils.concurrency
+
+MOD_PERMISSION_ALL: Final[str] = "all"
+MOD_PERMISSION_CONFIG: Final[str] = "config"
+MOD_PERMISSION_WIKI: Final[str] = "wiki"
+
+
+def get_username(reddit: praw.reddit.Reddit) -> str:
+    """Get the name of the account the Reddit instance is logged in as."""
+    username: str = reddit.user.me().name
+    return username
+
+
+def get_mod_permissions(
+    reddit: praw.reddit.Reddit,
+    subreddit: str,
+) -> frozenset[str] | None:
+    """Get the account's mod permissions on a sub, or None if not a mod."""
+    username = get_username(reddit)
+    try:
+        moderators = reddit.subreddit(subreddit).moderator(redditor=username)
+    except submanager.exceptions.PRAW_FORBIDDEN_ERRORS:
+        return None
+    for moderator in moderators:
+        if moderator.name.lower() == username.lower():
+            return frozenset(moderator.mod_permissions)
+    return None
+
+
+class ModPermissionsCache:
+    """Look up each account's mod permissions on each sub at most once.
+
+    Create one per validation run, so checking any number of endpoints on the
+    same sub costs a single request, while permission changes are still seen
+    by the next run. Concurrent lookups of the same account and sub wait for
+    the first instead of making their own request.
+    """
+
+    def __init__(self) -> None:
+        self._mod_permissions: dict[
+            tuple[praw.reddit.Reddit, str],
+            frozenset[str] | None,
+        ] = {}
+        self._limiter = submanager.utils.concurrency.KeyedLimiter(limit=1)
+
+    def get_mod_permissions(
+        self,
+        reddit: praw.reddit.Reddit,
+        subreddit: str,
+    ) -> frozenset[str] | None:
+        """Get the account's mod permissions on a sub, looking up once."""
+        cache_key = (reddit, subreddit.lower())
+        with self._limiter.acquire(cache_key):
+            if cache_key not in self._mod_permissions:
+                self._mod_permissions[cache_key] = get_mod_permissions(
+                    reddit,
+                    subreddit,
+                )
+            return self._mod_permissions[cache_key]
+
+
+def check_mod_permission(
+    reddit: praw.reddit.Reddit,
+    subreddit: str,
+    permission: str,
+    *,
+    permissions_cache: ModPermissionsCache | None = None,
+) -> bool:
+    """Check if the account is a mod with the given permission on a sub."""
+    if permissions_cache is None:
+        mod_permissions = get_mod_permissions(reddit, subreddit)
+    else:
+        mod_permissions = permissions_cache.get_mod_permissions(
+            reddit,
+            subreddit,
+        )
+    if mod_permissions is None:
+        return False
+    return bool({MOD_PERMISSION_ALL, permission} & mod_permissions)
@@ -0,0 +1,40 @@
+"""Utilities for identifying and comparing sync endpoints."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+from typing import (
+    NamedTuple,
+)
+
+# Local imports
+import submanager.enums
+import submanager.models.config
+
+
+class EndpointKey(NamedTuple):
+    """Identity of the Reddit object a sync endpoint points to."""
+
+    endpoint_type: submanager.enums.EndpointType
+    subreddit: str
+    endpoint_name: str
+
+
+def get_endpoint_key(
+    config: submanager.models.config.EndpointTypeConfig,
+) -> EndpointKey:
+    """Get the key identifying the Reddit object behind an endpoint config."""
+    endpoint_name = config.endpoint_name
+    if config.endpoint_type in {
+        submanager.enums.EndpointType.THREAD,
+        submanager.enums.EndpointType.WIKI_PAGE,
+    }:
+        endpoint_name = endpoint_name.lower()
+    return EndpointKey(
+        endpoint_type=config.endpoint_type,
+        subreddit=config.context.subreddit.lower(),
+        endpoint_name=endpoint_name,
+    )
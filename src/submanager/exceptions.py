@@ -67,6 +67,13 @@ PRAW_REDDIT_ERRORS: Final[ExceptTuple] = (
     prawcore.exceptions.ResponseException,
 )
 
+PRAW_RETRYABLE_ERRORS: Final[ExceptTuple] = (
+    prawcore.exceptions.BadJSON,
+    prawcore.exceptions.RequestException,
+    prawcore.exceptions.ServerError,
+    prawcore.exceptions.TooManyRequests,
+)
+
 PRAW_ALL_ERRORS: Final[ExceptTuple] = (
     praw.exceptions.PRAWException,
     prawcore.exceptions.PrawcoreException,
@@ -377,6 +384,10 @@ class ConfigDefaultError(ConfigErrorWithPath):
     _message_post: ClassVar[str] = "Make sure to replace all EXAMPLE values."
 
 
+class SyncCycleWarning(UserWarning):
+    """Sync items depend on each other's targets in a cycle."""
+
+
 class AccountConfigError(ErrorWithAccount, ConfigError):
     """PRAW error loading the Reddit account configuration."""
 
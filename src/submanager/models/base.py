@@ -75,7 +75,31 @@ class ItemWithContextConfig(ItemConfig, metaclass=abc.ABCMeta):
     context: ContextConfig
 
 
-class DynamicItemConfig(CustomMutableBaseModel, metaclass=abc.ABCMeta):
+class DirtyTrackedModel(CustomMutableBaseModel, metaclass=abc.ABCMeta):
+    """Custom mutable BaseModel that records if its fields were changed."""
+
+    _dirty: bool = pydantic.PrivateAttr(default=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name in self.__fields__ and getattr(self, name) != value:
+            self.mark_dirty()
+        super().__setattr__(name, value)
+
+    @property
+    def dirty(self) -> bool:
+        """Whether any fields have changed since loading or marking clean."""
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """Record a change, e.g. after mutating a field in place."""
+        self._dirty = True
+
+    def mark_clean(self) -> None:
+        """Record that the current state has been saved."""
+        self._dirty = False
+
+
+class DynamicItemConfig(DirtyTrackedModel, metaclass=abc.ABCMeta):
     """Base class for the dynamic configuration of a generic item."""
 
 
@@ -17,6 +17,7 @@ from typing import (
     Any,
     Mapping,
     MutableMapping,
+    MutableSequence,
     NewType,
     Sequence,
     Union,
@@ -37,6 +38,10 @@ import submanager.models.utils
 from submanager.constants import (
     CONFIG_PATH_DYNAMIC,
     CONFIG_PATH_STATIC,
+    CONTROL_SOCKET_FILENAME,
+    TARGET_CACHE_FILENAME,
+    TOKEN_CACHE_FILENAME,
+    VALIDATION_CACHE_FILENAME,
 )
 from submanager.models.types import (
     NonEmptyStr,
@@ -65,6 +70,26 @@ class ConfigPaths(submanager.models.base.CustomBaseModel):
     dynamic: Path = CONFIG_PATH_DYNAMIC
     static: Path = CONFIG_PATH_STATIC
 
+    @property
+    def validation_cache(self) -> Path:
+        """Get the path to the cached validation results."""
+        return self.dynamic.with_name(VALIDATION_CACHE_FILENAME)
+
+    @property
+    def token_cache(self) -> Path:
+        """Get the path to the cached OAuth access tokens."""
+        return self.dynamic.with_name(TOKEN_CACHE_FILENAME)
+
+    @property
+    def target_cache(self) -> Path:
+        """Get the path to the cached content last written to targets."""
+        return self.dynamic.with_name(TARGET_CACHE_FILENAME)
+
+    @property
+    def control_socket(self) -> Path:
+        """Get the path to the socket to control a running Sub Manager."""
+        return self.dynamic.with_name(CONTROL_SOCKET_FILENAME)
+
 
 # ---- Config common sub-models
 
@@ -146,6 +171,19 @@ class SyncManagerConfig(submanager.models.base.ItemManagerConfig):
 
     items: Mapping[StripStr, SyncItemConfig] = {}
 
+    _sync_levels: Union[Sequence[Sequence[str]], None] = pydantic.PrivateAttr(
+        default=None,
+    )
+
+    @property
+    def sync_levels(self) -> Sequence[Sequence[str]] | None:
+        """The order to sync the items in, once worked out for this config."""
+        return self._sync_levels
+
+    def set_sync_levels(self, sync_levels: Sequence[Sequence[str]]) -> None:
+        """Keep the order to sync the items in, to reuse for this config."""
+        self._sync_levels = sync_levels
+
 
 # ---- Thread manager models ----
 
@@ -204,7 +242,7 @@ class ThreadItemConfig(submanager.models.base.ItemWithContextConfig):
             # If an offset interval, check against relativedelta kwargs
             delta_kwargs: dict[str, int] = {f"{interval_unit}s": interval_n}
             dateutil.relativedelta.relativedelta(
-                **delta_kwargs,  # type: ignore[arg-type]
+                **delta_kwargs,
             )
             if interval_n < 1:
                 raise ValueError(
@@ -231,13 +269,77 @@ class AccountConfig(submanager.models.base.CustomBaseModel):
 AccountsConfig = NewType("AccountsConfig", Mapping[StripStr, AccountConfig])
 
 
+class ReadPoolConfig(submanager.models.base.CustomBaseModel):
+    """Configuration for spreading read-only fetches across accounts."""
+
+    enabled: bool = False
+    accounts: Sequence[StripStr] = []
+
+
+class RetryConfig(submanager.models.base.CustomBaseModel):
+    """Configuration for backing off items that failed with an error."""
+
+    enabled: bool = True
+    backoff_initial_s: pydantic.PositiveFloat = 60
+    backoff_factor: pydantic.PositiveFloat = 2
+    backoff_max_s: pydantic.PositiveFloat = 3600
+
+
+class HTTPConfig(submanager.models.base.CustomBaseModel):
+    """Configuration for the HTTP connection pool shared by all accounts."""
+
+    pool_block: bool = False
+    pool_connections: pydantic.PositiveInt = 10
+    pool_maxsize: Union[pydantic.PositiveInt, None] = None
+    reddit_url: Union[pydantic.AnyHttpUrl, None] = None
+
+
+class ModlogConfig(submanager.models.base.CustomBaseModel):
+    """Configuration for syncing only sources touched in the modlog."""
+
+    enabled: bool = False
+    full_sweep_interval_s: pydantic.NonNegativeFloat = 3600
+    limit: pydantic.PositiveInt = 100
+
+
+class PacingConfig(submanager.models.base.CustomBaseModel):
+    """Configuration for spreading items evenly across the repeat interval."""
+
+    enabled: bool = False
+    slots: pydantic.PositiveInt = 12
+
+
+class ProbeConfig(submanager.models.base.CustomBaseModel):
+    """Configuration for frequently probing sources for changes."""
+
+    enabled: bool = False
+    interval_s: pydantic.PositiveFloat = 5
+
+
+class RateLimitConfig(submanager.models.base.CustomBaseModel):
+    """Configuration for pacing requests within each account's rate limit."""
+
+    enabled: bool = False
+    background_reserve: pydantic.NonNegativeInt = 50
+    read_burst_s: pydantic.NonNegativeFloat = 60
+    write_reserve: pydantic.NonNegativeInt = 10
+
+
 class StaticConfig(submanager.models.base.CustomBaseModel):
     """Model reprisenting the bot's static configuration."""
 
     check_readonly: bool = True
     repeat_interval_s: pydantic.NonNegativeFloat = 60
+    validation_ttl_s: pydantic.NonNegativeFloat = 86400
     accounts: AccountsConfig
     context_default: submanager.models.base.ContextConfig
+    http: HTTPConfig = HTTPConfig()
+    modlog: ModlogConfig = ModlogConfig()
+    pacing: PacingConfig = PacingConfig()
+    probe: ProbeConfig = ProbeConfig()
+    rate_limit: RateLimitConfig = RateLimitConfig()
+    read_pool: ReadPoolConfig = ReadPoolConfig()
+    retry: RetryConfig = RetryConfig()
     sync_manager: SyncManagerConfig = SyncManagerConfig()
     thread_manager: ThreadManagerConfig = ThreadManagerConfig()
 
@@ -259,6 +361,9 @@ class DynamicSyncItemConfig(submanager.models.base.DynamicItemConfig):
     """Dynamically-updated configuration for sync pairs."""
 
     source_timestamp: pydantic.NonNegativeFloat = 0
+    source_hash: Union[StripStr, None] = None
+    error_count: pydantic.NonNegativeInt = 0
+    retry_timestamp: pydantic.NonNegativeFloat = 0
 
 
 class DynamicThreadItemConfig(
@@ -285,8 +390,98 @@ class DynamicThreadManagerConfig(
     items: MutableMapping[StripStr, DynamicThreadItemConfig] = {}
 
 
+class DynamicModlogConfig(submanager.models.base.DirtyTrackedModel):
+    """Dynamically-updated position in each subreddit's modlog."""
+
+    cursors: MutableMapping[StripStr, StripStr] = {}
+    full_sweep_timestamp: pydantic.NonNegativeFloat = 0
+
+
 class DynamicConfig(submanager.models.base.CustomMutableBaseModel):
     """Model reprisenting the current dynamic configuration."""
 
+    modlog: DynamicModlogConfig = DynamicModlogConfig()
     sync_manager: DynamicSyncManagerConfig = DynamicSyncManagerConfig()
     thread_manager: DynamicThreadManagerConfig = DynamicThreadManagerConfig()
+
+    def get_dirty_models(
+        self,
+    ) -> list[submanager.models.base.DirtyTrackedModel]:
+        """Get the dynamic state models that changed since being loaded."""
+        dirty_models: list[submanager.models.base.DirtyTrackedModel] = [
+            self.modlog,
+            *self.sync_manager.items.values(),
+            *self.thread_manager.items.values(),
+        ]
+        return [
+            dirty_model for dirty_model in dirty_models if dirty_model.dirty
+        ]
+
+
+# ---- Cache models ----
+
+
+class ValidationCacheEntry(submanager.models.base.CustomBaseModel):
+    """Record of a successful validation of an account or endpoint."""
+
+    validated_timestamp: pydantic.NonNegativeFloat
+
+
+class ValidationCache(submanager.models.base.CustomMutableBaseModel):
+    """Successful validation results, keyed by a hash of the config."""
+
+    accounts: MutableMapping[StripStr, ValidationCacheEntry] = {}
+    endpoints: MutableMapping[StripStr, ValidationCacheEntry] = {}
+
+
+class TokenCacheEntry(submanager.models.base.CustomBaseModel):
+    """An OAuth access token obtained from Reddit and when it expires."""
+
+    access_token: NonEmptyStr
+    expiration_timestamp: pydantic.NonNegativeFloat
+    scope: pydantic.StrictStr = ""
+
+
+class TokenCache(submanager.models.base.CustomMutableBaseModel):
+    """OAuth access tokens, keyed by a hash of the token request."""
+
+    tokens: MutableMapping[StripStr, TokenCacheEntry] = {}
+
+
+class TargetCacheEntry(submanager.models.base.CustomBaseModel):
+    """The known content of a sync target at a given revision.
+
+    If the revision's ID isn't known, the one it was made on top of is.
+    """
+
+    content: pydantic.StrictStr
+    revision_id: Union[StripStr, None] = None
+    parent_revision_id: Union[StripStr, None] = None
+
+
+class TargetCache(submanager.models.base.CustomMutableBaseModel):
+    """Known content of sync targets, keyed by the target endpoint."""
+
+    targets: MutableMapping[StripStr, TargetCacheEntry] = {}
+
+
+class CassetteInteraction(submanager.models.base.CustomBaseModel):
+    """A request made to Reddit and the response, with secrets scrubbed."""
+
+    method: NonEmptyStr
+    url: NonEmptyStr
+    body: pydantic.StrictStr = ""
+    item: Union[StripStr, None] = None
+    status_code: pydantic.PositiveInt
+    headers: Mapping[NonEmptyStr, pydantic.StrictStr] = {}
+    content: pydantic.StrictStr = ""
+    duration_s: pydantic.NonNegativeFloat = 0
+
+
+class Cassette(submanager.models.base.CustomMutableBaseModel):
+    """The requests made during a run and the state the run started from."""
+
+    dynamic_config: Mapping[StripStr, Any] = {}
+    target_cache: Mapping[StripStr, Any] = {}
+    interactions: MutableSequence[CassetteInteraction] = []
+    wall_time_s: pydantic.NonNegativeFloat = 0
@@ -0,0 +1,323 @@
+"""Coalesce the writes of multiple sync items to the same target."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import contextlib
+import functools
+from typing import (
+    NamedTuple,
+)
+
+# Third party imports
+import prawcore.exceptions
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.core.isolation
+import submanager.endpoint.base
+import submanager.endpoint.endpoints
+import submanager.endpoint.utils
+import submanager.models.config
+import submanager.sync.cache
+import submanager.sync.plan
+import submanager.sync.processing
+import submanager.utils.concurrency
+import submanager.utils.tracing
+from submanager.types import (
+    AccountsMap,
+    MenuData,
+)
+
+EDIT_REASON_MAX_LENGTH: Final[int] = 256
+
+
+class PendingWrite(NamedTuple):
+    """Source content waiting to be synced to a target by a sync item."""
+
+    sync_item: submanager.models.config.SyncItemConfig
+    dynamic_config: submanager.models.config.DynamicSyncItemConfig
+    target_config: submanager.models.config.FullEndpointConfig
+    source_content: str | MenuData
+
+
+class WriteBatch:
+    """Collect pending writes and apply them with one edit per target.
+
+    Writes to a target are coalesced per account, so each is still made with
+    the account configured for it; other accounts' writes follow in turn.
+    """
+
+    def __init__(
+        self,
+        target_cache: submanager.sync.cache.TargetContentCache | None = None,
+        render_cache: submanager.sync.cache.RenderCache | None = None,
+    ) -> None:
+        self.target_cache = target_cache
+        self.render_cache = render_cache
+        self.pending: dict[
+            submanager.endpoint.utils.EndpointKey,
+            dict[str, list[PendingWrite]],
+        ] = {}
+        self._limiter = submanager.utils.concurrency.KeyedLimiter(
+            limit=submanager.utils.concurrency.MAX_WORKERS_PER_ACCOUNT,
+        )
+
+    def add(self, pending_write: PendingWrite) -> None:
+        """Queue a write to be applied when the batch is flushed."""
+        target_key = submanager.endpoint.utils.get_endpoint_key(
+            pending_write.target_config,
+        )
+        self.pending.setdefault(target_key, {}).setdefault(
+            pending_write.target_config.context.account,
+            [],
+        ).append(pending_write)
+
+    def get_cached(
+        self,
+        target_key: submanager.endpoint.utils.EndpointKey,
+    ) -> submanager.models.config.TargetCacheEntry | None:
+        """Get the cached content of a target, if caching is enabled."""
+        if self.target_cache is None:
+            return None
+        return self.target_cache.get(target_key)
+
+    def fetch_target(
+        self,
+        pending_writes: list[PendingWrite],
+        accounts: AccountsMap,
+    ) -> submanager.sync.plan.EndpointRead:
+        """Fetch a target with the account its pending writes are made by."""
+        target_config = pending_writes[0].target_config
+        return submanager.sync.plan.fetch_endpoint(
+            target_config,
+            accounts,
+            target_config.context.account,
+            self._limiter,
+            read_content=self.get_cached(
+                submanager.endpoint.utils.get_endpoint_key(target_config),
+            )
+            is None,
+        )
+
+    def fetch_targets(
+        self,
+        accounts: AccountsMap,
+    ) -> dict[
+        submanager.endpoint.utils.EndpointKey,
+        submanager.sync.plan.EndpointRead,
+    ]:
+        """Fetch each target with pending writes once, concurrently."""
+        return submanager.utils.concurrency.run_concurrently(
+            {
+                target_key: functools.partial(
+                    self.fetch_target,
+                    next(iter(pending_by_account.values())),
+                    accounts,
+                )
+                for target_key, pending_by_account in self.pending.items()
+            },
+        )
+
+    def render_target(
+        self,
+        pending_writes: list[PendingWrite],
+        target_obj: submanager.endpoint.base.SyncEndpoint,
+        original_content: str | MenuData,
+    ) -> tuple[str | MenuData, list[str]]:
+        """Apply all the writes to a target's content in memory."""
+        target_content = original_content
+        descriptions = []
+        for pending_write in pending_writes:
+            target_content_processed = (
+                submanager.sync.processing.process_target_endpoint(
+                    target_config=pending_write.target_config,
+                    target_obj=target_obj,
+                    source_content=pending_write.source_content,
+                    menu_config=pending_write.sync_item.source.menu_config,
+                    target_content=target_content,
+                    render_cache=self.render_cache,
+                )
+            )
+            if target_content_processed is False:
+                continue
+            target_content = target_content_processed
+            descriptions.append(
+                pending_write.sync_item.description
+                or pending_write.sync_item.uid,
+            )
+        return target_content, descriptions
+
+    def edit_target(
+        self,
+        pending_writes: list[PendingWrite],
+        target_obj: submanager.endpoint.base.SyncEndpoint,
+        original_content: str | MenuData,
+        previous: str | None = None,
+    ) -> bool:
+        """Render the target from the given content and edit it if changed."""
+        target_key = submanager.endpoint.utils.get_endpoint_key(
+            pending_writes[0].target_config,
+        )
+        target_content, descriptions = self.render_target(
+            pending_writes,
+            target_obj,
+            original_content,
+        )
+        if not descriptions or target_content == original_content:
+            if self.target_cache is not None and previous is not None:
+                self.target_cache.record(
+                    target_key,
+                    str(original_content),
+                    previous,
+                )
+            return False
+
+        reason = (
+            f"Auto-sync {', '.join(descriptions)} "
+            f"from {target_obj.config.endpoint_name}"
+        )[:EDIT_REASON_MAX_LENGTH]
+        if not isinstance(
+            target_obj,
+            submanager.endpoint.endpoints.WikiSyncEndpoint,
+        ):
+            target_obj.edit(target_content, reason=reason)
+            return True
+
+        target_obj.edit(target_content, reason=reason, previous=previous)
+        if self.target_cache is not None:
+            # Reddit doesn't return the new revision's ID, so record its parent
+            self.target_cache.record(
+                target_key,
+                str(target_content),
+                None,
+                parent_revision_id=previous,
+            )
+        return True
+
+    def write_target(
+        self,
+        pending_writes: list[PendingWrite],
+        target_read: submanager.sync.plan.EndpointRead,
+    ) -> bool:
+        """Apply all the writes to one target in memory and edit it once."""
+        if isinstance(target_read, BaseException):
+            raise target_read
+        target_obj = target_read
+        target_key = submanager.endpoint.utils.get_endpoint_key(
+            pending_writes[0].target_config,
+        )
+
+        # Render from the content we last wrote, if no one's edited it since
+        cache_entry = self.get_cached(target_key)
+        if cache_entry is not None and isinstance(
+            target_obj,
+            submanager.endpoint.endpoints.WikiSyncEndpoint,
+        ):
+            revision_id = target_obj.check_own_revision(
+                cache_entry.revision_id,
+                cache_entry.parent_revision_id,
+            )
+            if revision_id is not None:
+                with contextlib.suppress(prawcore.exceptions.Conflict):
+                    return self.edit_target(
+                        pending_writes,
+                        target_obj,
+                        cache_entry.content,
+                        previous=revision_id,
+                    )
+            if self.target_cache is not None:
+                self.target_cache.record(target_key, "", None)
+
+        # Otherwise, fetch the current content and render from that
+        previous = None
+        if isinstance(
+            target_obj,
+            submanager.endpoint.endpoints.WikiSyncEndpoint,
+        ):
+            previous = target_obj.revision_id
+        return self.edit_target(
+            pending_writes,
+            target_obj,
+            target_obj.content,
+            previous=previous,
+        )
+
+    def write_target_isolated(
+        self,
+        pending_by_account: dict[str, list[PendingWrite]],
+        target_read: submanager.sync.plan.EndpointRead,
+        accounts: AccountsMap,
+    ) -> tuple[bool, dict[str, BaseException]]:
+        """Write one target, returning any errors to record, by account."""
+        written = False
+        errors: dict[str, BaseException] = {}
+        for account_index, (account_key, pending_writes) in enumerate(
+            pending_by_account.items(),
+        ):
+            # Each account after the first edits on top of the previous one
+            if account_index:
+                target_read = self.fetch_target(pending_writes, accounts)
+            try:
+                with self._limiter.acquire(
+                    account_key,
+                ), submanager.utils.tracing.trace_item(
+                    pending_writes[0].target_config.uid,
+                ):
+                    written |= self.write_target(pending_writes, target_read)
+            except submanager.core.isolation.ITEM_ERRORS as error:
+                errors[account_key] = error
+                if submanager.core.isolation.is_fatal_error(error):
+                    break
+        return written, errors
+
+    def flush(
+        self,
+        accounts: AccountsMap,
+        *,
+        retry_config: submanager.models.config.RetryConfig | None = None,
+    ) -> set[submanager.endpoint.utils.EndpointKey]:
+        """Write out all pending writes, one edit per target, concurrently.
+
+        Returns the keys of the targets whose content was actually changed.
+        """
+        target_reads = self.fetch_targets(accounts)
+        write_results = submanager.utils.concurrency.run_concurrently(
+            {
+                target_key: functools.partial(
+                    self.write_target_isolated,
+                    pending_by_account,
+                    target_reads[target_key],
+                    accounts,
+                )
+                for target_key, pending_by_account in self.pending.items()
+            },
+        )
+
+        written_keys = set()
+        for target_key, (written, errors) in write_results.items():
+            if written:
+                written_keys.add(target_key)
+            for account_key, error in errors.items():
+                if (
+                    retry_config is None
+                    or not retry_config.enabled
+                    or submanager.core.isolation.is_fatal_error(error)
+                ):
+                    self.pending.clear()
+                    raise error
+                # Only the failed account's writes are retried later
+                for pending_write in self.pending[target_key][account_key]:
+                    submanager.core.isolation.record_item_error(
+                        error,
+                        item_config=pending_write.sync_item,
+                        dynamic_config=pending_write.dynamic_config,
+                        retry_config=retry_config,
+                    )
+        self.pending.clear()
+        return written_keys
@@ -0,0 +1,190 @@
+"""Cache sync content to avoid re-reading targets and re-rendering text."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import collections
+import json
+import threading
+from pathlib import (
+    Path,
+)
+from typing import (
+    Callable,
+    Hashable,
+    TypeVar,
+)
+
+# Third party imports
+import pydantic
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.config.utils
+import submanager.endpoint.utils
+import submanager.enums
+import submanager.exceptions
+import submanager.models.config
+from submanager.types import (
+    PathLikeStr,
+)
+
+RenderedT = TypeVar("RenderedT")
+
+# Only wiki pages can be edited conditionally on their current revision
+CACHED_ENDPOINT_TYPES: Final[
+    frozenset[submanager.enums.EndpointType]
+] = frozenset((submanager.enums.EndpointType.WIKI_PAGE,))
+
+RENDER_CACHE_SIZE_DEFAULT: Final[int] = 256
+
+
+def format_cache_key(
+    endpoint_key: submanager.endpoint.utils.EndpointKey,
+) -> str:
+    """Format an endpoint key as a key in the persisted cache."""
+    return "/".join(
+        (
+            endpoint_key.endpoint_type.value,
+            endpoint_key.subreddit,
+            endpoint_key.endpoint_name,
+        ),
+    )
+
+
+def load_target_cache(
+    cache_path: PathLikeStr,
+) -> submanager.models.config.TargetCache:
+    """Load the target cache, starting empty if missing or invalid."""
+    if not Path(cache_path).exists():
+        return submanager.models.config.TargetCache()
+    try:
+        return submanager.models.config.TargetCache.parse_obj(
+            submanager.config.utils.load_config(cache_path),
+        )
+    except (
+        json.decoder.JSONDecodeError,
+        pydantic.ValidationError,
+        submanager.exceptions.ConfigError,
+    ):
+        return submanager.models.config.TargetCache()
+
+
+class TargetContentCache:
+    """Write-through cache of targets' content at their latest revision."""
+
+    def __init__(
+        self,
+        target_cache: submanager.models.config.TargetCache | None = None,
+    ) -> None:
+        if target_cache is None:
+            target_cache = submanager.models.config.TargetCache()
+        self.target_cache = target_cache
+        self.modified = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_cacheable(
+        target_key: submanager.endpoint.utils.EndpointKey,
+    ) -> bool:
+        """Check if the target's content can be cached."""
+        return target_key.endpoint_type in CACHED_ENDPOINT_TYPES
+
+    def get(
+        self,
+        target_key: submanager.endpoint.utils.EndpointKey,
+    ) -> submanager.models.config.TargetCacheEntry | None:
+        """Get the cached content and revision of a target, if any."""
+        return self.target_cache.targets.get(
+            format_cache_key(target_key),
+            None,
+        )
+
+    def record(
+        self,
+        target_key: submanager.endpoint.utils.EndpointKey,
+        content: str,
+        revision_id: str | None,
+        parent_revision_id: str | None = None,
+    ) -> None:
+        """Record the target content, or drop it if the revision is unknown."""
+        if not self.is_cacheable(target_key):
+            return
+        cache_key = format_cache_key(target_key)
+        with self._lock:
+            if revision_id is None and parent_revision_id is None:
+                if self.target_cache.targets.pop(cache_key, None):
+                    self.modified = True
+                return
+            cache_entry = submanager.models.config.TargetCacheEntry(
+                content=content,
+                revision_id=revision_id,
+                parent_revision_id=parent_revision_id,
+            )
+            if self.target_cache.targets.get(cache_key, None) != cache_entry:
+                self.target_cache.targets[cache_key] = cache_entry
+                self.modified = True
+
+    def write(self, cache_path: PathLikeStr) -> None:
+        """Write the cache to disk if it was modified."""
+        with self._lock:
+            if not self.modified:
+                return
+            submanager.config.utils.write_config(
+                self.target_cache,
+                config_path=cache_path,
+            )
+            self.modified = False
+
+
+class RenderCache:
+    """Bounded LRU cache of rendered text, with hit and miss counters."""
+
+    def __init__(self, max_size: int = RENDER_CACHE_SIZE_DEFAULT) -> None:
+        if max_size < 1:
+            raise ValueError(f"Max size must be >= 1, not {max_size!r}")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._rendered: collections.OrderedDict[
+            Hashable,
+            object,
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rendered)
+
+    def get_or_render(
+        self,
+        cache_key: Hashable,
+        render: Callable[[], RenderedT],
+    ) -> RenderedT:
+        """Get the cached rendered output for the key, or render it."""
+        with self._lock:
+            if cache_key in self._rendered:
+                self._rendered.move_to_end(cache_key)
+                self.hits += 1
+                return self._rendered[cache_key]  # type: ignore[return-value]
+            self.misses += 1
+        rendered = render()
+        with self._lock:
+            self._rendered[cache_key] = rendered
+            self._rendered.move_to_end(cache_key)
+            while len(self._rendered) > self.max_size:
+                self._rendered.popitem(last=False)
+        return rendered
+
+    def format_stats(self) -> str:
+        """Format a summary of the cache's size, hits and misses."""
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups if lookups else 0
+        return (
+            f"{len(self)}/{self.max_size} entries, {self.hits} hits, "
+            f"{self.misses} misses ({hit_rate:.0%} hit rate)"
+        )
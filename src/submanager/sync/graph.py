@@ -0,0 +1,127 @@
+"""Order sync items so chained syncs propagate within a single run."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import warnings
+from typing import (
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Local imports
+import submanager.endpoint.utils
+import submanager.exceptions
+import submanager.models.config
+
+SectionKey = Optional[Tuple[str, str, str]]
+
+
+def get_section_key(
+    endpoint_config: submanager.models.config.FullEndpointConfig,
+) -> SectionKey:
+    """Get the section of the endpoint synced, or None for all of it."""
+    if endpoint_config.pattern is False:
+        return None
+    return (
+        endpoint_config.pattern,
+        endpoint_config.pattern_start,
+        endpoint_config.pattern_end,
+    )
+
+
+def check_sections_overlap(
+    section_key: SectionKey,
+    other_section_key: SectionKey,
+) -> bool:
+    """Check if syncing one section of an endpoint can change the other."""
+    return (
+        section_key is None
+        or other_section_key is None
+        or section_key == other_section_key
+    )
+
+
+def get_sync_dependencies(
+    manager_config: submanager.models.config.SyncManagerConfig,
+) -> dict[str, set[str]]:
+    """Get the items whose targets each item's source depends on."""
+    sync_items = {
+        item_key: sync_item
+        for item_key, sync_item in manager_config.items.items()
+        if sync_item.enabled and sync_item.source.enabled
+    }
+    target_writers: dict[
+        submanager.endpoint.utils.EndpointKey,
+        list[tuple[str, SectionKey]],
+    ] = {}
+    for item_key, sync_item in sync_items.items():
+        for target_config in sync_item.targets.values():
+            if target_config.enabled:
+                target_writers.setdefault(
+                    submanager.endpoint.utils.get_endpoint_key(target_config),
+                    [],
+                ).append((item_key, get_section_key(target_config)))
+
+    # Only the section read counts, and an item doesn't depend on itself
+    sync_dependencies: dict[str, set[str]] = {}
+    for item_key, sync_item in sync_items.items():
+        source_section_key = get_section_key(sync_item.source)
+        sync_dependencies[item_key] = {
+            writer_key
+            for writer_key, target_section_key in target_writers.get(
+                submanager.endpoint.utils.get_endpoint_key(sync_item.source),
+                [],
+            )
+            if writer_key != item_key
+            and check_sections_overlap(source_section_key, target_section_key)
+        }
+    return sync_dependencies
+
+
+def build_sync_levels(
+    manager_config: submanager.models.config.SyncManagerConfig,
+) -> list[list[str]]:
+    """Group the item keys into levels that only depend on earlier ones."""
+    dependencies = get_sync_dependencies(manager_config)
+    sync_levels: list[list[str]] = []
+    done_keys: set[str] = set()
+    while len(done_keys) < len(dependencies):
+        sync_level = [
+            item_key
+            for item_key, depends_on in dependencies.items()
+            if item_key not in done_keys and depends_on <= done_keys
+        ]
+        # Run the rest unordered, as changes only propagate on the next run
+        if not sync_level:
+            cycle_keys = sorted(dependencies.keys() - done_keys)
+            warnings.warn(
+                f"Sync items {cycle_keys!r} read from each other's targets "
+                "in a cycle (or depend on items that do); running them "
+                "unordered, so changes may take multiple runs to propagate",
+                submanager.exceptions.SyncCycleWarning,
+                stacklevel=3,
+            )
+            sync_level = [
+                item_key
+                for item_key in dependencies
+                if item_key not in done_keys
+            ]
+        sync_levels.append(sync_level)
+        done_keys.update(sync_level)
+    return sync_levels
+
+
+def get_sync_levels(
+    manager_config: submanager.models.config.SyncManagerConfig,
+) -> Sequence[Sequence[str]]:
+    """Get the levels to sync the items in, built once for each config."""
+    sync_levels = manager_config.sync_levels
+    if sync_levels is None:
+        sync_levels = build_sync_levels(manager_config)
+        manager_config.set_sync_levels(sync_levels)
+    return sync_levels
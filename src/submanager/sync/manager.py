@@ -5,42 +5,102 @@ from __future__ import (
     annotations,
 )
 
+# Standard library imports
+import functools
+from typing import (
+    Callable,
+    Mapping,
+)
+
 # Local imports
+import submanager.core.isolation
+import submanager.core.pacing
+import submanager.core.readpool
 import submanager.endpoint.creation
+import submanager.endpoint.utils
+import submanager.exceptions
 import submanager.models.config
+import submanager.sync.batch
+import submanager.sync.cache
+import submanager.sync.graph
+import submanager.sync.plan
 import submanager.sync.processing
+import submanager.utils.misc
 from submanager.types import (
     AccountsMap,
 )
 
+SyncItemFilter = Callable[[submanager.models.config.SyncItemConfig], bool]
+
 
 def sync_one(
     sync_item: submanager.models.config.SyncItemConfig,
     dynamic_config: submanager.models.config.DynamicSyncItemConfig,
     accounts: AccountsMap,
+    *,
+    read_pool: submanager.core.readpool.ReadPool | None = None,
+    write_batch: submanager.sync.batch.WriteBatch | None = None,
+    source_read: submanager.sync.plan.EndpointRead | None = None,
 ) -> None:
     """Sync one specific pair of sources and targets."""
     if not (sync_item.enabled and sync_item.source.enabled):
         return
 
-    # Create source sync endpoint
-    source_obj = submanager.endpoint.creation.create_sync_endpoint_from_config(
-        config=sync_item.source,
-        reddit=accounts[sync_item.source.context.account],
-    )
-    source_content = submanager.sync.processing.process_source_endpoint(
-        sync_item.source,
-        source_obj,
-        dynamic_config,
-    )
+    # Use the source if already fetched, raising any error fetching it
+    if isinstance(source_read, BaseException):
+        raise source_read
+    source_obj = source_read
+    source_account = sync_item.source.context.account
+    # Otherwise, create it, reading with a pool account if enabled
+    if source_obj is None:
+        if read_pool is not None:
+            source_account = read_pool.get_reader(sync_item.source)
+        source_obj = (
+            submanager.endpoint.creation.create_sync_endpoint_from_config(
+                config=sync_item.source,
+                reddit=accounts[source_account],
+            )
+        )
+    try:
+        source_content = submanager.sync.processing.process_source_endpoint(
+            sync_item.source,
+            source_obj,
+            dynamic_config,
+        )
+    except submanager.exceptions.PRAW_RETRIVAL_ERRORS:
+        # Stop using a pool account that turned out to have lost read access
+        if read_pool is not None and source_read is None:
+            read_pool.drop_reader(sync_item.source, source_account)
+        raise
     if source_content is False:
         return
 
+    # Skip the targets if the synced content and config haven't changed
+    source_hash = submanager.utils.misc.hash_data(
+        source_content,
+        sync_item.dict(exclude={"description"}),
+    )
+    if source_hash == dynamic_config.source_hash:
+        return
+    dynamic_config.source_hash = source_hash
+
     # Create target endpoints, process data and sync
     for target_config in sync_item.targets.values():
         if not target_config.enabled:
             continue
 
+        # If batching, leave the target to be written with the others
+        if write_batch is not None:
+            write_batch.add(
+                submanager.sync.batch.PendingWrite(
+                    sync_item=sync_item,
+                    dynamic_config=dynamic_config,
+                    target_config=target_config,
+                    source_content=source_content,
+                ),
+            )
+            continue
+
         target_obj = (
             submanager.endpoint.creation.create_sync_endpoint_from_config(
                 config=target_config,
@@ -69,11 +129,92 @@ def sync_all(
     manager_config: submanager.models.config.SyncManagerConfig,
     dynamic_config: submanager.models.config.DynamicSyncManagerConfig,
     accounts: AccountsMap,
+    *,
+    retry_config: submanager.models.config.RetryConfig | None = None,
+    phase_slot: submanager.core.pacing.PhaseSlot | None = None,
+    item_filter: SyncItemFilter | None = None,
+    read_pool: submanager.core.readpool.ReadPool | None = None,
+    target_cache: submanager.sync.cache.TargetContentCache | None = None,
+    render_cache: submanager.sync.cache.RenderCache | None = None,
 ) -> None:
     """Sync all pairs of sources/targets (pages,threads, sections) on a sub."""
-    for sync_item_id, sync_item in manager_config.items.items():
-        sync_one(
+    written_keys: set[submanager.endpoint.utils.EndpointKey] = set()
+    for sync_level in submanager.sync.graph.get_sync_levels(manager_config):
+        sync_items = {}
+        for sync_item_id in sync_level:
+            sync_item = manager_config.items[sync_item_id]
+            # Items reading a target written earlier this run always propagate
+            source_key = submanager.endpoint.utils.get_endpoint_key(
+                sync_item.source,
+            )
+            if source_key not in written_keys and (
+                (phase_slot is not None and not phase_slot.contains(sync_item))
+                or (item_filter is not None and not item_filter(sync_item))
+            ):
+                continue
+            sync_items[sync_item_id] = sync_item
+        written_keys |= sync_level_items(
+            sync_items,
+            dynamic_config,
+            accounts,
+            retry_config=retry_config,
+            read_pool=read_pool,
+            target_cache=target_cache,
+            render_cache=render_cache,
+        )
+
+
+def sync_level_items(
+    sync_items: Mapping[str, submanager.models.config.SyncItemConfig],
+    dynamic_config: submanager.models.config.DynamicSyncManagerConfig,
+    accounts: AccountsMap,
+    *,
+    retry_config: submanager.models.config.RetryConfig | None = None,
+    read_pool: submanager.core.readpool.ReadPool | None = None,
+    target_cache: submanager.sync.cache.TargetContentCache | None = None,
+    render_cache: submanager.sync.cache.RenderCache | None = None,
+) -> set[submanager.endpoint.utils.EndpointKey]:
+    """Sync items that don't depend on each other, returning the written."""
+    # Phase 1: Fetch each distinct source once, concurrently
+    source_reads = submanager.sync.plan.fetch_sources(
+        {
+            sync_item_id: sync_item
+            for sync_item_id, sync_item in sync_items.items()
+            if sync_item.enabled
+            and sync_item.source.enabled
+            and not submanager.core.isolation.is_quarantined(
+                dynamic_config.items[sync_item_id],
+                retry_config,
+            )
+        },
+        accounts,
+        read_pool=read_pool,
+    )
+
+    # Phase 2: Render each item's source content for its targets
+    write_batch = submanager.sync.batch.WriteBatch(
+        target_cache=target_cache,
+        render_cache=render_cache,
+    )
+    for sync_item_id, sync_item in sync_items.items():
+        run_item = functools.partial(
+            sync_one,
             sync_item=sync_item,
             dynamic_config=dynamic_config.items[sync_item_id],
             accounts=accounts,
+            read_pool=read_pool,
+            write_batch=write_batch,
+            source_read=source_reads.get(sync_item_id, None),
         )
+        if retry_config is None:
+            run_item()
+            continue
+        submanager.core.isolation.run_isolated(
+            run_item,
+            item_config=sync_item,
+            dynamic_config=dynamic_config.items[sync_item_id],
+            retry_config=retry_config,
+        )
+
+    # Phase 3: Write all the targets, with one edit for all sections of each
+    return write_batch.flush(accounts, retry_config=retry_config)
@@ -0,0 +1,270 @@
+"""Sync only the sources touched in each subreddit's moderation log."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import re
+import time
+from typing import (
+    Collection,
+    NamedTuple,
+)
+
+# Third party imports
+import praw.reddit
+from typing_extensions import (
+    Final,
+    Protocol,
+)
+
+# Local imports
+import submanager.core.isolation
+import submanager.core.ratelimit
+import submanager.endpoint.utils
+import submanager.enums
+import submanager.models.config
+import submanager.sync.manager
+import submanager.utils.output
+import submanager.utils.tracing
+from submanager.types import (
+    AccountsMap,
+)
+
+WIKI_REVISE_ACTION: Final[str] = "wikirevise"
+WIDGETS_ACTION: Final[str] = "community_widgets"
+
+WIKI_PAGE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"/wiki/([^?#\s]+?)/?(?:[?#\s]|$)",
+)
+WIKI_DETAILS_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"[Pp]age ([^\s]+)",
+)
+
+TRACKED_ENDPOINT_TYPES: Final[
+    frozenset[submanager.enums.EndpointType]
+] = frozenset(
+    (
+        submanager.enums.EndpointType.MENU,
+        submanager.enums.EndpointType.WIDGET,
+        submanager.enums.EndpointType.WIKI_PAGE,
+    ),
+)
+WIDGET_ENDPOINT_TYPES: Final[
+    frozenset[submanager.enums.EndpointType]
+] = frozenset(
+    (
+        submanager.enums.EndpointType.MENU,
+        submanager.enums.EndpointType.WIDGET,
+    ),
+)
+
+
+class ModAction(Protocol):
+    """The parts of a modlog action used to find what it touched."""
+
+    id: str  # noqa: WPS125
+    action: str
+
+
+class ModlogPage(NamedTuple):
+    """The actions newer than the cursor and the new cursor position."""
+
+    mod_actions: list[ModAction]
+    cursor: str | None
+    complete: bool
+
+
+class ModlogChanges:
+    """The sync endpoints touched by actions in the modlog."""
+
+    def __init__(self) -> None:
+        self.endpoint_keys: set[submanager.endpoint.utils.EndpointKey] = set()
+        self.endpoint_types: set[
+            tuple[str, submanager.enums.EndpointType]
+        ] = set()
+        self.cursors: dict[str, str] = {}
+
+    def touch_all(
+        self,
+        subreddit: str,
+        endpoint_types: Collection[
+            submanager.enums.EndpointType
+        ] = TRACKED_ENDPOINT_TYPES,
+    ) -> None:
+        """Mark all endpoints of the given types on a subreddit touched."""
+        for endpoint_type in endpoint_types:
+            self.endpoint_types.add((subreddit.lower(), endpoint_type))
+
+    def add_mod_action(self, subreddit: str, mod_action: ModAction) -> None:
+        """Mark the endpoints touched by a modlog action."""
+        if mod_action.action == WIKI_REVISE_ACTION:
+            page_name = get_wiki_page_name(mod_action)
+            if page_name is None:
+                self.touch_all(
+                    subreddit,
+                    {submanager.enums.EndpointType.WIKI_PAGE},
+                )
+                return
+            self.endpoint_keys.add(
+                submanager.endpoint.utils.EndpointKey(
+                    endpoint_type=submanager.enums.EndpointType.WIKI_PAGE,
+                    subreddit=subreddit.lower(),
+                    endpoint_name=page_name.lower(),
+                ),
+            )
+        elif mod_action.action == WIDGETS_ACTION:
+            self.touch_all(subreddit, WIDGET_ENDPOINT_TYPES)
+
+    def is_touched(
+        self,
+        endpoint_config: submanager.models.config.EndpointTypeConfig,
+    ) -> bool:
+        """Check if an endpoint may have changed since it was last synced."""
+        if endpoint_config.endpoint_type not in TRACKED_ENDPOINT_TYPES:
+            return True
+        endpoint_key = submanager.endpoint.utils.get_endpoint_key(
+            endpoint_config,
+        )
+        return endpoint_key in self.endpoint_keys or (
+            (endpoint_key.subreddit, endpoint_key.endpoint_type)
+            in self.endpoint_types
+        )
+
+    def advance_cursors(
+        self,
+        dynamic_config: submanager.models.config.DynamicModlogConfig,
+    ) -> None:
+        """Move the cursors past the actions, once their items are synced."""
+        for subreddit, cursor in self.cursors.items():
+            if dynamic_config.cursors.get(subreddit, None) != cursor:
+                dynamic_config.cursors[subreddit] = cursor
+                dynamic_config.mark_dirty()
+
+
+def get_wiki_page_name(mod_action: ModAction) -> str | None:
+    """Get the name of the wiki page edited in a modlog action, if known."""
+    target_permalink = getattr(mod_action, "target_permalink", None) or ""
+    page_match = WIKI_PAGE_PATTERN.search(target_permalink)
+    if page_match is None:
+        details = getattr(mod_action, "details", None) or ""
+        page_match = WIKI_DETAILS_PATTERN.search(details)
+    if page_match is None:
+        return None
+    return page_match.group(1)
+
+
+def fetch_modlog_page(
+    reddit: praw.reddit.Reddit,
+    subreddit: str,
+    cursor: str | None,
+    *,
+    limit: int,
+) -> ModlogPage:
+    """Get the modlog actions newer than the cursor, newest first."""
+    mod_actions: list[ModAction] = []
+    new_cursor = None
+    for mod_action in reddit.subreddit(subreddit).mod.log(limit=limit):
+        if new_cursor is None:
+            new_cursor = mod_action.id
+        if mod_action.id == cursor:
+            return ModlogPage(mod_actions, new_cursor, complete=True)
+        mod_actions.append(mod_action)
+    # Without a cursor or once past the limit, changes may have been missed
+    return ModlogPage(
+        mod_actions,
+        new_cursor or cursor,
+        complete=not mod_actions,
+    )
+
+
+def get_modlog_subreddits(
+    manager_config: submanager.models.config.SyncManagerConfig,
+) -> dict[str, str]:
+    """Get the subreddits with tracked sources and an account to read them."""
+    subreddit_accounts: dict[str, str] = {}
+    for sync_item in manager_config.items.values():
+        if not (sync_item.enabled and sync_item.source.enabled):
+            continue
+        if sync_item.source.endpoint_type not in TRACKED_ENDPOINT_TYPES:
+            continue
+        subreddit_accounts.setdefault(
+            sync_item.source.context.subreddit.lower(),
+            sync_item.source.context.account,
+        )
+    return subreddit_accounts
+
+
+def poll_modlog(
+    static_config: submanager.models.config.StaticConfig,
+    dynamic_config: submanager.models.config.DynamicModlogConfig,
+    accounts: AccountsMap,
+    *,
+    verbose: bool = False,
+) -> ModlogChanges:
+    """Collect the changes in each subreddit's modlog since the cursor."""
+    vprint = submanager.utils.output.VerbosePrinter(enable=verbose)
+    modlog_changes = ModlogChanges()
+    subreddit_accounts = get_modlog_subreddits(static_config.sync_manager)
+    for subreddit, account_key in subreddit_accounts.items():
+        try:
+            with submanager.utils.tracing.trace_item(
+                f"modlog.cursors.{subreddit}",
+            ), submanager.core.ratelimit.background_requests():
+                modlog_page = fetch_modlog_page(
+                    accounts[account_key],
+                    subreddit,
+                    dynamic_config.cursors.get(subreddit, None),
+                    limit=static_config.modlog.limit,
+                )
+        except submanager.core.isolation.ITEM_ERRORS as error:
+            vprint(
+                f"Could not read modlog of r/{subreddit}; polling all its "
+                f"sources ({type(error).__name__}: {error})",
+            )
+            modlog_changes.touch_all(subreddit)
+            continue
+        # Only advanced once the touched items are synced, so none are lost
+        if modlog_page.cursor is not None:
+            modlog_changes.cursors[subreddit] = modlog_page.cursor
+        if not modlog_page.complete:
+            modlog_changes.touch_all(subreddit)
+        for mod_action in modlog_page.mod_actions:
+            modlog_changes.add_mod_action(subreddit, mod_action)
+    return modlog_changes
+
+
+def get_modlog_filter(
+    static_config: submanager.models.config.StaticConfig,
+    dynamic_config: submanager.models.config.DynamicConfig,
+    modlog_changes: ModlogChanges,
+) -> submanager.sync.manager.SyncItemFilter | None:
+    """Get a filter for the sync items to run, or None for a full sweep."""
+    # Periodically sync everything as a safety net for missed changes
+    current_time = time.time()
+    if (
+        current_time - dynamic_config.modlog.full_sweep_timestamp
+        >= static_config.modlog.full_sweep_interval_s
+    ):
+        dynamic_config.modlog.full_sweep_timestamp = current_time
+        return None
+
+    # Keep retrying items that failed, even if their source wasn't touched
+    sync_items = static_config.sync_manager.items
+    retry_uids = {
+        sync_items[item_key].uid
+        for item_key, dynamic_item in dynamic_config.sync_manager.items.items()
+        if dynamic_item.error_count and item_key in sync_items
+    }
+
+    def modlog_filter(
+        sync_item: submanager.models.config.SyncItemConfig,
+    ) -> bool:
+        """Check if an item's source was touched or it is pending retry."""
+        return sync_item.uid in retry_uids or modlog_changes.is_touched(
+            sync_item.source,
+        )
+
+    return modlog_filter
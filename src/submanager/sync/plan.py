@@ -0,0 +1,244 @@
+"""Plan the reads and writes of a sync run, and run the read phase."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import functools
+from typing import (
+    Mapping,
+    NamedTuple,
+    Union,
+)
+
+# Local imports
+import submanager.core.isolation
+import submanager.core.readpool
+import submanager.endpoint.base
+import submanager.endpoint.creation
+import submanager.endpoint.utils
+import submanager.exceptions
+import submanager.models.config
+import submanager.utils.concurrency
+import submanager.utils.tracing
+from submanager.types import (
+    AccountsMap,
+)
+
+EndpointRead = Union[submanager.endpoint.base.SyncEndpoint, BaseException]
+
+
+class PlannedRead(NamedTuple):
+    """A Reddit object fetched once with a given account."""
+
+    account: str
+    endpoint_key: submanager.endpoint.utils.EndpointKey
+
+
+class RequestCounts(NamedTuple):
+    """Predicted number of Reddit requests in each phase of a run."""
+
+    source_reads: int
+    target_reads: int
+    writes: int
+
+    @property
+    def total(self) -> int:
+        """Get the total number of requests across all phases."""
+        return self.source_reads + self.target_reads + self.writes
+
+
+class ExecutionPlan:
+    """The deduplicated reads and coalesced writes of the sync items."""
+
+    def __init__(self) -> None:
+        self.source_reads: dict[PlannedRead, list[str]] = {}
+        self.target_writes: dict[
+            submanager.endpoint.utils.EndpointKey,
+            list[str],
+        ] = {}
+        self.item_count = 0
+        self.target_count = 0
+
+    def add_item(
+        self,
+        sync_item: submanager.models.config.SyncItemConfig,
+    ) -> None:
+        """Add the reads and writes of a sync item to the plan."""
+        self.item_count += 1
+        planned_read = PlannedRead(
+            account=sync_item.source.context.account,
+            endpoint_key=submanager.endpoint.utils.get_endpoint_key(
+                sync_item.source,
+            ),
+        )
+        self.source_reads.setdefault(planned_read, []).append(sync_item.uid)
+        for target_config in sync_item.targets.values():
+            if not target_config.enabled:
+                continue
+            self.target_count += 1
+            target_key = submanager.endpoint.utils.get_endpoint_key(
+                target_config,
+            )
+            self.target_writes.setdefault(target_key, []).append(
+                target_config.uid,
+            )
+
+    @property
+    def planned_requests(self) -> RequestCounts:
+        """Get the predicted requests when running the plan."""
+        return RequestCounts(
+            source_reads=len(self.source_reads),
+            target_reads=len(self.target_writes),
+            writes=len(self.target_writes),
+        )
+
+    @property
+    def naive_requests(self) -> RequestCounts:
+        """Get the predicted requests syncing each item on its own."""
+        return RequestCounts(
+            source_reads=self.item_count,
+            target_reads=self.target_count,
+            writes=self.target_count,
+        )
+
+
+def build_plan(
+    manager_config: submanager.models.config.SyncManagerConfig,
+) -> ExecutionPlan:
+    """Build the execution plan for all the enabled sync items."""
+    execution_plan = ExecutionPlan()
+    if not manager_config.enabled:
+        return execution_plan
+    for sync_item in manager_config.items.values():
+        if sync_item.enabled and sync_item.source.enabled:
+            execution_plan.add_item(sync_item)
+    return execution_plan
+
+
+def format_plan(execution_plan: ExecutionPlan) -> str:
+    """Format a summary of the plan and its predicted request counts."""
+    plan_lines = [
+        f"Sync items: {execution_plan.item_count}",
+        "",
+        f"Phase 1 (read): {len(execution_plan.source_reads)} sources",
+    ]
+    for planned_read, item_uids in execution_plan.source_reads.items():
+        endpoint_key = planned_read.endpoint_key
+        plan_lines.append(
+            f"  {endpoint_key.endpoint_type} r/{endpoint_key.subreddit} "
+            f"{endpoint_key.endpoint_name!r} as {planned_read.account!r} "
+            f"for {len(item_uids)} item(s)",
+        )
+    plan_lines += [
+        f"Phase 2 (render): {execution_plan.target_count} target sections",
+        f"Phase 3 (write): {len(execution_plan.target_writes)} targets",
+    ]
+    for target_key, target_uids in execution_plan.target_writes.items():
+        plan_lines.append(
+            f"  {target_key.endpoint_type} r/{target_key.subreddit} "
+            f"{target_key.endpoint_name!r} with {len(target_uids)} section(s)",
+        )
+
+    plan_lines += ["", "Predicted requests per run (at most):"]
+    for label, request_counts in (
+        ("Planned", execution_plan.planned_requests),
+        ("Item by item", execution_plan.naive_requests),
+    ):
+        plan_lines.append(
+            f"  {label}: {request_counts.total} "
+            f"({request_counts.source_reads} source reads, "
+            f"{request_counts.target_reads} target reads, "
+            f"{request_counts.writes} writes)",
+        )
+    return "\n".join(plan_lines)
+
+
+def fetch_endpoint(
+    config: submanager.models.config.EndpointTypeConfig,
+    accounts: AccountsMap,
+    account_key: str,
+    limiter: submanager.utils.concurrency.KeyedLimiter,
+    *,
+    read_content: bool = True,
+) -> EndpointRead:
+    """Fetch an endpoint's content, returning any error to raise later."""
+    with limiter.acquire(account_key), submanager.utils.tracing.trace_item(
+        config.uid,
+    ):
+        try:
+            endpoint_obj = (
+                submanager.endpoint.creation.create_sync_endpoint_from_config(
+                    config=config,
+                    reddit=accounts[account_key],
+                )
+            )
+            if read_content:
+                endpoint_obj.content  # noqa: WPS428
+        except submanager.core.isolation.ITEM_ERRORS as error:
+            return error
+    return endpoint_obj
+
+
+def fetch_sources(
+    sync_items: Mapping[str, submanager.models.config.SyncItemConfig],
+    accounts: AccountsMap,
+    *,
+    read_pool: submanager.core.readpool.ReadPool | None = None,
+    max_workers: int = submanager.utils.concurrency.MAX_WORKERS_DEFAULT,
+    max_workers_per_account: int = (
+        submanager.utils.concurrency.MAX_WORKERS_PER_ACCOUNT
+    ),
+) -> dict[str, EndpointRead]:
+    """Fetch each distinct source once, concurrently, by sync item key."""
+    item_reads: dict[str, PlannedRead] = {}
+    source_configs: dict[
+        PlannedRead,
+        submanager.models.config.FullEndpointConfig,
+    ] = {}
+    for item_key, sync_item in sync_items.items():
+        account_key = sync_item.source.context.account
+        if read_pool is not None:
+            account_key = read_pool.get_reader(sync_item.source)
+        planned_read = PlannedRead(
+            account=account_key,
+            endpoint_key=submanager.endpoint.utils.get_endpoint_key(
+                sync_item.source,
+            ),
+        )
+        item_reads[item_key] = planned_read
+        source_configs.setdefault(planned_read, sync_item.source)
+
+    limiter = submanager.utils.concurrency.KeyedLimiter(
+        limit=max_workers_per_account,
+    )
+    source_reads = submanager.utils.concurrency.run_concurrently(
+        {
+            planned_read: functools.partial(
+                fetch_endpoint,
+                source_config,
+                accounts,
+                planned_read.account,
+                limiter,
+            )
+            for planned_read, source_config in source_configs.items()
+        },
+        max_workers=max_workers,
+    )
+    # Stop using pool accounts that turned out to have lost read access
+    if read_pool is not None:
+        for planned_read, source_read in source_reads.items():
+            if isinstance(
+                source_read,
+                submanager.exceptions.PRAW_RETRIVAL_ERRORS,
+            ):
+                read_pool.drop_reader(
+                    source_configs[planned_read],
+                    planned_read.account,
+                )
+    return {
+        item_key: source_reads[planned_read]
+        for item_key, planned_read in item_reads.items()
+    }
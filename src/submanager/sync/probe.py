@@ -0,0 +1,161 @@
+"""Cheaply probe sync sources for changes between full sync runs."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+from typing import (
+    Collection,
+)
+
+# Third party imports
+import praw.reddit
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.core.isolation
+import submanager.core.ratelimit
+import submanager.endpoint.utils
+import submanager.enums
+import submanager.models.config
+import submanager.sync.manager
+import submanager.utils.output
+from submanager.types import (
+    AccountsMap,
+)
+
+SUBMISSION_PREFIX: Final[str] = "t3_"
+
+
+def probe_wiki_revision_date(
+    reddit: praw.reddit.Reddit,
+    endpoint_config: submanager.models.config.EndpointConfig,
+) -> float:
+    """Get the date of a wiki page's latest revision, without its content."""
+    wiki_page = reddit.subreddit(endpoint_config.context.subreddit).wiki[
+        endpoint_config.endpoint_name
+    ]
+    for revision in wiki_page.revisions(limit=1):
+        revision_date: float = revision["timestamp"]
+        return revision_date
+    return 0
+
+
+def probe_thread_revision_dates(
+    reddit: praw.reddit.Reddit,
+    thread_ids: Collection[str],
+) -> dict[str, float]:
+    """Get the dates threads were last edited, batched without comments."""
+    revision_dates = {}
+    fullnames = [
+        f"{SUBMISSION_PREFIX}{thread_id}" for thread_id in sorted(thread_ids)
+    ]
+    for submission in reddit.info(fullnames=fullnames):
+        revision_dates[submission.id] = (
+            submission.edited or submission.created_utc
+        )
+    return revision_dates
+
+
+def probe_sources(
+    manager_config: submanager.models.config.SyncManagerConfig,
+    accounts: AccountsMap,
+    *,
+    verbose: bool = False,
+) -> dict[str, float]:
+    """Get the current revision date of each probeable source, by uid."""
+    vprint = submanager.utils.output.VerbosePrinter(enable=verbose)
+    revision_dates: dict[str, float] = {}
+    # Group the sources, so each thread and page is only probed once
+    thread_sources: dict[
+        str,
+        dict[str, list[submanager.models.config.FullEndpointConfig]],
+    ] = {}
+    wiki_sources: dict[
+        submanager.endpoint.utils.EndpointKey,
+        list[submanager.models.config.FullEndpointConfig],
+    ] = {}
+
+    for sync_item in manager_config.items.values():
+        source = sync_item.source
+        if not (sync_item.enabled and source.enabled):
+            continue
+        if source.endpoint_type == submanager.enums.EndpointType.THREAD:
+            thread_sources.setdefault(source.context.account, {}).setdefault(
+                source.endpoint_name,
+                [],
+            ).append(source)
+        elif source.endpoint_type == submanager.enums.EndpointType.WIKI_PAGE:
+            wiki_sources.setdefault(
+                submanager.endpoint.utils.get_endpoint_key(source),
+                [],
+            ).append(source)
+
+    for sources in wiki_sources.values():
+        try:
+            revision_date = probe_wiki_revision_date(
+                accounts[sources[0].context.account],
+                sources[0],
+            )
+        except submanager.core.isolation.ITEM_ERRORS as error:
+            vprint(
+                f"Error probing {sources[0].uid}; leaving it for the full "
+                f"sync ({type(error).__name__}: {error})",
+            )
+            continue
+        for source in sources:
+            revision_dates[source.uid] = revision_date
+
+    # Probe the threads for each account together in batched requests
+    for account_key, sources_by_thread in thread_sources.items():
+        try:
+            thread_dates = probe_thread_revision_dates(
+                accounts[account_key],
+                sources_by_thread.keys(),
+            )
+        except submanager.core.isolation.ITEM_ERRORS as error:
+            vprint(
+                f"Error probing threads of account {account_key!r}; leaving "
+                f"them for the full sync ({type(error).__name__}: {error})",
+            )
+            continue
+        for thread_id, sources in sources_by_thread.items():
+            if thread_id in thread_dates:
+                for source in sources:
+                    revision_dates[source.uid] = thread_dates[thread_id]
+
+    return revision_dates
+
+
+def get_probe_filter(
+    manager_config: submanager.models.config.SyncManagerConfig,
+    dynamic_config: submanager.models.config.DynamicSyncManagerConfig,
+    accounts: AccountsMap,
+    *,
+    verbose: bool = False,
+) -> submanager.sync.manager.SyncItemFilter:
+    """Get a filter for the sync items whose source probed as changed."""
+    with submanager.core.ratelimit.background_requests():
+        revision_dates = probe_sources(
+            manager_config,
+            accounts,
+            verbose=verbose,
+        )
+    changed_uids = {
+        sync_item.uid
+        for item_key, sync_item in manager_config.items.items()
+        if revision_dates.get(sync_item.source.uid, 0)
+        > dynamic_config.items[item_key].source_timestamp
+    }
+
+    def probe_filter(
+        sync_item: submanager.models.config.SyncItemConfig,
+    ) -> bool:
+        """Check if an item's source changed since it was last synced."""
+        return sync_item.uid in changed_uids
+
+    return probe_filter
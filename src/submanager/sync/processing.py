@@ -5,6 +5,9 @@ from __future__ import (
     annotations,
 )
 
+# Standard library imports
+import functools
+
 # Third party imports
 from typing_extensions import (
     Literal,
@@ -14,8 +17,10 @@ from typing_extensions import (
 import submanager.endpoint.base
 import submanager.endpoint.endpoints
 import submanager.models.config
+import submanager.sync.cache
 import submanager.sync.menu
 import submanager.sync.utils
+import submanager.utils.misc
 from submanager.types import (
     MenuData,
 )
@@ -37,6 +42,27 @@ def process_source_text(
     return source_text
 
 
+def render_target_text(
+    source_text: str,
+    endpoint_config: submanager.models.config.FullEndpointConfig,
+) -> str:
+    """Process the source text and pad it to splice into a target."""
+    source_text = process_source_text(source_text, endpoint_config)
+    return f"\n\n{source_text.strip()}\n\n"
+
+
+def get_render_key(
+    source_text: str,
+    endpoint_config: submanager.models.config.FullEndpointConfig,
+) -> str:
+    """Get the key of the source text rendered with the endpoint's config."""
+    return submanager.utils.misc.hash_data(
+        source_text,
+        endpoint_config.replace_patterns,
+        endpoint_config.truncate_lines,
+    )
+
+
 def handle_endpoint_pattern(
     content: str,
     pattern_config: submanager.models.config.PatternConfig,
@@ -107,15 +133,28 @@ def process_target_endpoint(
     target_obj: submanager.endpoint.base.SyncEndpoint,
     source_content: str | MenuData,
     menu_config: submanager.models.config.MenuConfig | None = None,
+    target_content: str | MenuData | None = None,
+    render_cache: submanager.sync.cache.RenderCache | None = None,
 ) -> str | MenuData | Literal[False]:
     """Handle text conversions and deployment onto a sync target."""
     # Perform the target-specific pattern replacements
     if isinstance(source_content, str):
-        source_content = process_source_text(source_content, target_config)
-        source_content = f"\n\n{source_content.strip()}\n\n"
+        source_text = source_content
+        if render_cache is None:
+            source_content = render_target_text(source_text, target_config)
+        else:
+            source_content = render_cache.get_or_render(
+                get_render_key(source_text, target_config),
+                functools.partial(
+                    render_target_text,
+                    source_text,
+                    target_config,
+                ),
+            )
 
     # If the target is a menu, build the source into one if not already one
-    target_content = target_obj.content
+    if target_content is None:
+        target_content = target_obj.content
     if isinstance(target_obj, submanager.endpoint.endpoints.MenuSyncEndpoint):
         if isinstance(source_content, str):
             target_content = submanager.sync.menu.parse_menu(
@@ -7,8 +7,12 @@ from __future__ import (
 
 # Standard library imports
 import contextlib
+import functools
 import re
 import time
+from typing import (
+    Mapping,
+)
 
 # Third party imports
 import praw.models.reddit.submission
@@ -125,7 +129,7 @@ def create_new_thread(
         .subreddit(thread_config.target_context.subreddit)
         .submit(title=template_vars["post_title"], selftext=post_text)
     )
-    new_thread.disable_inbox_replies()  # type: ignore[no-untyped-call]
+    new_thread.disable_inbox_replies()
     for attribute in THREAD_ATTRIBUTES:
         template_vars[f"thread_{attribute}"] = getattr(new_thread, attribute)
 
@@ -191,9 +195,39 @@ def handle_pin_thread(
     return True
 
 
+def create_link_page_configs(
+    thread_config: submanager.models.config.ThreadItemConfig,
+) -> list[submanager.models.config.EndpointConfig]:
+    """Create the configs of the pages to update the thread links on."""
+    uid = thread_config.uid + ".link_update_pages"
+    return [
+        submanager.models.config.EndpointConfig(
+            context=thread_config.context,
+            description=f"Thread link page {page_name}",
+            endpoint_name=page_name,
+            uid=uid + f".{page_name}",
+        )
+        for page_name in thread_config.link_update_pages
+    ]
+
+
+def replace_thread_links(content: str, links: Mapping[str, str]) -> str:
+    """Replace each old thread link in the text with the new one."""
+    for old_link, new_link in links.items():
+        content = re.sub(
+            pattern=re.escape(old_link),
+            repl=new_link,
+            string=content,
+            flags=re.IGNORECASE,
+        )
+    return content
+
+
 def update_page_links(
     thread_config: submanager.models.config.ThreadItemConfig,
     thread_context: ThreadContext,
+    *,
+    config_cache: submanager.thread.utils.ThreadConfigCache | None = None,
 ) -> None:
     """Update the links to the given thread on the passed pages."""
     if not (
@@ -209,28 +243,25 @@ def update_page_links(
         for link_type in ("permalink", "shortlink")
     }
 
-    uid = thread_config.uid + ".link_update_pages"
-    for page_name in thread_config.link_update_pages:
-        page_config = submanager.models.config.EndpointConfig(
-            context=thread_config.context,
-            description=f"Thread link page {page_name}",
-            endpoint_name=page_name,
-            uid=uid + f".{page_name}",
+    build_page_configs = functools.partial(
+        create_link_page_configs,
+        thread_config,
+    )
+    if config_cache is None:
+        page_configs = build_page_configs()
+    else:
+        page_configs = config_cache.link_page_configs.get_or_build(
+            thread_config,
+            None,
+            build_page_configs,
         )
+    for page_config in page_configs:
         page = submanager.endpoint.endpoints.WikiSyncEndpoint(
             config=page_config,
             reddit=thread_context.mod.reddit,
         )
-        new_content = page.content
-        for old_link, new_link in links.items():
-            new_content = re.sub(
-                pattern=re.escape(old_link),
-                repl=new_link,
-                string=new_content,
-                flags=re.IGNORECASE,
-            )
         page.edit(
-            new_content,
+            replace_thread_links(page.content, links),
             reason=(
                 f"Update {thread_config.description or thread_config.uid} "
                 "thread URLs"
@@ -272,10 +303,13 @@ def handle_new_thread(
     thread_config: submanager.models.config.ThreadItemConfig,
     dynamic_config: submanager.models.config.DynamicThreadItemConfig,
     accounts: AccountsMap,
+    *,
+    config_cache: submanager.thread.utils.ThreadConfigCache | None = None,
 ) -> None:
     """Handle creating and setting up a new thread and retiring the old."""
     # Bump counts in dynamic config
     dynamic_config.source_timestamp = 0
+    dynamic_config.source_hash = None
     dynamic_config.thread_number += 1
 
     # Generate template variables, title and post text and post
@@ -311,6 +345,7 @@ def handle_new_thread(
     update_page_links(
         thread_config=thread_config,
         thread_context=thread_context,
+        config_cache=config_cache,
     )
 
     # Add messages to new thread on old thread if enabled
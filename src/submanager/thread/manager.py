@@ -5,11 +5,18 @@ from __future__ import (
     annotations,
 )
 
+# Standard library imports
+import functools
+
 # Local imports
+import submanager.core.isolation
+import submanager.core.pacing
+import submanager.core.readpool
 import submanager.models.config
 import submanager.thread.creation
 import submanager.thread.sync
 import submanager.thread.utils
+import submanager.utils.tracing
 from submanager.types import (
     AccountsMap,
 )
@@ -21,6 +28,8 @@ def manage_thread(
     accounts: AccountsMap,
     *,
     post_new_thread: bool | None = None,
+    read_pool: submanager.core.readpool.ReadPool | None = None,
+    config_cache: submanager.thread.utils.ThreadConfigCache | None = None,
     verbose: bool = True,
 ) -> None:
     """Manage the current thread, creating or updating it as necessary."""
@@ -47,6 +56,7 @@ def manage_thread(
             thread_config,
             dynamic_config,
             accounts,
+            config_cache=config_cache,
         )
     # Otherwise, sync the current thread
     else:
@@ -54,6 +64,8 @@ def manage_thread(
             thread_config=thread_config,
             dynamic_config=dynamic_config,
             accounts=accounts,
+            read_pool=read_pool,
+            config_cache=config_cache,
         )
 
 
@@ -61,11 +73,31 @@ def manage_threads(
     manager_config: submanager.models.config.ThreadManagerConfig,
     dynamic_config: submanager.models.config.DynamicThreadManagerConfig,
     accounts: AccountsMap,
+    *,
+    retry_config: submanager.models.config.RetryConfig | None = None,
+    phase_slot: submanager.core.pacing.PhaseSlot | None = None,
+    read_pool: submanager.core.readpool.ReadPool | None = None,
+    config_cache: submanager.thread.utils.ThreadConfigCache | None = None,
 ) -> None:
     """Check and create/update all defined threads for a sub."""
     for thread_key, thread_config in manager_config.items.items():
-        manage_thread(
+        if phase_slot is not None and not phase_slot.contains(thread_config):
+            continue
+        run_item = functools.partial(
+            manage_thread,
             thread_config=thread_config,
             dynamic_config=dynamic_config.items[thread_key],
             accounts=accounts,
+            read_pool=read_pool,
+            config_cache=config_cache,
         )
+        with submanager.utils.tracing.trace_item(thread_config.uid):
+            if retry_config is None:
+                run_item()
+            else:
+                submanager.core.isolation.run_isolated(
+                    run_item,
+                    item_config=thread_config,
+                    dynamic_config=dynamic_config.items[thread_key],
+                    retry_config=retry_config,
+                )
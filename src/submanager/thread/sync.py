@@ -5,7 +5,11 @@ from __future__ import (
     annotations,
 )
 
+# Standard library imports
+import functools
+
 # Local imports
+import submanager.core.readpool
 import submanager.enums
 import submanager.exceptions
 import submanager.models.config
@@ -16,37 +20,61 @@ from submanager.types import (
 )
 
 
-def sync_thread(
+def create_thread_sync_item(
     thread_config: submanager.models.config.ThreadItemConfig,
-    dynamic_config: submanager.models.config.DynamicThreadItemConfig,
-    accounts: AccountsMap,
-) -> None:
-    """Sync a managed thread from its source."""
-    if not dynamic_config.thread_id:
-        raise submanager.exceptions.SubManagerValueError(
-            "Thread ID for must be specified for thread sync to work "
-            f"for thread {thread_config!r}",
-            message_post=f"Dynamic Config: {dynamic_config!r}",
-        )
-
+    thread_id: str,
+) -> submanager.models.config.SyncItemConfig:
+    """Create the config to sync a managed thread from its source."""
     thread_target = submanager.models.config.FullEndpointConfig(
         context=thread_config.target_context,
         description=f"{thread_config.description or thread_config.uid} Thread",
-        endpoint_name=dynamic_config.thread_id,
+        endpoint_name=thread_id,
         endpoint_type=submanager.enums.EndpointType.THREAD,
         pattern=submanager.thread.utils.THREAD_PATTERN,
         pattern_end=thread_config.source.pattern_end,
         pattern_start=thread_config.source.pattern_start,
         uid=thread_config.uid + ".target",
     )
-    sync_item = submanager.models.config.SyncItemConfig(
+    return submanager.models.config.SyncItemConfig(
         description=thread_config.description,
         source=thread_config.source,
         targets={"managed_thread": thread_target},
         uid=thread_config.uid + ".sync_item",
     )
+
+
+def sync_thread(
+    thread_config: submanager.models.config.ThreadItemConfig,
+    dynamic_config: submanager.models.config.DynamicThreadItemConfig,
+    accounts: AccountsMap,
+    *,
+    read_pool: submanager.core.readpool.ReadPool | None = None,
+    config_cache: submanager.thread.utils.ThreadConfigCache | None = None,
+) -> None:
+    """Sync a managed thread from its source."""
+    if not dynamic_config.thread_id:
+        raise submanager.exceptions.SubManagerValueError(
+            "Thread ID for must be specified for thread sync to work "
+            f"for thread {thread_config!r}",
+            message_post=f"Dynamic Config: {dynamic_config!r}",
+        )
+
+    build_sync_item = functools.partial(
+        create_thread_sync_item,
+        thread_config,
+        dynamic_config.thread_id,
+    )
+    if config_cache is None:
+        sync_item = build_sync_item()
+    else:
+        sync_item = config_cache.sync_items.get_or_build(
+            thread_config,
+            dynamic_config.thread_id,
+            build_sync_item,
+        )
     submanager.sync.manager.sync_one(
         sync_item=sync_item,
         dynamic_config=dynamic_config,
         accounts=accounts,
+        read_pool=read_pool,
     )
@@ -7,6 +7,13 @@ from __future__ import (
 
 # Standard library imports
 import datetime
+import threading
+from typing import (
+    Callable,
+    Generic,
+    Hashable,
+    TypeVar,
+)
 
 # Third party imports
 import dateutil.relativedelta
@@ -17,6 +24,7 @@ from typing_extensions import (
 )
 
 # Local imports
+import submanager.models.base
 import submanager.models.config
 import submanager.models.utils
 from submanager.types import (
@@ -25,6 +33,58 @@ from submanager.types import (
 
 THREAD_PATTERN: Final[str] = "Auto Sync"
 
+DerivedT = TypeVar("DerivedT")
+
+
+class DerivedConfigCache(Generic[DerivedT]):
+    """Memoize configs derived from an item config, one entry per item.
+
+    An entry is reused only while the item config is the same object and
+    the derived key (e.g. the thread ID) is unchanged, so reloading the
+    config or posting a new thread rebuilds it.
+    """
+
+    def __init__(self) -> None:
+        self._derived: dict[
+            str,
+            tuple[submanager.models.base.ItemConfig, Hashable, DerivedT],
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self,
+        item_config: submanager.models.base.ItemConfig,
+        derived_key: Hashable,
+        build: Callable[[], DerivedT],
+    ) -> DerivedT:
+        """Get the derived config for the item and key, building if needed."""
+        with self._lock:
+            cache_entry = self._derived.get(item_config.uid, None)
+        if cache_entry is not None:
+            cached_config, cached_key, derived = cache_entry
+            if cached_config is item_config and cached_key == derived_key:
+                return derived
+        derived = build()
+        with self._lock:
+            self._derived[item_config.uid] = (
+                item_config,
+                derived_key,
+                derived,
+            )
+        return derived
+
+
+class ThreadConfigCache:
+    """The configs derived from each managed thread, kept between runs."""
+
+    def __init__(self) -> None:
+        self.sync_items: DerivedConfigCache[
+            submanager.models.config.SyncItemConfig
+        ] = DerivedConfigCache()
+        self.link_page_configs: DerivedConfigCache[
+            list[submanager.models.config.EndpointConfig]
+        ] = DerivedConfigCache()
+
 
 def generate_template_vars(
     thread_config: submanager.models.config.ThreadItemConfig,
@@ -83,7 +143,7 @@ def should_post_new_thread(
     else:
         delta_kwargs: dict[str, int] = {f"{interval_unit}s": interval_n}
         relative_timedelta = dateutil.relativedelta.relativedelta(
-            **delta_kwargs,  # type: ignore[arg-type]
+            **delta_kwargs,
         )
         interval_exceeded = current_datetime > (
             last_post_timestamp + relative_timedelta
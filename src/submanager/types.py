@@ -11,10 +11,12 @@ import os
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     List,
     Mapping,
     MutableMapping,
     NewType,
+    Sequence,
     Tuple,
     Type,
     Union,
@@ -41,3 +43,16 @@ SectionData = MutableMapping[str, Union[str, ChildrenData]]
 MenuData = NewType("MenuData", List[SectionData])
 
 TemplateVars = MutableMapping[str, Union[str, int, float, datetime.datetime]]
+
+JSONValue = Union[
+    None,
+    bool,
+    int,
+    float,
+    str,
+    Sequence["JSONValue"],
+    Mapping[str, "JSONValue"],
+]
+JSONDict = Mapping[str, JSONValue]
+
+ControlHandler = Callable[..., str]
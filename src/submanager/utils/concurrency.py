@@ -0,0 +1,98 @@
+"""Utilities to run independent tasks concurrently with bounded limits."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import concurrent.futures
+import contextlib
+import contextvars
+import threading
+from typing import (
+    Callable,
+    Generator,
+    Hashable,
+    Mapping,
+    TypeVar,
+)
+
+# Third party imports
+from typing_extensions import (
+    Final,
+)
+
+KeyType = TypeVar("KeyType")
+ResultType = TypeVar("ResultType")
+
+MAX_WORKERS_DEFAULT: Final[int] = 8
+MAX_WORKERS_PER_KEY_DEFAULT: Final[int] = 4
+# Each account's PRAW instance isn't thread-safe, so is used by one at a time
+MAX_WORKERS_PER_ACCOUNT: Final[int] = 1
+
+
+class KeyedLimiter:
+    """Limit the number of concurrent operations sharing the same key."""
+
+    def __init__(self, limit: int = MAX_WORKERS_PER_KEY_DEFAULT) -> None:
+        if limit < 1:
+            raise ValueError(f"Limit must be >= 1, not {limit!r}")
+        self.limit = limit
+        self._semaphores: dict[Hashable, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _get_semaphore(self, key: Hashable) -> threading.BoundedSemaphore:
+        """Get the semaphore for a key, creating it if needed."""
+        with self._lock:
+            semaphore = self._semaphores.get(key, None)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.limit)
+                self._semaphores[key] = semaphore
+            return semaphore
+
+    @contextlib.contextmanager
+    def acquire(self, key: Hashable) -> Generator[None, None, None]:
+        """Block until a slot is free for the key, then hold it."""
+        semaphore = self._get_semaphore(key)
+        with semaphore:
+            yield
+
+
+def run_concurrently(
+    tasks: Mapping[KeyType, Callable[[], ResultType]],
+    *,
+    max_workers: int = MAX_WORKERS_DEFAULT,
+) -> dict[KeyType, ResultType]:
+    """Run each task in a thread pool and return the results by key.
+
+    If any task raises, tasks not yet started are cancelled and the error
+    from the earliest task (in the order passed) is re-raised. Each task runs
+    in a copy of the caller's context, so context variables carry over.
+    """
+    if max_workers <= 1 or len(tasks) <= 1:
+        return {key: task() for key, task in tasks.items()}
+
+    results: dict[KeyType, ResultType] = {}
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(tasks)),
+    ) as executor:
+        futures = {
+            key: executor.submit(contextvars.copy_context().run, task)
+            for key, task in tasks.items()
+        }
+        concurrent.futures.wait(
+            futures.values(),
+            return_when=concurrent.futures.FIRST_EXCEPTION,
+        )
+        if any(
+            future.done() and future.exception() is not None
+            for future in futures.values()
+        ):
+            for future in futures.values():
+                future.cancel()
+        for key, future in futures.items():
+            if future.cancelled():
+                continue
+            results[key] = future.result()
+    return results
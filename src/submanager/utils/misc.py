@@ -6,6 +6,8 @@ from __future__ import (
 )
 
 # Standard library imports
+import hashlib
+import json
 import time
 
 # Third party imports
@@ -28,3 +30,14 @@ def sleep_for_interval(
         time_left_s -= sleep_tick
         if time_left_s <= 0:
             return
+
+
+def hash_data(*data: object) -> str:
+    """Generate a stable hash of JSON-serializable data."""
+    serialized_data = json.dumps(
+        data,
+        default=str,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return hashlib.sha256(serialized_data.encode("utf-8")).hexdigest()
@@ -0,0 +1,37 @@
+"""Track which item the current code is working on, across threads."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import contextlib
+import contextvars
+from typing import (
+    Generator,
+)
+
+# Third party imports
+from typing_extensions import (
+    Final,
+)
+
+CURRENT_ITEM: Final[
+    contextvars.ContextVar[str | None]
+] = contextvars.ContextVar("current_item", default=None)
+
+
+def get_current_item() -> str | None:
+    """Get the uid of the item currently being worked on, if any."""
+    return CURRENT_ITEM.get()
+
+
+@contextlib.contextmanager
+def trace_item(item_uid: str) -> Generator[None, None, None]:
+    """Attribute the work done in the block to the given item."""
+    reset_token = CURRENT_ITEM.set(item_uid)
+    try:
+        yield
+    finally:
+        CURRENT_ITEM.reset(reset_token)
@@ -7,8 +7,10 @@ from __future__ import (
 
 # Standard library imports
 import enum
+import functools
 import warnings
 from typing import (
+    Callable,
     Collection,
 )
 
@@ -20,7 +22,9 @@ from typing_extensions import (
 
 # Local imports
 import submanager.exceptions
+import submanager.utils.concurrency
 import submanager.utils.output
+import submanager.validation.cache
 from submanager.types import (
     AccountsMap,
 )
@@ -252,32 +256,72 @@ def validate_account(
 # ---- Top level account validation ----
 
 
+def _validate_account_full(
+    reddit: praw.reddit.Reddit,
+    account_key: str,
+    *,
+    offline_only: bool = False,
+    check_readonly: bool = True,
+    raise_error: bool = True,
+) -> bool:
+    """Validate an account offline, then online if requested."""
+    account_valid = validate_account_offline(
+        reddit=reddit,
+        account_key=account_key,
+        check_readonly=check_readonly,
+        raise_error=raise_error,
+    )
+    if account_valid and not offline_only:
+        account_valid = validate_account(
+            reddit,
+            account_key=account_key,
+            raise_error=raise_error,
+        )
+    return account_valid
+
+
 def validate_accounts(
     accounts: AccountsMap,
     *,
     offline_only: bool = False,
     check_readonly: bool = True,
     raise_error: bool = True,
+    max_workers: int = submanager.utils.concurrency.MAX_WORKERS_DEFAULT,
+    validation_cache: (
+        submanager.validation.cache.ValidationCacheSession | None
+    ) = None,
     verbose: bool = False,
 ) -> dict[str, bool]:
     """Validate that the passed accounts are authenticated and work."""
     vprint = submanager.utils.output.VerbosePrinter(verbose)
 
-    # For each account, validate it offline and online
-    accounts_valid = {}
+    # For each account, validate it offline and online concurrently
+    accounts_valid: dict[str, bool] = {}
+    tasks: dict[str, Callable[[], bool]] = {}
     for account_key, reddit in accounts.items():
+        if validation_cache and validation_cache.check_account(account_key):
+            vprint(f"Account {account_key!r} unchanged since last validated")
+            accounts_valid[account_key] = True
+            continue
         vprint(f"Validating account {account_key!r}")
-        account_valid = validate_account_offline(
+        tasks[account_key] = functools.partial(
+            _validate_account_full,
             reddit=reddit,
             account_key=account_key,
+            offline_only=offline_only,
             check_readonly=check_readonly,
             raise_error=raise_error,
         )
-        if account_valid and not offline_only:
-            account_valid = validate_account(
-                reddit,
-                account_key=account_key,
-                raise_error=raise_error,
-            )
-        accounts_valid[account_key] = account_valid
+    accounts_valid.update(
+        submanager.utils.concurrency.run_concurrently(
+            tasks,
+            max_workers=max_workers,
+        ),
+    )
+
+    # Record the accounts that passed full online validation
+    if validation_cache and not offline_only:
+        for account_key in tasks:
+            if accounts_valid[account_key]:
+                validation_cache.record_account(account_key)
     return accounts_valid
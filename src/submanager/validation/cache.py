@@ -0,0 +1,224 @@
+"""Cache successful validation results to skip rechecking unchanged items."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import json
+import threading
+import time
+from pathlib import (
+    Path,
+)
+from typing import (
+    MutableMapping,
+)
+
+# Third party imports
+import pydantic
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.config.utils
+import submanager.exceptions
+import submanager.models.config
+import submanager.utils.misc
+from submanager.types import (
+    PathLikeStr,
+)
+
+# Fields that don't affect whether an endpoint validates successfully
+HASH_EXCLUDE_FIELDS: Final[frozenset[str]] = frozenset(
+    ("description", "enabled", "uid"),
+)
+
+
+# ---- Hashing ----
+
+
+def hash_account_config(
+    account_config: submanager.models.config.AccountConfig,
+    *,
+    check_readonly: bool = True,
+) -> str:
+    """Hash the parts of an account config that affect its validation."""
+    return submanager.utils.misc.hash_data(
+        "account",
+        dict(account_config.config),
+        check_readonly,
+    )
+
+
+def hash_endpoint_config(
+    endpoint_config: submanager.models.config.EndpointTypeConfig,
+    account_config: submanager.models.config.AccountConfig,
+    *,
+    check_editable: bool = False,
+) -> str:
+    """Hash the parts of an endpoint config that affect its validation."""
+    return submanager.utils.misc.hash_data(
+        "endpoint",
+        endpoint_config.dict(exclude=set(HASH_EXCLUDE_FIELDS)),
+        dict(account_config.config),
+        check_editable,
+    )
+
+
+# ---- Loading and saving ----
+
+
+def load_validation_cache(
+    cache_path: PathLikeStr,
+) -> submanager.models.config.ValidationCache:
+    """Load the validation cache, returning an empty one if not usable."""
+    cache_path = Path(cache_path)
+    if not cache_path.exists():
+        return submanager.models.config.ValidationCache()
+    try:
+        raw_cache = submanager.config.utils.load_config(cache_path)
+        return submanager.models.config.ValidationCache.parse_obj(raw_cache)
+    except (
+        json.decoder.JSONDecodeError,
+        pydantic.ValidationError,
+        submanager.exceptions.ConfigError,
+    ):
+        return submanager.models.config.ValidationCache()
+
+
+def prune_validation_cache(
+    validation_cache: submanager.models.config.ValidationCache,
+    ttl_s: float,
+) -> None:
+    """Remove expired entries from the validation cache in place."""
+    expire_before = time.time() - ttl_s
+    cache_sections: list[
+        MutableMapping[str, submanager.models.config.ValidationCacheEntry]
+    ] = [validation_cache.accounts, validation_cache.endpoints]
+    for cache_section in cache_sections:
+        for config_hash, cache_entry in list(cache_section.items()):
+            if cache_entry.validated_timestamp < expire_before:
+                del cache_section[config_hash]  # noqa: WPS420
+
+
+# ---- Session handling ----
+
+
+class ValidationCacheSession:
+    """Check and record validation results against a specific config."""
+
+    def __init__(
+        self,
+        static_config: submanager.models.config.StaticConfig,
+        validation_cache: submanager.models.config.ValidationCache,
+        *,
+        use_cached: bool = True,
+    ) -> None:
+        self.static_config = static_config
+        self.validation_cache = validation_cache
+        self.use_cached = use_cached
+        self._lock = threading.Lock()
+
+    def _check_entry(
+        self,
+        cache_section: MutableMapping[
+            str,
+            submanager.models.config.ValidationCacheEntry,
+        ],
+        config_hash: str,
+    ) -> bool:
+        """Check if a config hash has a current cache entry."""
+        if not self.use_cached:
+            return False
+        cache_entry = cache_section.get(config_hash, None)
+        if cache_entry is None:
+            return False
+        entry_age_s = time.time() - cache_entry.validated_timestamp
+        return 0 <= entry_age_s <= self.static_config.validation_ttl_s
+
+    def _record_entry(
+        self,
+        cache_section: MutableMapping[
+            str,
+            submanager.models.config.ValidationCacheEntry,
+        ],
+        config_hash: str,
+    ) -> None:
+        """Record a successful validation for a config hash."""
+        cache_entry = submanager.models.config.ValidationCacheEntry(
+            validated_timestamp=time.time(),
+        )
+        with self._lock:
+            cache_section[config_hash] = cache_entry
+
+    def _hash_account(self, account_key: str) -> str:
+        """Hash the config of the given account."""
+        return hash_account_config(
+            self.static_config.accounts[account_key],
+            check_readonly=self.static_config.check_readonly,
+        )
+
+    def _hash_endpoint(
+        self,
+        endpoint_config: submanager.models.config.EndpointTypeConfig,
+        check_editable: bool,
+    ) -> str:
+        """Hash the config of the given endpoint and its account."""
+        return hash_endpoint_config(
+            endpoint_config,
+            self.static_config.accounts[endpoint_config.context.account],
+            check_editable=check_editable,
+        )
+
+    def check_account(self, account_key: str) -> bool:
+        """Check if the account has been validated and is unchanged."""
+        return self._check_entry(
+            self.validation_cache.accounts,
+            self._hash_account(account_key),
+        )
+
+    def record_account(self, account_key: str) -> None:
+        """Record that the account was successfully validated."""
+        self._record_entry(
+            self.validation_cache.accounts,
+            self._hash_account(account_key),
+        )
+
+    def check_endpoint(
+        self,
+        endpoint_config: submanager.models.config.EndpointTypeConfig,
+        *,
+        check_editable: bool = False,
+    ) -> bool:
+        """Check if the endpoint has been validated and is unchanged."""
+        return self._check_entry(
+            self.validation_cache.endpoints,
+            self._hash_endpoint(endpoint_config, check_editable),
+        )
+
+    def record_endpoint(
+        self,
+        endpoint_config: submanager.models.config.EndpointTypeConfig,
+        *,
+        check_editable: bool = False,
+    ) -> None:
+        """Record that the endpoint was successfully validated."""
+        self._record_entry(
+            self.validation_cache.endpoints,
+            self._hash_endpoint(endpoint_config, check_editable),
+        )
+
+    def write(self, cache_path: PathLikeStr) -> None:
+        """Prune expired entries and write the cache to disk."""
+        with self._lock:
+            prune_validation_cache(
+                self.validation_cache,
+                ttl_s=self.static_config.validation_ttl_s,
+            )
+            submanager.config.utils.write_config(
+                self.validation_cache,
+                config_path=cache_path,
+            )
@@ -29,18 +29,23 @@ REQUEST_TIMEOUT_S: Final[float] = 5
 
 def get_reddit_oauth_scopes(
     scopes: Collection[str] | None = None,
+    *,
+    session: requests.Session | None = None,
+    reddit_url: str | None = None,
 ) -> dict[str, dict[str, str]]:
     """Get metadata on the OAUTH scopes offered by the Reddit API."""
     # Set up the request for scopes
     scopes_endpoint = "/api/v1/scopes"
-    scopes_endpoint_url = REDDIT_BASE_URL + scopes_endpoint
+    scopes_endpoint_url = (reddit_url or REDDIT_BASE_URL).rstrip("/")
+    scopes_endpoint_url += scopes_endpoint
     headers = {"User-Agent": USER_AGENT}
     query_params = {}
     if scopes:
         query_params["scopes"] = scopes
 
-    # Make and process the request
-    response = requests.get(
+    # Make and process the request, reusing the session's connections if any
+    request_get = requests.get if session is None else session.get
+    response = request_get(
         scopes_endpoint_url,
         params=query_params,
         headers=headers,
@@ -51,10 +56,15 @@ def get_reddit_oauth_scopes(
     return response_json
 
 
-def check_reddit_connectivity(raise_error: bool = True) -> bool:
+def check_reddit_connectivity(
+    raise_error: bool = True,
+    *,
+    session: requests.Session | None = None,
+    reddit_url: str | None = None,
+) -> bool:
     """Check if Sub Manager is able to contact Reddit at all."""
     try:
-        get_reddit_oauth_scopes()
+        get_reddit_oauth_scopes(session=session, reddit_url=reddit_url)
     except submanager.exceptions.REQUESTS_CONNECTIVITY_ERROS as error:
         if not raise_error:
             return False
@@ -6,26 +6,52 @@ from __future__ import (
 )
 
 # Standard library imports
+import functools
 from typing import (
+    Callable,
+    Tuple,
     Union,
 )
 
 # Third party imports
 import prawcore.exceptions
+from typing_extensions import (
+    Final,
+)
 
 # Local imports
+import submanager.core.readpool
 import submanager.endpoint.creation
+import submanager.endpoint.permissions
+import submanager.endpoint.utils
 import submanager.exceptions
 import submanager.models.config
+import submanager.utils.concurrency
 import submanager.utils.output
+import submanager.validation.cache
 from submanager.types import (
     AccountsMap,
+    ExceptTuple,
 )
 
 ManagerWithEndpoints = Union[
     submanager.models.config.SyncManagerConfig,
     submanager.models.config.ThreadManagerConfig,
 ]
+ValidationKey = Tuple[str, submanager.endpoint.utils.EndpointKey, bool]
+
+# Any of these while checking read access mean the account can't read it
+READ_ACCESS_ERRORS: Final[ExceptTuple] = (
+    *submanager.exceptions.PRAW_ALL_ERRORS,
+    submanager.exceptions.SubManagerError,
+)
+
+
+def _get_check_editable(
+    config: submanager.models.config.EndpointTypeConfig,
+) -> bool:
+    """Determine whether an endpoint needs to be checked for editability."""
+    return "target" in config.uid
 
 
 def validate_endpoint(
@@ -34,10 +60,13 @@ def validate_endpoint(
     *,
     check_editable: bool | None = None,
     raise_error: bool = True,
+    permissions_cache: (
+        submanager.endpoint.permissions.ModPermissionsCache | None
+    ) = None,
 ) -> bool:
     """Validate that the sync endpoint points to a valid Reddit object."""
     if check_editable is None:
-        check_editable = "target" in config.uid
+        check_editable = _get_check_editable(config)
     reddit = accounts[config.context.account]
 
     details_urls = [
@@ -58,7 +87,10 @@ def validate_endpoint(
         endpoint_valid = endpoint.validate(raise_error=raise_error)
         if endpoint_valid and check_editable:
             endpoint_valid = bool(
-                endpoint.check_is_editable(raise_error=raise_error),
+                endpoint.check_is_editable(
+                    raise_error=raise_error,
+                    permissions_cache=permissions_cache,
+                ),
             )
     except prawcore.exceptions.InsufficientScope as error:
         if not raise_error:
@@ -130,12 +162,68 @@ def get_all_endpoints(
     return all_endpoints
 
 
+def dedupe_endpoints(
+    endpoints: list[submanager.models.config.FullEndpointConfig],
+) -> dict[ValidationKey, list[submanager.models.config.FullEndpointConfig]]:
+    """Group endpoints that would perform identical validation checks."""
+    endpoint_groups: dict[
+        ValidationKey,
+        list[submanager.models.config.FullEndpointConfig],
+    ] = {}
+    for endpoint in endpoints:
+        validation_key = (
+            endpoint.context.account,
+            submanager.endpoint.utils.get_endpoint_key(endpoint),
+            _get_check_editable(endpoint),
+        )
+        endpoint_groups.setdefault(validation_key, []).append(endpoint)
+    return endpoint_groups
+
+
+def _validate_endpoint_limited(
+    config: submanager.models.config.EndpointTypeConfig,
+    accounts: AccountsMap,
+    limiter: submanager.utils.concurrency.KeyedLimiter,
+    *,
+    check_editable: bool,
+    raise_error: bool = True,
+    validation_cache: (
+        submanager.validation.cache.ValidationCacheSession | None
+    ) = None,
+    permissions_cache: (
+        submanager.endpoint.permissions.ModPermissionsCache | None
+    ) = None,
+) -> bool:
+    """Validate an endpoint once a slot is free for its account."""
+    with limiter.acquire(config.context.account):
+        endpoint_valid = validate_endpoint(
+            config=config,
+            accounts=accounts,
+            check_editable=check_editable,
+            raise_error=raise_error,
+            permissions_cache=permissions_cache,
+        )
+    if endpoint_valid and validation_cache:
+        validation_cache.record_endpoint(
+            config,
+            check_editable=check_editable,
+        )
+    return endpoint_valid
+
+
 def validate_endpoints(
     static_config: submanager.models.config.StaticConfig,
     accounts: AccountsMap,
     *,
     include_disabled: bool = False,
     raise_error: bool = True,
+    max_workers: int = submanager.utils.concurrency.MAX_WORKERS_DEFAULT,
+    max_workers_per_account: int = (
+        submanager.utils.concurrency.MAX_WORKERS_PER_ACCOUNT
+    ),
+    validation_cache: (
+        submanager.validation.cache.ValidationCacheSession | None
+    ) = None,
     verbose: bool = False,
 ) -> dict[str, bool]:
     """Validate all the endpoints defined in the config."""
@@ -145,16 +233,145 @@ def validate_endpoints(
         static_config=static_config,
         include_disabled=include_disabled,
     )
+    endpoint_groups = dedupe_endpoints(all_endpoints)
 
-    # Check if each endpoint is valid
-    endpoints_valid = {}
-    for endpoint in all_endpoints:
-        vprint(f"Validating endpoint {endpoint.uid!r}")
-        endpoint_valid = validate_endpoint(
-            config=endpoint,
+    # Check each unique endpoint concurrently, limited per account
+    limiter = submanager.utils.concurrency.KeyedLimiter(
+        limit=max_workers_per_account,
+    )
+    # Look up mod permissions afresh each run, but only once per account/sub
+    permissions_cache = submanager.endpoint.permissions.ModPermissionsCache()
+    group_results: dict[ValidationKey, bool] = {}
+    tasks: dict[ValidationKey, Callable[[], bool]] = {}
+    for validation_key, endpoint_group in endpoint_groups.items():
+        endpoint_uids = ", ".join(
+            repr(config.uid) for config in endpoint_group
+        )
+        # Skip endpoints that passed recently and haven't changed since
+        if validation_cache is not None and validation_cache.check_endpoint(
+            endpoint_group[0],
+            check_editable=validation_key[2],
+        ):
+            vprint(f"Skipping unchanged validated endpoint {endpoint_uids}")
+            group_results[validation_key] = True
+            continue
+        vprint(f"Validating endpoint {endpoint_uids}")
+        tasks[validation_key] = functools.partial(
+            _validate_endpoint_limited,
+            config=endpoint_group[0],
             accounts=accounts,
+            limiter=limiter,
+            check_editable=validation_key[2],
             raise_error=raise_error,
+            validation_cache=validation_cache,
+            permissions_cache=permissions_cache,
         )
-        endpoints_valid[endpoint.uid] = endpoint_valid
+    group_results.update(
+        submanager.utils.concurrency.run_concurrently(
+            tasks,
+            max_workers=max_workers,
+        ),
+    )
+
+    # Fan the result for each unique endpoint back out to its duplicates
+    endpoints_valid = {}
+    for validation_key, endpoint_group in endpoint_groups.items():
+        for endpoint in endpoint_group:
+            endpoints_valid[endpoint.uid] = group_results[validation_key]
 
     return endpoints_valid
+
+
+def _check_read_access(
+    config: submanager.models.config.EndpointTypeConfig,
+    accounts: AccountsMap,
+    limiter: submanager.utils.concurrency.KeyedLimiter,
+    validation_cache: submanager.validation.cache.ValidationCacheSession,
+) -> bool:
+    """Check if an account can read an endpoint, recording if it can."""
+    try:
+        return _validate_endpoint_limited(
+            config=config,
+            accounts=accounts,
+            limiter=limiter,
+            check_editable=False,
+            raise_error=False,
+            validation_cache=validation_cache,
+        )
+    except READ_ACCESS_ERRORS:
+        return False
+
+
+def validate_read_access(
+    static_config: submanager.models.config.StaticConfig,
+    accounts: AccountsMap,
+    validation_cache: submanager.validation.cache.ValidationCacheSession,
+    *,
+    max_workers: int = submanager.utils.concurrency.MAX_WORKERS_DEFAULT,
+    max_workers_per_account: int = (
+        submanager.utils.concurrency.MAX_WORKERS_PER_ACCOUNT
+    ),
+    verbose: bool = False,
+) -> dict[tuple[str, submanager.endpoint.utils.EndpointKey], bool]:
+    """Learn which read pool accounts can access each source endpoint."""
+    vprint = submanager.utils.output.VerbosePrinter(verbose)
+    source_endpoints = [
+        endpoint
+        for endpoint in get_all_endpoints(static_config=static_config)
+        if not _get_check_editable(endpoint)
+    ]
+    pool_accounts = submanager.core.readpool.get_pool_accounts(static_config)
+
+    limiter = submanager.utils.concurrency.KeyedLimiter(
+        limit=max_workers_per_account,
+    )
+    tasks: dict[
+        tuple[str, submanager.endpoint.utils.EndpointKey],
+        Callable[[], bool],
+    ] = {}
+    # Duplicate sources differing only in processing share one check
+    duplicate_configs: dict[
+        tuple[str, submanager.endpoint.utils.EndpointKey],
+        list[submanager.models.config.EndpointTypeConfig],
+    ] = {}
+    for endpoint in source_endpoints:
+        endpoint_key = submanager.endpoint.utils.get_endpoint_key(endpoint)
+        for account_key in pool_accounts:
+            reader_config = submanager.core.readpool.make_reader_config(
+                endpoint,
+                account_key,
+            )
+            if account_key == endpoint.context.account or (
+                validation_cache.check_endpoint(reader_config)
+            ):
+                continue
+            if (account_key, endpoint_key) in tasks:
+                duplicate_configs[(account_key, endpoint_key)].append(
+                    reader_config,
+                )
+                continue
+            duplicate_configs[(account_key, endpoint_key)] = []
+            vprint(
+                f"Checking read access to {endpoint.uid!r} "
+                f"from account {account_key!r}",
+            )
+            tasks[(account_key, endpoint_key)] = functools.partial(
+                _check_read_access,
+                config=reader_config,
+                accounts=accounts,
+                limiter=limiter,
+                validation_cache=validation_cache,
+            )
+
+    read_access = submanager.utils.concurrency.run_concurrently(
+        tasks,
+        max_workers=max_workers,
+    )
+
+    # Record the result for the duplicates, so the pool can use them too
+    for read_key, reader_configs in duplicate_configs.items():
+        if read_access[read_key]:
+            for reader_config in reader_configs:
+                validation_cache.record_endpoint(reader_config)
+
+    return read_access
@@ -5,12 +5,24 @@ from __future__ import (
     annotations,
 )
 
+# Standard library imports
+import functools
+from typing import (
+    Callable,
+)
+
+# Third party imports
+import requests.adapters
+
 # Local imports
 import submanager.core.initialization
+import submanager.core.session
 import submanager.exceptions
 import submanager.models.config
+import submanager.utils.concurrency
 import submanager.utils.output
 import submanager.validation.accounts
+import submanager.validation.cache
 import submanager.validation.connection
 import submanager.validation.endpoints
 import submanager.validation.offline
@@ -22,13 +34,16 @@ def validate_config(
     offline_only: bool = False,
     minimal: bool = False,
     include_disabled: bool = False,
+    use_cache: bool = False,
     raise_error: bool = True,
+    http_adapter: requests.adapters.HTTPAdapter | None = None,
     verbose: bool = False,
 ) -> bool:
     """Check if the config is valid."""
     vprint = submanager.utils.output.FancyPrinter(enable=verbose)
     if config_paths is None:
         config_paths = submanager.models.config.ConfigPaths()
+    validation_cache = None
 
     try:  # pylint: disable = too-many-try-statements
         vprint("Loading config", level=1)
@@ -46,26 +61,56 @@ def validate_config(
                 verbose=verbose,
             )
         vprint("Loading accounts", level=1)
+        if http_adapter is None:
+            http_adapter = submanager.core.session.create_http_adapter(
+                static_config.http,
+                account_count=len(static_config.accounts),
+            )
         accounts = submanager.core.initialization.setup_accounts(
             static_config.accounts,
+            token_cache_path=config_paths.token_cache,
+            rate_limit_config=static_config.rate_limit,
+            http_adapter=http_adapter,
+            reddit_url=static_config.http.reddit_url,
             verbose=verbose,
         )
 
+        if not (minimal or offline_only):
+            cache_data = submanager.validation.cache.load_validation_cache(
+                config_paths.validation_cache,
+            )
+            validation_cache = (
+                submanager.validation.cache.ValidationCacheSession(
+                    static_config=static_config,
+                    validation_cache=cache_data,
+                    use_cached=use_cache,
+                )
+            )
+
         if not minimal:
+            # Check connectivity while the accounts refresh their tokens
+            setup_tasks: dict[str, Callable[[], object]] = {}
             if not offline_only:
                 vprint("Checking Reddit connectivity", level=1)
-                submanager.validation.connection.check_reddit_connectivity(
+                setup_tasks["connectivity"] = functools.partial(
+                    submanager.validation.connection.check_reddit_connectivity,
                     raise_error=True,
+                    session=submanager.core.session.create_session(
+                        http_adapter,
+                    ),
+                    reddit_url=static_config.http.reddit_url,
                 )
-
             vprint("Checking accounts", level=1)
-            submanager.validation.accounts.validate_accounts(
+            setup_tasks["accounts"] = functools.partial(
+                submanager.validation.accounts.validate_accounts,
                 accounts=accounts,
                 offline_only=offline_only,
                 check_readonly=static_config.check_readonly,
                 raise_error=True,
+                validation_cache=validation_cache,
                 verbose=verbose,
             )
+            submanager.utils.concurrency.run_concurrently(setup_tasks)
 
             if not offline_only:
                 vprint("Checking endpoints", level=1)
@@ -74,12 +119,26 @@ def validate_config(
                     accounts=accounts,
                     include_disabled=include_disabled,
                     raise_error=True,
+                    validation_cache=validation_cache,
                     verbose=verbose,
                 )
+                if static_config.read_pool.enabled and validation_cache:
+                    vprint("Checking read pool access", level=1)
+                    submanager.validation.endpoints.validate_read_access(
+                        static_config=static_config,
+                        accounts=accounts,
+                        validation_cache=validation_cache,
+                        verbose=verbose,
+                    )
 
     except submanager.exceptions.SubManagerUserError:
         if not raise_error:
             return False
         raise
 
+    # Save whatever passed, even if something else failed
+    finally:
+        if validation_cache is not None:
+            validation_cache.write(config_paths.validation_cache)
+
     return True
@@ -0,0 +1,426 @@
+"""Test coalescing the writes of multiple sync items to the same target."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+from types import (
+    SimpleNamespace,
+)
+from typing import (
+    Any,
+)
+
+# Third party imports
+import prawcore.exceptions
+import pytest
+
+# Local imports
+import submanager.bench.fakereddit
+import submanager.core.initialization
+import submanager.endpoint.creation
+import submanager.endpoint.endpoints
+import submanager.models.config
+import submanager.sync.batch
+import submanager.sync.cache
+import submanager.sync.manager
+from submanager.types import (
+    AccountsMap,
+)
+
+# ---- Constants ----
+
+TARGET_TEMPLATE = """Intro
+
+[](/# Spam Start)
+Old spam
+[](/# Spam End)
+
+[](/# Eggs Start)
+Old eggs
+[](/# Eggs End)
+"""
+
+
+# ---- Helpers ----
+
+
+class TargetStub:
+    """Stand-in for a text target endpoint that records its edits."""
+
+    def __init__(self, config: submanager.models.config.EndpointConfig):
+        self.config = config
+        self.content = TARGET_TEMPLATE
+        self.edits: list[tuple[object, str]] = []
+
+    def edit(self, new_content: object, reason: str = "") -> None:
+        """Record the edit instead of making it."""
+        self.edits.append((new_content, reason))
+
+
+class WikiStub(submanager.endpoint.endpoints.WikiSyncEndpoint):
+    """Stand-in for a wiki page that tracks its reads and revisions."""
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        self.current_content = TARGET_TEMPLATE
+        self.revision_authors = ["mod"]
+        self.read_count = 0
+        self.fetched = False
+
+    def reset(self, config: Any) -> WikiStub:
+        """Set the config, as if the object was freshly created."""
+        self.config = config
+        self.fetched = False
+        return self
+
+    @property
+    def content(self) -> str:
+        """Get the current content, counting the first read."""
+        if not self.fetched:
+            self.read_count += 1
+            self.fetched = True
+        return self.current_content
+
+    @property
+    def revision_id(self) -> str:
+        """Get the current revision ID."""
+        return str(len(self.revision_authors) - 1)
+
+    def edit(
+        self,
+        new_content: object,
+        reason: str = "",
+        *,
+        previous: str | None = None,
+    ) -> None:
+        """Edit the content if at the previous revision, else conflict."""
+        if previous != self.revision_id:
+            raise prawcore.exceptions.Conflict(
+                SimpleNamespace(status_code=409),  # type: ignore[arg-type]
+            )
+        self.current_content = str(new_content)
+        self.revision_authors.append("test")
+
+    def edit_as_other(self, new_content: str) -> None:
+        """Edit the content as another user."""
+        self.current_content = new_content
+        self.revision_authors.append("mod")
+
+    def check_own_revision(
+        self,
+        revision_id: str | None,
+        parent_revision_id: str | None = None,
+    ) -> str | None:
+        """Get the current revision ID, if it's the given own edit."""
+        if revision_id:
+            return revision_id if revision_id == self.revision_id else None
+        if self.revision_authors[-1] != "test" or (
+            parent_revision_id != str(len(self.revision_authors) - 2)
+        ):
+            return None
+        return self.revision_id
+
+
+def _make_pending_write(
+    item_key: str,
+    pattern: str,
+    source_content: str,
+    account: str = "test",
+) -> submanager.sync.batch.PendingWrite:
+    """Create a pending write of a section of the shared target page."""
+    context = {"account": account, "subreddit": "SubManagerTesting"}
+    target_config = submanager.models.config.FullEndpointConfig(
+        context=context,
+        endpoint_name="target",
+        pattern=pattern,
+        uid=f"sync_manager.items.{item_key}.targets.target",
+    )
+    sync_item = submanager.models.config.SyncItemConfig(
+        description=item_key,
+        source=target_config.copy(update={"endpoint_name": item_key}),
+        targets={"target": target_config},
+        uid=f"sync_manager.items.{item_key}",
+    )
+    return submanager.sync.batch.PendingWrite(
+        sync_item=sync_item,
+        dynamic_config=submanager.models.config.DynamicSyncItemConfig(),
+        target_config=target_config,
+        source_content=source_content,
+    )
+
+
+def _setup_fake_reddit() -> (
+    tuple[
+        submanager.bench.fakereddit.FakeReddit,
+        submanager.bench.fakereddit.FakeSubreddit,
+        AccountsMap,
+    ]
+):
+    """Set up a fake sub with the shared target page, and log into it."""
+    fake_reddit = submanager.bench.fakereddit.FakeReddit()
+    praw_config = fake_reddit.add_account("test")
+    subreddit = fake_reddit.add_subreddit(
+        "SubManagerTesting",
+        {"test": ["all"]},
+    )
+    fake_reddit.edit_wiki_page(
+        subreddit,
+        "target",
+        TARGET_TEMPLATE,
+        author="mod",
+    )
+    static_config = submanager.models.config.StaticConfig(
+        accounts={"test": {"config": praw_config}},
+        context_default={"account": "test", "subreddit": "SubManagerTesting"},
+    )
+    accounts = submanager.core.initialization.setup_accounts(
+        static_config.accounts,
+        http_adapter=submanager.bench.fakereddit.FakeRedditAdapter(
+            fake_reddit,
+        ),
+    )
+    return fake_reddit, subreddit, accounts
+
+
+# ---- Tests ----
+
+
+def test_writes_coalesced(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that sections synced to the same target are written at once."""
+    target_objs: list[TargetStub] = []
+
+    def create_target(config: Any, reddit: Any) -> TargetStub:
+        target_objs.append(TargetStub(config))
+        return target_objs[-1]
+
+    monkeypatch.setattr(
+        submanager.endpoint.creation,
+        "create_sync_endpoint_from_config",
+        create_target,
+    )
+    write_batch = submanager.sync.batch.WriteBatch()
+    write_batch.add(_make_pending_write("spam", "Spam", "New spam"))
+    write_batch.add(_make_pending_write("eggs", "Eggs", "New eggs"))
+    write_batch.flush(AccountsMap({"test": None}))  # type: ignore[dict-item]
+
+    assert len(target_objs) == 1
+    assert len(target_objs[0].edits) == 1
+    new_content, reason = target_objs[0].edits[0]
+    assert "New spam" in str(new_content)
+    assert "New eggs" in str(new_content)
+    assert "Old" not in str(new_content)
+    assert reason == "Auto-sync spam, eggs from target"
+    assert not write_batch.pending
+
+
+def test_writes_per_account(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that writes to one target are made with each item's account."""
+    target_content = [TARGET_TEMPLATE]
+    target_edits: list[tuple[object, object]] = []
+
+    def create_target(config: Any, reddit: Any) -> TargetStub:
+        target_obj = TargetStub(config)
+        target_obj.content = target_content[0]
+
+        def edit(new_content: object, reason: str = "") -> None:
+            target_content[0] = str(new_content)
+            target_edits.append((reddit, new_content))
+
+        target_obj.edit = edit  # type: ignore[assignment]
+        return target_obj
+
+    monkeypatch.setattr(
+        submanager.endpoint.creation,
+        "create_sync_endpoint_from_config",
+        create_target,
+    )
+    reddit_spam, reddit_eggs = object(), object()
+    write_batch = submanager.sync.batch.WriteBatch()
+    write_batch.add(_make_pending_write("spam", "Spam", "New spam", "spam"))
+    write_batch.add(_make_pending_write("eggs", "Eggs", "New eggs", "eggs"))
+    accounts = AccountsMap(
+        {  # type: ignore[dict-item]
+            "spam": reddit_spam,
+            "eggs": reddit_eggs,
+        },
+    )
+    write_batch.flush(accounts)
+
+    assert [reddit for reddit, __ in target_edits] == [
+        reddit_spam,
+        reddit_eggs,
+    ]
+    assert "New spam" in str(target_edits[0][1])
+    assert "Old eggs" in str(target_edits[0][1])
+    assert "New spam" in target_content[0]
+    assert "New eggs" in target_content[0]
+
+
+def test_write_errors_per_account(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a failed write only quarantines that account's items."""
+    target_content = [TARGET_TEMPLATE]
+
+    def create_target(config: Any, reddit: Any) -> TargetStub:
+        target_obj = TargetStub(config)
+        target_obj.content = target_content[0]
+
+        def edit(new_content: object, reason: str = "") -> None:
+            if config.context.account == "spam":
+                raise prawcore.exceptions.Conflict(
+                    SimpleNamespace(status_code=409),  # type: ignore[arg-type]
+                )
+            target_content[0] = str(new_content)
+
+        target_obj.edit = edit  # type: ignore[assignment]
+        return target_obj
+
+    monkeypatch.setattr(
+        submanager.endpoint.creation,
+        "create_sync_endpoint_from_config",
+        create_target,
+    )
+    pending_spam = _make_pending_write("spam", "Spam", "New spam", "spam")
+    pending_eggs = _make_pending_write("eggs", "Eggs", "New eggs", "eggs")
+    write_batch = submanager.sync.batch.WriteBatch()
+    write_batch.add(pending_spam)
+    write_batch.add(pending_eggs)
+    accounts = AccountsMap(
+        {  # type: ignore[dict-item]
+            "spam": object(),
+            "eggs": object(),
+        },
+    )
+    written_keys = write_batch.flush(
+        accounts,
+        retry_config=submanager.models.config.RetryConfig(),
+    )
+
+    assert written_keys
+    assert pending_spam.dynamic_config.error_count == 1
+    assert pending_eggs.dynamic_config.error_count == 0
+    assert "Old spam" in target_content[0]
+    assert "New eggs" in target_content[0]
+
+
+def test_unchanged_source_skipped() -> None:
+    """Test that targets are skipped if the synced section didn't change."""
+    pending_write = _make_pending_write("spam", "Spam", "")
+    source_obj = TargetStub(pending_write.sync_item.source)
+    write_batch = submanager.sync.batch.WriteBatch()
+    for source_content in ("Old spam", "Old spam", "New spam"):
+        source_obj.content = TARGET_TEMPLATE.replace(
+            "Old spam", source_content
+        )
+        submanager.sync.manager.sync_one(
+            sync_item=pending_write.sync_item,
+            dynamic_config=pending_write.dynamic_config,
+            accounts=AccountsMap({}),
+            write_batch=write_batch,
+            source_read=source_obj,  # type: ignore[arg-type]
+        )
+        source_obj.content += "Edited outside the section"
+
+    target_key = next(iter(write_batch.pending))
+    assert len(write_batch.pending[target_key]["test"]) == 2
+    assert pending_write.dynamic_config.source_hash
+
+
+def test_cached_target_not_reread(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that targets are rendered from our cached last write."""
+    wiki_obj = WikiStub()
+    monkeypatch.setattr(
+        submanager.endpoint.creation,
+        "create_sync_endpoint_from_config",
+        lambda config, reddit: wiki_obj.reset(config),
+    )
+    target_cache = submanager.sync.cache.TargetContentCache()
+    accounts = AccountsMap({"test": None})  # type: ignore[dict-item]
+    for source_content, read_count in (("Spam 1", 1), ("Spam 2", 1)):
+        write_batch = submanager.sync.batch.WriteBatch(target_cache)
+        write_batch.add(_make_pending_write("spam", "Spam", source_content))
+        write_batch.flush(accounts)
+        assert source_content in wiki_obj.current_content
+        assert wiki_obj.read_count == read_count
+
+    # If someone else edited the page since, it's re-read and still synced
+    wiki_obj.edit_as_other(f"{wiki_obj.current_content}Edit")
+    write_batch = submanager.sync.batch.WriteBatch(target_cache)
+    write_batch.add(_make_pending_write("spam", "Spam", "Spam 3"))
+    write_batch.flush(accounts)
+
+    assert "Spam 3" in wiki_obj.current_content
+    assert wiki_obj.current_content.endswith("Edit")
+    assert wiki_obj.read_count == 2
+    assert target_cache.modified
+
+
+def test_cached_target_checked() -> None:
+    """Test the cache is only used while our edit is the latest revision."""
+    fake_reddit, subreddit, accounts = _setup_fake_reddit()
+    target_cache = submanager.sync.cache.TargetContentCache()
+    for source_content in ("Spam 1", "Spam 2"):
+        write_batch = submanager.sync.batch.WriteBatch(target_cache)
+        write_batch.add(_make_pending_write("spam", "Spam", source_content))
+        fake_reddit.reset_request_log()
+        write_batch.flush(accounts)
+    request_counts = fake_reddit.get_request_counts()
+    assert "wiki_page" not in request_counts
+    assert request_counts["subreddit"] == 1
+    assert request_counts["wiki_revisions"] == 1
+
+    # Someone else's edit is kept, and the page is re-read once after it
+    wiki_page = subreddit.wiki_pages["target"]
+    assert wiki_page.latest is not None
+    fake_reddit.edit_wiki_page(
+        subreddit,
+        "target",
+        wiki_page.latest.content.replace("Intro", "New intro"),
+        author="mod",
+    )
+    for source_content, page_reads in (("Spam 3", 1), ("Spam 4", 0)):
+        write_batch = submanager.sync.batch.WriteBatch(target_cache)
+        write_batch.add(_make_pending_write("spam", "Spam", source_content))
+        fake_reddit.reset_request_log()
+        write_batch.flush(accounts)
+        assert fake_reddit.get_request_counts()["wiki_page"] == page_reads
+        assert wiki_page.latest is not None
+        assert source_content in wiki_page.latest.content
+        assert "New intro" in wiki_page.latest.content
+
+
+def test_wiki_edits_merged() -> None:
+    """Test edits on an old revision merge, and aren't then trusted."""
+    fake_reddit, subreddit, accounts = _setup_fake_reddit()
+    wiki_page = subreddit.wiki_pages["target"]
+    assert wiki_page.latest is not None
+    previous = wiki_page.latest.revision_id
+    target_obj = submanager.endpoint.creation.create_sync_endpoint_from_config(
+        _make_pending_write("spam", "Spam", "").target_config,
+        accounts["test"],
+    )
+    assert isinstance(
+        target_obj,
+        submanager.endpoint.endpoints.WikiSyncEndpoint,
+    )
+
+    fake_reddit.edit_wiki_page(
+        subreddit,
+        "target",
+        TARGET_TEMPLATE.replace("Old eggs", "New eggs"),
+        author="mod",
+    )
+    target_obj.edit(
+        TARGET_TEMPLATE.replace("Old spam", "New spam"),
+        previous=previous,
+    )
+    assert "New eggs" in wiki_page.latest.content
+    assert "New spam" in wiki_page.latest.content
+    assert target_obj.check_own_revision(None, previous) is None
+
+    with pytest.raises(prawcore.exceptions.Conflict):
+        target_obj.edit(
+            TARGET_TEMPLATE.replace("Old eggs", "Other eggs"),
+            previous=previous,
+        )
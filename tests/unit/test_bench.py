@@ -0,0 +1,171 @@
+"""Test benchmarking the core routines against a fake Reddit."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+from pathlib import (
+    Path,
+)
+
+# Third party imports
+import pytest
+
+# Local imports
+import submanager.bench.fakereddit
+import submanager.bench.harness
+import submanager.bench.server
+import submanager.bench.synthetic
+import submanager.bench.text
+import submanager.config.static
+import submanager.config.synthetic
+import submanager.core.initialization
+import submanager.core.run
+import submanager.enums
+import submanager.exceptions
+
+# ---- Tests ----
+
+
+@pytest.mark.parametrize("scenario", submanager.bench.harness.SCENARIOS)
+def test_scenario_runs_offline(scenario: str) -> None:
+    """Test that each scenario completes against the fake Reddit."""
+    result = submanager.bench.harness.run_scenario(
+        scenario,
+        item_count=3,
+        measure_memory=False,
+    )
+
+    assert result.wall_time_s > 0
+    assert result.request_count >= 3
+    assert "not_found" not in result.request_counts
+    assert "unauthorized" not in result.request_counts
+    assert scenario in submanager.bench.harness.format_results([result])
+
+
+def test_manage_over_http(tmp_path: Path) -> None:
+    """Test that the manage loop runs against the fake Reddit over HTTP."""
+    fake_reddit = submanager.bench.fakereddit.FakeReddit()
+    raw_config = submanager.bench.synthetic.seed_synthetic_data(
+        fake_reddit,
+        submanager.config.synthetic.generate_synthetic_config(
+            submanager.config.synthetic.SyntheticConfigOptions(item_count=3),
+        ),
+    )
+    with submanager.bench.server.FakeRedditServer(fake_reddit) as server:
+        raw_config["http"] = {"reddit_url": server.url}
+        static_config = submanager.config.static.render_static_config(
+            raw_config,
+        )
+        accounts = submanager.core.initialization.setup_accounts(
+            static_config.accounts,
+            reddit_url=static_config.http.reddit_url,
+        )
+        submanager.core.run.run_manage_once(
+            static_config,
+            accounts,
+            config_path_dynamic=tmp_path / "config_dynamic.json",
+            verbose=False,
+        )
+
+        request_counts = fake_reddit.get_request_counts()
+        assert "not_found" not in request_counts
+        assert "unauthorized" not in request_counts
+        assert request_counts["wiki_edit"] == 3
+        assert "requests in" in server.format_throughput()
+
+
+def test_synthetic_config_syncs(tmp_path: Path) -> None:
+    """Test that a generated synthetic config syncs against its seed data."""
+    options = submanager.config.synthetic.SyntheticConfigOptions(
+        item_count=12,
+        target_count=3,
+        subreddit_count=3,
+        account_count=2,
+        endpoint_types=list(submanager.enums.EndpointType),
+        source_count=5,
+    )
+    raw_config = submanager.config.synthetic.generate_synthetic_config(
+        options,
+    )
+    assert raw_config == submanager.config.synthetic.generate_synthetic_config(
+        options,
+    )
+    fake_reddit = submanager.bench.fakereddit.FakeReddit()
+    raw_config = submanager.bench.synthetic.seed_synthetic_data(
+        fake_reddit,
+        raw_config,
+    )
+    static_config = submanager.config.static.render_static_config(raw_config)
+    sync_items = static_config.sync_manager.items.values()
+    assert len(sync_items) == options.item_count
+    assert len(static_config.accounts) == options.account_count
+    assert len({item.source.endpoint_name for item in sync_items}) == (
+        options.source_count
+    )
+    assert all(
+        len(item.targets) == options.target_count for item in sync_items
+    )
+
+    accounts = submanager.core.initialization.setup_accounts(
+        static_config.accounts,
+        http_adapter=submanager.bench.fakereddit.FakeRedditAdapter(
+            fake_reddit,
+        ),
+    )
+    submanager.core.run.run_manage_once(
+        static_config,
+        accounts,
+        config_path_dynamic=tmp_path / "config_dynamic.json",
+        verbose=False,
+    )
+
+    request_counts = fake_reddit.get_request_counts()
+    assert "not_found" not in request_counts
+    assert "unauthorized" not in request_counts
+    assert request_counts["widget_edit"]
+    assert request_counts["wiki_edit"]
+    assert request_counts["edit"]
+
+
+@pytest.mark.parametrize(
+    "invalid_options",
+    [{"account_count": 0}, {"subreddit_count": 0}, {"source_count": 0}],
+)
+def test_synthetic_config_invalid(invalid_options: dict[str, int]) -> None:
+    """Test that counts that can't generate a config raise a clear error."""
+    with pytest.raises(submanager.exceptions.ConfigError):
+        submanager.config.synthetic.generate_synthetic_config(
+            submanager.config.synthetic.SyntheticConfigOptions(
+                **invalid_options,
+            ),
+        )
+
+
+def test_text_benchmarks_compare(tmp_path: Path) -> None:
+    """Test that the text benchmarks run and flag regressions."""
+    results = submanager.bench.text.run_text_benchmarks(
+        sizes_bytes=[1024],
+        min_time_s=0.001,
+        repeat=1,
+    )
+    assert {result.case for result in results} == set(
+        submanager.bench.text.CASES,
+    )
+    baseline_path = tmp_path / "baseline.json"
+    submanager.bench.text.write_baseline(results, baseline_path)
+    baseline = submanager.bench.text.load_baseline(baseline_path)
+
+    comparisons = submanager.bench.text.compare_to_baseline(results, baseline)
+    assert not submanager.bench.text.get_regressions(comparisons)
+    faster_baseline = {key: time_s / 2 for key, time_s in baseline.items()}
+    comparisons = submanager.bench.text.compare_to_baseline(
+        results,
+        faster_baseline,
+    )
+    assert len(submanager.bench.text.get_regressions(comparisons)) == len(
+        results,
+    )
+    assert "SLOWER" in submanager.bench.text.format_comparisons(comparisons)
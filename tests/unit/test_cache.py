@@ -0,0 +1,54 @@
+"""Test caching the rendered text of sync targets."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Local imports
+import submanager.models.config
+import submanager.sync.cache
+import submanager.sync.processing
+
+# ---- Tests ----
+
+
+def test_render_cache_shared() -> None:
+    """Test that identical transforms are rendered once and shared."""
+    render_cache = submanager.sync.cache.RenderCache(max_size=2)
+    endpoint_configs = [
+        submanager.models.config.FullEndpointConfig(
+            context={"account": "test", "subreddit": "SubManagerTesting"},
+            endpoint_name=f"target{target_number}",
+            replace_patterns=replace_patterns,
+            uid=f"sync_manager.items.spam.targets.target{target_number}",
+        )
+        for target_number, replace_patterns in enumerate(
+            ({"spam": "eggs"}, {"spam": "eggs"}, {"spam": "ham"}),
+        )
+    ]
+    rendered_texts = [
+        render_cache.get_or_render(
+            submanager.sync.processing.get_render_key("spam", endpoint_config),
+            lambda endpoint_config=endpoint_config: (
+                submanager.sync.processing.render_target_text(
+                    "spam",
+                    endpoint_config,
+                )
+            ),
+        )
+        for endpoint_config in endpoint_configs
+    ]
+
+    assert rendered_texts == ["\n\neggs\n\n", "\n\neggs\n\n", "\n\nham\n\n"]
+    assert (render_cache.hits, render_cache.misses) == (1, 2)
+
+
+def test_render_cache_bounded() -> None:
+    """Test that the least recently used entries are evicted first."""
+    render_cache = submanager.sync.cache.RenderCache(max_size=2)
+    for cache_key in ("spam", "eggs", "spam", "ham", "spam", "eggs"):
+        render_cache.get_or_render(cache_key, cache_key.upper)
+
+    assert len(render_cache) == 2
+    assert (render_cache.hits, render_cache.misses) == (2, 4)
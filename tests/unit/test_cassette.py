@@ -0,0 +1,107 @@
+"""Test recording and replaying the requests made to Reddit."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import contextlib
+import io
+import json
+from pathlib import (
+    Path,
+)
+
+# Local imports
+import submanager.bench.harness
+import submanager.bench.replay
+import submanager.core.cassette
+import submanager.core.initialization
+import submanager.core.run
+
+# ---- Constants ----
+
+ITEM_COUNT = 3
+
+
+# ---- Tests ----
+
+
+def test_request_bodies_scrubbed() -> None:
+    """Test that secrets are scrubbed from both form and JSON bodies."""
+    form_body = submanager.core.cassette.scrub_body(
+        data={"grant_type": "password", "password": "spam"},
+    )
+    json_body = submanager.core.cassette.scrub_body(
+        json_data={
+            "text": "Eggs",
+            "auth": {"refresh_token": "spam"},
+            "accounts": [{"client_secret": "spam"}],
+        },
+    )
+
+    assert "spam" not in form_body
+    assert "grant_type=password" in form_body
+    assert "spam" not in json_body
+    assert json.loads(json_body)["auth"] == {
+        "refresh_token": submanager.core.cassette.SCRUBBED_VALUE,
+    }
+    assert json.loads(json_body)["text"] == "Eggs"
+
+
+def test_record_replay_roundtrip(tmp_path: Path) -> None:
+    """Test that a recorded run replays offline with the same requests."""
+    context = submanager.bench.harness.setup_context(
+        submanager.bench.harness.SCENARIO_MANAGE,
+        ITEM_COUNT,
+        tmp_path,
+    )
+    recorder = submanager.core.cassette.CassetteRecorder()
+    accounts = submanager.core.initialization.setup_accounts(
+        context.static_config.accounts,
+        rate_limit_config=context.static_config.rate_limit,
+        http_adapter=context.http_adapter,
+        cassette=recorder,
+    )
+    recorder.snapshot(context.config_paths)
+    with contextlib.redirect_stdout(io.StringIO()):
+        submanager.core.run.run_manage_once(
+            context.static_config,
+            accounts,
+            config_path_dynamic=context.config_paths.dynamic,
+        )
+    cassette_path = tmp_path / "cassette.json"
+    recorder.write(cassette_path)
+
+    cassette_text = cassette_path.read_text(encoding="utf-8")
+    for account_config in context.static_config.accounts.values():
+        for secret_key in ("client_secret", "refresh_token"):
+            assert account_config.config[secret_key] not in cassette_text
+    assert context.fake_reddit.access_tokens
+    for access_token in context.fake_reddit.access_tokens:
+        assert access_token not in cassette_text
+    item_labels = {
+        interaction.item for interaction in recorder.cassette.interactions
+    }
+    for item_n in range(ITEM_COUNT):
+        assert any(
+            f".sync_{item_n}." in label for label in item_labels if label
+        )
+
+    result = submanager.bench.replay.replay_cassette(
+        cassette_path,
+        context.config_paths.static,
+        replay_latency=False,
+    )
+    assert not submanager.bench.replay.get_regressions(result)
+    assert all(
+        not item_stats.count_delta
+        for item_stats in result.item_stats
+        if item_stats.item != submanager.core.cassette.ITEM_ACCOUNT
+    )
+    assert all(
+        interaction.status_code < 400
+        for interaction in result.replayed.interactions
+    )
+    assert "Total" in submanager.bench.replay.format_replay_result(result)
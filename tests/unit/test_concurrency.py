@@ -0,0 +1,111 @@
+"""Test the concurrent task running and endpoint deduplication helpers."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import threading
+import time
+from typing import (
+    Callable,
+)
+
+# Third party imports
+import pytest
+
+# Local imports
+import submanager.models.config
+import submanager.utils.concurrency
+import submanager.validation.endpoints
+
+# ---- Helpers ----
+
+
+def _make_endpoint(
+    uid: str,
+    endpoint_name: str,
+    subreddit: str = "SubManagerTesting",
+) -> submanager.models.config.FullEndpointConfig:
+    """Create a minimal wiki page endpoint config."""
+    return submanager.models.config.FullEndpointConfig(
+        context={"account": "testbot", "subreddit": subreddit},
+        endpoint_name=endpoint_name,
+        uid=uid,
+    )
+
+
+# ---- Tests ----
+
+
+def test_run_concurrently_results() -> None:
+    """Test that results are returned for each task by key."""
+    tasks: dict[int, Callable[[], int]] = {
+        task_n: (lambda task_n=task_n: task_n**2)  # type: ignore[misc]
+        for task_n in range(10)
+    }
+    results = submanager.utils.concurrency.run_concurrently(tasks)
+
+    assert results == {task_n: task_n**2 for task_n in range(10)}
+
+
+def test_run_concurrently_error() -> None:
+    """Test that an error in a task is re-raised to the caller."""
+
+    def _raise_error() -> int:
+        raise ValueError("Spam")
+
+    tasks = {"good": lambda: 1, "bad": _raise_error}
+    with pytest.raises(ValueError, match="Spam"):
+        submanager.utils.concurrency.run_concurrently(tasks)
+
+
+def test_keyed_limiter() -> None:
+    """Test that the limiter caps concurrent tasks sharing the same key."""
+    limiter = submanager.utils.concurrency.KeyedLimiter(limit=2)
+    active_count = 0
+    max_active_count = 0
+    count_lock = threading.Lock()
+
+    def _limited_task() -> None:
+        nonlocal active_count, max_active_count
+        with limiter.acquire("testbot"):
+            with count_lock:
+                active_count += 1
+                max_active_count = max(max_active_count, active_count)
+            time.sleep(0.01)
+            with count_lock:
+                active_count -= 1
+
+    tasks = {task_n: _limited_task for task_n in range(8)}
+    submanager.utils.concurrency.run_concurrently(tasks, max_workers=8)
+
+    assert max_active_count == 2
+
+
+def test_dedupe_endpoints() -> None:
+    """Test that endpoints pointing to the same object are grouped."""
+    endpoints = [
+        _make_endpoint("sync.a.source", "Index"),
+        _make_endpoint(
+            "sync.b.source",
+            "index",
+            subreddit="submanagertesting",
+        ),
+        _make_endpoint("sync.a.targets.c", "index"),
+        _make_endpoint("sync.b.targets.d", "other"),
+    ]
+    endpoint_groups = submanager.validation.endpoints.dedupe_endpoints(
+        endpoints,
+    )
+    group_uids = sorted(
+        sorted(endpoint.uid for endpoint in endpoint_group)
+        for endpoint_group in endpoint_groups.values()
+    )
+
+    assert group_uids == [
+        ["sync.a.source", "sync.b.source"],
+        ["sync.a.targets.c"],
+        ["sync.b.targets.d"],
+    ]
@@ -0,0 +1,133 @@
+"""Test controlling a running Sub Manager over its socket."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import stat
+import threading
+from pathlib import (
+    Path,
+)
+from typing import (
+    Iterator,
+)
+
+# Third party imports
+import pytest
+
+# Local imports
+import submanager.core.control
+import submanager.exceptions
+from submanager.constants import (
+    SECRET_FILE_MODE,
+)
+
+# ---- Fixtures ----
+
+
+@pytest.fixture(name="control_server")
+def fixture_control_server(
+    tmp_path: Path,
+) -> Iterator[submanager.core.control.ControlServer]:
+    """Start a control server, handling commands on a separate thread."""
+    if not submanager.core.control.CONTROL_SUPPORTED:
+        pytest.skip("Unix domain sockets not supported on this platform")
+    control_server = submanager.core.control.ControlServer(
+        tmp_path / "control.sock",
+        {
+            "echo": lambda text: f"Echo {text}",
+            submanager.core.control.COMMAND_STATUS: lambda: "Running",
+        },
+    )
+    assert control_server.start()
+    serve_thread = threading.Thread(
+        target=control_server.serve_for_interval,
+        args=(5,),
+        daemon=True,
+    )
+    serve_thread.start()
+    yield control_server
+    control_server.stop()
+
+
+# ---- Tests ----
+
+
+def test_control_commands(
+    control_server: submanager.core.control.ControlServer,
+) -> None:
+    """Test that commands are run by the server and responses returned."""
+    socket_path = control_server.socket_path
+    echo_response = submanager.core.control.send_command(
+        socket_path,
+        "echo",
+        {"text": "spam"},
+    )
+    status_response = submanager.core.control.send_command(
+        socket_path,
+        submanager.core.control.COMMAND_STATUS,
+    )
+
+    assert echo_response == {"ok": True, "message": "Echo spam"}
+    assert status_response == {"ok": True, "message": "Running"}
+    assert stat.S_IMODE(socket_path.stat().st_mode) == SECRET_FILE_MODE
+
+
+def test_control_command_error(
+    control_server: submanager.core.control.ControlServer,
+) -> None:
+    """Test that errors running commands are reported to the client."""
+    with pytest.raises(submanager.exceptions.SubManagerUserError):
+        submanager.core.control.run_on_daemon(
+            control_server.socket_path,
+            "nonexistent",
+            verbose=False,
+        )
+
+
+def test_control_not_running(tmp_path: Path) -> None:
+    """Test that commands aren't handed off when nothing is running."""
+    socket_path = tmp_path / "control.sock"
+    socket_path.touch()
+
+    assert not submanager.core.control.run_on_daemon(
+        socket_path,
+        submanager.core.control.COMMAND_STATUS,
+        verbose=False,
+    )
+
+
+def test_control_invalid_arguments(
+    control_server: submanager.core.control.ControlServer,
+) -> None:
+    """Test that commands passed the wrong arguments report an error."""
+    response = submanager.core.control.send_command(
+        control_server.socket_path,
+        "echo",
+        {"spam": "eggs"},
+    )
+
+    assert response is not None
+    assert not response["ok"]
+    assert "Invalid arguments" in str(response["message"])
+
+
+def test_control_handler_bug_raised(tmp_path: Path) -> None:
+    """Test that bugs in a handler are raised, not reported as bad input."""
+
+    def buggy_handler() -> str:  # noqa: WPS430
+        """Fail with a programming error while running."""
+        return str(len(None))  # type: ignore[arg-type]
+
+    control_server = submanager.core.control.ControlServer(
+        tmp_path / "control.sock",
+        {"buggy": buggy_handler},
+    )
+    request = submanager.core.control.ControlRequest("buggy", {})
+    with pytest.raises(TypeError):
+        control_server.handle_request(request)
+    assert request.done.is_set()
+    assert not request.response["ok"]
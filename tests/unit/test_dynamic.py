@@ -0,0 +1,87 @@
+"""Test tracking the changes to the dynamic config."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+from pathlib import (
+    Path,
+)
+
+# Local imports
+import submanager.config.dynamic
+import submanager.core.run
+import submanager.models.config
+
+# ---- Tests ----
+
+
+def test_dirty_tracked(tmp_path: Path) -> None:
+    """Test that the config is only written when its state changed."""
+    dynamic_config = submanager.models.config.DynamicConfig.parse_obj(
+        {
+            "sync_manager": {
+                "items": {"spam": {"source_timestamp": 42}, "eggs": {}},
+            },
+        },
+    )
+    config_path = tmp_path / "config_dynamic.json"
+    dynamic_item = dynamic_config.sync_manager.items["spam"]
+    dynamic_item.source_timestamp = 42
+
+    assert not dynamic_config.get_dirty_models()
+    assert not submanager.core.run.write_dynamic_config_if_dirty(
+        dynamic_config,
+        config_path,
+    )
+    assert not config_path.exists()
+
+    dynamic_item.source_timestamp = 84
+    assert dynamic_config.get_dirty_models() == [dynamic_item]
+    assert submanager.core.run.write_dynamic_config_if_dirty(
+        dynamic_config,
+        config_path,
+    )
+    assert "84" in config_path.read_text(encoding="utf-8")
+    assert not dynamic_config.get_dirty_models()
+
+
+def test_dynamic_config_cache(tmp_path: Path) -> None:
+    """Test that the dynamic config is reused until its file changes."""
+    static_config = submanager.models.config.StaticConfig(
+        accounts={"testbot": {"config": {"site_name": "testbot"}}},
+        context_default={"account": "testbot", "subreddit": "test"},
+    )
+    config_path = tmp_path / "config_dynamic.json"
+    cache = submanager.config.dynamic.DynamicConfigCache()
+
+    with submanager.config.dynamic.LockedandLoadedDynamicConfig(
+        static_config=static_config,
+        config_path=config_path,
+        cache=cache,
+    ) as dynamic_config:
+        dynamic_config.modlog.full_sweep_timestamp = 42
+        submanager.core.run.write_dynamic_config_if_dirty(
+            dynamic_config,
+            config_path,
+        )
+    with submanager.config.dynamic.LockedandLoadedDynamicConfig(
+        static_config=static_config,
+        config_path=config_path,
+        cache=cache,
+    ) as dynamic_config_reused:
+        assert dynamic_config_reused is dynamic_config
+
+    config_path.write_text(
+        config_path.read_text(encoding="utf-8").replace("42", "420"),
+        encoding="utf-8",
+    )
+    with submanager.config.dynamic.LockedandLoadedDynamicConfig(
+        static_config=static_config,
+        config_path=config_path,
+        cache=cache,
+    ) as dynamic_config_reloaded:
+        assert dynamic_config_reloaded is not dynamic_config
+        assert dynamic_config_reloaded.modlog.full_sweep_timestamp == 420
@@ -0,0 +1,138 @@
+"""Test ordering sync items by the targets their sources depend on."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import warnings
+
+# Third party imports
+import pytest
+
+# Local imports
+import submanager.config.static
+import submanager.exceptions
+import submanager.models.config
+import submanager.sync.graph
+
+# ---- Helpers ----
+
+
+def _make_static_config(
+    items: dict[str, tuple[str, list[str]]],
+) -> submanager.models.config.StaticConfig:
+    """Create a static config with the given sources and targets."""
+    return submanager.config.static.render_static_config(
+        {
+            "accounts": {"test": {"config": {"site_name": "test"}}},
+            "context_default": {
+                "account": "test",
+                "subreddit": "SubManagerTesting",
+            },
+            "sync_manager": {
+                "items": {
+                    item_key: {
+                        "source": _make_endpoint(source_name),
+                        "targets": {
+                            target_name: _make_endpoint(target_name)
+                            for target_name in target_names
+                        },
+                    }
+                    for item_key, (source_name, target_names) in items.items()
+                },
+            },
+        },
+    )
+
+
+def _make_endpoint(endpoint_spec: str) -> dict[str, str]:
+    """Create an endpoint config from a ``page`` or ``page#Section`` spec."""
+    endpoint_name, __, pattern = endpoint_spec.partition("#")
+    endpoint_config = {"endpoint_name": endpoint_name}
+    if pattern:
+        endpoint_config["pattern"] = pattern
+    return endpoint_config
+
+
+# ---- Tests ----
+
+
+def test_levels_chained() -> None:
+    """Test that items run after the items writing their sources."""
+    static_config = _make_static_config(
+        {
+            "ham": ("page2", ["page3"]),
+            "spam": ("page1", ["page2", "page4"]),
+            "eggs": ("page5", ["page6"]),
+            "self": ("Page4", ["page4"]),
+        },
+    )
+    sync_levels = submanager.sync.graph.get_sync_levels(
+        static_config.sync_manager,
+    )
+
+    assert sync_levels == [["spam", "eggs"], ["ham", "self"]]
+
+
+def test_levels_sections() -> None:
+    """Test that only items reading a section written by another wait."""
+    static_config = _make_static_config(
+        {
+            "spam": ("page1#Spam", ["page1#Eggs"]),
+            "eggs": ("page1#Ham", ["page1#Bacon"]),
+            "ham": ("page1#Sausage", ["page2#Ham"]),
+            "bacon": ("page2#Bacon", ["page1#Sausage"]),
+            "sausage": ("page1#Eggs", ["page3"]),
+            "whole": ("page2", ["page4"]),
+        },
+    )
+    sync_levels = submanager.sync.graph.get_sync_levels(
+        static_config.sync_manager,
+    )
+
+    assert sync_levels == [
+        ["spam", "eggs", "bacon"],
+        ["ham", "sausage"],
+        ["whole"],
+    ]
+
+
+def test_levels_cycle() -> None:
+    """Test that items syncing to each other's sources run unordered."""
+    static_config = _make_static_config(
+        {
+            "spam": ("page1", ["page2"]),
+            "eggs": ("page2", ["page1"]),
+            "ham": ("page2#Ham", ["page3"]),
+            "bacon": ("page4", ["page5"]),
+        },
+    )
+
+    with pytest.warns(submanager.exceptions.SyncCycleWarning):
+        sync_levels = submanager.sync.graph.get_sync_levels(
+            static_config.sync_manager,
+        )
+    assert sync_levels == [["bacon"], ["spam", "eggs", "ham"]]
+
+
+def test_levels_built_once() -> None:
+    """Test that the levels are built and any cycle warned of only once."""
+    static_config = _make_static_config(
+        {
+            "spam": ("page1", ["page2"]),
+            "eggs": ("page2", ["page1"]),
+        },
+    )
+
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
+        sync_levels = submanager.sync.graph.get_sync_levels(
+            static_config.sync_manager,
+        )
+        sync_levels_again = submanager.sync.graph.get_sync_levels(
+            static_config.sync_manager,
+        )
+    assert sync_levels_again is sync_levels
+    assert len(caught_warnings) == 1
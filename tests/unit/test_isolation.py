@@ -0,0 +1,157 @@
+"""Test isolating and backing off items that fail with an error."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import time
+
+# Third party imports
+import praw.exceptions
+import prawcore.exceptions
+import pytest
+
+# Local imports
+import submanager.core.isolation
+import submanager.exceptions
+import submanager.models.base
+import submanager.models.config
+
+# ---- Constants ----
+
+RETRY_CONFIG = submanager.models.config.RetryConfig(
+    backoff_initial_s=10,
+    backoff_factor=2,
+    backoff_max_s=100,
+)
+ITEM_CONFIG = submanager.models.base.ItemConfig(uid="sync_manager.items.test")
+
+
+# ---- Helpers ----
+
+
+def _raise_transient_error() -> None:
+    """Raise an error from a failed request."""
+    raise prawcore.exceptions.RequestException(
+        ConnectionError("Spam"),
+        request_args=(),
+        request_kwargs={},
+    )
+
+
+def _raise_persistent_error() -> None:
+    """Raise an error with the item that retrying soon won't fix."""
+    raise praw.exceptions.ClientException("Eggs")
+
+
+def _raise_fatal_error() -> None:
+    """Raise an error with the config that affects every item."""
+    raise submanager.exceptions.ConfigError("Bacon")
+
+
+# ---- Tests ----
+
+
+@pytest.mark.parametrize(
+    ("error_count", "expected_backoff_s"),
+    [(1, 10), (2, 20), (4, 80), (5, 100), (50, 100)],
+)
+def test_get_backoff_s(error_count: int, expected_backoff_s: float) -> None:
+    """Test that the back-off grows exponentially up to the maximum."""
+    backoff_s = submanager.core.isolation.get_backoff_s(
+        error_count,
+        RETRY_CONFIG,
+    )
+
+    assert backoff_s == expected_backoff_s
+
+
+def test_run_isolated_transient() -> None:
+    """Test that a transient error quarantines the item with back-off."""
+    dynamic_config = submanager.models.config.DynamicSyncItemConfig(
+        source_timestamp=42,
+    )
+    succeeded = submanager.core.isolation.run_isolated(
+        _raise_transient_error,
+        ITEM_CONFIG,
+        dynamic_config,
+        RETRY_CONFIG,
+    )
+
+    assert not succeeded
+    assert dynamic_config.error_count == 1
+    assert dynamic_config.source_timestamp == 0
+    assert 0 < dynamic_config.retry_timestamp - time.time() <= 10
+
+
+def test_run_isolated_persistent() -> None:
+    """Test that a persistent error quarantines for the maximum time."""
+    dynamic_config = submanager.models.config.DynamicSyncItemConfig()
+    submanager.core.isolation.run_isolated(
+        _raise_persistent_error,
+        ITEM_CONFIG,
+        dynamic_config,
+        RETRY_CONFIG,
+    )
+
+    assert 10 < dynamic_config.retry_timestamp - time.time() <= 100
+
+
+def test_run_isolated_fatal() -> None:
+    """Test that a fatal error stops the run without quarantining."""
+    dynamic_config = submanager.models.config.DynamicSyncItemConfig()
+    with pytest.raises(submanager.exceptions.ConfigError, match="Bacon"):
+        submanager.core.isolation.run_isolated(
+            _raise_fatal_error,
+            ITEM_CONFIG,
+            dynamic_config,
+            RETRY_CONFIG,
+        )
+
+    assert dynamic_config.error_count == 0
+    assert dynamic_config.retry_timestamp == 0
+
+
+def test_run_isolated_quarantined() -> None:
+    """Test that quarantined items are skipped, and reset on success."""
+    item_runs: list[bool] = []
+    dynamic_config = submanager.models.config.DynamicSyncItemConfig(
+        error_count=2,
+        retry_timestamp=time.time() + 10,
+    )
+    skipped_result = submanager.core.isolation.run_isolated(
+        lambda: item_runs.append(True),
+        ITEM_CONFIG,
+        dynamic_config,
+        RETRY_CONFIG,
+    )
+    dynamic_config.retry_timestamp = time.time() - 1
+    retried_result = submanager.core.isolation.run_isolated(
+        lambda: item_runs.append(True),
+        ITEM_CONFIG,
+        dynamic_config,
+        RETRY_CONFIG,
+    )
+
+    assert not skipped_result
+    assert retried_result
+    assert item_runs == [True]
+    assert dynamic_config.error_count == 0
+    assert dynamic_config.retry_timestamp == 0
+
+
+def test_run_isolated_other_error() -> None:
+    """Test that errors not specific to an item are still raised."""
+
+    def _raise_other_error() -> None:
+        raise TypeError("Ham")
+
+    with pytest.raises(TypeError, match="Ham"):
+        submanager.core.isolation.run_isolated(
+            _raise_other_error,
+            ITEM_CONFIG,
+            submanager.models.config.DynamicSyncItemConfig(),
+            RETRY_CONFIG,
+        )
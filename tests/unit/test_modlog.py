@@ -0,0 +1,279 @@
+"""Test syncing only the sources touched in the subreddit modlog."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import time
+from pathlib import (
+    Path,
+)
+from typing import (
+    Any,
+)
+
+# Local imports
+import submanager.bench.fakereddit
+import submanager.config.static
+import submanager.core.initialization
+import submanager.core.pacing
+import submanager.core.run
+import submanager.models.config
+import submanager.sync.modlog
+from submanager.types import (
+    AccountsMap,
+)
+
+# ---- Helpers ----
+
+
+class ModActionStub:
+    """Stand-in for a modlog entry."""
+
+    def __init__(
+        self,
+        action_id: str,
+        action: str = "wikirevise",
+        target_permalink: str | None = None,
+    ) -> None:
+        self.id = action_id  # noqa: WPS125
+        self.action = action
+        self.target_permalink = target_permalink
+        self.details = None
+
+
+class RedditStub:
+    """Stand-in for a Reddit instance with a fixed modlog, newest first."""
+
+    def __init__(self, mod_actions: list[ModActionStub]) -> None:
+        self.mod_actions = mod_actions
+
+    def subreddit(self, display_name: str) -> Any:
+        """Get a stand-in for the subreddit with only its modlog."""
+        return self
+
+    @property
+    def mod(self) -> Any:
+        """Get the stand-in for the subreddit moderation helper."""
+        return self
+
+    def log(self, limit: int) -> list[ModActionStub]:
+        """Get the newest actions in the modlog up to the limit."""
+        return self.mod_actions[:limit]
+
+
+def _make_static_config() -> submanager.models.config.StaticConfig:
+    """Create a static config with wiki page sources on one subreddit."""
+    return submanager.config.static.render_static_config(
+        {
+            "accounts": {"test": {"config": {"site_name": "test"}}},
+            "context_default": {
+                "account": "test",
+                "subreddit": "SubManagerTesting",
+            },
+            "modlog": {"enabled": True, "limit": 3},
+            "sync_manager": {
+                "items": {
+                    item_key: {
+                        "source": {"endpoint_name": item_key},
+                        "targets": {
+                            "target": {"endpoint_name": f"{item_key}_target"},
+                        },
+                    }
+                    for item_key in ("page1", "page2")
+                },
+            },
+        },
+    )
+
+
+def _get_synced(
+    static_config: submanager.models.config.StaticConfig,
+    dynamic_config: submanager.models.config.DynamicConfig,
+    mod_actions: list[ModActionStub],
+) -> set[str]:
+    """Get the keys of the items that the modlog filter lets through."""
+    modlog_changes = submanager.sync.modlog.poll_modlog(
+        static_config,
+        dynamic_config.modlog,
+        AccountsMap({"test": RedditStub(mod_actions)}),
+    )
+    modlog_filter = submanager.sync.modlog.get_modlog_filter(
+        static_config,
+        dynamic_config,
+        modlog_changes,
+    )
+    assert modlog_filter is not None
+    synced_keys = {
+        item_key
+        for item_key, sync_item in static_config.sync_manager.items.items()
+        if modlog_filter(sync_item)
+    }
+    modlog_changes.advance_cursors(dynamic_config.modlog)
+    return synced_keys
+
+
+# ---- Tests ----
+
+
+def test_modlog_touched_only() -> None:
+    """Test that only items whose source page was edited are synced."""
+    static_config = _make_static_config()
+    dynamic_config = submanager.models.config.DynamicConfig(
+        modlog={"cursors": {"submanagertesting": "a1"}},
+    )
+    dynamic_config.modlog.full_sweep_timestamp = time.time()
+    mod_actions = [
+        ModActionStub(
+            "a3",
+            target_permalink="/r/SubManagerTesting/wiki/Page2",
+        ),
+        ModActionStub("a2", action="approvelink"),
+        ModActionStub(
+            "a1",
+            target_permalink="/r/SubManagerTesting/wiki/page1",
+        ),
+    ]
+
+    assert _get_synced(static_config, dynamic_config, mod_actions) == {
+        "page2",
+    }
+    assert dynamic_config.modlog.cursors["submanagertesting"] == "a3"
+    assert not _get_synced(static_config, dynamic_config, mod_actions)
+
+
+def test_modlog_cursor_missed() -> None:
+    """Test that everything is synced if the cursor is past the limit."""
+    static_config = _make_static_config()
+    dynamic_config = submanager.models.config.DynamicConfig(
+        modlog={"cursors": {"submanagertesting": "a0"}},
+    )
+    dynamic_config.modlog.full_sweep_timestamp = time.time()
+    mod_actions = [
+        ModActionStub(f"a{action_num}", action="approvelink")
+        for action_num in range(5, 0, -1)
+    ]
+
+    assert _get_synced(static_config, dynamic_config, mod_actions) == {
+        "page1",
+        "page2",
+    }
+
+
+def test_modlog_cursor_after_sync() -> None:
+    """Test that the cursor only advances once the touched items synced."""
+    static_config = _make_static_config()
+    dynamic_config = submanager.models.config.DynamicConfig(
+        modlog={"cursors": {"submanagertesting": "a1"}},
+    )
+    mod_actions = [
+        ModActionStub(
+            "a2",
+            target_permalink="/r/SubManagerTesting/wiki/page1",
+        ),
+        ModActionStub("a1"),
+    ]
+    modlog_changes = submanager.sync.modlog.poll_modlog(
+        static_config,
+        dynamic_config.modlog,
+        AccountsMap({"test": RedditStub(mod_actions)}),
+    )
+
+    assert dynamic_config.modlog.cursors["submanagertesting"] == "a1"
+    assert not dynamic_config.modlog.dirty
+    modlog_changes.advance_cursors(dynamic_config.modlog)
+    assert dynamic_config.modlog.cursors["submanagertesting"] == "a2"
+    assert dynamic_config.modlog.dirty
+
+
+def test_modlog_full_sweep() -> None:
+    """Test that a full sweep is run when due, and then not again."""
+    static_config = _make_static_config()
+    dynamic_config = submanager.models.config.DynamicConfig()
+    modlog_changes = submanager.sync.modlog.ModlogChanges()
+
+    assert (
+        submanager.sync.modlog.get_modlog_filter(
+            static_config,
+            dynamic_config,
+            modlog_changes,
+        )
+        is None
+    )
+    assert (
+        submanager.sync.modlog.get_modlog_filter(
+            static_config,
+            dynamic_config,
+            modlog_changes,
+        )
+        is not None
+    )
+
+
+def test_modlog_touched_outside_slot(tmp_path: Path) -> None:
+    """Test that touched items are synced even if in another phase slot."""
+    fake_reddit = submanager.bench.fakereddit.FakeReddit()
+    subreddit = fake_reddit.add_subreddit(
+        "SubManagerTesting", {"test": ["all"]}
+    )
+    item_keys = [f"page{item_num}" for item_num in range(8)]
+    for item_key in item_keys:
+        for page_name in (item_key, f"{item_key}_target"):
+            fake_reddit.edit_wiki_page(
+                subreddit,
+                page_name,
+                "Old text",
+                author="mod",
+            )
+    static_config = submanager.config.static.render_static_config(
+        {
+            "accounts": {"test": {"config": fake_reddit.add_account("test")}},
+            "context_default": {
+                "account": "test",
+                "subreddit": "SubManagerTesting",
+            },
+            "modlog": {"enabled": True},
+            "sync_manager": {
+                "items": {
+                    item_key: {
+                        "source": {"endpoint_name": item_key},
+                        "targets": {
+                            "target": {"endpoint_name": f"{item_key}_target"},
+                        },
+                    }
+                    for item_key in item_keys
+                },
+            },
+        },
+    )
+    accounts = submanager.core.initialization.setup_accounts(
+        static_config.accounts,
+        http_adapter=submanager.bench.fakereddit.FakeRedditAdapter(
+            fake_reddit,
+        ),
+    )
+    config_path_dynamic = tmp_path / "config_dynamic.json"
+    submanager.core.run.run_manage_once(
+        static_config,
+        accounts,
+        config_path_dynamic,
+    )
+
+    phase_slot = submanager.core.pacing.PhaseSlot(slot_index=0, slot_count=4)
+    item_key = next(
+        item_key
+        for item_key, sync_item in static_config.sync_manager.items.items()
+        if not phase_slot.contains(sync_item)
+    )
+    fake_reddit.edit_wiki_page(subreddit, item_key, "New text", author="mod")
+    submanager.core.run.run_manage_once(
+        static_config,
+        accounts,
+        config_path_dynamic,
+        phase_slot=phase_slot,
+    )
+
+    target_page = subreddit.wiki_pages[f"{item_key}_target"]
+    assert target_page.revisions[-1].content.strip() == "New text"
@@ -0,0 +1,48 @@
+"""Test spreading items across the repeat interval by phase offset."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Local imports
+import submanager.core.pacing
+import submanager.models.base
+
+# ---- Constants ----
+
+ITEM_UIDS = [f"sync_manager.items.item_{item_n}" for item_n in range(100)]
+
+
+# ---- Tests ----
+
+
+def test_phase_fraction_stable() -> None:
+    """Test that the phase fraction of an item is stable and in range."""
+    fractions = [
+        submanager.core.pacing.get_phase_fraction(uid) for uid in ITEM_UIDS
+    ]
+    fractions_again = [
+        submanager.core.pacing.get_phase_fraction(uid) for uid in ITEM_UIDS
+    ]
+
+    assert fractions == fractions_again
+    assert all(0 <= fraction < 1 for fraction in fractions)
+
+
+def test_phase_slots_partition() -> None:
+    """Test that each item falls in exactly one slot, spread across them."""
+    slot_count = 4
+    slot_items: list[list[str]] = [[] for __ in range(slot_count)]
+    for uid in ITEM_UIDS:
+        item_config = submanager.models.base.ItemConfig(uid=uid)
+        for slot_index in range(slot_count):
+            phase_slot = submanager.core.pacing.PhaseSlot(
+                slot_index=slot_index,
+                slot_count=slot_count,
+            )
+            if phase_slot.contains(item_config):
+                slot_items[slot_index].append(uid)
+
+    assert sorted(sum(slot_items, [])) == sorted(ITEM_UIDS)
+    assert all(slot_uids for slot_uids in slot_items)
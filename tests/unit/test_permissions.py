@@ -0,0 +1,165 @@
+"""Test checking endpoint editability from the account's mod permissions."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+from typing import (
+    Sequence,
+)
+
+# Third party imports
+import pytest
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.bench.fakereddit
+import submanager.core.initialization
+import submanager.endpoint.permissions
+import submanager.enums
+import submanager.models.config
+import submanager.validation.endpoints
+from submanager.types import (
+    AccountsMap,
+)
+
+ACCOUNT: Final[str] = "testbot"
+SUBREDDIT: Final[str] = "SubManagerTesting"
+WIDGET_NAME: Final[str] = "Test Widget"
+
+# ---- Helpers ----
+
+
+def _setup_fake_reddit(
+    mod_permissions: Sequence[str] | None,
+) -> tuple[
+    submanager.bench.fakereddit.FakeReddit,
+    submanager.bench.fakereddit.FakeSubreddit,
+    AccountsMap,
+]:
+    """Set up a fake sub with a wiki page and widget, and log into it."""
+    fake_reddit = submanager.bench.fakereddit.FakeReddit()
+    praw_config = fake_reddit.add_account(ACCOUNT)
+    subreddit = fake_reddit.add_subreddit(
+        SUBREDDIT,
+        {} if mod_permissions is None else {ACCOUNT: mod_permissions},
+    )
+    for page_name in ("index", "config/sidebar"):
+        fake_reddit.edit_wiki_page(subreddit, page_name, "Text", author="mod")
+    fake_reddit.add_widget(
+        subreddit,
+        "textarea",
+        shortName=WIDGET_NAME,
+        styles={"backgroundColor": "", "headerColor": ""},
+        text="Text",
+    )
+    static_config = submanager.models.config.StaticConfig(
+        accounts={ACCOUNT: {"config": praw_config}},
+        context_default={"account": ACCOUNT, "subreddit": SUBREDDIT},
+    )
+    accounts = submanager.core.initialization.setup_accounts(
+        static_config.accounts,
+        http_adapter=submanager.bench.fakereddit.FakeRedditAdapter(
+            fake_reddit,
+        ),
+    )
+    return fake_reddit, subreddit, accounts
+
+
+def _make_target(
+    endpoint_type: submanager.enums.EndpointType,
+    endpoint_name: str,
+) -> submanager.models.config.FullEndpointConfig:
+    """Create a sync target endpoint config on the test sub."""
+    return submanager.models.config.FullEndpointConfig(
+        context={"account": ACCOUNT, "subreddit": SUBREDDIT},
+        endpoint_name=endpoint_name,
+        endpoint_type=endpoint_type,
+        uid=f"sync_manager.items.test.targets.{endpoint_type.value}",
+    )
+
+
+# ---- Tests ----
+
+
+@pytest.mark.parametrize(
+    ("endpoint_type", "endpoint_name", "mod_permissions", "expected"),
+    [
+        (submanager.enums.EndpointType.WIDGET, WIDGET_NAME, ["all"], True),
+        (submanager.enums.EndpointType.WIDGET, WIDGET_NAME, ["config"], True),
+        (submanager.enums.EndpointType.WIDGET, WIDGET_NAME, ["wiki"], False),
+        (submanager.enums.EndpointType.WIDGET, WIDGET_NAME, None, False),
+        (submanager.enums.EndpointType.WIKI_PAGE, "index", ["wiki"], True),
+        (submanager.enums.EndpointType.WIKI_PAGE, "index", None, False),
+        (
+            submanager.enums.EndpointType.WIKI_PAGE,
+            "config/sidebar",
+            ["wiki"],
+            False,
+        ),
+        (
+            submanager.enums.EndpointType.WIKI_PAGE,
+            "config/sidebar",
+            ["config"],
+            True,
+        ),
+    ],
+)
+def test_endpoint_editable(
+    endpoint_type: submanager.enums.EndpointType,
+    endpoint_name: str,
+    mod_permissions: Sequence[str] | None,
+    expected: bool,
+) -> None:
+    """Test that editability follows the account's mod permissions."""
+    fake_reddit, __, accounts = _setup_fake_reddit(mod_permissions)
+    endpoint_valid = submanager.validation.endpoints.validate_endpoint(
+        _make_target(endpoint_type, endpoint_name),
+        accounts,
+        check_editable=True,
+        raise_error=False,
+    )
+
+    assert endpoint_valid is expected
+    request_counts = fake_reddit.get_request_counts()
+    assert "wiki_edit" not in request_counts
+    assert "widget_edit" not in request_counts
+
+
+def test_permissions_cache_per_run() -> None:
+    """Test permissions are looked up once per run and fresh each run."""
+    fake_reddit, subreddit, accounts = _setup_fake_reddit(["config"])
+    target_config = _make_target(
+        submanager.enums.EndpointType.WIDGET,
+        WIDGET_NAME,
+    )
+    permissions_cache = submanager.endpoint.permissions.ModPermissionsCache()
+    for __ in range(3):
+        assert submanager.validation.endpoints.validate_endpoint(
+            target_config,
+            accounts,
+            check_editable=True,
+            permissions_cache=permissions_cache,
+        )
+    assert fake_reddit.get_request_counts()["moderators"] == 1
+
+    subreddit.moderators[ACCOUNT.lower()] = ["wiki"]
+    assert submanager.validation.endpoints.validate_endpoint(
+        target_config,
+        accounts,
+        check_editable=True,
+        permissions_cache=permissions_cache,
+    )
+    assert not submanager.validation.endpoints.validate_endpoint(
+        target_config,
+        accounts,
+        check_editable=True,
+        raise_error=False,
+        permissions_cache=(
+            submanager.endpoint.permissions.ModPermissionsCache()
+        ),
+    )
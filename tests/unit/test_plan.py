@@ -0,0 +1,102 @@
+"""Test planning the reads and writes of a sync run."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import threading
+import time
+from types import (
+    SimpleNamespace,
+)
+from typing import (
+    Any,
+)
+
+# Third party imports
+import pytest
+
+# Local imports
+import submanager.config.static
+import submanager.endpoint.creation
+import submanager.models.config
+import submanager.sync.plan
+
+# ---- Helpers ----
+
+
+def _make_static_config() -> submanager.models.config.StaticConfig:
+    """Create a static config with shared sources and targets."""
+    items = {
+        "spam": ("source1", ["target1", "target2"]),
+        "eggs": ("Source1", ["target1"]),
+        "ham": ("source2", ["target1", "target3"]),
+    }
+    return submanager.config.static.render_static_config(
+        {
+            "accounts": {"test": {"config": {"site_name": "test"}}},
+            "context_default": {
+                "account": "test",
+                "subreddit": "SubManagerTesting",
+            },
+            "sync_manager": {
+                "items": {
+                    item_key: {
+                        "source": {"endpoint_name": source_name},
+                        "targets": {
+                            target_name: {"endpoint_name": target_name}
+                            for target_name in target_names
+                        },
+                    }
+                    for item_key, (source_name, target_names) in items.items()
+                },
+            },
+        },
+    )
+
+
+# ---- Tests ----
+
+
+def test_plan_deduped() -> None:
+    """Test that shared sources are read once and targets written once."""
+    static_config = _make_static_config()
+    execution_plan = submanager.sync.plan.build_plan(
+        static_config.sync_manager,
+    )
+
+    assert execution_plan.planned_requests == (2, 3, 3)
+    assert execution_plan.naive_requests == (3, 5, 5)
+    assert execution_plan.planned_requests.total == 8
+    assert "Planned: 8" in submanager.sync.plan.format_plan(execution_plan)
+
+
+def test_reads_serialized_per_account(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that each account's Reddit instance is used by one at a time."""
+    static_config = _make_static_config()
+    lock = threading.Lock()
+    active_reads = [0]
+    max_active_reads = [0]
+
+    def create_endpoint(config: Any, reddit: Any) -> Any:
+        with lock:
+            active_reads[0] += 1
+            max_active_reads[0] = max(max_active_reads[0], active_reads[0])
+        time.sleep(0.05)
+        with lock:
+            active_reads[0] -= 1
+        return SimpleNamespace(content="")
+
+    monkeypatch.setattr(
+        submanager.endpoint.creation,
+        "create_sync_endpoint_from_config",
+        create_endpoint,
+    )
+    submanager.sync.plan.fetch_sources(
+        static_config.sync_manager.items,
+        {"test": object()},  # type: ignore[arg-type]
+    )
+
+    assert max_active_reads[0] == 1
@@ -0,0 +1,202 @@
+"""Test cheaply probing sync sources for changes."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+from pathlib import (
+    Path,
+)
+from typing import (
+    Any,
+    Iterator,
+    Sequence,
+)
+
+# Local imports
+import submanager.bench.fakereddit
+import submanager.config.dynamic
+import submanager.config.static
+import submanager.core.initialization
+import submanager.core.run
+import submanager.models.config
+import submanager.sync.cache
+import submanager.sync.probe
+from submanager.types import (
+    AccountsMap,
+)
+
+# ---- Helpers ----
+
+
+class SubmissionStub:
+    """Stand-in for a submission with only its dates."""
+
+    def __init__(self, thread_id: str, edited: float | bool) -> None:
+        self.id = thread_id  # noqa: WPS125
+        self.created_utc = 100
+        self.edited = edited
+
+
+class RedditStub:
+    """Stand-in for a Reddit instance with only what the probes need."""
+
+    def __init__(
+        self,
+        wiki_dates: dict[str, float],
+        thread_dates: dict[str, float | bool],
+    ) -> None:
+        self.wiki_dates = wiki_dates
+        self.thread_dates = thread_dates
+        self.request_count = 0
+        self.wiki: dict[str, Any] = {}
+
+    def subreddit(self, display_name: str) -> Any:
+        """Get a stand-in for a subreddit with only its wiki pages."""
+        self.wiki = {
+            page_name: self._make_wiki_page(revision_date)
+            for page_name, revision_date in self.wiki_dates.items()
+        }
+        return self
+
+    def _make_wiki_page(self, revision_date: float) -> Any:
+        """Make a stand-in for a wiki page with only its revisions."""
+        reddit = self
+
+        class WikiPageStub:  # noqa: WPS431
+            """Stand-in for a wiki page with only its revisions."""
+
+            def revisions(self, limit: int) -> Iterator[dict[str, float]]:
+                """Get the latest revision of the wiki page."""
+                reddit.request_count += 1
+                yield {"timestamp": revision_date}
+
+        return WikiPageStub()
+
+    def info(self, fullnames: Sequence[str]) -> list[SubmissionStub]:
+        """Get the submissions with the given fullnames in one request."""
+        self.request_count += 1
+        return [
+            SubmissionStub(thread_id, self.thread_dates[thread_id])
+            for thread_id in (fullname[3:] for fullname in fullnames)
+        ]
+
+
+def _make_static_config() -> submanager.models.config.StaticConfig:
+    """Create a static config with wiki page and thread sources."""
+    sources = {
+        "page1": {"endpoint_name": "page1"},
+        "page2": {"endpoint_name": "page2"},
+        "page2_copy": {"endpoint_name": "Page2"},
+        "thread1": {"endpoint_name": "abc123", "endpoint_type": "thread"},
+        "thread2": {"endpoint_name": "def456", "endpoint_type": "thread"},
+        "thread2_copy": {"endpoint_name": "def456", "endpoint_type": "thread"},
+        "widget": {"endpoint_name": "Widget", "endpoint_type": "widget"},
+    }
+    return submanager.config.static.render_static_config(
+        {
+            "accounts": {"test": {"config": {"site_name": "test"}}},
+            "context_default": {
+                "account": "test",
+                "subreddit": "SubManagerTesting",
+            },
+            "sync_manager": {
+                "items": {
+                    item_key: {
+                        "source": source,
+                        "targets": {"target": {"endpoint_name": "target"}},
+                    }
+                    for item_key, source in sources.items()
+                },
+            },
+        },
+    )
+
+
+# ---- Tests ----
+
+
+def test_probe_changed_only() -> None:
+    """Test that only changed sources pass, probing each source once."""
+    static_config = _make_static_config()
+    dynamic_config = submanager.models.config.DynamicSyncManagerConfig(
+        items={
+            item_key: {"source_timestamp": 200}
+            for item_key in static_config.sync_manager.items
+        },
+    )
+    reddit = RedditStub(
+        wiki_dates={"page1": 200, "page2": 300},
+        thread_dates={"abc123": False, "def456": 250},
+    )
+    probe_filter = submanager.sync.probe.get_probe_filter(
+        static_config.sync_manager,
+        dynamic_config,
+        AccountsMap({"test": reddit}),
+    )
+    changed_items = {
+        item_key
+        for item_key, sync_item in static_config.sync_manager.items.items()
+        if probe_filter(sync_item)
+    }
+
+    assert changed_items == {"page2", "page2_copy", "thread2", "thread2_copy"}
+    assert reddit.request_count == 3
+
+
+def test_probe_run_uses_caches(tmp_path: Path) -> None:
+    """Test that probe runs share the caches of the full runs."""
+    fake_reddit = submanager.bench.fakereddit.FakeReddit()
+    praw_config = fake_reddit.add_account("testbot")
+    subreddit = fake_reddit.add_subreddit(
+        "SubManagerTesting",
+        {"testbot": ["all"]},
+    )
+    fake_reddit.edit_wiki_page(subreddit, "source", "Spam", author="mod")
+    fake_reddit.edit_wiki_page(subreddit, "target", "Eggs", author="mod")
+    static_config = submanager.config.static.render_static_config(
+        {
+            "accounts": {"testbot": {"config": praw_config}},
+            "context_default": {
+                "account": "testbot",
+                "subreddit": "SubManagerTesting",
+            },
+            "sync_manager": {
+                "items": {
+                    "spam": {
+                        "source": {"endpoint_name": "source"},
+                        "targets": {"target": {"endpoint_name": "target"}},
+                    },
+                },
+            },
+        },
+    )
+    accounts = submanager.core.initialization.setup_accounts(
+        static_config.accounts,
+        http_adapter=submanager.bench.fakereddit.FakeRedditAdapter(
+            fake_reddit,
+        ),
+    )
+    target_cache_path = tmp_path / "target_cache.json"
+    render_cache = submanager.sync.cache.RenderCache()
+    dynamic_config_cache = submanager.config.dynamic.DynamicConfigCache()
+
+    submanager.core.run.run_probe_once(
+        static_config,
+        accounts,
+        config_path_dynamic=tmp_path / "config_dynamic.json",
+        target_cache_path=target_cache_path,
+        render_cache=render_cache,
+        dynamic_config_cache=dynamic_config_cache,
+    )
+
+    wiki_page = subreddit.wiki_pages["target"].latest
+    assert wiki_page is not None
+    assert wiki_page.content.strip() == "Spam"
+    assert render_cache.misses == 1
+    assert dynamic_config_cache.dynamic_config is not None
+    assert submanager.sync.cache.load_target_cache(
+        target_cache_path,
+    ).targets
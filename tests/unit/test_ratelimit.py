@@ -0,0 +1,119 @@
+"""Test pacing requests within an account's rate limit budget."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Third party imports
+import pytest
+
+# Local imports
+import submanager.core.ratelimit
+import submanager.models.config
+
+# ---- Helpers ----
+
+
+def _make_pacer(
+    remaining: int,
+    reset_in_s: int = 100,
+    read_burst_s: float = 0,
+) -> submanager.core.ratelimit.RequestPacer:
+    """Create a pacer that has seen a response with the given budget."""
+    request_pacer = submanager.core.ratelimit.RequestPacer(
+        submanager.models.config.RateLimitConfig(
+            enabled=True,
+            background_reserve=20,
+            read_burst_s=read_burst_s,
+            write_reserve=10,
+        ),
+    )
+    request_pacer.update(
+        {
+            submanager.core.ratelimit.HEADER_REMAINING: str(remaining),
+            submanager.core.ratelimit.HEADER_RESET: str(reset_in_s),
+            submanager.core.ratelimit.HEADER_USED: "0",
+        },
+    )
+    return request_pacer
+
+
+# ---- Tests ----
+
+
+def test_no_budget_known() -> None:
+    """Test that requests aren't delayed before any budget is reported."""
+    request_pacer = submanager.core.ratelimit.RequestPacer(
+        submanager.models.config.RateLimitConfig(),
+    )
+
+    assert request_pacer.reserve(write=False) == 0
+
+
+def test_reads_paced_evenly() -> None:
+    """Test that reads are spread evenly over the rest of the window."""
+    request_pacer = _make_pacer(remaining=60)
+    wait_times = [request_pacer.reserve(write=False) for __ in range(3)]
+
+    assert wait_times[0] == 0
+    assert wait_times[1] == pytest.approx(2, abs=0.1)
+    assert wait_times[2] == pytest.approx(4, abs=0.1)
+
+
+def test_reads_burst() -> None:
+    """Test that reads within the burst allowance aren't delayed."""
+    request_pacer = _make_pacer(remaining=60, read_burst_s=10)
+    wait_times = [request_pacer.reserve(write=False) for __ in range(6)]
+
+    assert wait_times[:5] == [0] * 5
+    assert wait_times[5] == pytest.approx(0, abs=0.1)
+
+
+def test_writes_prioritized() -> None:
+    """Test that writes can use the reserve that reads must wait for."""
+    request_pacer = _make_pacer(remaining=5)
+
+    assert request_pacer.reserve(write=True) == 0
+    assert request_pacer.reserve(write=False) == pytest.approx(100, abs=1)
+
+
+def test_background_deprioritized() -> None:
+    """Test that background reads leave a reserve for syncing items."""
+    request_pacer = _make_pacer(remaining=25)
+
+    assert request_pacer.reserve(write=False) == 0
+    assert request_pacer.reserve(
+        write=False,
+        background=True,
+    ) == pytest.approx(100, abs=1)
+
+
+def test_background_requests_context() -> None:
+    """Test that requests are only marked background within the context."""
+    with submanager.core.ratelimit.background_requests():
+        assert submanager.core.ratelimit.BACKGROUND_REQUESTS.get()
+    assert not submanager.core.ratelimit.BACKGROUND_REQUESTS.get()
+
+
+def test_disabled_by_default() -> None:
+    """Test that requests aren't paced unless enabled in the config."""
+    request_pacer = submanager.core.ratelimit.RequestPacer(
+        submanager.models.config.RateLimitConfig(),
+    )
+    request_pacer.update(
+        {
+            submanager.core.ratelimit.HEADER_REMAINING: "0",
+            submanager.core.ratelimit.HEADER_RESET: "100",
+            submanager.core.ratelimit.HEADER_USED: "600",
+        },
+    )
+
+    assert request_pacer.reserve(write=False) == 0
+
+
+def test_budget_used_up() -> None:
+    """Test that writes wait for the window to reset once out of budget."""
+    request_pacer = _make_pacer(remaining=0)
+
+    assert request_pacer.reserve(write=True) == pytest.approx(100, abs=1)
@@ -0,0 +1,242 @@
+"""Test picking accounts from the read pool for read-only fetches."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import time
+
+# Third party imports
+import pytest
+
+# Local imports
+import submanager.bench.fakereddit
+import submanager.config.static
+import submanager.core.initialization
+import submanager.core.readpool
+import submanager.models.config
+import submanager.validation.cache
+import submanager.validation.endpoints
+from submanager.types import (
+    AccountsMap,
+)
+
+# ---- Helpers ----
+
+
+class AuthStub:
+    """Stand-in for a Reddit instance's auth with a rate limit budget."""
+
+    def __init__(self, remaining: float | None) -> None:
+        self.limits = {
+            "remaining": remaining,
+            "reset_timestamp": None,
+            "used": None,
+        }
+
+
+class RedditStub:
+    """Stand-in for a Reddit instance, with only what the pool needs."""
+
+    def __init__(self, remaining: float | None = None) -> None:
+        self.auth = AuthStub(remaining)
+
+
+def _make_static_config(
+    pool_accounts: list[str] | None = None,
+) -> submanager.models.config.StaticConfig:
+    """Create a static config with several accounts and the pool enabled."""
+    return submanager.models.config.StaticConfig(
+        accounts={
+            account_key: {"config": {"site_name": account_key}}
+            for account_key in ("writer", "reader1", "reader2")
+        },
+        context_default={
+            "account": "writer",
+            "subreddit": "SubManagerTesting",
+        },
+        read_pool={"enabled": True, "accounts": pool_accounts or []},
+    )
+
+
+def _make_source() -> submanager.models.config.FullEndpointConfig:
+    """Create a source endpoint config owned by the writer account."""
+    return submanager.models.config.FullEndpointConfig(
+        context={"account": "writer", "subreddit": "SubManagerTesting"},
+        endpoint_name="index",
+        uid="sync_manager.items.test.source",
+    )
+
+
+def _make_read_pool(
+    static_config: submanager.models.config.StaticConfig,
+    accounts: AccountsMap,
+    readable_by: list[str],
+) -> submanager.core.readpool.ReadPool:
+    """Create a read pool where the source was readable by some accounts."""
+    validation_cache = submanager.validation.cache.ValidationCacheSession(
+        static_config,
+        submanager.models.config.ValidationCache(),
+    )
+    for account_key in readable_by:
+        validation_cache.record_endpoint(
+            submanager.core.readpool.make_reader_config(
+                _make_source(),
+                account_key,
+            ),
+        )
+    return submanager.core.readpool.ReadPool(
+        static_config,
+        accounts,
+        validation_cache,
+    )
+
+
+# ---- Tests ----
+
+
+def test_reader_fallback_to_owner() -> None:
+    """Test that the owner is used if no other account could read it."""
+    static_config = _make_static_config()
+    accounts = AccountsMap(
+        {key: RedditStub() for key in static_config.accounts},
+    )
+    read_pool = _make_read_pool(static_config, accounts, readable_by=[])
+
+    assert read_pool.get_reader(_make_source()) == "writer"
+
+
+def test_reader_most_budget() -> None:
+    """Test that the eligible account with the most budget is picked."""
+    static_config = _make_static_config()
+    accounts = AccountsMap(
+        {  # type: ignore[dict-item]
+            "writer": RedditStub(300),
+            "reader1": RedditStub(100),
+            "reader2": RedditStub(500),
+        },
+    )
+    read_pool = _make_read_pool(
+        static_config,
+        accounts,
+        readable_by=["reader1", "reader2"],
+    )
+
+    assert read_pool.get_readers(_make_source()) == [
+        "writer",
+        "reader1",
+        "reader2",
+    ]
+    assert read_pool.get_reader(_make_source()) == "reader2"
+    accounts["reader2"].auth.limits["remaining"] = 200
+    assert read_pool.get_reader(_make_source()) == "writer"
+
+
+def test_reader_pool_accounts() -> None:
+    """Test that only accounts listed in the pool are used, if any are."""
+    static_config = _make_static_config(pool_accounts=["reader1"])
+    accounts = AccountsMap(
+        {key: RedditStub() for key in static_config.accounts},
+    )
+    read_pool = _make_read_pool(
+        static_config,
+        accounts,
+        readable_by=["reader1", "reader2"],
+    )
+
+    assert read_pool.get_readers(_make_source()) == ["writer", "reader1"]
+
+
+def test_readers_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test readers are looked up again after the validation TTL or error."""
+    static_config = _make_static_config()
+    accounts = AccountsMap(
+        {key: RedditStub() for key in static_config.accounts},
+    )
+    read_pool = _make_read_pool(
+        static_config,
+        accounts,
+        readable_by=["reader1", "reader2"],
+    )
+    assert read_pool.get_readers(_make_source()) == [
+        "writer",
+        "reader1",
+        "reader2",
+    ]
+
+    read_pool.drop_reader(_make_source(), "reader1")
+    read_pool.drop_reader(_make_source(), "writer")
+    assert read_pool.get_readers(_make_source()) == ["writer", "reader2"]
+
+    # Once the validations are stale, no other account is trusted to read
+    current_time = time.time() + static_config.validation_ttl_s + 1
+    monkeypatch.setattr(time, "time", lambda: current_time)
+    assert read_pool.get_readers(_make_source()) == ["writer"]
+
+
+def test_read_access_duplicate_sources() -> None:
+    """Test that sources differing only in processing share read access."""
+    fake_reddit = submanager.bench.fakereddit.FakeReddit()
+    subreddit = fake_reddit.add_subreddit(
+        "SubManagerTesting",
+        {"writer": ["all"]},
+    )
+    fake_reddit.edit_wiki_page(subreddit, "index", "Text", author="writer")
+    static_config = submanager.config.static.render_static_config(
+        {
+            "accounts": {
+                account_key: {"config": fake_reddit.add_account(account_key)}
+                for account_key in ("writer", "reader1")
+            },
+            "context_default": {
+                "account": "writer",
+                "subreddit": "SubManagerTesting",
+            },
+            "read_pool": {"enabled": True},
+            "sync_manager": {
+                "items": {
+                    f"item_{truncate_lines}": {
+                        "source": {
+                            "endpoint_name": "index",
+                            "truncate_lines": truncate_lines,
+                        },
+                        "targets": {
+                            "target": {
+                                "endpoint_name": f"page_{truncate_lines}",
+                            },
+                        },
+                    }
+                    for truncate_lines in (1, 2)
+                },
+            },
+        },
+    )
+    accounts = submanager.core.initialization.setup_accounts(
+        static_config.accounts,
+        http_adapter=submanager.bench.fakereddit.FakeRedditAdapter(
+            fake_reddit,
+        ),
+    )
+    validation_cache = submanager.validation.cache.ValidationCacheSession(
+        static_config,
+        submanager.models.config.ValidationCache(),
+    )
+    submanager.validation.endpoints.validate_read_access(
+        static_config,
+        accounts,
+        validation_cache,
+    )
+    read_pool = submanager.core.readpool.ReadPool(
+        static_config,
+        accounts,
+        validation_cache,
+    )
+
+    assert fake_reddit.get_request_counts()["wiki_page"] == 1
+    for sync_item in static_config.sync_manager.items.values():
+        assert read_pool.get_readers(sync_item.source) == [
+            "writer",
+            "reader1",
+        ]
@@ -0,0 +1,91 @@
+"""Test the shared HTTP connection pool."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Third party imports
+import requests.adapters
+
+# Local imports
+import submanager.core.initialization
+import submanager.core.session
+import submanager.models.config
+import submanager.utils.concurrency
+
+# ---- Tests ----
+
+
+def test_adapter_pool_size_default() -> None:
+    """Test that the pool is sized to the workers for each account."""
+    http_adapter = submanager.core.session.create_http_adapter(
+        submanager.models.config.HTTPConfig(),
+        account_count=requests.adapters.DEFAULT_POOLSIZE * 2,
+    )
+    http_adapter_single = submanager.core.session.create_http_adapter(
+        submanager.models.config.HTTPConfig(),
+    )
+
+    assert (
+        http_adapter._pool_maxsize  # noqa: WPS437
+        == submanager.utils.concurrency.MAX_WORKERS_PER_ACCOUNT
+        * requests.adapters.DEFAULT_POOLSIZE
+        * 2
+    )
+    assert (
+        http_adapter_single._pool_maxsize  # noqa: WPS437
+        >= requests.adapters.DEFAULT_POOLSIZE
+    )
+
+
+def test_accounts_share_pool() -> None:
+    """Test that every account uses the same pool, but not the same session."""
+    http_adapter = submanager.core.session.create_http_adapter(
+        submanager.models.config.HTTPConfig(pool_maxsize=32),
+    )
+    accounts_config = submanager.models.config.AccountsConfig(
+        {
+            account_key: submanager.models.config.AccountConfig(
+                config={
+                    "client_id": "spam",
+                    "client_secret": "eggs",
+                    "refresh_token": account_key,
+                },
+            )
+            for account_key in ("testbot1", "testbot2")
+        },
+    )
+    accounts = submanager.core.initialization.setup_accounts(
+        accounts_config,
+        http_adapter=http_adapter,
+    )
+    sessions = [
+        reddit._core._requestor._http  # noqa: WPS437
+        for reddit in accounts.values()
+    ]
+
+    assert sessions[0] is not sessions[1]
+    assert all(
+        session.get_adapter("https://oauth.reddit.com") is http_adapter
+        for session in sessions
+    )
+
+
+def test_session_close_keeps_pool() -> None:
+    """Test that closing one session does not close the shared pool."""
+    http_adapter = submanager.core.session.create_http_adapter(
+        submanager.models.config.HTTPConfig(),
+    )
+    pool_manager = http_adapter.poolmanager
+    pool_manager.connection_from_url("https://oauth.reddit.com")
+    sessions = [
+        submanager.core.session.create_session(http_adapter) for __ in range(2)
+    ]
+    sessions[0].close()
+
+    assert len(pool_manager.pools) == 1
+    assert sessions[1].get_adapter("https://oauth.reddit.com") is http_adapter
+
+    http_adapter.close_pool()
+    assert not pool_manager.pools
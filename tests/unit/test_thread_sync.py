@@ -0,0 +1,194 @@
+"""Test building the configs to sync managed threads."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+from typing import (
+    Any,
+)
+
+# Third party imports
+import pytest
+from typing_extensions import (
+    Final,
+)
+
+# Local imports
+import submanager.bench.fakereddit
+import submanager.config.static
+import submanager.core.initialization
+import submanager.models.config
+import submanager.thread.creation
+import submanager.thread.sync
+import submanager.thread.utils
+from submanager.types import (
+    AccountsMap,
+)
+
+ACCOUNT: Final[str] = "testbot"
+SUBREDDIT: Final[str] = "SubManagerTesting"
+THREAD_TEXT = """Intro
+
+[](/# Auto Sync Start)
+Old text
+[](/# Auto Sync End)
+"""
+
+# ---- Helpers ----
+
+
+def _count_calls(
+    monkeypatch: pytest.MonkeyPatch,
+    module: object,
+    function_name: str,
+) -> list[tuple[Any, ...]]:
+    """Record the calls of a module's function, passing them through."""
+    function = getattr(module, function_name)
+    calls: list[tuple[Any, ...]] = []
+
+    def record_call(*args: Any) -> Any:
+        calls.append(args)
+        return function(*args)
+
+    monkeypatch.setattr(module, function_name, record_call)
+    return calls
+
+
+def _setup_fake_reddit() -> (
+    tuple[
+        submanager.bench.fakereddit.FakeReddit,
+        submanager.bench.fakereddit.FakeSubreddit,
+        submanager.models.config.StaticConfig,
+        AccountsMap,
+    ]
+):
+    """Set up a fake sub with a thread source page and two threads."""
+    fake_reddit = submanager.bench.fakereddit.FakeReddit()
+    praw_config = fake_reddit.add_account(ACCOUNT)
+    subreddit = fake_reddit.add_subreddit(SUBREDDIT, {ACCOUNT: ["all"]})
+    fake_reddit.edit_wiki_page(subreddit, "eggs", "Spam", author="mod")
+    for thread_id in ("abc123", "def456"):
+        fake_reddit.add_submission(
+            subreddit,
+            ACCOUNT,
+            "Thread",
+            THREAD_TEXT,
+            submission_id=thread_id,
+        )
+    static_config = _make_static_config(praw_config)
+    accounts = submanager.core.initialization.setup_accounts(
+        static_config.accounts,
+        http_adapter=submanager.bench.fakereddit.FakeRedditAdapter(
+            fake_reddit,
+        ),
+    )
+    return fake_reddit, subreddit, static_config, accounts
+
+
+def _make_static_config(
+    praw_config: dict[str, str],
+) -> submanager.models.config.StaticConfig:
+    """Create a static config with one managed thread."""
+    return submanager.config.static.render_static_config(
+        {
+            "accounts": {ACCOUNT: {"config": praw_config}},
+            "context_default": {"account": ACCOUNT, "subreddit": SUBREDDIT},
+            "thread_manager": {
+                "items": {
+                    "spam": {
+                        "link_update_pages": ["index"],
+                        "source": {"endpoint_name": "eggs"},
+                    },
+                },
+            },
+        },
+    )
+
+
+# ---- Tests ----
+
+
+def test_sync_item_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the sync item is reused until the thread or config changes."""
+    fake_reddit, __, static_config, accounts = _setup_fake_reddit()
+    build_calls = _count_calls(
+        monkeypatch,
+        submanager.thread.sync,
+        "create_thread_sync_item",
+    )
+
+    config_cache = submanager.thread.utils.ThreadConfigCache()
+    thread_config = static_config.thread_manager.items["spam"]
+    for thread_id, build_count in (
+        ("abc123", 1),
+        ("abc123", 1),
+        ("def456", 2),
+    ):
+        submanager.thread.sync.sync_thread(
+            thread_config,
+            submanager.models.config.DynamicThreadItemConfig(
+                thread_id=thread_id,
+            ),
+            accounts,
+            config_cache=config_cache,
+        )
+        assert len(build_calls) == build_count
+        assert "Spam" in fake_reddit.submissions[thread_id].selftext
+
+    reloaded_config = _make_static_config(
+        static_config.accounts[ACCOUNT].config,  # type: ignore[arg-type]
+    )
+    submanager.thread.sync.sync_thread(
+        reloaded_config.thread_manager.items["spam"],
+        submanager.models.config.DynamicThreadItemConfig(thread_id="def456"),
+        accounts,
+        config_cache=config_cache,
+    )
+    assert len(build_calls) == 3
+
+    # Without a cache, e.g. in a one-off run, it's just built each time
+    submanager.thread.sync.sync_thread(
+        reloaded_config.thread_manager.items["spam"],
+        submanager.models.config.DynamicThreadItemConfig(thread_id="def456"),
+        accounts,
+    )
+    assert len(build_calls) == 4
+
+
+def test_link_page_configs_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the link page configs are built once per thread config."""
+    fake_reddit, subreddit, static_config, accounts = _setup_fake_reddit()
+    build_calls = _count_calls(
+        monkeypatch,
+        submanager.thread.creation,
+        "create_link_page_configs",
+    )
+
+    config_cache = submanager.thread.utils.ThreadConfigCache()
+    thread_config = static_config.thread_manager.items["spam"]
+    old_permalink = fake_reddit.submissions["abc123"].permalink
+    new_permalink = fake_reddit.submissions["def456"].permalink
+    for __ in range(2):
+        fake_reddit.edit_wiki_page(
+            subreddit,
+            "index",
+            f"Current thread: {old_permalink}",
+            author="mod",
+        )
+        submanager.thread.creation.update_page_links(
+            thread_config,
+            submanager.thread.creation.ThreadContext(
+                thread_config,
+                accounts,
+                new_thread_id="def456",
+                current_thread_id="abc123",
+            ),
+            config_cache=config_cache,
+        )
+        wiki_page = subreddit.wiki_pages["index"].latest
+        assert wiki_page is not None
+        assert new_permalink.strip("/") in wiki_page.content
+    assert len(build_calls) == 1
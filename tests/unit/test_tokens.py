@@ -0,0 +1,201 @@
+"""Test the persistent OAuth access token cache."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import concurrent.futures
+import http
+import json
+import os
+import stat
+import subprocess  # noqa: S404
+import sys
+import threading
+import time
+from pathlib import (
+    Path,
+)
+from typing import (
+    Any,
+)
+
+# Third party imports
+import pytest
+import requests
+
+# Local imports
+import submanager.config.lock
+import submanager.core.requestor
+import submanager.core.tokens
+from submanager.constants import (
+    SECRET_FILE_MODE,
+)
+
+# ---- Constants ----
+
+TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+TOKEN_DATA = [("grant_type", "refresh_token"), ("refresh_token", "spam")]
+
+
+# ---- Helpers ----
+
+
+class TokenSession(requests.Session):
+    """Session that hands out a new access token on each request."""
+
+    def __init__(self, expires_in: float = 3600) -> None:
+        super().__init__()
+        self.expires_in = expires_in
+        self.request_count = 0
+
+    def request(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Return a token response without making a network request."""
+        self.request_count += 1
+        response = requests.Response()
+        response.status_code = http.HTTPStatus.OK
+        response._content = json.dumps(  # noqa: WPS437
+            {
+                "access_token": f"token{self.request_count}",
+                "expires_in": self.expires_in,
+                "scope": "*",
+            },
+        ).encode("utf-8")
+        return response
+
+
+def _make_requestor(
+    cache_path: Path,
+    session: TokenSession,
+) -> submanager.core.requestor.SubManagerRequestor:
+    """Create a requestor using the passed token cache path and session."""
+    return submanager.core.requestor.SubManagerRequestor(
+        "submanager test",
+        session=session,
+        token_cache=submanager.core.tokens.TokenCache(cache_path),
+    )
+
+
+def _request_token(
+    requestor: submanager.core.requestor.SubManagerRequestor,
+) -> str:
+    """Request an access token the same way PRAW does."""
+    response = requestor.request(
+        "post",
+        TOKEN_URL,
+        auth=("client_id", "client_secret"),
+        data=TOKEN_DATA,
+    )
+    access_token: str = response.json()["access_token"]
+    return access_token
+
+
+# ---- Tests ----
+
+
+def test_token_reused_after_restart(tmp_path: Path) -> None:
+    """Test that a fresh token is reused by a new process without a request."""
+    cache_path = tmp_path / "token_cache.json"
+    session = TokenSession()
+    first_token = _request_token(_make_requestor(cache_path, session))
+    second_token = _request_token(_make_requestor(cache_path, session))
+
+    assert first_token == second_token == "token1"
+    assert session.request_count == 1
+    assert stat.S_IMODE(cache_path.stat().st_mode) == SECRET_FILE_MODE
+    assert "spam" not in cache_path.read_text(encoding="utf-8")
+
+
+def test_token_rerequested(tmp_path: Path) -> None:
+    """Test that asking again in the same process gets a new token."""
+    session = TokenSession()
+    requestor = _make_requestor(tmp_path / "token_cache.json", session)
+    first_token = _request_token(requestor)
+    second_token = _request_token(requestor)
+
+    assert first_token != second_token
+    assert session.request_count == 2
+
+
+def test_token_near_expiry(tmp_path: Path) -> None:
+    """Test that tokens close to expiring are refreshed instead of reused."""
+    cache_path = tmp_path / "token_cache.json"
+    session = TokenSession(expires_in=60)
+    _request_token(_make_requestor(cache_path, session))
+    _request_token(_make_requestor(cache_path, session))
+
+    assert session.request_count == 2
+
+
+def test_stale_lock_broken(tmp_path: Path) -> None:
+    """Test that a lock left by an exited process doesn't block the cache."""
+    cache_path = tmp_path / "token_cache.json"
+    exited_process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-c", "pass"],
+    )
+    exited_process.wait()
+    lock_path = submanager.config.lock.generate_lock_file_path(cache_path)
+    lock_path.write_text(f"{exited_process.pid}\n", encoding="utf-8")
+    session = TokenSession()
+    start_time = time.monotonic()
+    first_token = _request_token(_make_requestor(cache_path, session))
+
+    assert time.monotonic() - start_time < (
+        submanager.core.tokens.TOKEN_LOCK_TIMEOUT_S
+    )
+    assert not lock_path.exists()
+    assert first_token == _request_token(_make_requestor(cache_path, session))
+    assert session.request_count == 1
+
+
+def test_held_lock_skips_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the cache isn't touched while another process holds it."""
+    monkeypatch.setattr(submanager.core.tokens, "TOKEN_LOCK_TIMEOUT_S", 0.2)
+    cache_path = tmp_path / "token_cache.json"
+    lock_path = submanager.config.lock.generate_lock_file_path(cache_path)
+    lock_path.write_text(f"{os.getpid()}\n", encoding="utf-8")
+    session = TokenSession()
+    _request_token(_make_requestor(cache_path, session))
+
+    assert session.request_count == 1
+    assert not cache_path.exists()
+    assert lock_path.exists()
+
+
+def test_tokens_requested_concurrently(tmp_path: Path) -> None:
+    """Test that different tokens are requested at the same time."""
+    token_cache = submanager.core.tokens.TokenCache(
+        tmp_path / "token_cache.json",
+    )
+    session = TokenSession()
+    # Each request waits for the other, so this fails if they're serialized
+    barrier = threading.Barrier(2, timeout=5)
+
+    def request_token() -> requests.Response:
+        barrier.wait()
+        return session.request("post", TOKEN_URL)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        responses = list(
+            executor.map(
+                lambda token_key: token_cache.request_token(
+                    token_key,
+                    request_token,
+                    url=TOKEN_URL,
+                ),
+                ("spam", "eggs"),
+            ),
+        )
+
+    assert {response.status_code for response in responses} == {200}
+    assert set(token_cache.load().tokens) == {"spam", "eggs"}
@@ -0,0 +1,175 @@
+"""Test the incremental validation result cache."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import time
+from pathlib import (
+    Path,
+)
+
+# Local imports
+import submanager.models.config
+import submanager.validation.cache
+import submanager.validation.endpoints
+from submanager.types import (
+    AccountsMap,
+)
+
+# ---- Helpers ----
+
+
+def _make_static_config(
+    ttl_s: float = 60,
+) -> submanager.models.config.StaticConfig:
+    """Create a minimal static config with one endpoint."""
+    context = {"account": "testbot", "subreddit": "SubManagerTesting"}
+    return submanager.models.config.StaticConfig(
+        accounts={"testbot": {"config": {"site_name": "testbot"}}},
+        context_default=context,
+        validation_ttl_s=ttl_s,
+    )
+
+
+def _make_endpoint(
+    description: str = "",
+    endpoint_name: str = "index",
+) -> submanager.models.config.FullEndpointConfig:
+    """Create a minimal wiki page endpoint config."""
+    return submanager.models.config.FullEndpointConfig(
+        context={"account": "testbot", "subreddit": "SubManagerTesting"},
+        description=description,
+        endpoint_name=endpoint_name,
+        uid="sync_manager.items.test.source",
+    )
+
+
+# ---- Tests ----
+
+
+def test_hash_ignores_description() -> None:
+    """Test that cosmetic fields don't change the endpoint hash."""
+    account_config = submanager.models.config.AccountConfig()
+    hashes = {
+        submanager.validation.cache.hash_endpoint_config(
+            endpoint,
+            account_config,
+        )
+        for endpoint in (_make_endpoint("Spam"), _make_endpoint("Eggs"))
+    }
+    changed_hash = submanager.validation.cache.hash_endpoint_config(
+        _make_endpoint(endpoint_name="other"),
+        account_config,
+    )
+
+    assert len(hashes) == 1
+    assert changed_hash not in hashes
+
+
+def test_session_record_check(tmp_path: Path) -> None:
+    """Test that recorded items are found after a write and reload."""
+    cache_path = tmp_path / "validation_cache.json"
+    static_config = _make_static_config()
+    endpoint = _make_endpoint()
+    session = submanager.validation.cache.ValidationCacheSession(
+        static_config,
+        submanager.validation.cache.load_validation_cache(cache_path),
+    )
+    assert not session.check_endpoint(endpoint)
+    session.record_account("testbot")
+    session.record_endpoint(endpoint)
+    session.write(cache_path)
+
+    session_reloaded = submanager.validation.cache.ValidationCacheSession(
+        static_config,
+        submanager.validation.cache.load_validation_cache(cache_path),
+    )
+    assert session_reloaded.check_account("testbot")
+    assert session_reloaded.check_endpoint(endpoint)
+    assert not session_reloaded.check_endpoint(endpoint, check_editable=True)
+
+
+def test_session_expired() -> None:
+    """Test that entries older than the TTL are not used and are pruned."""
+    static_config = _make_static_config(ttl_s=60)
+    validation_cache = submanager.models.config.ValidationCache()
+    session = submanager.validation.cache.ValidationCacheSession(
+        static_config,
+        validation_cache,
+    )
+    session.record_account("testbot")
+    for cache_entry_key in list(validation_cache.accounts):
+        validation_cache.accounts[
+            cache_entry_key
+        ] = submanager.models.config.ValidationCacheEntry(
+            validated_timestamp=time.time() - 120,
+        )
+
+    assert not session.check_account("testbot")
+    submanager.validation.cache.prune_validation_cache(
+        validation_cache,
+        ttl_s=static_config.validation_ttl_s,
+    )
+    assert not validation_cache.accounts
+
+
+def test_session_use_cached_false() -> None:
+    """Test that cached entries are ignored when revalidating everything."""
+    session = submanager.validation.cache.ValidationCacheSession(
+        _make_static_config(),
+        submanager.models.config.ValidationCache(),
+        use_cached=False,
+    )
+    session.record_account("testbot")
+
+    assert not session.check_account("testbot")
+
+
+def test_validate_endpoints_cached() -> None:
+    """Test that cached endpoints are skipped without contacting Reddit."""
+    context = {"account": "testbot", "subreddit": "SubManagerTesting"}
+    static_config = submanager.models.config.StaticConfig(
+        accounts={"testbot": {"config": {"site_name": "testbot"}}},
+        context_default=context,
+        sync_manager={
+            "items": {
+                "test": {
+                    "uid": "sync_manager.items.test",
+                    "source": {
+                        "context": context,
+                        "endpoint_name": "source",
+                        "uid": "sync_manager.items.test.source",
+                    },
+                    "targets": {
+                        "target": {
+                            "context": context,
+                            "endpoint_name": "target",
+                            "uid": "sync_manager.items.test.targets.target",
+                        },
+                    },
+                },
+            },
+        },
+    )
+    session = submanager.validation.cache.ValidationCacheSession(
+        static_config,
+        submanager.models.config.ValidationCache(),
+    )
+    sync_item = static_config.sync_manager.items["test"]
+    session.record_endpoint(sync_item.source)
+    for target in sync_item.targets.values():
+        session.record_endpoint(target, check_editable=True)
+
+    endpoints_valid = submanager.validation.endpoints.validate_endpoints(
+        static_config,
+        accounts=AccountsMap({}),
+        validation_cache=session,
+    )
+
+    assert endpoints_valid == {
+        "sync_manager.items.test.source": True,
+        "sync_manager.items.test.targets.target": True,
+    }
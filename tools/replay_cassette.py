@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Replay a recorded cassette offline and compare the requests made."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import argparse
+import sys
+from typing import (
+    Sequence,
+)
+
+# Local imports
+import submanager.bench.replay
+from submanager.constants import (
+    CONFIG_PATH_STATIC,
+)
+
+
+def main(sys_argv: Sequence[str] | None = None) -> None:
+    """Replay the cassette and print each item's requests and timings."""
+    parser_main = argparse.ArgumentParser(
+        description=(
+            "Replay a cassette recorded with 'submanager run "
+            "--record-cassette' and compare the requests made per item"
+        ),
+    )
+    parser_main.add_argument(
+        "cassette_path",
+        help="Path to the cassette file to replay",
+    )
+    parser_main.add_argument(
+        "--config-path",
+        dest="config_path_static",
+        default=CONFIG_PATH_STATIC,
+        help="Path to the static config the cassette was recorded with",
+    )
+    parser_main.add_argument(
+        "--no-latency",
+        dest="replay_latency",
+        action="store_false",
+        help="Respond immediately instead of with the recorded latency",
+    )
+    parser_main.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with an error if any item made more requests than recorded",
+    )
+
+    parsed_args = parser_main.parse_args(sys_argv)
+    result = submanager.bench.replay.replay_cassette(
+        parsed_args.cassette_path,
+        parsed_args.config_path_static,
+        replay_latency=parsed_args.replay_latency,
+    )
+    print(submanager.bench.replay.format_replay_result(result))
+    if parsed_args.check and submanager.bench.replay.get_regressions(result):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
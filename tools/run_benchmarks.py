@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark Sub Manager's core routines against a simulated Reddit."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import argparse
+from typing import (
+    Sequence,
+)
+
+# Local imports
+import submanager.bench.harness
+
+
+def main(sys_argv: Sequence[str] | None = None) -> None:
+    """Run the benchmarks and print a table of the results."""
+    parser_main = argparse.ArgumentParser(
+        description="Benchmark Sub Manager against a simulated Reddit",
+    )
+    parser_main.add_argument(
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        choices=submanager.bench.harness.SCENARIOS,
+        help="Scenario(s) to run; all if not passed",
+    )
+    parser_main.add_argument(
+        "--items",
+        dest="item_counts",
+        action="append",
+        type=int,
+        help=(
+            "Number(s) of sync items/threads in the synthetic config; "
+            f"{submanager.bench.harness.ITEM_COUNTS_DEFAULT} if not passed"
+        ),
+    )
+    parser_main.add_argument(
+        "--latency-s",
+        type=float,
+        default=0,
+        help="Simulated latency of each Reddit request, in seconds",
+    )
+    parser_main.add_argument(
+        "--no-memory",
+        dest="measure_memory",
+        action="store_false",
+        help="Skip the extra, slower run that measures peak memory",
+    )
+    parser_main.add_argument(
+        "--rate-limit",
+        type=int,
+        default=None,
+        help="Requests each account may make per 10 minute window",
+    )
+
+    parsed_args = parser_main.parse_args(sys_argv)
+    submanager.bench.harness.run_benchmarks(
+        parsed_args.scenarios or submanager.bench.harness.SCENARIOS,
+        parsed_args.item_counts
+        or submanager.bench.harness.ITEM_COUNTS_DEFAULT,
+        measure_memory=parsed_args.measure_memory,
+        latency_s=parsed_args.latency_s,
+        rate_limit=parsed_args.rate_limit,
+        verbose=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the text processing and compare against a baseline."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import argparse
+import sys
+from pathlib import (
+    Path,
+)
+from typing import (
+    Sequence,
+)
+
+# Local imports
+import submanager.bench.text
+
+BASELINE_PATH_DEFAULT = Path(".benchmarks") / "text_baseline.json"
+SIZES_KB_DEFAULT = [
+    size_bytes // 1024
+    for size_bytes in submanager.bench.text.SIZES_BYTES_DEFAULT
+]
+
+
+def main(sys_argv: Sequence[str] | None = None) -> None:
+    """Run the text benchmarks and save or compare against a baseline."""
+    parser_main = argparse.ArgumentParser(
+        description="Micro-benchmark Sub Manager's text processing",
+    )
+    parser_main.add_argument(
+        "--case",
+        dest="cases",
+        action="append",
+        choices=submanager.bench.text.CASES,
+        help="Case(s) to run; all if not passed",
+    )
+    parser_main.add_argument(
+        "--size-kb",
+        dest="sizes_kb",
+        action="append",
+        type=int,
+        help=f"Input size(s) in KB; {SIZES_KB_DEFAULT} if not passed",
+    )
+    parser_main.add_argument(
+        "--save",
+        action="store_true",
+        help="Save the results as the new baseline",
+    )
+    parser_main.add_argument(
+        "--compare",
+        action="store_true",
+        help="Compare against the baseline; exit with an error if slower",
+    )
+    parser_main.add_argument(
+        "--baseline-path",
+        type=Path,
+        default=BASELINE_PATH_DEFAULT,
+        help=f"Path to the baseline file; {BASELINE_PATH_DEFAULT} by default",
+    )
+    parser_main.add_argument(
+        "--threshold",
+        type=float,
+        default=submanager.bench.text.REGRESSION_THRESHOLD_DEFAULT,
+        help="Ratio to the baseline time above which a case has regressed",
+    )
+
+    parsed_args = parser_main.parse_args(sys_argv)
+    sizes_bytes = submanager.bench.text.SIZES_BYTES_DEFAULT
+    if parsed_args.sizes_kb:
+        sizes_bytes = tuple(size_kb * 1024 for size_kb in parsed_args.sizes_kb)
+    results = submanager.bench.text.run_text_benchmarks(
+        parsed_args.cases or submanager.bench.text.CASES,
+        sizes_bytes,
+    )
+
+    baseline = {}
+    if parsed_args.compare:
+        baseline = submanager.bench.text.load_baseline(
+            parsed_args.baseline_path,
+        )
+    comparisons = submanager.bench.text.compare_to_baseline(results, baseline)
+    print(
+        submanager.bench.text.format_comparisons(
+            comparisons,
+            parsed_args.threshold,
+        ),
+    )
+    if parsed_args.save:
+        submanager.bench.text.write_baseline(
+            results,
+            parsed_args.baseline_path,
+        )
+        print(f"Saved baseline to {parsed_args.baseline_path.as_posix()!r}")
+    if parsed_args.compare and submanager.bench.text.get_regressions(
+        comparisons,
+        parsed_args.threshold,
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
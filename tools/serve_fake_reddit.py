@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Serve a seeded fake Reddit over HTTP for soak testing Sub Manager."""
+
+# Future imports
+from __future__ import (
+    annotations,
+)
+
+# Standard library imports
+import argparse
+import time
+from pathlib import (
+    Path,
+)
+from typing import (
+    Sequence,
+)
+
+# Local imports
+import submanager.bench.fakereddit
+import submanager.bench.server
+import submanager.bench.synthetic
+import submanager.config.synthetic
+import submanager.config.utils
+
+
+def main(sys_argv: Sequence[str] | None = None) -> None:
+    """Seed the fake Reddit, write a config pointing at it and serve it."""
+    parser_main = argparse.ArgumentParser(
+        description=(
+            "Serve a fake Reddit seeded with synthetic data, and write a "
+            "config for 'submanager --config-path PATH start' to run against"
+        ),
+    )
+    parser_main.add_argument(
+        "config_path",
+        help="Path to write the static config pointing at the server to",
+    )
+    parser_main.add_argument(
+        "--from-config",
+        default=None,
+        help=(
+            "Seed from this config (e.g. from 'generate-config --synthetic') "
+            "instead of generating one; its accounts are replaced"
+        ),
+    )
+    parser_main.add_argument(
+        "--items",
+        type=int,
+        default=submanager.config.synthetic.ITEM_COUNT_DEFAULT,
+        help="Number of synthetic sync items to seed",
+    )
+    parser_main.add_argument(
+        "--threads",
+        type=int,
+        default=submanager.config.synthetic.THREAD_COUNT_DEFAULT,
+        help="Number of synthetic managed threads to seed",
+    )
+    parser_main.add_argument(
+        "--seed",
+        type=int,
+        default=submanager.config.synthetic.SEED_DEFAULT,
+        help="Random seed for the generated config and page contents",
+    )
+    parser_main.add_argument(
+        "--host",
+        default=submanager.bench.server.HOST_DEFAULT,
+        help="Host to serve on",
+    )
+    parser_main.add_argument(
+        "--port",
+        type=int,
+        default=0,
+        help="Port to serve on; any free port if not passed",
+    )
+    parser_main.add_argument(
+        "--latency-s",
+        type=float,
+        default=0,
+        help="Simulated latency of each Reddit request, in seconds",
+    )
+    parser_main.add_argument(
+        "--rate-limit",
+        type=int,
+        default=None,
+        help="Requests each account may make per 10 minute window",
+    )
+    parser_main.add_argument(
+        "--repeat-interval-s",
+        type=float,
+        default=60,
+        help="Interval between runs to write to the config",
+    )
+    parser_main.add_argument(
+        "--report-interval-s",
+        type=float,
+        default=60,
+        help="Interval between printing the requests served",
+    )
+
+    parsed_args = parser_main.parse_args(sys_argv)
+    fake_reddit = submanager.bench.fakereddit.FakeReddit(
+        latency_s=parsed_args.latency_s,
+        rate_limit=parsed_args.rate_limit,
+    )
+    if parsed_args.from_config:
+        raw_config = submanager.config.utils.load_config(
+            Path(parsed_args.from_config),
+        )
+    else:
+        raw_config = submanager.config.synthetic.generate_synthetic_config(
+            submanager.config.synthetic.SyntheticConfigOptions(
+                item_count=parsed_args.items,
+                thread_count=parsed_args.threads,
+                seed=parsed_args.seed,
+            ),
+        )
+    raw_config = submanager.bench.synthetic.seed_synthetic_data(
+        fake_reddit,
+        raw_config,
+        seed=parsed_args.seed,
+    )
+    with submanager.bench.server.FakeRedditServer(
+        fake_reddit,
+        host=parsed_args.host,
+        port=parsed_args.port,
+    ) as server:
+        submanager.config.utils.write_config(
+            {
+                **raw_config,
+                "http": {"reddit_url": server.url},
+                "repeat_interval_s": parsed_args.repeat_interval_s,
+            },
+            config_path=Path(parsed_args.config_path),
+        )
+        print(f"Serving fake Reddit at {server.url} (Ctrl-C to stop)")
+        try:
+            while True:
+                time.sleep(parsed_args.report_interval_s)
+                print(server.format_throughput())
+        except KeyboardInterrupt:
+            print("Stopping fake Reddit")
+
+
+if __name__ == "__main__":
+    main()